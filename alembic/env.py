@@ -6,6 +6,9 @@ from sqlalchemy import pool
 from alembic import context
 
 from app.infrastructure.relational_db.connection import Base
+from app.infrastructure.relational_db.schemas.analytics import SearchEvents
+from app.infrastructure.relational_db.schemas.embeddings import EmbeddingCacheEntries
+from app.infrastructure.relational_db.schemas.law_acts import LawActChunks, LawActReferences, LawActs
 from app.infrastructure.relational_db.schemas.users import Users, UsersFiles
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+
+from app.domain.entities.answers import ContextPassage
+from app.domain.entities.law_acts import LawActsFilter
+from app.domain.interfaces.embeddings import EmbeddingService, SparseTextEncoder
+from app.domain.interfaces.language_models import LanguageModel
+from app.domain.interfaces.law_acts import LawActsIndex
+from app.domain.services.answer_context import (
+    CONTEXT_PAYLOAD_FIELDS,
+    build_answer_prompt,
+    merge_context_hits,
+    pack_context,
+)
+from app.domain.services.search import SearchStageTimings, search_law_acts
+from app.shared.enums import AnswerStage
+
+NO_SOURCES_ANSWER = "Nie znaleziono przepisów, na podstawie których można odpowiedzieć na to pytanie."
+
+
+@dataclass
+class AnswerQuestion:
+    """Answer a question with a language model, grounded in the law acts fragments found for it.
+
+    Found chunks are merged per article and packed into the token budget of the context, the sources are
+    yielded before the first fragment of the answer, so they can be shown while the model generates it.
+    """
+
+    law_acts_repository: LawActsIndex
+    embedding_service: EmbeddingService
+    language_model: LanguageModel
+    question: str
+    filters: LawActsFilter
+    rerank: bool
+    retrieval_limit: int
+    context_token_budget: int
+    max_answer_tokens: int
+    timings: SearchStageTimings = field(default_factory=SearchStageTimings)
+    sparse_encoder: Optional[SparseTextEncoder] = None
+
+    async def stream(self) -> AsyncIterator[tuple[AnswerStage, list[ContextPassage] | str]]:
+        hits = await search_law_acts(
+            self.law_acts_repository,
+            self.embedding_service,
+            self.question,
+            self.filters,
+            self.retrieval_limit,
+            None,
+            CONTEXT_PAYLOAD_FIELDS,
+            self.rerank,
+            self.timings,
+            sparse_encoder=self.sparse_encoder,
+        )
+        with self.timings.measure("pack"):
+            passages = pack_context(merge_context_hits(hits), self.context_token_budget)
+        yield AnswerStage.SOURCES, passages
+
+        if not passages:
+            # The model is not asked without sources, it would answer from its own, unverifiable knowledge.
+            yield AnswerStage.DELTA, NO_SOURCES_ANSWER
+            return
+
+        prompt = build_answer_prompt(self.question, passages)
+        with self.timings.measure("generate"):
+            async for text in self.language_model.stream(prompt, self.max_answer_tokens):
+                yield AnswerStage.DELTA, text
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from redis.asyncio import Redis
+
+from app.domain.entities.law_acts import IngestionCheckpoint, IngestionReport, RelatedLawAct
+from app.domain.interfaces.embeddings import SparseTextEncoder, TextEncoder
+from app.domain.services.embedding_cache import EmbeddingCache
+from app.domain.services.law_acts_chunking import chunk_law_act
+from app.domain.services.law_acts_ingestion import ingest_law_acts
+from app.domain.services.search_cache import publish_collection_version
+from app.domain.services.suggestions import SuggestionIndex
+from app.infrastructure.enums import HotSetPrecision
+from app.infrastructure.law_acts.checkpoint import load_checkpoint, save_checkpoint
+from app.infrastructure.law_acts.sources import iterate_law_act_documents
+from app.infrastructure.relational_db.units_of_work.embeddings import EmbeddingsUnitOfWork
+from app.infrastructure.relational_db.units_of_work.law_acts import LawActsUnitOfWork
+from app.infrastructure.vector_db.hot_set import write_hot_set_index
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository, build_payload
+from app.shared.enums import ReferenceDirection
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IngestLawActs:
+    law_acts_repository: LawActsRepository
+    law_acts_unit_of_work: LawActsUnitOfWork
+    key_value_repo: Redis
+    encoder: TextEncoder
+    source: Path
+    checkpoint_path: Path
+    window_size: int
+    embedding_batch_size: int
+    upload_batch_size: int
+    upload_workers: int
+    max_chunk_length: int
+    embeddings_unit_of_work: Optional[EmbeddingsUnitOfWork] = None
+    sparse_encoder: Optional[SparseTextEncoder] = None
+
+    async def execute(self) -> IngestionReport:
+        source = str(self.source.resolve())
+        checkpoint = load_checkpoint(self.checkpoint_path)
+        if checkpoint is not None and checkpoint.source != source:
+            logger.warning(f"Checkpoint was saved for {checkpoint.source}, ingestion starts from the beginning.")
+            checkpoint = None
+        if checkpoint is None:
+            checkpoint = IngestionCheckpoint(source=source)
+        elif checkpoint.processed_documents:
+            logger.info(f"Resuming ingestion after {checkpoint.processed_documents} documents.")
+
+        try:
+            return await ingest_law_acts(
+                iterate_law_act_documents(self.source),
+                self.law_acts_repository,
+                self.law_acts_unit_of_work,
+                self.encoder,
+                checkpoint,
+                partial(save_checkpoint, self.checkpoint_path),
+                self.window_size,
+                self.embedding_batch_size,
+                self.upload_batch_size,
+                self.upload_workers,
+                self.max_chunk_length,
+                EmbeddingCache(self.embeddings_unit_of_work) if self.embeddings_unit_of_work else None,
+                SuggestionIndex(self.key_value_repo),
+                self.sparse_encoder,
+            )
+        finally:
+            # Also after a failure, chunks uploaded before it are already searchable.
+            collection_version = await publish_collection_version(
+                self.key_value_repo, self.law_acts_repository.collection_name
+            )
+            logger.info(f"Published version {collection_version} of {self.law_acts_repository.collection_name}.")
+
+
+@dataclass
+class BuildHotSetIndex:
+    law_acts_repository: LawActsRepository
+    encoder: TextEncoder
+    act_ids: frozenset[str]
+    directory: Path
+    precision: HotSetPrecision
+    source: Optional[Path]
+    batch_size: int
+    max_chunk_length: int
+
+    async def execute(self) -> int:
+        """Write hot set index of chunks of the acts, read from the vector database or embedded from a source."""
+        if self.source is None:
+            ids, vectors, payloads = await self._read_stored_chunks()
+        else:
+            ids, vectors, payloads = await self._embed_source_chunks()
+
+        if not ids:
+            logger.warning("No chunks of the hot set acts were found, index was not written.")
+            return 0
+        await asyncio.to_thread(write_hot_set_index, self.directory, ids, vectors, payloads, self.precision)
+        return len(ids)
+
+    async def _read_stored_chunks(self) -> tuple[list[str], np.ndarray, list[dict]]:
+        ids, vectors, payloads = [], [], []
+        async for point_id, vector, payload in self.law_acts_repository.iterate_points(self.act_ids, self.batch_size):
+            ids.append(point_id)
+            vectors.append(vector)
+            payloads.append(payload)
+        return ids, np.array(vectors, dtype=np.float32), payloads
+
+    async def _embed_source_chunks(self) -> tuple[list[str], np.ndarray, list[dict]]:
+        chunks = [
+            chunk
+            for document in iterate_law_act_documents(self.source)
+            if not self.act_ids or document.act_id in self.act_ids
+            for chunk in chunk_law_act(document, self.max_chunk_length)
+        ]
+        vectors = []
+        for offset in range(0, len(chunks), self.batch_size):
+            texts = [chunk.text for chunk in chunks[offset : offset + self.batch_size]]
+            vectors.append(await asyncio.to_thread(self.encoder.encode, texts))
+        vectors = np.vstack(vectors) if vectors else np.empty((0, self.encoder.dimension), dtype=np.float32)
+        return [chunk.id for chunk in chunks], vectors, [build_payload(chunk) for chunk in chunks]
+
+
+@dataclass
+class ListRelatedLawActs:
+    law_acts_unit_of_work: LawActsUnitOfWork
+    act_id: str
+    limit: int
+
+    async def execute(self) -> list[RelatedLawAct]:
+        async with self.law_acts_unit_of_work as uof:
+            related_acts = await uof.references.list_related(self.act_id, self.limit)
+        return [
+            RelatedLawAct(act_id=act_id, title=title, direction=ReferenceDirection(direction), references=references)
+            for act_id, title, direction, references in related_acts
+        ]
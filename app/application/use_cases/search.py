@@ -0,0 +1,225 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional, Sequence
+
+from app.domain.entities.law_acts import LawActHit, LawActsFilter, LawActSuggestion, SearchEvent, SearchPage
+from app.domain.interfaces.embeddings import EmbeddingService, SparseTextEncoder
+from app.domain.interfaces.law_acts import LawActsIndex
+from app.domain.services.search import SearchStageTimings, iterate_search_stages
+from app.domain.services.search_analytics import SearchAnalyticsBuffer
+from app.domain.services.search_cache import SearchResultCache
+from app.domain.services.search_cursor import SearchCursorStore
+from app.domain.services.suggestions import SuggestionIndex
+from app.infrastructure.relational_db.units_of_work.analytics import AnalyticsUnitOfWork
+from app.infrastructure.relational_db.units_of_work.law_acts import LawActsUnitOfWork
+from app.shared.enums import LawActPayloadField, SearchStage
+from app.shared.settings.search import search_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SearchLawActs:
+    law_acts_repository: LawActsIndex
+    embedding_service: EmbeddingService
+    search_result_cache: SearchResultCache
+    query: str
+    filters: LawActsFilter
+    limit: int
+    score_threshold: Optional[float]
+    payload_fields: Sequence[LawActPayloadField]
+    rerank: bool
+    timings: SearchStageTimings = field(default_factory=SearchStageTimings)
+    suggestion_index: Optional[SuggestionIndex] = None
+    law_acts_unit_of_work: Optional[LawActsUnitOfWork] = None
+    sparse_encoder: Optional[SparseTextEncoder] = None
+    analytics_buffer: Optional[SearchAnalyticsBuffer] = None
+
+    async def execute(self) -> list[LawActHit]:
+        hits = []
+        async for _, hits in self.stream():
+            pass
+        return hits
+
+    async def stream(self) -> AsyncIterator[tuple[SearchStage, list[LawActHit]]]:
+        if self.law_acts_unit_of_work is not None and search_settings.GRAPH_BOOST_WEIGHT > 0:
+            final_stage = SearchStage.BOOSTED
+        elif self.rerank:
+            final_stage = SearchStage.RERANKED
+        else:
+            final_stage = SearchStage.ANN
+
+        cache_key = None
+        try:
+            with self.timings.measure("cache"):
+                cache_key = await self.search_result_cache.build_key(
+                    self.query,
+                    self.filters,
+                    self.limit,
+                    self.score_threshold,
+                    self.payload_fields,
+                    self.rerank,
+                    hybrid=self.sparse_encoder is not None,
+                )
+                cached_hits = await self.search_result_cache.get(cache_key)
+        except Exception:
+            logger.warning("Search result cache is not available.", exc_info=True)
+            cached_hits = None
+        if cached_hits is not None:
+            yield final_stage, cached_hits
+            await self._record_popularity(cached_hits)
+            self._record_event(cached_hits, cached=True)
+            return
+
+        hits = []
+        async for stage, hits in iterate_search_stages(
+            self.law_acts_repository,
+            self.embedding_service,
+            self.query,
+            self.filters,
+            self.limit,
+            self.score_threshold,
+            self.payload_fields,
+            self.rerank,
+            self.timings,
+            self.law_acts_unit_of_work,
+            search_settings.GRAPH_BOOST_WEIGHT,
+            self.sparse_encoder,
+        ):
+            yield stage, hits
+
+        if cache_key is not None:
+            try:
+                search_seconds = sum(duration for stage, duration in self.timings.stages.items() if stage != "cache")
+                await self.search_result_cache.set(cache_key, hits, search_seconds)
+            except Exception:
+                logger.warning("Search result could not be cached.", exc_info=True)
+        await self._record_popularity(hits)
+        self._record_event(hits, cached=False)
+
+    async def _record_popularity(self, hits: list[LawActHit]):
+        if self.suggestion_index is None:
+            return
+        act_ids = [hit.payload[LawActPayloadField.ACT_ID] for hit in hits if LawActPayloadField.ACT_ID in hit.payload]
+        try:
+            await self.suggestion_index.record_popularity(act_ids)
+        except Exception:
+            logger.warning("Popularity of found acts could not be recorded.", exc_info=True)
+
+    def _record_event(self, hits: list[LawActHit], cached: bool):
+        if self.analytics_buffer is None:
+            return
+        self.analytics_buffer.record(
+            SearchEvent(
+                query=self.query,
+                filters=self.filters,
+                limit=self.limit,
+                score_threshold=self.score_threshold,
+                payload_fields=list(self.payload_fields),
+                rerank=self.rerank,
+                cached=cached,
+                latency_seconds=sum(self.timings.stages.values()),
+                result_ids=[hit.id for hit in hits],
+                searched_at=datetime.now(timezone.utc),
+            )
+        )
+
+
+@dataclass
+class OpenSearchCursor:
+    """Search once for all results which can be paged, return the first page and a cursor of the next ones."""
+
+    search_law_acts: SearchLawActs
+    search_cursor_store: SearchCursorStore
+    page_size: int
+
+    async def execute(self) -> SearchPage:
+        hits = await self.search_law_acts.execute()
+        pages = max(1, -(-len(hits) // self.page_size))
+        cursor = None
+        if pages > 1:
+            try:
+                cursor = await self.search_cursor_store.save(hits, self.search_law_acts.payload_fields, self.page_size)
+            except Exception:
+                logger.warning("Search cursor could not be saved.", exc_info=True)
+                pages = 1
+        return SearchPage(hits=hits[: self.page_size], cursor=cursor, page=1, pages=pages)
+
+
+@dataclass
+class GetSearchPage:
+    """Read a page of a snapshot of search results, payloads of its hits are fetched by ids in one request."""
+
+    law_acts_repository: LawActsIndex
+    search_cursor_store: SearchCursorStore
+    cursor: str
+    page: int
+
+    async def execute(self) -> SearchPage:
+        snapshot = await self.search_cursor_store.load(self.cursor)
+        start = (self.page - 1) * snapshot.page_size
+        page_ids = snapshot.ids[start : start + snapshot.page_size]
+        page_scores = snapshot.scores[start : start + snapshot.page_size]
+
+        hits = []
+        if page_ids:
+            retrieved_hits = await self.law_acts_repository.retrieve(page_ids, snapshot.payload_fields)
+            payloads = {hit.id: hit.payload for hit in retrieved_hits}
+            hits = [
+                LawActHit(id=hit_id, score=score, payload=payloads[hit_id])
+                for hit_id, score in zip(page_ids, page_scores)
+                if hit_id in payloads
+            ]
+        return SearchPage(hits=hits, cursor=self.cursor, page=self.page, pages=snapshot.pages)
+
+
+@dataclass
+class WarmUpSearchCaches:
+    """Replay the most frequent recent searches, so their results are cached before the first request."""
+
+    analytics_unit_of_work: AnalyticsUnitOfWork
+    law_acts_repository: LawActsIndex
+    embedding_service: EmbeddingService
+    search_result_cache: SearchResultCache
+    since: datetime
+    max_searches: int
+    law_acts_unit_of_work: Optional[LawActsUnitOfWork] = None
+    sparse_encoder: Optional[SparseTextEncoder] = None
+
+    async def execute(self) -> int:
+        async with self.analytics_unit_of_work as uof:
+            top_searches = await uof.search_events.list_top_searches(self.since, self.max_searches)
+
+        replayed_searches = 0
+        for top_search in top_searches:
+            search_law_acts = SearchLawActs(
+                self.law_acts_repository,
+                self.embedding_service,
+                self.search_result_cache,
+                top_search.query,
+                LawActsFilter(top_search.act_type, top_search.issuing_body, top_search.in_force_on),
+                top_search.result_limit,
+                top_search.score_threshold,
+                [LawActPayloadField(payload_field) for payload_field in top_search.payload_fields],
+                top_search.rerank,
+                law_acts_unit_of_work=self.law_acts_unit_of_work,
+                sparse_encoder=self.sparse_encoder,
+            )
+            try:
+                await search_law_acts.execute()
+            except Exception:
+                logger.warning(f"Search {top_search.query!r} could not be replayed.", exc_info=True)
+                continue
+            replayed_searches += 1
+        return replayed_searches
+
+
+@dataclass
+class SuggestLawActs:
+    suggestion_index: SuggestionIndex
+    prefix: str
+    limit: int
+
+    async def execute(self) -> list[LawActSuggestion]:
+        return await self.suggestion_index.suggest(self.prefix, self.limit)
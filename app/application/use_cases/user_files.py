@@ -1,7 +1,152 @@
+import logging
 from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional, Sequence
+
+from fastapi import UploadFile
+
+from app.domain.entities.user_files import UploadSession, UserFileHit
+from app.domain.interfaces.embeddings import EmbeddingService, TextEncoder
+from app.domain.interfaces.file_storage import StorageRepository
+from app.domain.services.embedding_cache import EmbeddingCache
+from app.domain.services.user_files import (
+    add_user_file,
+    create_upload_session,
+    finalize_upload_session,
+    sweep_orphaned_uploads,
+)
+from app.domain.services.user_files_indexing import index_pending_user_files
+from app.infrastructure.relational_db.schemas.users import UsersFiles
+from app.infrastructure.relational_db.units_of_work.embeddings import EmbeddingsUnitOfWork
+from app.infrastructure.relational_db.units_of_work.users import UsersUnitOfWork
+from app.infrastructure.vector_db.repositories.user_files import UserFilesIndexRepository
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class AddUserFile:
+    users_unit_of_work: UsersUnitOfWork
+    storage_repository: StorageRepository
+    user_file: UploadFile
+    user_id: str
+
+    async def execute(self):
+        await add_user_file(self.users_unit_of_work, self.user_file, self.user_id, self.storage_repository)
+
+
+@dataclass
+class CreateUploadSession:
+    users_unit_of_work: UsersUnitOfWork
+    storage_repository: StorageRepository
+    user_id: str
+    file_name: str
+    content_type: str
+    size: int
+    expires_in: int
+
+    async def execute(self) -> UploadSession:
+        return await create_upload_session(
+            self.users_unit_of_work,
+            self.storage_repository,
+            self.user_id,
+            self.file_name,
+            self.content_type,
+            self.size,
+            self.expires_in,
+        )
+
+
+@dataclass
+class FinalizeUploadSession:
+    users_unit_of_work: UsersUnitOfWork
+    storage_repository: StorageRepository
+    user_id: str
+    file_id: str
+    size: int
+    md5_hash: str
+
+    async def execute(self):
+        await finalize_upload_session(
+            self.users_unit_of_work, self.storage_repository, self.user_id, self.file_id, self.size, self.md5_hash
+        )
+
+
+@dataclass
+class ListUserFiles:
+    users_unit_of_work: UsersUnitOfWork
+    user_id: str
+
+    async def execute(self) -> Sequence[UsersFiles]:
+        async with self.users_unit_of_work as uow:
+            user_files = await uow.files.list_by_user(self.user_id)
+        return user_files
+
+
+@dataclass
+class SweepOrphanedUploads:
+    users_unit_of_work: UsersUnitOfWork
+    storage_repository: StorageRepository
+    pending_timeout: timedelta
 
     async def execute(self):
-        raise NotImplementedError
+        removed_uploads = await sweep_orphaned_uploads(
+            self.users_unit_of_work, self.storage_repository, self.pending_timeout
+        )
+        if removed_uploads:
+            logger.info(f"Removed {removed_uploads} orphaned uploads.")
+
+
+@dataclass
+class IndexUserFiles:
+    users_unit_of_work: UsersUnitOfWork
+    storage_repository: StorageRepository
+    user_files_index_repository: UserFilesIndexRepository
+    encoder: TextEncoder
+    batch_size: int
+    stale_timeout: timedelta
+    embedding_batch_size: int
+    max_chunk_length: int
+    max_file_size: int
+    max_unpacked_size: int
+    embeddings_unit_of_work: Optional[EmbeddingsUnitOfWork] = None
+
+    async def execute(self) -> int:
+        embedding_cache = EmbeddingCache(self.embeddings_unit_of_work) if self.embeddings_unit_of_work else None
+        indexing_statuses = await index_pending_user_files(
+            self.users_unit_of_work,
+            self.storage_repository,
+            self.user_files_index_repository,
+            self.encoder,
+            self.batch_size,
+            self.stale_timeout,
+            self.embedding_batch_size,
+            self.max_chunk_length,
+            self.max_file_size,
+            self.max_unpacked_size,
+            embedding_cache,
+        )
+        if indexing_statuses:
+            summary = ", ".join(f"{status}: {count}" for status, count in indexing_statuses.items())
+            if embedding_cache is not None:
+                summary += (
+                    f", embedding cache hits: {embedding_cache.stats.hits}, misses: {embedding_cache.stats.misses}"
+                )
+            logger.info(f"Processed user files for search ({summary}).")
+        return sum(indexing_statuses.values())
+
+
+@dataclass
+class SearchUserFiles:
+    user_files_index_repository: UserFilesIndexRepository
+    embedding_service: EmbeddingService
+    user_id: str
+    query: str
+    limit: int
+    score_threshold: Optional[float]
+
+    async def execute(self) -> list[UserFileHit]:
+        query_vector = await self.embedding_service.embed(self.query)
+        return await self.user_files_index_repository.search(
+            self.user_id, query_vector, self.limit, self.score_threshold
+        )
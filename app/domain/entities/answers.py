@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ContextPassage:
+    act_id: str
+    title: str
+    unit: str
+    text: str
+    score: float
+    chunk_ids: list[str] = field(default_factory=list)
+    tokens: int = 0
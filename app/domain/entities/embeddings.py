@@ -0,0 +1,7 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SparseVector:
+    indices: list[int] = field(default_factory=list)
+    values: list[float] = field(default_factory=list)
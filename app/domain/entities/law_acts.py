@@ -0,0 +1,113 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Optional
+
+from app.shared.enums import LawActPayloadField, ReferenceDirection
+
+
+@dataclass
+class LawActsFilter:
+    act_type: Optional[str] = None
+    issuing_body: Optional[str] = None
+    in_force_on: Optional[date] = None
+
+
+@dataclass
+class LawActHit:
+    id: str
+    score: float
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class LawActSuggestion:
+    act_id: str
+    title: str
+    citation: Optional[str]
+    popularity: float
+
+
+@dataclass
+class LawActDocument:
+    act_id: str
+    title: str
+    act_type: str
+    issuing_body: str
+    in_force_from: date
+    text: str
+    in_force_to: Optional[date] = None
+
+
+@dataclass
+class LawActChunk:
+    id: str
+    key: str
+    act: LawActDocument
+    unit: str
+    text: str
+    content_hash: str
+
+
+@dataclass
+class IngestionCheckpoint:
+    source: str
+    processed_documents: int = 0
+    uploaded_chunks: int = 0
+
+
+@dataclass
+class IngestionReport:
+    documents: int
+    chunks: int
+    elapsed_seconds: float
+    skipped_chunks: int = 0
+    deleted_chunks: int = 0
+    references: int = 0
+    embedding_cache_hits: int = 0
+    embedding_cache_misses: int = 0
+
+    @property
+    def chunks_per_second(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.chunks / self.elapsed_seconds
+
+
+@dataclass
+class LawActCitation:
+    """Reference found in text, to an act given by its journal position or by its kind and enactment date."""
+
+    target_unit: str
+    target_act_id: Optional[str] = None
+    act_type: Optional[str] = None
+    enacted_on: Optional[date] = None
+
+
+@dataclass
+class RelatedLawAct:
+    act_id: str
+    title: Optional[str]
+    direction: ReferenceDirection
+    references: int
+
+
+@dataclass
+class SearchPage:
+    hits: list[LawActHit]
+    cursor: Optional[str]
+    page: int
+    pages: int
+
+
+@dataclass
+class SearchEvent:
+    query: str
+    filters: LawActsFilter
+    limit: int
+    score_threshold: Optional[float]
+    payload_fields: list[LawActPayloadField]
+    rerank: bool
+    cached: bool
+    latency_seconds: float
+    result_ids: list[str]
+    searched_at: datetime
@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class UploadTarget:
+    url: str
+    method: str
+    expires_at: datetime
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class UploadSession:
+    file_id: str
+    upload_target: UploadTarget
+
+
+@dataclass
+class StoredFileMetadata:
+    size: int
+    md5_hash: str
+
+
+@dataclass
+class FilesPage:
+    file_names: list[str]
+    next_page_token: Optional[str]
+
+
+@dataclass
+class UserFileChunk:
+    id: str
+    file_id: str
+    user_id: str
+    file_name: str
+    number: int
+    text: str
+
+
+@dataclass
+class UserFileHit:
+    file_id: str
+    file_name: str
+    chunk_number: int
+    text: str
+    score: float
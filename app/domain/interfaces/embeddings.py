@@ -0,0 +1,23 @@
+from typing import Protocol, Sequence
+
+import numpy as np
+
+from app.domain.entities.embeddings import SparseVector
+
+
+class TextEncoder(Protocol):
+    dimension: int
+    # Identifies the model and its version, vectors of different models are never mixed in the embedding cache.
+    model_id: str
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray: ...
+
+
+class EmbeddingService(Protocol):
+    async def embed(self, text: str) -> list[float]: ...
+
+
+class SparseTextEncoder(Protocol):
+    def encode_documents(self, texts: Sequence[str]) -> list[SparseVector]: ...
+
+    def encode_query(self, text: str) -> SparseVector: ...
@@ -1,15 +1,36 @@
-from typing import List, Optional, Protocol
+from typing import AsyncIterator, Optional, Protocol
 
 from fastapi import UploadFile
 
+from app.domain.entities.user_files import FilesPage, StoredFileMetadata, UploadTarget
+
 
 class StorageRepository(Protocol):
-    async def upload_file(self, file_bytes: UploadFile, file_name: str) -> str: ...
+    async def upload_file(
+        self,
+        file_bytes: UploadFile,
+        file_name: str,
+        content_type: Optional[str] = None,
+    ) -> str: ...
+
+    async def move_file(self, source_file_name: str, target_file_name: str) -> None: ...
 
     async def delete_file(self, file_name: str) -> None: ...
 
     async def get_file(self, file_name: str) -> bytes: ...
 
+    async def get_file_head(self, file_name: str, length: int) -> bytes: ...
+
+    async def get_file_metadata(self, file_name: str) -> Optional[StoredFileMetadata]: ...
+
+    async def create_upload_target(
+        self,
+        file_name: str,
+        content_type: str,
+        size: int,
+        expires_in: int,
+    ) -> UploadTarget: ...
+
     async def get_file_url(
         self,
         file_name: str,
@@ -17,7 +38,9 @@ class StorageRepository(Protocol):
         expires_in: Optional[int] = None,
     ) -> str: ...
 
-    async def list_files(
+    def list_files(
         self,
         prefix: Optional[str] = None,
-    ) -> List[str]: ...
+        page_token: Optional[str] = None,
+        max_results: Optional[int] = None,
+    ) -> AsyncIterator[FilesPage]: ...
@@ -0,0 +1,7 @@
+from typing import AsyncIterator, Protocol
+
+
+class LanguageModel(Protocol):
+    def stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]: ...
+
+    async def close(self): ...
@@ -0,0 +1,19 @@
+from typing import Optional, Protocol, Sequence
+
+from app.domain.entities.embeddings import SparseVector
+from app.domain.entities.law_acts import LawActHit, LawActsFilter
+from app.shared.enums import LawActPayloadField
+
+
+class LawActsIndex(Protocol):
+    async def search(
+        self,
+        vector: Sequence[float],
+        filters: LawActsFilter,
+        limit: int,
+        score_threshold: Optional[float] = None,
+        payload_fields: Sequence[LawActPayloadField] = (),
+        sparse_vector: Optional[SparseVector] = None,
+    ) -> list[LawActHit]: ...
+
+    async def retrieve(self, ids: Sequence[str], payload_fields: Sequence[LawActPayloadField]) -> list[LawActHit]: ...
@@ -0,0 +1,128 @@
+import re
+from typing import Sequence
+
+from app.domain.entities.answers import ContextPassage
+from app.domain.entities.law_acts import LawActHit
+from app.domain.services.law_acts_chunking import PREAMBLE_UNIT
+from app.domain.services.text import collapse_whitespace
+from app.shared.enums import LawActPayloadField
+
+CONTEXT_PAYLOAD_FIELDS = [
+    LawActPayloadField.ACT_ID,
+    LawActPayloadField.TITLE,
+    LawActPayloadField.UNIT,
+    LawActPayloadField.TEXT,
+]
+# Polish words are split into more tokens than English ones, so the estimate is on the safe side.
+CHARS_PER_TOKEN = 3
+ARTICLE_UNIT_PATTERN = re.compile(rf"^(?:art\. \d+[a-z]*|{PREAMBLE_UNIT})")
+NUMBER_PATTERN = re.compile(r"(\d+)")
+# Shorter common fragments of consecutive parts are taken as a coincidence, not an overlap.
+MIN_OVERLAP_LENGTH = 20
+ANSWER_INSTRUCTION = (
+    "Odpowiedz na pytanie wyłącznie na podstawie poniższych przepisów. Po każdym twierdzeniu podaj w nawiasie "
+    "kwadratowym numer przepisu, na którym się opiera, np. [1]. Jeśli przepisy nie wystarczają do odpowiedzi, "
+    "napisz to wprost."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def get_article_unit(unit: str) -> str:
+    """Article of a chunk unit, e.g. `art. 5` of `art. 5 § 2-§ 4`, other units are returned unchanged."""
+    match = ARTICLE_UNIT_PATTERN.match(unit)
+    return match.group() if match else unit
+
+
+def merge_context_hits(hits: Sequence[LawActHit]) -> list[ContextPassage]:
+    """Merge found chunks of the same article into one passage, in the order of the article text.
+
+    Chunks with text equal to a better scored one (the same provision in another act) or contained in another
+    chunk of the article are dropped, overlapping ends of consecutive parts are joined once. Passages are
+    ordered by the best score of their chunks.
+    """
+    articles: dict[tuple[str, str], list[LawActHit]] = {}
+    seen_texts = set()
+    for hit in sorted(hits, key=lambda hit: hit.score, reverse=True):
+        text = collapse_whitespace(hit.payload.get(LawActPayloadField.TEXT, ""))
+        if not text or text in seen_texts:
+            continue
+        seen_texts.add(text)
+        article_key = (hit.payload.get(LawActPayloadField.ACT_ID, ""), get_article_unit(_get_unit(hit)))
+        articles.setdefault(article_key, []).append(hit)
+
+    passages = []
+    for (act_id, article_unit), article_hits in articles.items():
+        parts = sorted(article_hits, key=lambda hit: _get_natural_sort_key(_get_unit(hit)))
+        texts = [collapse_whitespace(part.payload[LawActPayloadField.TEXT]) for part in parts]
+        kept_parts = [
+            (part, text)
+            for part_number, (part, text) in enumerate(zip(parts, texts))
+            if not _is_contained(texts, part_number)
+        ]
+        passages.append(
+            ContextPassage(
+                act_id=act_id,
+                title=article_hits[0].payload.get(LawActPayloadField.TITLE, ""),
+                unit=article_unit,
+                text=_join_parts([text for _, text in kept_parts]),
+                score=article_hits[0].score,
+                chunk_ids=[part.id for part, _ in kept_parts],
+            )
+        )
+    return passages
+
+
+def pack_context(passages: Sequence[ContextPassage], token_budget: int) -> list[ContextPassage]:
+    """Take passages in order while they fit in the budget, a passage which does not fit is skipped for smaller ones."""
+    packed_passages = []
+    remaining_tokens = token_budget
+    for passage in passages:
+        passage.tokens = estimate_tokens(passage.text)
+        if passage.tokens <= remaining_tokens:
+            packed_passages.append(passage)
+            remaining_tokens -= passage.tokens
+    return packed_passages
+
+
+def build_answer_prompt(question: str, passages: Sequence[ContextPassage]) -> str:
+    sources = "\n\n".join(
+        f"[{number}] {passage.title}, {passage.unit}\n{passage.text}"
+        for number, passage in enumerate(passages, start=1)
+    )
+    return f"{ANSWER_INSTRUCTION}\n\nPrzepisy:\n{sources}\n\nPytanie: {question}"
+
+
+def _get_unit(hit: LawActHit) -> str:
+    return hit.payload.get(LawActPayloadField.UNIT, "")
+
+
+def _get_natural_sort_key(unit: str) -> list[str | int]:
+    # Numbers are compared as numbers, so `ust. 10` comes after `ust. 2`.
+    return [int(part) if part.isdigit() else part for part in NUMBER_PATTERN.split(unit)]
+
+
+def _is_contained(texts: Sequence[str], text_number: int) -> bool:
+    return any(texts[text_number] in text for number, text in enumerate(texts) if number != text_number)
+
+
+def _join_parts(texts: Sequence[str]) -> str:
+    joined_text = ""
+    for text in texts:
+        remaining_text = text[_find_overlap_length(joined_text, text) :].lstrip()
+        joined_text = f"{joined_text}\n{remaining_text}" if joined_text else text
+    return joined_text
+
+
+def _find_overlap_length(previous_text: str, next_text: str) -> int:
+    """Length of the longest end of `previous_text` which starts `next_text`, at least `MIN_OVERLAP_LENGTH` long."""
+    if len(next_text) < MIN_OVERLAP_LENGTH:
+        return 0
+    overlap_start = previous_text.find(next_text[:MIN_OVERLAP_LENGTH])
+    while overlap_start != -1:
+        if next_text.startswith(previous_text[overlap_start:]):
+            return len(previous_text) - overlap_start
+        overlap_start = previous_text.find(next_text[:MIN_OVERLAP_LENGTH], overlap_start + 1)
+    return 0
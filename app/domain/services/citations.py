@@ -0,0 +1,149 @@
+import re
+from datetime import date
+from typing import Iterable, Optional
+
+from app.domain.entities.law_acts import LawActCitation, LawActHit
+from app.shared.enums import LawActPayloadField
+
+GENITIVE_MONTHS = {
+    "stycznia": 1,
+    "lutego": 2,
+    "marca": 3,
+    "kwietnia": 4,
+    "maja": 5,
+    "czerwca": 6,
+    "lipca": 7,
+    "sierpnia": 8,
+    "września": 9,
+    "października": 10,
+    "listopada": 11,
+    "grudnia": 12,
+}
+ACT_TYPE_STEMS = {"ustaw": "ustawa", "rozporządze": "rozporządzenie", "obwieszcze": "obwieszczenie"}
+JOURNAL_ACT_ID_PREFIXES = {"dz": "DU", "m": "MP"}
+
+_MONTHS = "|".join(GENITIVE_MONTHS)
+ENACTMENT_DATE_PATTERN = re.compile(rf"\bz\s+dnia\s+(\d{{1,2}})\s+({_MONTHS})\s+(\d{{4}})\s*r\.", re.IGNORECASE)
+# `art. 5 ust. 2 ustawy z dnia 23 kwietnia 1964 r.`, the issuing body of a regulation may come before the date.
+DATED_ACT_PATTERN = re.compile(
+    rf"(?:\bart\.\s*(\d+[a-z]*)(?:\s*(?:§|ust\.|pkt)\s*\d+[a-z]*)*\s+)?"
+    rf"\b({'|'.join(ACT_TYPE_STEMS)})\w*(?:\s+[^\s()]+){{0,12}}?\s+"
+    rf"z\s+dnia\s+(\d{{1,2}})\s+({_MONTHS})\s+(\d{{4}})\s*r\.",
+    re.IGNORECASE,
+)
+# `Dz. U. z 2023 r. poz. 1610 i 1615` and the older `Dz. U. z 1964 r. Nr 16, poz. 93`.
+JOURNAL_PATTERN = re.compile(
+    r"\b(Dz|M)\.\s?[UP]\.\s*(?:z\s*)?(\d{4})\s*(?:r\.)?\s*,?\s*(?:Nr\s*\d+\s*,?\s*)?"
+    r"poz\.\s*(\d+(?:\s*(?:,|i)\s*\d+)*)"
+)
+POSITIONS_SEPARATOR_PATTERN = re.compile(r"\s*(?:,|i)\s*")
+# Journal position of a dated act follows its name in parentheses, e.g. `z dnia ... r. - Kodeks cywilny (Dz. U.`.
+MAX_DATED_ACT_TO_JOURNAL_DISTANCE = 300
+
+
+def parse_enactment_date(text: str) -> Optional[date]:
+    """Date of enactment from a title, e.g. `Ustawa z dnia 23 kwietnia 1964 r. - Kodeks cywilny`."""
+    match = ENACTMENT_DATE_PATTERN.search(text)
+    if match is None:
+        return None
+    day, month, year = match.groups()
+    return _to_date(day, month, year)
+
+
+def extract_citations(text: str) -> list[LawActCitation]:
+    """Find references to other acts, by their journal positions or by their kinds and dates of enactment.
+
+    A dated act followed by its journal position is resolved to the journal act id. Citations without journal
+    positions have only the act type and date, they are resolved with the catalog of ingested acts. References
+    to articles of the same act (`art. 5 § 2`) are not citations.
+    """
+    citations = []
+    journal_matches = list(JOURNAL_PATTERN.finditer(text))
+    journal_match_number = 0
+
+    for dated_match in DATED_ACT_PATTERN.finditer(text):
+        article, act_type_stem, day, month, year = dated_match.groups()
+        target_unit = f"art. {article.lower()}" if article else ""
+        while journal_match_number < len(journal_matches) and (
+            journal_matches[journal_match_number].start() < dated_match.end()
+        ):
+            citations.extend(_journal_citations(journal_matches[journal_match_number], ""))
+            journal_match_number += 1
+
+        if journal_match_number < len(journal_matches):
+            journal_match = journal_matches[journal_match_number]
+            if _is_journal_of_dated_act(text[dated_match.end() : journal_match.start()]):
+                # Only the first position is the cited act, the following ones are its amendments.
+                journal_citations = _journal_citations(journal_match, "")
+                journal_citations[0].target_unit = target_unit
+                citations.extend(journal_citations)
+                journal_match_number += 1
+                continue
+
+        enacted_on = _to_date(day, month, year)
+        if enacted_on is not None:
+            citations.append(
+                LawActCitation(
+                    target_unit=target_unit,
+                    act_type=ACT_TYPE_STEMS[act_type_stem.lower()],
+                    enacted_on=enacted_on,
+                )
+            )
+
+    for journal_match in journal_matches[journal_match_number:]:
+        citations.extend(_journal_citations(journal_match, ""))
+    return citations
+
+
+def boost_connected_hits(hits: list[LawActHit], edges: Iterable[tuple[str, str]], weight: float) -> list[LawActHit]:
+    """Add to scores of hits the share of other found acts connected to their act by a citation.
+
+    Acts cited by, or citing, many of the other results are central to the query, so they move up. The boost
+    is at most `weight`, scores of hits from acts without connections are not changed.
+    """
+    act_ids = {hit.payload.get(LawActPayloadField.ACT_ID) for hit in hits} - {None}
+    if len(act_ids) < 2 or not weight:
+        return hits
+
+    neighbours: dict[str, set[str]] = {}
+    for source_act_id, target_act_id in edges:
+        if source_act_id != target_act_id and {source_act_id, target_act_id} <= act_ids:
+            neighbours.setdefault(source_act_id, set()).add(target_act_id)
+            neighbours.setdefault(target_act_id, set()).add(source_act_id)
+
+    boosted_hits = [
+        LawActHit(
+            id=hit.id,
+            score=hit.score
+            + weight * len(neighbours.get(hit.payload.get(LawActPayloadField.ACT_ID), ())) / (len(act_ids) - 1),
+            payload=hit.payload,
+        )
+        for hit in hits
+    ]
+    boosted_hits.sort(key=lambda hit: hit.score, reverse=True)
+    return boosted_hits
+
+
+def _journal_citations(journal_match: re.Match, target_unit: str) -> list[LawActCitation]:
+    journal, year, positions = journal_match.groups()
+    act_id_prefix = JOURNAL_ACT_ID_PREFIXES[journal.lower()]
+    return [
+        LawActCitation(target_unit=target_unit, target_act_id=f"{act_id_prefix}/{year}/{position}")
+        for position in POSITIONS_SEPARATOR_PATTERN.split(positions.strip())
+    ]
+
+
+def _is_journal_of_dated_act(text_between: str) -> bool:
+    return (
+        len(text_between) <= MAX_DATED_ACT_TO_JOURNAL_DISTANCE
+        and "(" in text_between
+        and ")" not in text_between
+        and "\n" not in text_between
+    )
+
+
+def _to_date(day: str, month: str, year: str) -> Optional[date]:
+    try:
+        return date(int(year), GENITIVE_MONTHS[month.lower()], int(day))
+    except ValueError:
+        return None
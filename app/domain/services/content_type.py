@@ -0,0 +1,49 @@
+SNIFF_LENGTH = 512
+
+OCTET_STREAM_CONTENT_TYPE = "application/octet-stream"
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+MAGIC_SIGNATURES = (
+    (b"%PDF-", "application/pdf"),
+    (b"{\\rtf", "application/rtf"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "application/msword"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x1f\x8b", "application/gzip"),
+    (b"MZ", "application/x-msdownload"),
+    (b"\x7fELF", "application/x-executable"),
+)
+ZIP_SIGNATURE = b"PK\x03\x04"
+UTF8_BOM = b"\xef\xbb\xbf"
+TEXT_CONTROL_CHARACTERS = frozenset(b"\t\n\r\f\x1b")
+
+
+def sniff_content_type(file_head: bytes) -> str:
+    """Detect content type from the first bytes of a file.
+
+    Only the leading bytes are inspected, so it can be used on the first chunk of a stream.
+    Unknown binary content is reported as `application/octet-stream`.
+    """
+    for signature, content_type in MAGIC_SIGNATURES:
+        if file_head.startswith(signature):
+            return content_type
+
+    if file_head.startswith(ZIP_SIGNATURE):
+        if b"word/" in file_head or b"[Content_Types].xml" in file_head:
+            return DOCX_CONTENT_TYPE
+        return "application/zip"
+
+    if not _is_text(file_head):
+        return OCTET_STREAM_CONTENT_TYPE
+
+    text_head = file_head.removeprefix(UTF8_BOM).lstrip().lower()
+    if text_head.startswith(b"<?xml"):
+        return "application/xml"
+    if text_head.startswith((b"<!doctype html", b"<html")):
+        return "text/html"
+    return "text/plain"
+
+
+def _is_text(file_head: bytes) -> bool:
+    # Legacy encodings (e.g. cp1250) are common in law documents, so UTF-8 validity is not required.
+    return not any(byte < 0x20 and byte not in TEXT_CONTROL_CHARACTERS for byte in file_head)
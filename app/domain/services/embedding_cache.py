@@ -0,0 +1,103 @@
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.domain.interfaces.embeddings import TextEncoder
+from app.domain.services.text import collapse_whitespace
+from app.infrastructure.relational_db.units_of_work.embeddings import EmbeddingsUnitOfWork
+from app.shared.metrics import metrics_registry
+
+VECTOR_DTYPE = np.dtype("<f4")
+# Keeps number of bound parameters of a single insert far below the Postgres limit.
+CACHE_WRITE_BATCH_SIZE = 1000
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class EmbeddingCache:
+    """Persistent cache of embeddings keyed by model id and SHA-256 of the text with collapsed whitespace.
+
+    The same paragraphs are repeated in act versions, consolidated texts and uploaded copies of public documents,
+    with the cache every one of them is encoded once per model. Statistics are counted from the cache creation,
+    so one cache is created for every ingestion or indexing run.
+    """
+
+    def __init__(self, embeddings_unit_of_work: EmbeddingsUnitOfWork):
+        self.embeddings_unit_of_work = embeddings_unit_of_work
+        self.stats = EmbeddingCacheStats()
+        self._hits = metrics_registry.counter("embedding_cache_lookups_total", result="hit")
+        self._misses = metrics_registry.counter("embedding_cache_lookups_total", result="miss")
+
+    async def encode(self, texts: Sequence[str], encoder: TextEncoder, embedding_batch_size: int) -> np.ndarray:
+        if not texts:
+            return np.empty((0, encoder.dimension), dtype=np.float32)
+        # Whitespace is collapsed only for keys, texts are encoded as given, like without the cache.
+        text_hashes = [get_text_hash(collapse_whitespace(text)) for text in texts]
+
+        async with self.embeddings_unit_of_work as uow:
+            cached_vectors = await uow.cache.get_many(encoder.model_id, list(set(text_hashes)))
+        vectors_by_hash = {
+            text_hash: np.frombuffer(vector, dtype=VECTOR_DTYPE)
+            for text_hash, vector in cached_vectors.items()
+            if len(vector) == encoder.dimension * VECTOR_DTYPE.itemsize
+        }
+
+        # Texts repeated in one call are encoded once, in their first form.
+        missing_texts: dict[bytes, str] = {}
+        for text_hash, text in zip(text_hashes, texts):
+            if text_hash not in vectors_by_hash:
+                missing_texts.setdefault(text_hash, text)
+        misses = sum(text_hash in missing_texts for text_hash in text_hashes)
+        self._count_lookups(len(texts) - misses, misses)
+
+        if missing_texts:
+            missing_vectors = await encode_in_batches(list(missing_texts.values()), encoder, embedding_batch_size)
+            vectors_by_hash.update(zip(missing_texts, missing_vectors))
+            await self._store(encoder.model_id, list(missing_texts), missing_vectors)
+
+        return np.vstack([vectors_by_hash[text_hash] for text_hash in text_hashes]).astype(np.float32, copy=False)
+
+    async def _store(self, model_id: str, text_hashes: list[bytes], vectors: np.ndarray):
+        entries_data = [
+            {"model_id": model_id, "text_hash": text_hash, "vector": vector.astype(VECTOR_DTYPE).tobytes()}
+            for text_hash, vector in zip(text_hashes, vectors)
+        ]
+        async with self.embeddings_unit_of_work as uow:
+            for offset in range(0, len(entries_data), CACHE_WRITE_BATCH_SIZE):
+                await uow.cache.add_many(entries_data[offset : offset + CACHE_WRITE_BATCH_SIZE])
+
+    def _count_lookups(self, hits: int, misses: int):
+        self.stats.hits += hits
+        self.stats.misses += misses
+        self._hits.inc(hits)
+        self._misses.inc(misses)
+
+
+def get_text_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode()).digest()
+
+
+async def encode_texts(
+    texts: Sequence[str],
+    encoder: TextEncoder,
+    embedding_batch_size: int,
+    embedding_cache: Optional[EmbeddingCache] = None,
+) -> np.ndarray:
+    if embedding_cache is None:
+        return await encode_in_batches(texts, encoder, embedding_batch_size)
+    return await embedding_cache.encode(texts, encoder, embedding_batch_size)
+
+
+async def encode_in_batches(texts: Sequence[str], encoder: TextEncoder, embedding_batch_size: int) -> np.ndarray:
+    batches = []
+    for offset in range(0, len(texts), embedding_batch_size):
+        # Encoding is CPU bound, it runs in a thread to not block the event loop.
+        batches.append(await asyncio.to_thread(encoder.encode, texts[offset : offset + embedding_batch_size]))
+    return np.vstack(batches)
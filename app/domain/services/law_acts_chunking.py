@@ -0,0 +1,142 @@
+import hashlib
+import json
+import re
+from typing import Iterator, Optional
+from uuid import uuid5
+
+from app.domain.entities.law_acts import LawActChunk, LawActDocument
+from app.shared.consts import LAW_ACT_CHUNKS_NAMESPACE
+
+ARTICLE_PATTERN = re.compile(r"^[ \t]*Art\.[ \t]*(\d+[a-z]*)\.[ \t]*", re.MULTILINE)
+PARAGRAPH_PATTERN = re.compile(r"^[ \t]*(?:§[ \t]*(\d+[a-z]*)\.|(\d+[a-z]*)\.[ \t])", re.MULTILINE)
+PREAMBLE_UNIT = "preambuła"
+
+
+def chunk_law_act(document: LawActDocument, max_chunk_length: int) -> Iterator[LawActChunk]:
+    """Split law act along the structure of Polish statutes.
+
+    Every article (`Art. 12.`) becomes one chunk, articles longer than `max_chunk_length` are split into groups
+    of consecutive paragraphs (`§ 1.`) or sections (`1.`, ustęp). Chunk keys are built from the act id and the
+    unit label, so they do not change when the act is ingested again.
+    """
+    unit_occurrences: dict[str, int] = {}
+    for article_number, article_text in _split_articles(document.text):
+        article_unit = f"art. {article_number}" if article_number else PREAMBLE_UNIT
+        if len(article_text) <= max_chunk_length:
+            units = [(article_unit, article_text)]
+        else:
+            units = [
+                (f"{article_unit} {unit_suffix}".strip(), text)
+                for unit_suffix, text in _group_paragraphs(article_text, max_chunk_length)
+            ]
+
+        for unit, text in units:
+            # Repeated numbering (e.g. an amended article quoted in full) would otherwise overwrite earlier chunks.
+            occurrence = unit_occurrences.get(unit, 0) + 1
+            unit_occurrences[unit] = occurrence
+            if occurrence > 1:
+                unit = f"{unit} ({occurrence})"
+            yield _create_chunk(document, unit, text)
+
+
+def get_chunk_key(act_id: str, unit: str) -> str:
+    return f"{act_id}#{unit}"
+
+
+def get_chunk_content_hash(document: LawActDocument, unit: str, text: str) -> str:
+    """Hash of everything stored for a chunk, amended metadata (e.g. repeal date) also changes it."""
+    content = [
+        unit,
+        text,
+        document.title,
+        document.act_type,
+        document.issuing_body,
+        document.in_force_from.isoformat(),
+        document.in_force_to.isoformat() if document.in_force_to else None,
+    ]
+    return hashlib.sha256(json.dumps(content, ensure_ascii=False).encode()).hexdigest()
+
+
+def _create_chunk(document: LawActDocument, unit: str, text: str) -> LawActChunk:
+    key = get_chunk_key(document.act_id, unit)
+    return LawActChunk(
+        id=str(uuid5(LAW_ACT_CHUNKS_NAMESPACE, key)),
+        key=key,
+        act=document,
+        unit=unit,
+        text=text,
+        content_hash=get_chunk_content_hash(document, unit, text),
+    )
+
+
+def _split_articles(text: str) -> Iterator[tuple[Optional[str], str]]:
+    matches = list(ARTICLE_PATTERN.finditer(text))
+    preamble = text[: matches[0].start() if matches else len(text)].strip()
+    if preamble:
+        yield None, preamble
+
+    for match, next_match in zip(matches, matches[1:] + [None]):
+        end = next_match.start() if next_match else len(text)
+        article_text = text[match.start() : end].strip()
+        if article_text:
+            yield match.group(1), article_text
+
+
+def _split_paragraphs(article_text: str) -> list[tuple[Optional[str], str]]:
+    # Article header is removed first, so a section starting in the header line ("Art. 5. 1. ...") is found too.
+    body = ARTICLE_PATTERN.sub("", article_text, count=1)
+    matches = list(PARAGRAPH_PATTERN.finditer(body))
+    if not matches:
+        return [(None, body.strip())]
+
+    paragraphs = []
+    introduction = body[: matches[0].start()].strip()
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(body)
+        paragraph_text = body[match.start() : end].strip()
+        if index == 0 and introduction:
+            paragraph_text = f"{introduction}\n{paragraph_text}"
+        label = f"§ {match.group(1)}" if match.group(1) else f"ust. {match.group(2)}"
+        paragraphs.append((label, paragraph_text))
+    return paragraphs
+
+
+def _group_paragraphs(article_text: str, max_chunk_length: int) -> Iterator[tuple[str, str]]:
+    group: list[tuple[Optional[str], str]] = []
+    group_length = 0
+    for label, text in _split_paragraphs(article_text):
+        if group and group_length + len(text) > max_chunk_length:
+            yield _label_group(group), "\n".join(text for _, text in group)
+            group, group_length = [], 0
+
+        if len(text) > max_chunk_length:
+            for part_number, part in enumerate(split_long_text(text, max_chunk_length), start=1):
+                yield f"{label or ''} część {part_number}".strip(), part
+            continue
+
+        group.append((label, text))
+        group_length += len(text) + 1
+
+    if group:
+        yield _label_group(group), "\n".join(text for _, text in group)
+
+
+def _label_group(group: list[tuple[Optional[str], str]]) -> str:
+    first_label, last_label = group[0][0], group[-1][0]
+    if first_label is None:
+        return ""
+    if first_label == last_label:
+        return first_label
+    return f"{first_label}-{last_label.split(' ')[-1]}"
+
+
+def split_long_text(text: str, max_chunk_length: int) -> Iterator[str]:
+    start = 0
+    while start < len(text):
+        end = start + max_chunk_length
+        if end < len(text):
+            split_position = text.rfind(" ", start, end)
+            if split_position > start:
+                end = split_position
+        yield text[start:end].strip()
+        start = end
@@ -0,0 +1,210 @@
+import logging
+import time
+from datetime import date
+from typing import Callable, Iterable, Optional
+
+from app.domain.entities.law_acts import IngestionCheckpoint, IngestionReport, LawActChunk, LawActDocument
+from app.domain.interfaces.embeddings import SparseTextEncoder, TextEncoder
+from app.domain.services.citations import extract_citations, parse_enactment_date
+from app.domain.services.embedding_cache import EmbeddingCache, encode_texts
+from app.domain.services.law_acts_chunking import chunk_law_act
+from app.domain.services.suggestions import SuggestionIndex
+from app.infrastructure.relational_db.units_of_work.law_acts import LawActsUnitOfWork
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_COLUMNS = ("source_act_id", "source_unit", "target_act_id", "target_unit")
+
+
+async def ingest_law_acts(
+    documents: Iterable[LawActDocument],
+    law_acts_repository: LawActsRepository,
+    law_acts_unit_of_work: LawActsUnitOfWork,
+    encoder: TextEncoder,
+    checkpoint: IngestionCheckpoint,
+    save_checkpoint: Callable[[IngestionCheckpoint], None],
+    window_size: int,
+    embedding_batch_size: int,
+    upload_batch_size: int,
+    upload_workers: int,
+    max_chunk_length: int,
+    embedding_cache: Optional[EmbeddingCache] = None,
+    suggestion_index: Optional[SuggestionIndex] = None,
+    sparse_encoder: Optional[SparseTextEncoder] = None,
+) -> IngestionReport:
+    """Chunk, embed and upload documents in windows of about `window_size` chunks.
+
+    Only one window is held in memory. Checkpoint is saved after every uploaded window, always on a document
+    boundary, so an interrupted run is resumed by skipping the documents which were already processed.
+    Chunks with content hash equal to the one in the manifest are skipped, chunks missing from the new version
+    of an act are deleted, so re-ingesting amended acts embeds only what has changed. Changed chunks with text
+    known from other acts are taken from `embedding_cache`, when it is given. Titles and citations of acts are
+    added to `suggestion_index` together with their chunks. Citations of other acts found in chunks replace
+    the stored references of their acts. With `sparse_encoder`, chunks are uploaded with sparse vectors of
+    their terms, for hybrid search.
+    """
+    await law_acts_repository.ensure_collection(encoder.dimension)
+
+    start_time = time.perf_counter()
+    report = IngestionReport(documents=0, chunks=0, elapsed_seconds=0.0)
+    # Only the last version of an act is kept, when it appears more than once in a window.
+    window: dict[str, list[LawActChunk]] = {}
+    window_chunks = 0
+    last_document_number = checkpoint.processed_documents
+
+    async def flush_window(document_number: int) -> IngestionCheckpoint:
+        uploaded_chunks, skipped_chunks, deleted_chunks = await _synchronize_acts(
+            window,
+            law_acts_repository,
+            law_acts_unit_of_work,
+            encoder,
+            embedding_batch_size,
+            upload_batch_size,
+            upload_workers,
+            embedding_cache,
+            sparse_encoder,
+        )
+        report.references += await _store_references(window, law_acts_unit_of_work)
+        if suggestion_index is not None:
+            await suggestion_index.add_acts([act_chunks[0].act for act_chunks in window.values() if act_chunks])
+        report.chunks += uploaded_chunks
+        report.skipped_chunks += skipped_chunks
+        report.deleted_chunks += deleted_chunks
+
+        window_checkpoint = IngestionCheckpoint(
+            source=checkpoint.source,
+            processed_documents=document_number,
+            uploaded_chunks=checkpoint.uploaded_chunks + uploaded_chunks,
+        )
+        save_checkpoint(window_checkpoint)
+        return window_checkpoint
+
+    for document_number, document in enumerate(documents, start=1):
+        if document_number <= checkpoint.processed_documents:
+            continue
+        window_chunks -= len(window.pop(document.act_id, []))
+        window[document.act_id] = list(chunk_law_act(document, max_chunk_length))
+        window_chunks += len(window[document.act_id])
+        report.documents += 1
+        last_document_number = document_number
+
+        if window_chunks >= window_size:
+            checkpoint = await flush_window(document_number)
+            window = {}
+            window_chunks = 0
+            chunks_per_second = report.chunks / (time.perf_counter() - start_time)
+            logger.info(
+                f"Ingested {checkpoint.processed_documents} documents, {checkpoint.uploaded_chunks} chunks, "
+                f"skipped {report.skipped_chunks} unchanged chunks, {chunks_per_second:.1f} chunks/s."
+            )
+
+    if window:
+        await flush_window(last_document_number)
+
+    report.elapsed_seconds = time.perf_counter() - start_time
+    if embedding_cache is not None:
+        report.embedding_cache_hits = embedding_cache.stats.hits
+        report.embedding_cache_misses = embedding_cache.stats.misses
+    return report
+
+
+async def _synchronize_acts(
+    acts_chunks: dict[str, list[LawActChunk]],
+    law_acts_repository: LawActsRepository,
+    law_acts_unit_of_work: LawActsUnitOfWork,
+    encoder: TextEncoder,
+    embedding_batch_size: int,
+    upload_batch_size: int,
+    upload_workers: int,
+    embedding_cache: Optional[EmbeddingCache],
+    sparse_encoder: Optional[SparseTextEncoder] = None,
+) -> tuple[int, int, int]:
+    """Upload changed chunks of acts and delete the removed ones, return numbers of uploaded, skipped and deleted."""
+    async with law_acts_unit_of_work as uof:
+        stored_chunks = await uof.chunks.list_by_acts(list(acts_chunks))
+    stored_hashes = {str(stored_chunk.id): stored_chunk.content_hash for stored_chunk in stored_chunks}
+
+    chunks = [chunk for act_chunks in acts_chunks.values() for chunk in act_chunks]
+    changed_chunks = [chunk for chunk in chunks if stored_hashes.get(chunk.id) != chunk.content_hash]
+    current_chunk_ids = {chunk.id for chunk in chunks}
+    removed_chunks = [stored_chunk for stored_chunk in stored_chunks if str(stored_chunk.id) not in current_chunk_ids]
+
+    # The manifest is updated last, after a failure chunks are uploaded again instead of being skipped.
+    if changed_chunks:
+        vectors = await encode_texts(
+            [chunk.text for chunk in changed_chunks], encoder, embedding_batch_size, embedding_cache
+        )
+        sparse_vectors = None
+        if sparse_encoder is not None:
+            sparse_vectors = sparse_encoder.encode_documents([chunk.text for chunk in changed_chunks])
+        await law_acts_repository.upload_chunks(
+            changed_chunks, vectors, upload_batch_size, upload_workers, sparse_vectors=sparse_vectors
+        )
+    if removed_chunks:
+        amended_act_ids = {removed_chunk.act_id for removed_chunk in removed_chunks}
+        await law_acts_repository.delete_stale_chunks(
+            {act_id: [chunk.id for chunk in acts_chunks[act_id]] for act_id in amended_act_ids}
+        )
+
+    async with law_acts_unit_of_work as uof:
+        if changed_chunks:
+            await uof.chunks.upsert_many(
+                [
+                    {"id": chunk.id, "act_id": chunk.act.act_id, "content_hash": chunk.content_hash}
+                    for chunk in changed_chunks
+                ]
+            )
+        if removed_chunks:
+            await uof.chunks.delete_many([str(removed_chunk.id) for removed_chunk in removed_chunks])
+
+    return len(changed_chunks), len(chunks) - len(changed_chunks), len(removed_chunks)
+
+
+async def _store_references(acts_chunks: dict[str, list[LawActChunk]], law_acts_unit_of_work: LawActsUnitOfWork) -> int:
+    """Add acts to the catalog and replace their references, return the number of stored references.
+
+    Citations by act type and enactment date are resolved only when exactly one act in the catalog matches,
+    acts ingested later are not resolved until the citing act is ingested again.
+    """
+    acts = [act_chunks[0].act for act_chunks in acts_chunks.values() if act_chunks]
+    chunks_citations = [
+        (chunk, citation)
+        for act_chunks in acts_chunks.values()
+        for chunk in act_chunks
+        for citation in extract_citations(chunk.text)
+    ]
+    enactments = {
+        (citation.act_type, citation.enacted_on) for _, citation in chunks_citations if citation.target_act_id is None
+    }
+
+    async with law_acts_unit_of_work as uof:
+        if acts:
+            await uof.acts.upsert_many(
+                [
+                    {
+                        "act_id": act.act_id,
+                        "title": act.title,
+                        "act_type": act.act_type,
+                        "enacted_on": parse_enactment_date(act.title),
+                    }
+                    for act in acts
+                ]
+            )
+        enacted_acts: dict[tuple[str, date], list[str]] = {}
+        if enactments:
+            for act_id, act_type, enacted_on in await uof.acts.list_by_enactment(list(enactments)):
+                enacted_acts.setdefault((act_type, enacted_on), []).append(act_id)
+
+        references: dict[tuple[str, str, str, str], dict[str, str]] = {}
+        for chunk, citation in chunks_citations:
+            if citation.target_act_id is not None:
+                target_act_ids = [citation.target_act_id]
+            else:
+                target_act_ids = enacted_acts.get((citation.act_type, citation.enacted_on), [])
+            if len(target_act_ids) != 1 or target_act_ids[0] == chunk.act.act_id:
+                continue
+            reference = (chunk.act.act_id, chunk.unit, target_act_ids[0], citation.target_unit)
+            references[reference] = dict(zip(REFERENCE_COLUMNS, reference))
+        await uof.references.replace_for_sources(list(acts_chunks), list(references.values()))
+    return len(references)
@@ -0,0 +1,81 @@
+import re
+from collections import Counter
+from typing import Sequence
+
+import numpy as np
+
+from app.domain.entities.law_acts import LawActHit
+from app.domain.services.text import fold_diacritics
+from app.shared.enums import LawActPayloadField
+from app.shared.settings.search import search_settings
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(fold_diacritics(text.lower()))
+
+
+def get_rerank_candidates_limit(limit: int) -> int:
+    """Number of ANN candidates fetched for reranking, to return `limit` results."""
+    candidates_limit = min(limit * search_settings.RERANK_CANDIDATES_PER_RESULT, search_settings.RERANK_MAX_CANDIDATES)
+    return max(candidates_limit, limit)
+
+
+def bm25_scores(query_terms: Sequence[str], documents: Sequence[Sequence[str]], k1: float, b: float) -> np.ndarray:
+    """Score tokenized documents against query terms with BM25.
+
+    Document frequencies are counted over the given documents only, so rare terms of the candidate set
+    (e.g. exact legal terms) are weighted the most.
+    """
+    query_terms = list(dict.fromkeys(query_terms))
+    if not documents or not query_terms:
+        return np.zeros(len(documents))
+
+    term_counts = [Counter(document) for document in documents]
+    term_frequencies = np.array(
+        [[counts.get(term, 0) for term in query_terms] for counts in term_counts], dtype=np.float64
+    )
+    document_lengths = np.array([len(document) for document in documents], dtype=np.float64)
+    average_length = document_lengths.mean() or 1.0
+
+    documents_number = len(documents)
+    document_frequencies = np.count_nonzero(term_frequencies, axis=0)
+    inverse_frequencies = np.log1p((documents_number - document_frequencies + 0.5) / (document_frequencies + 0.5))
+
+    length_norms = k1 * (1 - b + b * document_lengths / average_length)
+    saturated_frequencies = term_frequencies * (k1 + 1) / (term_frequencies + length_norms[:, np.newaxis])
+    return saturated_frequencies @ inverse_frequencies
+
+
+def fuse_scores(
+    dense_scores: np.ndarray, lexical_scores: np.ndarray, dense_weight: float, lexical_weight: float
+) -> np.ndarray:
+    # Both scores are on different scales, so they are min-max normalized over the candidates first.
+    return dense_weight * _min_max_normalize(dense_scores) + lexical_weight * _min_max_normalize(lexical_scores)
+
+
+def rerank_hits(query: str, hits: list[LawActHit], limit: int) -> list[LawActHit]:
+    """Rescore ANN candidates with fused dense and BM25 scores, return `limit` best of them."""
+    if not hits:
+        return []
+
+    documents = [tokenize(hit.payload.get(LawActPayloadField.TEXT, "")) for hit in hits]
+    lexical_scores = bm25_scores(tokenize(query), documents, search_settings.BM25_K1, search_settings.BM25_B)
+    dense_scores = np.array([hit.score for hit in hits], dtype=np.float64)
+    fused_scores = fuse_scores(
+        dense_scores, lexical_scores, search_settings.RERANK_DENSE_WEIGHT, search_settings.RERANK_LEXICAL_WEIGHT
+    )
+
+    best_indexes = np.argsort(-fused_scores, kind="stable")[:limit]
+    return [
+        LawActHit(id=hits[index].id, score=float(fused_scores[index]), payload=hits[index].payload)
+        for index in best_indexes
+    ]
+
+
+def _min_max_normalize(scores: np.ndarray) -> np.ndarray:
+    scores_range = scores.max() - scores.min()
+    if scores_range == 0:
+        return np.zeros_like(scores)
+    return (scores - scores.min()) / scores_range
@@ -0,0 +1,147 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import AsyncIterator, Optional, Sequence
+
+from app.domain.entities.law_acts import LawActHit, LawActsFilter
+from app.domain.interfaces.embeddings import EmbeddingService, SparseTextEncoder
+from app.domain.interfaces.law_acts import LawActsIndex
+from app.domain.services.citations import boost_connected_hits
+from app.domain.services.rerank import get_rerank_candidates_limit, rerank_hits
+from app.infrastructure.relational_db.units_of_work.law_acts import LawActsUnitOfWork
+from app.shared.enums import LawActPayloadField, SearchStage
+from app.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+class SearchStageTimings:
+    """Durations of search pipeline stages, observed in `search_stage_seconds` histograms."""
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, stage: str):
+        stage_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stage_duration = time.perf_counter() - stage_start
+            self.stages[stage] = stage_duration
+            metrics_registry.histogram("search_stage_seconds", stage=stage).observe(stage_duration)
+
+    def to_server_timing(self) -> str:
+        return ", ".join(f"{stage};dur={duration * 1000:.2f}" for stage, duration in self.stages.items())
+
+
+async def search_law_acts(
+    law_acts_repository: LawActsIndex,
+    embedding_service: EmbeddingService,
+    query: str,
+    filters: LawActsFilter,
+    limit: int,
+    score_threshold: Optional[float],
+    payload_fields: Sequence[LawActPayloadField],
+    rerank: bool = False,
+    timings: Optional[SearchStageTimings] = None,
+    law_acts_unit_of_work: Optional[LawActsUnitOfWork] = None,
+    graph_boost_weight: float = 0.0,
+    sparse_encoder: Optional[SparseTextEncoder] = None,
+) -> list[LawActHit]:
+    hits = []
+    async for _, hits in iterate_search_stages(
+        law_acts_repository,
+        embedding_service,
+        query,
+        filters,
+        limit,
+        score_threshold,
+        payload_fields,
+        rerank,
+        timings or SearchStageTimings(),
+        law_acts_unit_of_work,
+        graph_boost_weight,
+        sparse_encoder,
+    ):
+        pass
+    return hits
+
+
+async def iterate_search_stages(
+    law_acts_repository: LawActsIndex,
+    embedding_service: EmbeddingService,
+    query: str,
+    filters: LawActsFilter,
+    limit: int,
+    score_threshold: Optional[float],
+    payload_fields: Sequence[LawActPayloadField],
+    rerank: bool,
+    timings: SearchStageTimings,
+    law_acts_unit_of_work: Optional[LawActsUnitOfWork] = None,
+    graph_boost_weight: float = 0.0,
+    sparse_encoder: Optional[SparseTextEncoder] = None,
+) -> AsyncIterator[tuple[SearchStage, list[LawActHit]]]:
+    """Yield results of every search stage as soon as they are ready, the last ones are final.
+
+    With reranking, best ANN candidates are yielded before they are rescored, so they can be shown early.
+    With `law_acts_unit_of_work` and a positive `graph_boost_weight`, hits of acts connected by citations
+    to other found acts are moved up in the last stage. With `sparse_encoder`, candidates are found by hybrid
+    search, fusing rankings of the query embedding and of its terms.
+    """
+    boost = law_acts_unit_of_work is not None and graph_boost_weight > 0
+    candidates_payload_fields = list(payload_fields)
+    if rerank:
+        candidates_payload_fields.append(LawActPayloadField.TEXT)
+    if boost:
+        candidates_payload_fields.append(LawActPayloadField.ACT_ID)
+    candidates_payload_fields = list(dict.fromkeys(candidates_payload_fields))
+    not_requested_fields = set(candidates_payload_fields) - set(payload_fields)
+
+    with timings.measure("embed"):
+        query_vector = await embedding_service.embed(query)
+        query_sparse_vector = sparse_encoder.encode_query(query) if sparse_encoder is not None else None
+
+    with timings.measure("ann"):
+        candidates = await law_acts_repository.search(
+            query_vector,
+            filters,
+            get_rerank_candidates_limit(limit) if rerank else limit,
+            score_threshold,
+            candidates_payload_fields,
+            sparse_vector=query_sparse_vector,
+        )
+    hits = candidates[:limit]
+    yield SearchStage.ANN, _remove_payload_fields(hits, not_requested_fields)
+
+    if rerank:
+        with timings.measure("rerank"):
+            hits = rerank_hits(query, candidates, limit)
+        yield SearchStage.RERANKED, _remove_payload_fields(hits, not_requested_fields)
+
+    if boost:
+        act_ids = list({hit.payload.get(LawActPayloadField.ACT_ID) for hit in hits} - {None})
+        # Hits of a single act have no connections to other results, references are not read.
+        if len(act_ids) > 1:
+            try:
+                with timings.measure("graph"):
+                    async with law_acts_unit_of_work as uof:
+                        edges = await uof.references.list_edges_between(act_ids)
+            except Exception:
+                logger.warning("References between found acts could not be read.", exc_info=True)
+                edges = set()
+            hits = boost_connected_hits(hits, edges, graph_boost_weight)
+        yield SearchStage.BOOSTED, _remove_payload_fields(hits, not_requested_fields)
+
+
+def _remove_payload_fields(hits: list[LawActHit], payload_fields: set[LawActPayloadField]) -> list[LawActHit]:
+    if not payload_fields:
+        return hits
+    return [
+        LawActHit(
+            id=hit.id,
+            score=hit.score,
+            payload={field: value for field, value in hit.payload.items() if field not in payload_fields},
+        )
+        for hit in hits
+    ]
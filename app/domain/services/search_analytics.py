@@ -0,0 +1,105 @@
+import logging
+from collections import deque
+from dataclasses import astuple
+from datetime import datetime, timedelta, timezone
+
+from app.domain.entities.law_acts import SearchEvent
+from app.domain.services.text import normalize_query
+from app.infrastructure.relational_db.units_of_work.analytics import AnalyticsUnitOfWork
+from app.shared.metrics import metrics_registry
+from app.shared.settings.search import search_settings
+
+logger = logging.getLogger(__name__)
+
+SEARCH_EVENT_COLUMNS = (
+    "query",
+    "normalized_query",
+    "act_type",
+    "issuing_body",
+    "in_force_on",
+    "result_limit",
+    "score_threshold",
+    "payload_fields",
+    "rerank",
+    "cached",
+    "latency_ms",
+    "result_ids",
+    "searched_at",
+)
+
+
+class SearchAnalyticsBuffer:
+    """Ring buffer of search events, filled by requests and drained by a background task.
+
+    Recording does no I/O and never waits, when the buffer is full the oldest events are overwritten, so
+    a slow or unavailable database costs analytics, not search latency.
+    """
+
+    def __init__(self, capacity: int):
+        self._events: deque[SearchEvent] = deque(maxlen=capacity)
+        self._recorded = metrics_registry.counter("search_analytics_recorded_events")
+        self._dropped = metrics_registry.counter("search_analytics_dropped_events")
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def record(self, event: SearchEvent):
+        if len(self._events) == self._events.maxlen:
+            self._dropped.inc()
+        self._events.append(event)
+        self._recorded.inc()
+
+    def drain(self, max_events: int) -> list[SearchEvent]:
+        return [self._events.popleft() for _ in range(min(max_events, len(self._events)))]
+
+
+async def flush_search_events(
+    buffer: SearchAnalyticsBuffer, analytics_unit_of_work: AnalyticsUnitOfWork, batch_size: int
+) -> int:
+    """Copy buffered events to the database in batches, return the number of written events.
+
+    Events of a batch which could not be written are dropped, they are not put back in front of newer ones.
+    """
+    written_events = 0
+    while events := buffer.drain(batch_size):
+        try:
+            async with analytics_unit_of_work as uof:
+                await uof.search_events.copy_many(SEARCH_EVENT_COLUMNS, [_to_record(event) for event in events])
+        except Exception:
+            logger.warning(f"{len(events)} search events could not be written.", exc_info=True)
+            metrics_registry.counter("search_analytics_dropped_events").inc(len(events))
+            break
+        written_events += len(events)
+    metrics_registry.counter("search_analytics_written_events").inc(written_events)
+    return written_events
+
+
+async def delete_expired_search_events(analytics_unit_of_work: AnalyticsUnitOfWork, retention_days: int) -> int:
+    """Delete events older than the retention period, return the number of deleted events."""
+    searched_before = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    async with analytics_unit_of_work as uof:
+        deleted_events = await uof.search_events.delete_older_than(searched_before)
+    metrics_registry.counter("search_analytics_deleted_events").inc(deleted_events)
+    return deleted_events
+
+
+def _to_record(event: SearchEvent) -> tuple:
+    act_type, issuing_body, in_force_on = astuple(event.filters)
+    return (
+        event.query,
+        normalize_query(event.query),
+        act_type,
+        issuing_body,
+        in_force_on,
+        event.limit,
+        event.score_threshold,
+        [str(payload_field) for payload_field in event.payload_fields],
+        event.rerank,
+        event.cached,
+        event.latency_seconds * 1000,
+        event.result_ids,
+        event.searched_at,
+    )
+
+
+search_analytics_buffer = SearchAnalyticsBuffer(search_settings.ANALYTICS_BUFFER_SIZE)
@@ -0,0 +1,89 @@
+import hashlib
+import json
+import logging
+import time
+from dataclasses import asdict
+from datetime import date
+from typing import Optional, Sequence
+
+from redis.asyncio import Redis
+
+from app.domain.entities.law_acts import LawActHit, LawActsFilter
+from app.domain.services.text import normalize_query
+from app.shared.enums import KeyPrefix, LawActPayloadField
+from app.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+class SearchResultCache:
+    """Cache of search results, keyed by normalized query and all search parameters.
+
+    Keys contain the collection version, which is increased by ingestion, so results cached before new data was
+    published are never read again and expire with their TTL.
+    """
+
+    def __init__(self, key_value_repo: Redis, collection_name: str, ttl_seconds: int):
+        self._key_value_repo = key_value_repo
+        self._collection_name = collection_name
+        self._ttl_seconds = ttl_seconds
+
+        self._hits = metrics_registry.counter("search_cache_hits")
+        self._misses = metrics_registry.counter("search_cache_misses")
+        self._hit_ratio = metrics_registry.gauge("search_cache_hit_ratio")
+        self._saved_latency = metrics_registry.counter("search_cache_saved_seconds")
+
+    async def build_key(
+        self,
+        query: str,
+        filters: LawActsFilter,
+        limit: int,
+        score_threshold: Optional[float],
+        payload_fields: Sequence[LawActPayloadField],
+        rerank: bool = False,
+        hybrid: bool = False,
+    ) -> str:
+        collection_version = await get_collection_version(self._key_value_repo, self._collection_name)
+        search_parameters = {
+            "query": normalize_query(query),
+            "filters": asdict(filters),
+            "limit": limit,
+            "score_threshold": score_threshold,
+            "payload_fields": sorted(payload_fields),
+            "rerank": rerank,
+            "hybrid": hybrid,
+        }
+        serialized_parameters = json.dumps(search_parameters, sort_keys=True, default=date.isoformat)
+        parameters_hash = hashlib.sha256(serialized_parameters.encode()).hexdigest()
+        return f"{KeyPrefix.SEARCH_RESULT}:{self._collection_name}:{collection_version}:{parameters_hash}"
+
+    async def get(self, key: str) -> Optional[list[LawActHit]]:
+        lookup_start = time.perf_counter()
+        cached_result = await self._key_value_repo.get(key)
+        if cached_result is None:
+            self._misses.inc()
+            self._update_hit_ratio()
+            return None
+
+        cached_result = json.loads(cached_result)
+        self._hits.inc()
+        self._update_hit_ratio()
+        self._saved_latency.inc(max(0.0, cached_result["search_seconds"] - (time.perf_counter() - lookup_start)))
+        return [LawActHit(**hit) for hit in cached_result["hits"]]
+
+    async def set(self, key: str, hits: list[LawActHit], search_seconds: float):
+        cached_result = {"hits": [asdict(hit) for hit in hits], "search_seconds": search_seconds}
+        await self._key_value_repo.set(key, json.dumps(cached_result), ex=self._ttl_seconds)
+
+    def _update_hit_ratio(self):
+        lookups = self._hits.value + self._misses.value
+        self._hit_ratio.set(self._hits.value / lookups)
+
+
+async def get_collection_version(key_value_repo: Redis, collection_name: str) -> int:
+    collection_version = await key_value_repo.get(f"{KeyPrefix.COLLECTION_VERSION}:{collection_name}")
+    return int(collection_version or 0)
+
+
+async def publish_collection_version(key_value_repo: Redis, collection_name: str) -> int:
+    return await key_value_repo.incr(f"{KeyPrefix.COLLECTION_VERSION}:{collection_name}")
@@ -0,0 +1,75 @@
+import json
+import secrets
+from dataclasses import dataclass
+from typing import Sequence
+
+from redis.asyncio import Redis
+
+from app.domain.entities.law_acts import LawActHit
+from app.domain.services.search_cache import get_collection_version
+from app.shared.enums import KeyPrefix, LawActPayloadField
+from app.shared.exceptions import SearchCursorExpired
+
+CURSOR_BYTES = 16
+
+
+@dataclass
+class SearchSnapshot:
+    collection_version: int
+    ids: list[str]
+    scores: list[float]
+    payload_fields: list[LawActPayloadField]
+    page_size: int
+
+    @property
+    def pages(self) -> int:
+        return max(1, -(-len(self.ids) // self.page_size))
+
+
+class SearchCursorStore:
+    """Snapshots of ranked search results, so later pages are read by ids instead of searching again.
+
+    Only ids and scores are stored. A snapshot is bound to the collection version, after ingestion publishes
+    a new one the cursor is expired, so pages are never mixed from different data. Reading a page extends
+    the TTL of its snapshot.
+    """
+
+    def __init__(self, key_value_repo: Redis, collection_name: str, ttl_seconds: int):
+        self._key_value_repo = key_value_repo
+        self._collection_name = collection_name
+        self._ttl_seconds = ttl_seconds
+
+    async def save(
+        self, hits: Sequence[LawActHit], payload_fields: Sequence[LawActPayloadField], page_size: int
+    ) -> str:
+        cursor = secrets.token_urlsafe(CURSOR_BYTES)
+        snapshot = {
+            "collection_version": await get_collection_version(self._key_value_repo, self._collection_name),
+            "ids": [hit.id for hit in hits],
+            "scores": [hit.score for hit in hits],
+            "payload_fields": list(payload_fields),
+            "page_size": page_size,
+        }
+        await self._key_value_repo.set(self._build_key(cursor), json.dumps(snapshot), ex=self._ttl_seconds)
+        return cursor
+
+    async def load(self, cursor: str) -> SearchSnapshot:
+        key = self._build_key(cursor)
+        serialized_snapshot = await self._key_value_repo.getex(key, ex=self._ttl_seconds)
+        if serialized_snapshot is None:
+            raise SearchCursorExpired()
+
+        snapshot = json.loads(serialized_snapshot)
+        if snapshot["collection_version"] != await get_collection_version(self._key_value_repo, self._collection_name):
+            await self._key_value_repo.delete(key)
+            raise SearchCursorExpired()
+        return SearchSnapshot(
+            collection_version=snapshot["collection_version"],
+            ids=snapshot["ids"],
+            scores=snapshot["scores"],
+            payload_fields=[LawActPayloadField(payload_field) for payload_field in snapshot["payload_fields"]],
+            page_size=snapshot["page_size"],
+        )
+
+    def _build_key(self, cursor: str) -> str:
+        return f"{KeyPrefix.SEARCH_CURSOR}:{self._collection_name}:{cursor}"
@@ -0,0 +1,62 @@
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from app.domain.entities.law_acts import LawActHit
+from app.domain.services.law_acts_chunking import get_chunk_key
+from app.shared.enums import LawActPayloadField
+
+
+@dataclass
+class SearchQualityMetrics:
+    recall: float
+    reciprocal_rank: float
+    ndcg: float
+
+
+def get_hit_key(hit: LawActHit) -> Optional[str]:
+    """Chunk key of a hit, the form in which relevance judgments name chunks, e.g. `DU/1964/93#art. 535`."""
+    act_id = hit.payload.get(LawActPayloadField.ACT_ID)
+    unit = hit.payload.get(LawActPayloadField.UNIT)
+    if act_id is None or unit is None:
+        return None
+    return get_chunk_key(act_id, unit)
+
+
+def evaluate_ranking(ranked_keys: Sequence[Optional[str]], relevance: dict[str, int], k: int) -> SearchQualityMetrics:
+    """Recall, reciprocal rank and nDCG of the first `k` results, against graded relevance of chunks.
+
+    Grades are positive integers, chunks missing from `relevance` are not relevant. Gains of nDCG are
+    exponential (`2 ** grade - 1`), so a highly relevant chunk at the top counts more than two partially
+    relevant ones.
+    """
+    top_keys = list(ranked_keys[:k])
+    relevant_keys = {key for key, grade in relevance.items() if grade > 0}
+    if not relevant_keys:
+        return SearchQualityMetrics(recall=0.0, reciprocal_rank=0.0, ndcg=0.0)
+
+    found_keys = relevant_keys.intersection(top_keys)
+    first_rank = next((rank for rank, key in enumerate(top_keys, start=1) if key in relevant_keys), None)
+    dcg = sum(_gain(relevance.get(key, 0)) / math.log2(rank + 1) for rank, key in enumerate(top_keys, start=1))
+    ideal_grades = sorted((relevance[key] for key in relevant_keys), reverse=True)[:k]
+    ideal_dcg = sum(_gain(grade) / math.log2(rank + 1) for rank, grade in enumerate(ideal_grades, start=1))
+
+    return SearchQualityMetrics(
+        recall=len(found_keys) / len(relevant_keys),
+        reciprocal_rank=1 / first_rank if first_rank else 0.0,
+        ndcg=dcg / ideal_dcg,
+    )
+
+
+def average_metrics(metrics: Sequence[SearchQualityMetrics]) -> SearchQualityMetrics:
+    if not metrics:
+        return SearchQualityMetrics(recall=0.0, reciprocal_rank=0.0, ndcg=0.0)
+    return SearchQualityMetrics(
+        recall=sum(query_metrics.recall for query_metrics in metrics) / len(metrics),
+        reciprocal_rank=sum(query_metrics.reciprocal_rank for query_metrics in metrics) / len(metrics),
+        ndcg=sum(query_metrics.ndcg for query_metrics in metrics) / len(metrics),
+    )
+
+
+def _gain(grade: int) -> float:
+    return 2**grade - 1 if grade > 0 else 0.0
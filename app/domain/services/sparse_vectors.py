@@ -0,0 +1,98 @@
+import zlib
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+
+from app.domain.entities.embeddings import SparseVector
+from app.domain.services.rerank import tokenize
+from app.shared.settings.embedding import embedding_settings
+from app.shared.settings.search import search_settings
+
+# Function words, folded like tokens. They occur in almost every chunk, so they only make sparse search slower.
+STOP_WORDS = frozenset(
+    "a aby albo ani az ale bez by byc co czy dla do gdy i ich iz jak jako jednak jego jej jest lecz lub na nad nie "
+    "niz o od oraz po pod przed przez przy sa sie ta tak te tego tej ten to tych tym u w we z za ze ktora ktore "
+    "ktorego ktorej ktory ktorych ktorym".split()
+)
+# Inflectional endings of folded Polish words, the longest matching one is stripped, e.g. umowa, umowy, umowie -> umow.
+INFLECTIONAL_SUFFIXES = tuple(
+    sorted(
+        "owego owemu owych owymi owej owie owa owe owi owy ami ach ego emu ych ymi imi ich iem om ow ej em ie ia iu "
+        "ja ji a e i o u y".split(),
+        key=len,
+        reverse=True,
+    )
+)
+MIN_STEM_LENGTH = 3
+STEM_CACHE_SIZE = 1 << 16
+LOW_BITS = np.uint64(32)
+
+
+@lru_cache(maxsize=STEM_CACHE_SIZE)
+def stem(token: str) -> str:
+    """Light stemmer, strips one inflectional ending and keeps at least `MIN_STEM_LENGTH` letters.
+
+    Numbers (article and paragraph numbers, years) are kept whole.
+    """
+    if not token.isalpha():
+        return token
+    for suffix in INFLECTIONAL_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM_LENGTH:
+            return token[: -len(suffix)]
+    return token
+
+
+def analyze(text: str) -> list[str]:
+    return [stem(token) for token in tokenize(text) if token not in STOP_WORDS]
+
+
+def get_term_index(term: str) -> int:
+    return zlib.crc32(term.encode())
+
+
+class PolishSparseEncoder:
+    """Sparse vectors of stemmed terms, weighted like BM25 term frequencies.
+
+    Inverse document frequencies are not part of document vectors, Qdrant applies them to query terms (`IDF`
+    modifier of the sparse vector). They are counted over all chunks in the collection, so they stay correct
+    when acts are added or amended, without re-encoding the whole corpus.
+    """
+
+    def __init__(self, k1: float, b: float, average_length: float):
+        self.k1 = k1
+        self.b = b
+        self.average_length = average_length
+
+    def encode_documents(self, texts: Sequence[str]) -> list[SparseVector]:
+        if not texts:
+            return []
+        texts_terms = [analyze(text) for text in texts]
+        lengths = np.fromiter((len(terms) for terms in texts_terms), dtype=np.int64, count=len(texts_terms))
+        indices = np.fromiter(
+            (get_term_index(term) for terms in texts_terms for term in terms), dtype=np.uint64, count=lengths.sum()
+        )
+        rows = np.repeat(np.arange(len(texts), dtype=np.uint64), lengths)
+
+        # Terms of all texts are counted at once, as sorted pairs of row and term index packed into one integer.
+        pairs, frequencies = np.unique((rows << LOW_BITS) | indices, return_counts=True)
+        pair_rows = (pairs >> LOW_BITS).astype(np.int64)
+        pair_indices = pairs & np.uint64(0xFFFFFFFF)
+        length_norms = self.k1 * (1 - self.b + self.b * lengths / self.average_length)
+        weights = frequencies * (self.k1 + 1) / (frequencies + length_norms[pair_rows])
+
+        boundaries = np.searchsorted(pair_rows, np.arange(1, len(texts)))
+        return [
+            SparseVector(indices=row_indices.tolist(), values=row_weights.tolist())
+            for row_indices, row_weights in zip(np.split(pair_indices, boundaries), np.split(weights, boundaries))
+        ]
+
+    def encode_query(self, text: str) -> SparseVector:
+        # Every query term has weight 1, so its score is the IDF-weighted term frequency of the document (BM25).
+        indices = sorted({get_term_index(term) for term in analyze(text)})
+        return SparseVector(indices=indices, values=[1.0] * len(indices))
+
+
+sparse_encoder = PolishSparseEncoder(
+    search_settings.BM25_K1, search_settings.BM25_B, embedding_settings.SPARSE_AVERAGE_LENGTH
+)
@@ -0,0 +1,144 @@
+import json
+import re
+import time
+from typing import Iterable, Optional, Sequence
+
+from redis.asyncio import Redis
+
+from app.domain.entities.law_acts import LawActDocument, LawActSuggestion
+from app.domain.services.rerank import tokenize
+from app.shared.enums import KeyPrefix
+from app.shared.metrics import metrics_registry
+from app.shared.settings.search import search_settings
+
+TERMS_KEY = f"{KeyPrefix.SUGGESTIONS}:terms"
+ACTS_KEY = f"{KeyPrefix.SUGGESTIONS}:acts"
+POPULARITY_KEY = f"{KeyPrefix.SUGGESTIONS}:popularity"
+# Sorts before any character of a term, so shorter terms with the same prefix come first.
+TERM_SEPARATOR = "\x00"
+# Greater than any byte of UTF-8 encoded text, closes the lexicographic range of a prefix.
+LEX_RANGE_END = b"\xff"
+MAX_TERM_LENGTH = 120
+ACT_ID_PATTERN = re.compile(r"^(DU|MP)/(\d{4})/(\d+)$")
+JOURNAL_ABBREVIATIONS = {"DU": "Dz.U.", "MP": "M.P."}
+
+
+def get_act_citation(act_id: str) -> Optional[str]:
+    """Citation of an act published in the Journal of Laws or Monitor Polski, e.g. `Dz.U. 1964 poz. 93`."""
+    match = ACT_ID_PATTERN.match(act_id)
+    if match is None:
+        return None
+    journal, year, position = match.groups()
+    return f"{JOURNAL_ABBREVIATIONS[journal]} {year} poz. {position}"
+
+
+def normalize_suggestion_text(text: str) -> str:
+    return " ".join(tokenize(text))
+
+
+def get_suggestion_terms(document: LawActDocument, max_title_terms: int) -> list[str]:
+    """Terms matched by prefix: every word suffix of the title, so "kodeks cywilny" is found in
+    "ustawa z dnia 23 kwietnia 1964 r. kodeks cywilny", and the citation in full and short form.
+    """
+    title_words = normalize_suggestion_text(document.title).split(" ")
+    terms = [" ".join(title_words[start:]) for start in range(min(len(title_words), max_title_terms))]
+    citation = get_act_citation(document.act_id)
+    if citation is not None:
+        terms.append(normalize_suggestion_text(citation))
+    terms.append(normalize_suggestion_text(document.act_id))
+    return list(dict.fromkeys(term[:MAX_TERM_LENGTH] for term in terms if term))
+
+
+class SuggestionIndex:
+    """Typeahead of law-act titles and citations, in Redis sorted sets.
+
+    Terms are kept in one sorted set with equal scores, so prefix lookup is a single `ZRANGEBYLEX`. Candidates are
+    ranked by popularity, increased when acts are returned by search. Only the first `max_candidates` terms in
+    lexicographic order are ranked, which is enough after a few typed characters.
+    """
+
+    def __init__(
+        self,
+        key_value_repo: Redis,
+        max_candidates: int = search_settings.SUGGESTIONS_MAX_CANDIDATES,
+        max_title_terms: int = search_settings.SUGGESTIONS_MAX_TITLE_TERMS,
+    ):
+        self._key_value_repo = key_value_repo
+        self._max_candidates = max_candidates
+        self._max_title_terms = max_title_terms
+        self._latency = metrics_registry.histogram("suggestions_seconds")
+
+    async def add_acts(self, documents: Sequence[LawActDocument]):
+        """Add or replace acts, terms of a previous version of an act (e.g. with amended title) are removed."""
+        if not documents:
+            return
+        act_ids = [document.act_id for document in documents]
+        stored_acts = await self._key_value_repo.hmget(ACTS_KEY, act_ids)
+
+        async with self._key_value_repo.pipeline(transaction=False) as pipeline:
+            for act_id, stored_act in zip(act_ids, stored_acts):
+                if stored_act is not None:
+                    pipeline.zrem(TERMS_KEY, *_to_members(json.loads(stored_act)["terms"], act_id))
+            for document in documents:
+                terms = get_suggestion_terms(document, self._max_title_terms)
+                pipeline.zadd(TERMS_KEY, dict.fromkeys(_to_members(terms, document.act_id), 0))
+                stored_act = {"title": document.title, "citation": get_act_citation(document.act_id), "terms": terms}
+                pipeline.hset(ACTS_KEY, document.act_id, json.dumps(stored_act, ensure_ascii=False))
+            await pipeline.execute()
+
+    async def suggest(self, prefix: str, limit: int) -> list[LawActSuggestion]:
+        suggest_start = time.perf_counter()
+        normalized_prefix = normalize_suggestion_text(prefix)
+        if not normalized_prefix:
+            return []
+
+        members = await self._key_value_repo.zrangebylex(
+            TERMS_KEY,
+            f"[{normalized_prefix}",
+            f"[{normalized_prefix}".encode() + LEX_RANGE_END,
+            start=0,
+            num=self._max_candidates,
+        )
+        act_ids = list(dict.fromkeys(member.rsplit(TERM_SEPARATOR, 1)[1] for member in members))
+        if not act_ids:
+            self._latency.observe(time.perf_counter() - suggest_start)
+            return []
+
+        async with self._key_value_repo.pipeline(transaction=False) as pipeline:
+            pipeline.zmscore(POPULARITY_KEY, act_ids)
+            pipeline.hmget(ACTS_KEY, act_ids)
+            popularities, stored_acts = await pipeline.execute()
+
+        suggestions = []
+        for act_id, popularity, stored_act in zip(act_ids, popularities, stored_acts):
+            if stored_act is None:
+                continue
+            stored_act = json.loads(stored_act)
+            suggestions.append(
+                LawActSuggestion(
+                    act_id=act_id,
+                    title=stored_act["title"],
+                    citation=stored_act["citation"],
+                    popularity=float(popularity or 0.0),
+                )
+            )
+        # Sort is stable, acts with equal popularity stay in lexicographic order of matching terms.
+        suggestions.sort(key=lambda suggestion: suggestion.popularity, reverse=True)
+        self._latency.observe(time.perf_counter() - suggest_start)
+        return suggestions[:limit]
+
+    async def record_popularity(self, act_ids: Iterable[str]):
+        """Increase popularity of acts found by search, by the reciprocal of the position of their best hit."""
+        increments = {}
+        for position, act_id in enumerate(act_ids, start=1):
+            increments.setdefault(act_id, 1 / position)
+        if not increments:
+            return
+        async with self._key_value_repo.pipeline(transaction=False) as pipeline:
+            for act_id, increment in increments.items():
+                pipeline.zincrby(POPULARITY_KEY, increment, act_id)
+            await pipeline.execute()
+
+
+def _to_members(terms: Iterable[str], act_id: str) -> list[str]:
+    return [f"{term}{TERM_SEPARATOR}{act_id}" for term in terms]
@@ -0,0 +1,35 @@
+import re
+import unicodedata
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# Letters which are not decomposed by Unicode normalization.
+NOT_DECOMPOSABLE_LETTERS = {"ł": "l", "Ł": "L"}
+
+
+class _FoldingTable(dict):
+    """Translation table folding every character once, `str.translate` reads known characters without Python calls."""
+
+    def __missing__(self, code_point: int) -> str:
+        character = chr(code_point)
+        character = NOT_DECOMPOSABLE_LETTERS.get(character, character)
+        decomposed = unicodedata.normalize("NFKD", character)
+        folded = "".join(character for character in decomposed if not unicodedata.combining(character))
+        self[code_point] = folded
+        return folded
+
+
+_folding_table = _FoldingTable()
+
+
+def fold_diacritics(text: str) -> str:
+    if text.isascii():
+        return text
+    return text.translate(_folding_table)
+
+
+def collapse_whitespace(text: str) -> str:
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def normalize_query(query: str) -> str:
+    return collapse_whitespace(fold_diacritics(query.lower()))
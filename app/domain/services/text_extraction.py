@@ -0,0 +1,144 @@
+import re
+import zipfile
+from html.parser import HTMLParser
+from io import BytesIO
+from typing import Callable, Optional
+
+from defusedxml import ElementTree
+from pypdf import PdfReader
+
+from app.domain.services.content_type import DOCX_CONTENT_TYPE, SNIFF_LENGTH, UTF8_BOM, sniff_content_type
+from app.shared.exceptions import FileTooLargeToIndex
+
+# Legacy Polish documents are often saved in Windows encoding, UTF-8 is tried first.
+TEXT_ENCODINGS = ("utf-8", "cp1250")
+DOCX_DOCUMENT_PATH = "word/document.xml"
+DOCX_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+RTF_CONTROL_PATTERN = re.compile(r"\\'([0-9a-f]{2})|\\[a-z]+-?\d* ?|[{}]|\\\*", re.IGNORECASE)
+RTF_PARAGRAPH_PATTERN = re.compile(r"\\(?:par|line)(?![a-z]) ?")
+RTF_IGNORED_DESTINATIONS = ("{\\*", "{\\fonttbl", "{\\colortbl", "{\\stylesheet", "{\\info")
+HTML_SKIPPED_TAGS = frozenset({"script", "style", "head"})
+BLANK_LINES_PATTERN = re.compile(r"\n\s*\n\s*")
+
+
+def extract_text(file_bytes: bytes, max_unpacked_size: int) -> Optional[str]:
+    """Extract plain text from an uploaded file, `None` is returned for types without text (e.g. images).
+
+    Archives (DOCX) whose document is larger than `max_unpacked_size` bytes are not unpacked,
+    `FileTooLargeToIndex` is raised instead.
+    """
+    content_type = sniff_content_type(file_bytes[:SNIFF_LENGTH])
+    if content_type in ARCHIVE_TEXT_EXTRACTORS:
+        text = ARCHIVE_TEXT_EXTRACTORS[content_type](file_bytes, max_unpacked_size)
+    elif content_type in TEXT_EXTRACTORS:
+        text = TEXT_EXTRACTORS[content_type](file_bytes)
+    else:
+        return None
+    return BLANK_LINES_PATTERN.sub("\n\n", text).strip()
+
+
+def decode_text(file_bytes: bytes) -> str:
+    file_bytes = file_bytes.removeprefix(UTF8_BOM)
+    for encoding in TEXT_ENCODINGS:
+        try:
+            return file_bytes.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return file_bytes.decode(TEXT_ENCODINGS[0], errors="replace")
+
+
+def _parse_xml(xml_bytes: bytes):
+    # Uploaded files are untrusted, DTDs and entities (billion laughs, external entities) are refused.
+    return ElementTree.fromstring(xml_bytes, forbid_dtd=True)
+
+
+def _extract_xml(file_bytes: bytes) -> str:
+    return "\n".join(text.strip() for text in _parse_xml(file_bytes).itertext() if text.strip())
+
+
+class _HtmlTextParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.parts: list[str] = []
+        self._skipped_depth = 0
+
+    def handle_starttag(self, tag: str, attrs):
+        if tag in HTML_SKIPPED_TAGS:
+            self._skipped_depth += 1
+
+    def handle_endtag(self, tag: str):
+        if tag in HTML_SKIPPED_TAGS and self._skipped_depth:
+            self._skipped_depth -= 1
+
+    def handle_data(self, data: str):
+        if not self._skipped_depth and data.strip():
+            self.parts.append(data.strip())
+
+
+def _extract_html(file_bytes: bytes) -> str:
+    parser = _HtmlTextParser()
+    parser.feed(decode_text(file_bytes))
+    parser.close()
+    return "\n".join(parser.parts)
+
+
+def _extract_docx(file_bytes: bytes, max_unpacked_size: int) -> str:
+    with zipfile.ZipFile(BytesIO(file_bytes)) as docx_file:
+        # Reading stops at the declared size, so checking it is enough to not unpack a zip bomb.
+        if docx_file.getinfo(DOCX_DOCUMENT_PATH).file_size > max_unpacked_size:
+            raise FileTooLargeToIndex()
+        document = _parse_xml(docx_file.read(DOCX_DOCUMENT_PATH))
+    paragraphs = (
+        "".join(text_node.text or "" for text_node in paragraph.iter(f"{DOCX_NAMESPACE}t"))
+        for paragraph in document.iter(f"{DOCX_NAMESPACE}p")
+    )
+    return "\n".join(paragraph for paragraph in paragraphs if paragraph.strip())
+
+
+def _extract_rtf(file_bytes: bytes) -> str:
+    # Non-ASCII letters are escaped as code page bytes, Polish documents use cp1250 (\'b3 is "ł").
+    rtf_text = RTF_PARAGRAPH_PATTERN.sub("\n", _remove_rtf_destinations(file_bytes.decode("ascii", errors="ignore")))
+    return RTF_CONTROL_PATTERN.sub(
+        lambda match: bytes.fromhex(match.group(1)).decode("cp1250") if match.group(1) else "", rtf_text
+    )
+
+
+def _remove_rtf_destinations(rtf_text: str) -> str:
+    """Remove groups which hold metadata (fonts, styles) instead of document text."""
+    parts = []
+    position = 0
+    while (start := _find_rtf_destination(rtf_text, position)) != -1:
+        parts.append(rtf_text[position:start])
+        depth = 0
+        for position in range(start, len(rtf_text)):
+            if rtf_text[position] == "{" and rtf_text[position - 1] != "\\":
+                depth += 1
+            elif rtf_text[position] == "}" and rtf_text[position - 1] != "\\":
+                depth -= 1
+                if not depth:
+                    break
+        position += 1
+    parts.append(rtf_text[position:])
+    return "".join(parts)
+
+
+def _find_rtf_destination(rtf_text: str, position: int) -> int:
+    starts = (rtf_text.find(destination, position) for destination in RTF_IGNORED_DESTINATIONS)
+    return min((start for start in starts if start != -1), default=-1)
+
+
+def _extract_pdf(file_bytes: bytes) -> str:
+    return "\n".join(page.extract_text() or "" for page in PdfReader(BytesIO(file_bytes)).pages)
+
+
+TEXT_EXTRACTORS: dict[str, Callable[[bytes], str]] = {
+    "text/plain": decode_text,
+    "text/html": _extract_html,
+    "application/xml": _extract_xml,
+    "application/rtf": _extract_rtf,
+    "application/pdf": _extract_pdf,
+}
+
+ARCHIVE_TEXT_EXTRACTORS: dict[str, Callable[[bytes, int], str]] = {
+    DOCX_CONTENT_TYPE: _extract_docx,
+}
@@ -1,9 +1,32 @@
+import logging
+from datetime import timedelta
+from typing import Optional
+from uuid import UUID
+
 from fastapi import UploadFile
-from sqlalchemy.exc import IntegrityError
 
+from app.domain.entities.user_files import UploadSession
 from app.domain.interfaces.file_storage import StorageRepository
+from app.domain.services.content_type import SNIFF_LENGTH, sniff_content_type
 from app.infrastructure.relational_db.units_of_work.users import UsersUnitOfWork
-from app.shared.exceptions import EmptyFileException, FileNameExist
+from app.shared.consts import STAGING_FILES_PREFIX, STALE_UPLOADS_SWEEP_BATCH_SIZE
+from app.shared.enums import FileStatus
+from app.shared.exceptions import (
+    EmptyFileException,
+    FileNameExist,
+    FileTypeNotAllowed,
+    PendingUploadExpired,
+    RelationalDbIntegrityError,
+    UploadSessionNotFound,
+    UploadVerificationFailed,
+)
+from app.shared.settings.file_storage import file_storage_settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_staging_file_name(file_id: str) -> str:
+    return f"{STAGING_FILES_PREFIX}{file_id}"
 
 
 async def add_user_file(
@@ -11,18 +34,168 @@ async def add_user_file(
 ):
     file_name = user_file.filename
 
-    first_byte = await user_file.read(1)
-    if not first_byte:
+    file_head = await user_file.read(SNIFF_LENGTH)
+    if not file_head:
         raise EmptyFileException()
     user_file.file.seek(0)
+    content_type = sniff_content_type(file_head)
+
+    file_id = await reserve_pending_file(users_unit_of_work, user_id, file_name)
+
+    # The transfer runs outside any transaction, the row stays pending until the object is promoted.
+    staging_file_name = get_staging_file_name(file_id)
+    try:
+        await storage_repo.upload_file(user_file, staging_file_name, content_type)
+    except Exception:
+        await discard_pending_file(users_unit_of_work, storage_repo, file_id)
+        raise
 
-    file_data = {"file_name": file_name, "user_id": user_id}
+    await promote_pending_file(users_unit_of_work, storage_repo, file_id)
+
+
+async def reserve_pending_file(
+    users_unit_of_work: UsersUnitOfWork, user_id: str, file_name: str, declared_size: Optional[int] = None
+) -> str:
+    file_data = {"file_name": file_name, "user_id": user_id, "status": FileStatus.PENDING}
+    if declared_size is not None:
+        file_data["declared_size"] = declared_size
 
     async with users_unit_of_work as uof:
         try:
             result = await uof.files.add(file_data)
-        except IntegrityError:
+        except RelationalDbIntegrityError:
             raise FileNameExist
-        file_id = str(result.id)
+    return str(result.id)
+
+
+async def promote_pending_file(users_unit_of_work: UsersUnitOfWork, storage_repo: StorageRepository, file_id: str):
+    try:
+        await storage_repo.move_file(get_staging_file_name(file_id), file_id)
+    except Exception:
+        await discard_pending_file(users_unit_of_work, storage_repo, file_id)
+        raise
+
+    async with users_unit_of_work as uof:
+        is_marked_ready = await uof.files.mark_ready(file_id)
+    # An upload running longer than the pending timeout is swept, the moved object would have no row.
+    if not is_marked_ready:
+        logger.warning(f"Pending file {file_id} expired before its upload was finished.")
+        await discard_pending_file(users_unit_of_work, storage_repo, file_id)
+        raise PendingUploadExpired
+
+
+async def create_upload_session(
+    users_unit_of_work: UsersUnitOfWork,
+    storage_repo: StorageRepository,
+    user_id: str,
+    file_name: str,
+    content_type: str,
+    size: int,
+    expires_in: int,
+) -> UploadSession:
+    file_id = await reserve_pending_file(users_unit_of_work, user_id, file_name, declared_size=size)
+
+    staging_file_name = get_staging_file_name(file_id)
+    try:
+        upload_target = await storage_repo.create_upload_target(staging_file_name, content_type, size, expires_in)
+    except Exception:
+        await discard_pending_file(users_unit_of_work, storage_repo, file_id)
+        raise
+
+    return UploadSession(file_id=file_id, upload_target=upload_target)
+
+
+async def finalize_upload_session(
+    users_unit_of_work: UsersUnitOfWork,
+    storage_repo: StorageRepository,
+    user_id: str,
+    file_id: str,
+    size: int,
+    md5_hash: str,
+):
+    async with users_unit_of_work as uof:
+        user_file = await uof.files.get(file_id)
+    if user_file is None or str(user_file.user_id) != user_id or user_file.status != FileStatus.PENDING:
+        raise UploadSessionNotFound
+
+    staging_file_name = get_staging_file_name(file_id)
+    stored_file = await storage_repo.get_file_metadata(staging_file_name)
+    if stored_file is None:
+        raise UploadVerificationFailed("File was not uploaded!")
+    # The size sent on finalize comes from the same client, so it is also compared with the one of the session.
+    if stored_file.size != user_file.declared_size or stored_file.size != size or stored_file.md5_hash != md5_hash:
+        logger.warning(f"Uploaded file {file_id} does not match declared size or hash.")
+        await discard_pending_file(users_unit_of_work, storage_repo, file_id)
+        raise UploadVerificationFailed("Uploaded file does not match declared size or hash!")
+
+    # The content type of the session is only claimed by the client, the uploaded bytes are sniffed.
+    content_type = sniff_content_type(await storage_repo.get_file_head(staging_file_name, SNIFF_LENGTH))
+    if content_type not in file_storage_settings.ALLOWED_CONTENT_TYPES:
+        logger.warning(f"Uploaded file {file_id} has not allowed content type {content_type}.")
+        await discard_pending_file(users_unit_of_work, storage_repo, file_id)
+        raise FileTypeNotAllowed
+
+    await promote_pending_file(users_unit_of_work, storage_repo, file_id)
+
+
+async def discard_pending_file(users_unit_of_work: UsersUnitOfWork, storage_repo: StorageRepository, file_id: str):
+    for file_name in (get_staging_file_name(file_id), file_id):
+        try:
+            await storage_repo.delete_file(file_name)
+        except Exception:
+            logger.debug(f"Could not delete file {file_name} while discarding upload.", exc_info=True)
+
+    try:
+        async with users_unit_of_work as uof:
+            await uof.files.delete(file_id)
+    except Exception:
+        logger.error(f"Could not discard pending file {file_id}, it will be removed by sweeper.", exc_info=True)
+
+
+async def sweep_orphaned_uploads(
+    users_unit_of_work: UsersUnitOfWork, storage_repo: StorageRepository, pending_timeout: timedelta
+) -> int:
+    removed_uploads = 0
+
+    async with users_unit_of_work as uof:
+        stale_files = await uof.files.get_stale_pending(pending_timeout, STALE_UPLOADS_SWEEP_BATCH_SIZE)
+    for stale_file in stale_files:
+        await discard_pending_file(users_unit_of_work, storage_repo, str(stale_file.id))
+        removed_uploads += 1
+
+    async for files_page in storage_repo.list_files(prefix=STAGING_FILES_PREFIX):
+        removed_uploads += await _remove_orphaned_staging_files(users_unit_of_work, storage_repo, files_page.file_names)
+
+    return removed_uploads
+
+
+async def _remove_orphaned_staging_files(
+    users_unit_of_work: UsersUnitOfWork, storage_repo: StorageRepository, staging_file_names: list[str]
+) -> int:
+    staged_file_ids = {}
+    for staging_file_name in staging_file_names:
+        try:
+            file_id = UUID(staging_file_name.removeprefix(STAGING_FILES_PREFIX))
+        except ValueError:
+            logger.warning(f"Unexpected object {staging_file_name} in staging area.")
+            continue
+        staged_file_ids[file_id] = staging_file_name
+
+    if not staged_file_ids:
+        return 0
+
+    async with users_unit_of_work as uof:
+        pending_file_ids = await uof.files.get_pending_ids(list(staged_file_ids))
+
+    removed_uploads = 0
+    for file_id, staging_file_name in staged_file_ids.items():
+        if file_id in pending_file_ids:
+            continue
+        try:
+            await storage_repo.delete_file(staging_file_name)
+        except Exception:
+            logger.warning(f"Could not delete orphaned staging file {staging_file_name}.", exc_info=True)
+            continue
+        removed_uploads += 1
 
-        await storage_repo.upload_file(user_file, file_id)
+    return removed_uploads
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import re
+from datetime import timedelta
+from typing import Iterator, Optional
+from uuid import uuid5
+
+from app.domain.entities.user_files import UserFileChunk
+from app.domain.interfaces.embeddings import TextEncoder
+from app.domain.interfaces.file_storage import StorageRepository
+from app.domain.services.embedding_cache import EmbeddingCache, encode_texts
+from app.domain.services.law_acts_chunking import split_long_text
+from app.domain.services.text_extraction import extract_text
+from app.infrastructure.relational_db.schemas.users import UsersFiles
+from app.infrastructure.relational_db.units_of_work.users import UsersUnitOfWork
+from app.infrastructure.vector_db.repositories.user_files import UserFilesIndexRepository
+from app.shared.consts import USER_FILE_CHUNKS_NAMESPACE
+from app.shared.enums import IndexingStatus
+from app.shared.exceptions import FileTooLargeToIndex
+
+logger = logging.getLogger(__name__)
+
+PARAGRAPHS_SEPARATOR_PATTERN = re.compile(r"\n\s*\n")
+
+
+def chunk_user_file_text(text: str, max_chunk_length: int) -> Iterator[str]:
+    """Pack consecutive paragraphs into chunks of at most `max_chunk_length` characters.
+
+    User files have no common structure, so only blank lines are treated as boundaries. Paragraphs longer than
+    the limit are split between words.
+    """
+    chunk: list[str] = []
+    chunk_length = 0
+    for paragraph in PARAGRAPHS_SEPARATOR_PATTERN.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if chunk and chunk_length + len(paragraph) > max_chunk_length:
+            yield "\n\n".join(chunk)
+            chunk, chunk_length = [], 0
+
+        if len(paragraph) > max_chunk_length:
+            yield from split_long_text(paragraph, max_chunk_length)
+            continue
+
+        chunk.append(paragraph)
+        chunk_length += len(paragraph) + 2
+
+    if chunk:
+        yield "\n\n".join(chunk)
+
+
+def create_user_file_chunks(user_file: UsersFiles, text: str, max_chunk_length: int) -> list[UserFileChunk]:
+    file_id = str(user_file.id)
+    return [
+        UserFileChunk(
+            id=str(uuid5(USER_FILE_CHUNKS_NAMESPACE, f"{file_id}#{number}")),
+            file_id=file_id,
+            user_id=str(user_file.user_id),
+            file_name=user_file.file_name,
+            number=number,
+            text=chunk_text,
+        )
+        for number, chunk_text in enumerate(chunk_user_file_text(text, max_chunk_length))
+    ]
+
+
+async def index_pending_user_files(
+    users_unit_of_work: UsersUnitOfWork,
+    storage_repo: StorageRepository,
+    user_files_index_repository: UserFilesIndexRepository,
+    encoder: TextEncoder,
+    batch_size: int,
+    stale_timeout: timedelta,
+    embedding_batch_size: int,
+    max_chunk_length: int,
+    max_file_size: int,
+    max_unpacked_size: int,
+    embedding_cache: Optional[EmbeddingCache] = None,
+) -> dict[IndexingStatus, int]:
+    """Index a batch of ready files, which were not indexed yet.
+
+    Files are claimed in the relational database first, so every file is indexed by one worker only, and a file
+    claimed by a worker which stopped is indexed again after `stale_timeout`.
+    """
+    async with users_unit_of_work as uof:
+        user_files = await uof.files.claim_for_indexing(batch_size, stale_timeout)
+
+    indexing_statuses = {}
+    for user_file in user_files:
+        try:
+            indexing_status = await index_user_file(
+                user_file,
+                storage_repo,
+                user_files_index_repository,
+                encoder,
+                embedding_batch_size,
+                max_chunk_length,
+                max_file_size,
+                max_unpacked_size,
+                embedding_cache,
+            )
+        except Exception:
+            logger.error(f"Indexing of user file {user_file.id} failed!", exc_info=True)
+            indexing_status = IndexingStatus.FAILED
+
+        async with users_unit_of_work as uof:
+            await uof.files.set_indexing_status(str(user_file.id), indexing_status)
+        indexing_statuses[indexing_status] = indexing_statuses.get(indexing_status, 0) + 1
+
+    return indexing_statuses
+
+
+async def index_user_file(
+    user_file: UsersFiles,
+    storage_repo: StorageRepository,
+    user_files_index_repository: UserFilesIndexRepository,
+    encoder: TextEncoder,
+    embedding_batch_size: int,
+    max_chunk_length: int,
+    max_file_size: int,
+    max_unpacked_size: int,
+    embedding_cache: Optional[EmbeddingCache] = None,
+) -> IndexingStatus:
+    """Index text of a stored file, files larger than the limits are skipped without reading them whole."""
+    file_name = str(user_file.id)
+    file_metadata = await storage_repo.get_file_metadata(file_name)
+    if file_metadata is not None and file_metadata.size > max_file_size:
+        logger.warning(f"User file {user_file.id} is too large to be indexed.")
+        return IndexingStatus.SKIPPED
+
+    file_bytes = await storage_repo.get_file(file_name)
+    try:
+        # Extraction parses whole documents, it runs in a thread to not block the event loop.
+        text = await asyncio.to_thread(extract_text, file_bytes, max_unpacked_size)
+    except FileTooLargeToIndex:
+        logger.warning(f"Unpacked user file {user_file.id} is too large to be indexed.")
+        return IndexingStatus.SKIPPED
+    if not text:
+        return IndexingStatus.SKIPPED
+
+    chunks = create_user_file_chunks(user_file, text, max_chunk_length)
+    vectors = await encode_texts([chunk.text for chunk in chunks], encoder, embedding_batch_size, embedding_cache)
+    await user_files_index_repository.replace_file_chunks(str(user_file.user_id), str(user_file.id), chunks, vectors)
+    return IndexingStatus.INDEXED
@@ -0,0 +1,63 @@
+import logging
+from typing import Annotated, AsyncIterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from app.application.use_cases.answers import AnswerQuestion
+from app.framework.dependencies.answers import get_answer_question
+from app.framework.dependencies.authentication import validate_token
+from app.framework.models.answers import AnswerSourceOutput, AnswerStreamEvent
+from app.shared.consts import NDJSON_MEDIA_TYPE
+from app.shared.enums import AnswerStage
+
+logger = logging.getLogger(__name__)
+
+ANSWER_FAILED_DETAIL = "Answer could not be generated."
+
+answers_router = APIRouter(prefix="/answer", tags=["answer"], dependencies=[Depends(validate_token)])
+
+
+@answers_router.post(
+    "",
+    summary="Answer a question from law acts, stream its sources and then the answer as newline-delimited JSON.",
+    response_class=StreamingResponse,
+)
+async def answer_question(
+    answer_question_: Annotated[AnswerQuestion, Depends(get_answer_question)],
+) -> StreamingResponse:
+    # Disables proxy buffering (e.g. Nginx), so fragments of the answer reach the client as they are generated.
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(_stream_answer_events(answer_question_), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+
+async def _stream_answer_events(answer_question_: AnswerQuestion) -> AsyncIterator[str]:
+    # Headers with status 200 are already sent, so a failure is reported with a terminal event, not a status code.
+    try:
+        async for stage, content in answer_question_.stream():
+            if stage == AnswerStage.SOURCES:
+                sources = [
+                    AnswerSourceOutput(
+                        number=number,
+                        act_id=passage.act_id,
+                        title=passage.title,
+                        unit=passage.unit,
+                        score=passage.score,
+                        tokens=passage.tokens,
+                    )
+                    for number, passage in enumerate(content, start=1)
+                ]
+                yield _to_ndjson_line(AnswerStreamEvent(stage=stage, sources=sources))
+            else:
+                yield _to_ndjson_line(AnswerStreamEvent(stage=stage, text=content))
+    except Exception:
+        logger.error("Answer stream failed!", exc_info=True)
+        yield _to_ndjson_line(AnswerStreamEvent(stage=AnswerStage.ERROR, detail=ANSWER_FAILED_DETAIL))
+        return
+
+    timings_ms = {stage: round(duration * 1000, 2) for stage, duration in answer_question_.timings.stages.items()}
+    yield _to_ndjson_line(AnswerStreamEvent(stage=AnswerStage.DONE, timings_ms=timings_ms))
+
+
+def _to_ndjson_line(event: AnswerStreamEvent) -> str:
+    return event.model_dump_json(exclude_none=True) + "\n"
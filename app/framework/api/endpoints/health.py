@@ -7,6 +7,7 @@ from sqlalchemy.exc import InterfaceError
 
 from app.infrastructure.relational_db.connection import check_relational_db_connection
 from app.infrastructure.vector_db.connection import check_vector_db_connection
+from app.shared.metrics import metrics_registry
 
 logger = logging.getLogger(__name__)
 
@@ -56,3 +57,8 @@ async def check_readiness(request: Request) -> Literal[True]:
     else:
         logger.critical("Application is in invalid readiness state!.", exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid application state!")
+
+
+@health_router.get("/metrics", summary="Get snapshot of in-process application metrics.")
+async def get_metrics() -> dict[str, dict]:
+    return metrics_registry.snapshot()
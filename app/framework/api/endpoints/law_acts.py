@@ -0,0 +1,21 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.application.use_cases.law_acts import ListRelatedLawActs
+from app.framework.dependencies.law_acts import get_list_related_law_acts
+from app.framework.models.law_acts import RelatedLawActOutput, RelatedLawActsOutput
+
+law_acts_router = APIRouter(prefix="/acts", tags=["law acts"])
+
+
+# Act ids contain slashes (e.g. `DU/1964/93`), so the id is matched as a path.
+@law_acts_router.get(
+    "/{act_id:path}/related",
+    summary="List acts cited by the act and acts citing it, the most referenced first.",
+)
+async def list_related_law_acts(
+    list_related_law_acts_: Annotated[ListRelatedLawActs, Depends(get_list_related_law_acts)],
+) -> RelatedLawActsOutput:
+    related_acts = await list_related_law_acts_.execute()
+    return RelatedLawActsOutput(results=[RelatedLawActOutput.model_validate(act) for act in related_acts])
@@ -0,0 +1,45 @@
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from app.framework.dependencies.file_storage import get_file_storage
+from app.infrastructure.file_storage.local.repository import LocalFileStorage
+from app.infrastructure.file_storage.local.signing import verify_upload_signature
+from app.shared.consts import LOCAL_FILES_UPLOAD_ROUTE
+from app.shared.exceptions import UploadSizeExceeded
+
+logger = logging.getLogger(__name__)
+
+local_file_storage_router = APIRouter(prefix=LOCAL_FILES_UPLOAD_ROUTE, tags=["local file storage"])
+
+
+@local_file_storage_router.put(
+    "/{file_name:path}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Upload target for pre-signed uploads, used only with local file storage.",
+    responses={
+        status.HTTP_403_FORBIDDEN: {"description": "Invalid or expired signature!"},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"description": "Body is larger than the declared size!"},
+    },
+)
+async def upload_local_file(
+    file_name: str,
+    expires: int,
+    size: int,
+    signature: str,
+    request: Request,
+    local_file_storage: Annotated[LocalFileStorage, Depends(get_file_storage)],
+):
+    content_type = request.headers.get("content-type", "")
+    if not verify_upload_signature(file_name, expires, size, content_type, signature):
+        logger.warning("Invalid local file upload signature!")
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid or expired signature!")
+
+    try:
+        await local_file_storage.upload_stream(request.stream(), file_name, max_size=size)
+    except UploadSizeExceeded:
+        logger.warning("Local file upload is larger than the declared size!")
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail="Body is larger than the declared size!"
+        )
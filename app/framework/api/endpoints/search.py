@@ -0,0 +1,112 @@
+import logging
+from typing import Annotated, AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.application.use_cases.search import GetSearchPage, OpenSearchCursor, SearchLawActs, SuggestLawActs
+from app.domain.entities.law_acts import LawActHit, SearchPage
+from app.framework.dependencies.search import (
+    get_get_search_page,
+    get_open_search_cursor,
+    get_search_law_acts,
+    get_suggest_law_acts,
+)
+from app.framework.models.search import (
+    SearchOutput,
+    SearchPageOutput,
+    SearchResultOutput,
+    SearchStreamEvent,
+    SuggestionOutput,
+    SuggestionsOutput,
+)
+from app.shared.consts import NDJSON_MEDIA_TYPE
+from app.shared.enums import SearchStage
+from app.shared.exceptions import SearchCursorExpired
+
+logger = logging.getLogger(__name__)
+
+search_router = APIRouter(prefix="/search", tags=["search"])
+
+
+@search_router.get("", summary="Search law acts fragments semantically similar to the query.")
+async def search_law_acts(
+    search_law_acts_: Annotated[SearchLawActs, Depends(get_search_law_acts)], response: Response
+) -> SearchOutput:
+    hits = await search_law_acts_.execute()
+    response.headers["Server-Timing"] = search_law_acts_.timings.to_server_timing()
+    return SearchOutput(results=_to_results_output(hits))
+
+
+@search_router.get(
+    "/stream",
+    summary="Stream search results of every stage as newline-delimited JSON, ANN hits come before reranked ones.",
+    response_class=StreamingResponse,
+)
+async def stream_search_law_acts(
+    search_law_acts_: Annotated[SearchLawActs, Depends(get_search_law_acts)],
+) -> StreamingResponse:
+    # Disables proxy buffering (e.g. Nginx), so early stages reach the client before the search finishes.
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(_stream_search_events(search_law_acts_), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+
+@search_router.get(
+    "/pages",
+    summary="Search law acts and return the first page of results with a cursor of the next ones.",
+)
+async def open_search_cursor(
+    open_search_cursor_: Annotated[OpenSearchCursor, Depends(get_open_search_cursor)], response: Response
+) -> SearchPageOutput:
+    search_page = await open_search_cursor_.execute()
+    response.headers["Server-Timing"] = open_search_cursor_.search_law_acts.timings.to_server_timing()
+    return _to_page_output(search_page)
+
+
+@search_router.get(
+    "/pages/{cursor}",
+    summary="Get a page of search results by a cursor, without searching again.",
+    responses={status.HTTP_410_GONE: {"description": "Cursor expired or data changed, search again."}},
+)
+async def get_search_page(get_search_page_: Annotated[GetSearchPage, Depends(get_get_search_page)]) -> SearchPageOutput:
+    try:
+        search_page = await get_search_page_.execute()
+    except SearchCursorExpired:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Search cursor expired, search again!")
+    return _to_page_output(search_page)
+
+
+@search_router.get(
+    "/suggestions",
+    summary="Suggest law acts by prefix of their title or citation, e.g. `kodeks post` or `Dz.U. 2023 poz. 16`.",
+)
+async def suggest_law_acts(
+    suggest_law_acts_: Annotated[SuggestLawActs, Depends(get_suggest_law_acts)],
+) -> SuggestionsOutput:
+    suggestions = await suggest_law_acts_.execute()
+    return SuggestionsOutput(results=[SuggestionOutput.model_validate(suggestion) for suggestion in suggestions])
+
+
+async def _stream_search_events(search_law_acts_: SearchLawActs) -> AsyncIterator[str]:
+    async for stage, hits in search_law_acts_.stream():
+        yield _to_ndjson_line(SearchStreamEvent(stage=stage, results=_to_results_output(hits)))
+
+    timings_ms = {stage: round(duration * 1000, 2) for stage, duration in search_law_acts_.timings.stages.items()}
+    yield _to_ndjson_line(SearchStreamEvent(stage=SearchStage.DONE, timings_ms=timings_ms))
+
+
+def _to_results_output(hits: list[LawActHit]) -> list[SearchResultOutput]:
+    return [SearchResultOutput(id=hit.id, score=hit.score, payload=hit.payload) for hit in hits]
+
+
+def _to_page_output(search_page: SearchPage) -> SearchPageOutput:
+    return SearchPageOutput(
+        results=_to_results_output(search_page.hits),
+        cursor=search_page.cursor,
+        page=search_page.page,
+        pages=search_page.pages,
+    )
+
+
+def _to_ndjson_line(event: SearchStreamEvent) -> str:
+    return event.model_dump_json(exclude_none=True) + "\n"
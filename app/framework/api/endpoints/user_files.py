@@ -4,9 +4,34 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.framework.dependencies.authentication import validate_token
-from app.shared.exceptions import EmptyFileException, FileNameExist
-from app.framework.dependencies.user_files import get_add_user_file
-from app.application.use_cases.user_files import AddUserFile
+from app.shared.exceptions import (
+    EmptyFileException,
+    FileNameExist,
+    FileTypeNotAllowed,
+    PendingUploadExpired,
+    UploadSessionNotFound,
+    UploadVerificationFailed,
+)
+from app.framework.dependencies.user_files import (
+    get_add_user_file,
+    get_create_upload_session,
+    get_finalize_upload_session,
+    get_list_user_files,
+    get_search_user_files,
+)
+from app.framework.models.user_files import (
+    UploadSessionOutput,
+    UserFileHitOutput,
+    UserFileOutput,
+    UserFilesSearchOutput,
+)
+from app.application.use_cases.user_files import (
+    AddUserFile,
+    CreateUploadSession,
+    FinalizeUploadSession,
+    ListUserFiles,
+    SearchUserFiles,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +44,7 @@ user_files_router = APIRouter(prefix="/user", tags=["user files"], dependencies=
     responses={
         status.HTTP_400_BAD_REQUEST: {"description": "File name not provided!"},
         status.HTTP_409_CONFLICT: {"description": "File with that name already exist!"},
+        status.HTTP_410_GONE: {"description": "Upload expired before it was finished!"},
     },
 )
 async def add_user_file(add_user_file_: Annotated[AddUserFile, Depends(get_add_user_file)]):
@@ -28,3 +54,77 @@ async def add_user_file(add_user_file_: Annotated[AddUserFile, Depends(get_add_u
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="File can not be empty!")
     except FileNameExist:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="File with that name already exist!")
+    except PendingUploadExpired:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Upload expired before it was finished!")
+
+
+@user_files_router.get("/files", summary="List user files, including uploads which are not finished yet.")
+async def list_user_files(
+    list_user_files_: Annotated[ListUserFiles, Depends(get_list_user_files)],
+) -> list[UserFileOutput]:
+    user_files = await list_user_files_.execute()
+    return [UserFileOutput.model_validate(user_file) for user_file in user_files]
+
+
+@user_files_router.post(
+    "/files/upload-sessions",
+    status_code=status.HTTP_201_CREATED,
+    summary="Start upload, which sends file directly to the file storage.",
+    responses={status.HTTP_409_CONFLICT: {"description": "File with that name already exist!"}},
+)
+async def create_upload_session(
+    create_upload_session_: Annotated[CreateUploadSession, Depends(get_create_upload_session)],
+) -> UploadSessionOutput:
+    try:
+        upload_session = await create_upload_session_.execute()
+    except FileNameExist:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="File with that name already exist!")
+
+    upload_target = upload_session.upload_target
+    return UploadSessionOutput(
+        file_id=upload_session.file_id,
+        upload_url=upload_target.url,
+        method=upload_target.method,
+        headers=upload_target.headers,
+        expires_at=upload_target.expires_at,
+    )
+
+
+@user_files_router.post(
+    "/files/upload-sessions/{fileId}/finalize",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "Upload session not found!"},
+        status.HTTP_409_CONFLICT: {"description": "Uploaded file does not match declared size or hash!"},
+        status.HTTP_410_GONE: {"description": "Upload expired before it was finished!"},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"description": "File type is not allowed!"},
+    },
+)
+async def finalize_upload_session(
+    finalize_upload_session_: Annotated[FinalizeUploadSession, Depends(get_finalize_upload_session)],
+):
+    try:
+        await finalize_upload_session_.execute()
+    except UploadSessionNotFound:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload session not found!")
+    except UploadVerificationFailed as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except PendingUploadExpired:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Upload expired before it was finished!")
+    except FileTypeNotAllowed:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="File type is not allowed!")
+
+
+# Included only when Qdrant is used, user files are not indexed without it.
+user_files_search_router = APIRouter(prefix="/user", tags=["user files"], dependencies=[Depends(validate_token)])
+
+
+@user_files_search_router.get(
+    "/files/search/semantic",
+    summary="Search in text of user files, which were already indexed.",
+)
+async def search_user_files(
+    search_user_files_: Annotated[SearchUserFiles, Depends(get_search_user_files)],
+) -> UserFilesSearchOutput:
+    hits = await search_user_files_.execute()
+    return UserFilesSearchOutput(results=[UserFileHitOutput.model_validate(hit) for hit in hits])
@@ -0,0 +1,18 @@
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from app.shared.consts import FILE_STORAGE_BUSY_RETRY_AFTER_SECONDS
+from app.shared.exceptions import FileStorageBusy
+
+
+async def file_storage_busy_handler(_: Request, __: FileStorageBusy) -> JSONResponse:
+    # Saturated storage executor is a temporary overload, clients are asked to retry instead of getting an error.
+    return JSONResponse(
+        {"detail": "File storage is busy, try again later!"},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(FILE_STORAGE_BUSY_RETRY_AFTER_SECONDS)},
+    )
+
+
+def include_exception_handlers(app: FastAPI):
+    app.add_exception_handler(FileStorageBusy, file_storage_busy_handler)
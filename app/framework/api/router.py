@@ -1,13 +1,30 @@
 from fastapi import FastAPI
 
 from app.framework.api.endpoints.accounts import account_router
+from app.framework.api.endpoints.answers import answers_router
 from app.framework.api.endpoints.auth import auth_router
 from app.framework.api.endpoints.health import health_router
-from app.framework.api.endpoints.user_files import user_files_router
+from app.framework.api.endpoints.law_acts import law_acts_router
+from app.framework.api.endpoints.search import search_router
+from app.framework.api.endpoints.user_files import user_files_router, user_files_search_router
+from app.infrastructure.enums import FileStorageType
+from app.infrastructure.vector_db.connection import is_qdrant_used
+from app.shared.settings.application import app_settings
 
 
 def include_all_routers(app: FastAPI):
     app.include_router(account_router)
     app.include_router(auth_router)
     app.include_router(user_files_router)
+    app.include_router(search_router)
+    app.include_router(law_acts_router)
+    app.include_router(answers_router)
     app.include_router(health_router)
+
+    if is_qdrant_used():
+        app.include_router(user_files_search_router)
+
+    if app_settings.FILE_STORAGE == FileStorageType.LOCAL_FILES:
+        from app.framework.api.endpoints.local_file_storage import local_file_storage_router
+
+        app.include_router(local_file_storage_router)
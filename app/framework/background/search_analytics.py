@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+import redis.asyncio as redis
+
+from app.application.use_cases.search import WarmUpSearchCaches
+from app.domain.services.search_analytics import (
+    delete_expired_search_events,
+    flush_search_events,
+    search_analytics_buffer,
+)
+from app.domain.services.search_cache import SearchResultCache
+from app.framework.dependencies.search import get_sparse_encoder
+from app.framework.dependencies.vector_db import get_law_acts_index
+from app.infrastructure.embeddings.service import embedding_service
+from app.infrastructure.key_value_db.redis_db import redis_pool
+from app.infrastructure.relational_db.connection import async_session_maker
+from app.infrastructure.relational_db.units_of_work.analytics import AnalyticsUnitOfWork
+from app.infrastructure.relational_db.units_of_work.law_acts import LawActsUnitOfWork
+from app.infrastructure.vector_db.hot_set import hot_set_index
+from app.infrastructure.vector_db.qdrant_db import qdrant_client
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository
+from app.shared.settings.search import search_settings
+from app.shared.settings.vector_database import qdrant_settings
+
+logger = logging.getLogger(__name__)
+
+EXPIRED_SEARCH_EVENTS_DELETE_INTERVAL_SECONDS = 3600
+
+
+async def start_search_analytics_flusher() -> Callable[..., Awaitable[None]]:
+    flusher_task = asyncio.create_task(_flush_periodically())
+
+    async def closing_callback():
+        flusher_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await flusher_task
+        # Events recorded after the last flush are written on shutdown.
+        await _flush()
+
+    return closing_callback
+
+
+async def warm_up_search_caches():
+    """Replay the most frequent searches of the last `SEARCH_WARM_UP_WINDOW_HOURS`, until the timeout.
+
+    Failures are only logged, a cold cache is slower but does not prevent serving requests.
+    """
+    if search_settings.WARM_UP_QUERIES < 1:
+        return
+
+    key_value_repo = redis.Redis(connection_pool=redis_pool)
+    try:
+        async with asyncio.timeout(search_settings.WARM_UP_TIMEOUT_SECONDS):
+            async with async_session_maker() as analytics_session, async_session_maker() as law_acts_session:
+                warm_up = WarmUpSearchCaches(
+                    AnalyticsUnitOfWork(analytics_session),
+                    get_law_acts_index(LawActsRepository(qdrant_client), hot_set_index),
+                    embedding_service,
+                    SearchResultCache(
+                        key_value_repo, qdrant_settings.LAW_ACTS_COLLECTION, search_settings.CACHE_TTL_SECONDS
+                    ),
+                    since=datetime.now(timezone.utc) - timedelta(hours=search_settings.WARM_UP_WINDOW_HOURS),
+                    max_searches=search_settings.WARM_UP_QUERIES,
+                    law_acts_unit_of_work=LawActsUnitOfWork(law_acts_session),
+                    sparse_encoder=get_sparse_encoder(),
+                )
+                replayed_searches = await warm_up.execute()
+        logger.info(f"Search caches warmed up with {replayed_searches} searches.")
+    except TimeoutError:
+        logger.warning("Warming up of search caches timed out, the remaining searches are not replayed.")
+    except Exception:
+        logger.warning("Search caches could not be warmed up.", exc_info=True)
+    finally:
+        await key_value_repo.aclose()
+
+
+async def _flush_periodically():
+    loop = asyncio.get_running_loop()
+    last_deletion = None
+    while True:
+        await asyncio.sleep(search_settings.ANALYTICS_FLUSH_INTERVAL_SECONDS)
+        await _flush()
+        if last_deletion is None or loop.time() - last_deletion >= EXPIRED_SEARCH_EVENTS_DELETE_INTERVAL_SECONDS:
+            await _delete_expired()
+            last_deletion = loop.time()
+
+
+async def _flush():
+    if not len(search_analytics_buffer):
+        return
+    try:
+        async with async_session_maker() as session:
+            await flush_search_events(
+                search_analytics_buffer, AnalyticsUnitOfWork(session), search_settings.ANALYTICS_FLUSH_BATCH_SIZE
+            )
+    except Exception:
+        logger.error("Search events flush failed!", exc_info=True)
+
+
+async def _delete_expired():
+    # Only the recent events are read by warm-up, older ones are deleted, so the table does not grow without bound.
+    try:
+        async with async_session_maker() as session:
+            deleted_events = await delete_expired_search_events(
+                AnalyticsUnitOfWork(session), search_settings.ANALYTICS_RETENTION_DAYS
+            )
+        if deleted_events:
+            logger.info(f"{deleted_events} expired search events deleted.")
+    except Exception:
+        logger.error("Expired search events deletion failed!", exc_info=True)
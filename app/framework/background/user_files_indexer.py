@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import timedelta
+from typing import Awaitable, Callable
+
+from app.application.use_cases.user_files import IndexUserFiles
+from app.framework.dependencies.file_storage import get_file_storage
+from app.infrastructure.embeddings.service import text_encoder
+from app.infrastructure.relational_db.connection import async_session_maker
+from app.infrastructure.relational_db.units_of_work.embeddings import EmbeddingsUnitOfWork
+from app.infrastructure.relational_db.units_of_work.users import UsersUnitOfWork
+from app.infrastructure.vector_db.qdrant_db import qdrant_client
+from app.infrastructure.vector_db.repositories.user_files import UserFilesIndexRepository
+from app.shared.settings.embedding import embedding_settings
+from app.shared.settings.file_storage import user_files_indexing_settings
+
+logger = logging.getLogger(__name__)
+
+INDEXING_INTERVAL_SECONDS = user_files_indexing_settings.INTERVAL_SECONDS
+STALE_INDEXING_TIMEOUT = timedelta(seconds=user_files_indexing_settings.STALE_TIMEOUT_SECONDS)
+
+
+async def start_user_files_indexer() -> Callable[..., Awaitable[None]]:
+    indexer_task = asyncio.create_task(_index_periodically())
+
+    async def closing_callback():
+        indexer_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await indexer_task
+
+    return closing_callback
+
+
+async def _index_periodically():
+    while True:
+        try:
+            async with async_session_maker() as session:
+                index_user_files = IndexUserFiles(
+                    UsersUnitOfWork(session),
+                    get_file_storage(),
+                    UserFilesIndexRepository(qdrant_client),
+                    text_encoder,
+                    user_files_indexing_settings.BATCH_SIZE,
+                    STALE_INDEXING_TIMEOUT,
+                    user_files_indexing_settings.EMBEDDING_BATCH_SIZE,
+                    user_files_indexing_settings.MAX_CHUNK_LENGTH,
+                    user_files_indexing_settings.MAX_FILE_SIZE,
+                    user_files_indexing_settings.MAX_UNPACKED_SIZE,
+                    EmbeddingsUnitOfWork(session) if embedding_settings.CACHE_ENABLED else None,
+                )
+                processed_files = await index_user_files.execute()
+        except Exception:
+            logger.error("User files indexing failed!", exc_info=True)
+            processed_files = 0
+
+        # Next batch is claimed at once while there is a backlog of files to index.
+        if processed_files < user_files_indexing_settings.BATCH_SIZE:
+            await asyncio.sleep(INDEXING_INTERVAL_SECONDS)
@@ -0,0 +1,40 @@
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import timedelta
+from typing import Awaitable, Callable
+
+from app.application.use_cases.user_files import SweepOrphanedUploads
+from app.framework.dependencies.file_storage import get_file_storage
+from app.infrastructure.relational_db.connection import async_session_maker
+from app.infrastructure.relational_db.units_of_work.users import UsersUnitOfWork
+from app.shared.settings.file_storage import file_storage_settings
+
+logger = logging.getLogger(__name__)
+
+SWEEP_INTERVAL_SECONDS = file_storage_settings.SWEEP_INTERVAL_SECONDS
+PENDING_UPLOAD_TIMEOUT = timedelta(seconds=file_storage_settings.PENDING_UPLOAD_TIMEOUT_SECONDS)
+
+
+async def start_user_files_sweeper() -> Callable[..., Awaitable[None]]:
+    sweeper_task = asyncio.create_task(_sweep_periodically())
+
+    async def closing_callback():
+        sweeper_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await sweeper_task
+
+    return closing_callback
+
+
+async def _sweep_periodically():
+    while True:
+        await asyncio.sleep(SWEEP_INTERVAL_SECONDS)
+        try:
+            async with async_session_maker() as session:
+                sweep_orphaned_uploads = SweepOrphanedUploads(
+                    UsersUnitOfWork(session), get_file_storage(), PENDING_UPLOAD_TIMEOUT
+                )
+                await sweep_orphaned_uploads.execute()
+        except Exception:
+            logger.error("Orphaned uploads sweep failed!", exc_info=True)
@@ -0,0 +1,35 @@
+"""Create or update vector database collections to match their specs.
+
+Run with `python -m app.framework.cli.apply_collections`. Only differences are applied, so it is safe to run
+repeatedly. Changing vector size or distance requires recreating the collection and is reported as an error.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.infrastructure.vector_db.collections import (
+    apply_collection_spec,
+    build_law_acts_collection_spec,
+    build_user_files_collection_spec,
+)
+from app.infrastructure.vector_db.qdrant_db import qdrant_client
+from app.shared.logging_config import setup_logging
+
+logger = logging.getLogger("app.framework.cli.apply_collections")
+
+
+async def main():
+    try:
+        for spec in (build_law_acts_collection_spec(), build_user_files_collection_spec()):
+            applied_changes = await apply_collection_spec(qdrant_client, spec)
+            if not applied_changes:
+                logger.info(f"Collection {spec.name} is up to date.")
+    finally:
+        await qdrant_client.close()
+
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(description=__doc__).parse_args()
+    setup_logging()
+    asyncio.run(main())
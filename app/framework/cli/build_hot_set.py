@@ -0,0 +1,64 @@
+"""Build the in-process hot set index of the most often searched law acts.
+
+Run with `python -m app.framework.cli.build_hot_set`. Vectors of the acts listed in `HOT_SET_ACT_IDS` are read
+from the vector database; pass `--source <directory or JSONL file>` to embed the acts instead, e.g. for
+deployments without Qdrant. Running workers load the new index after a restart.
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from app.application.use_cases.law_acts import BuildHotSetIndex
+from app.framework.cli.ingest_law_acts import DEFAULT_MAX_CHUNK_LENGTH
+from app.infrastructure.embeddings.service import text_encoder
+from app.infrastructure.enums import HotSetPrecision
+from app.infrastructure.vector_db.qdrant_db import qdrant_client
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository
+from app.shared.logging_config import setup_logging
+from app.shared.settings.vector_database import hot_set_settings
+
+logger = logging.getLogger("app.framework.cli.build_hot_set")
+
+DEFAULT_BATCH_SIZE = 256
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--act-id", dest="act_ids", action="append", help="Act in the hot set, can be repeated.")
+    parser.add_argument("--all-acts", action="store_true", help="Index all acts, for small deployments.")
+    parser.add_argument("--source", type=Path, default=None, help="Directory with JSON documents, or JSONL file.")
+    parser.add_argument("--output", type=Path, default=hot_set_settings.DIRECTORY)
+    parser.add_argument("--precision", type=HotSetPrecision, default=hot_set_settings.PRECISION)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Chunks read or embedded at once.")
+    parser.add_argument("--max-chunk-length", type=int, default=DEFAULT_MAX_CHUNK_LENGTH)
+    return parser.parse_args()
+
+
+async def main(arguments: argparse.Namespace):
+    act_ids = frozenset()
+    if not arguments.all_acts:
+        act_ids = frozenset(arguments.act_ids or hot_set_settings.ACT_IDS)
+
+    build_hot_set_index = BuildHotSetIndex(
+        law_acts_repository=LawActsRepository(qdrant_client),
+        encoder=text_encoder,
+        act_ids=act_ids,
+        directory=arguments.output,
+        precision=arguments.precision,
+        source=arguments.source,
+        batch_size=arguments.batch_size,
+        max_chunk_length=arguments.max_chunk_length,
+    )
+    try:
+        indexed_chunks = await build_hot_set_index.execute()
+    finally:
+        await qdrant_client.close()
+
+    logger.info(f"Hot set index of {indexed_chunks} chunks written to {arguments.output}.")
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main(parse_arguments()))
@@ -0,0 +1,90 @@
+"""Load law acts into the vector database.
+
+Run with `python -m app.framework.cli.ingest_law_acts <directory or JSONL file>`. Progress is checkpointed,
+running the same command again after a crash resumes where it stopped. Chunks which did not change since the
+last ingestion are skipped, so amended acts can be loaded again with `--restart`.
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+import redis.asyncio as redis
+
+from app.application.use_cases.law_acts import IngestLawActs
+from app.domain.services.sparse_vectors import sparse_encoder
+from app.infrastructure.embeddings.service import text_encoder
+from app.infrastructure.key_value_db.redis_db import redis_pool
+from app.infrastructure.relational_db.connection import async_session_maker, engine
+from app.infrastructure.relational_db.units_of_work.embeddings import EmbeddingsUnitOfWork
+from app.infrastructure.relational_db.units_of_work.law_acts import LawActsUnitOfWork
+from app.infrastructure.vector_db.qdrant_db import qdrant_client
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository
+from app.shared.logging_config import setup_logging
+from app.shared.settings.embedding import embedding_settings
+
+logger = logging.getLogger("app.framework.cli.ingest_law_acts")
+
+DEFAULT_CHECKPOINT_PATH = Path("ingest_law_acts.checkpoint.json")
+DEFAULT_WINDOW_SIZE = 2048
+DEFAULT_UPLOAD_BATCH_SIZE = 256
+DEFAULT_UPLOAD_WORKERS = 4
+DEFAULT_MAX_CHUNK_LENGTH = 2000
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("source", type=Path, help="Directory with JSON documents, or JSONL file.")
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT_PATH)
+    parser.add_argument("--restart", action="store_true", help="Ignore saved checkpoint.")
+    parser.add_argument("--window-size", type=int, default=DEFAULT_WINDOW_SIZE, help="Chunks held in memory.")
+    parser.add_argument("--embedding-batch-size", type=int, default=embedding_settings.MAX_BATCH_SIZE)
+    parser.add_argument("--upload-batch-size", type=int, default=DEFAULT_UPLOAD_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=DEFAULT_UPLOAD_WORKERS, help="Parallel upload workers.")
+    parser.add_argument("--max-chunk-length", type=int, default=DEFAULT_MAX_CHUNK_LENGTH)
+    return parser.parse_args()
+
+
+async def main(arguments: argparse.Namespace):
+    if arguments.restart:
+        arguments.checkpoint.unlink(missing_ok=True)
+
+    key_value_repo = redis.Redis(connection_pool=redis_pool)
+    session = async_session_maker()
+    ingest_law_acts = IngestLawActs(
+        law_acts_repository=LawActsRepository(qdrant_client),
+        law_acts_unit_of_work=LawActsUnitOfWork(session),
+        key_value_repo=key_value_repo,
+        encoder=text_encoder,
+        source=arguments.source,
+        checkpoint_path=arguments.checkpoint,
+        window_size=arguments.window_size,
+        embedding_batch_size=arguments.embedding_batch_size,
+        upload_batch_size=arguments.upload_batch_size,
+        upload_workers=arguments.workers,
+        max_chunk_length=arguments.max_chunk_length,
+        embeddings_unit_of_work=EmbeddingsUnitOfWork(session) if embedding_settings.CACHE_ENABLED else None,
+        sparse_encoder=sparse_encoder,
+    )
+    try:
+        report = await ingest_law_acts.execute()
+    finally:
+        await qdrant_client.close()
+        await session.close()
+        await engine.dispose()
+        await key_value_repo.aclose()
+        await redis_pool.disconnect()
+
+    logger.info(
+        f"Ingested {report.documents} documents, {report.chunks} chunks in {report.elapsed_seconds:.1f} s, "
+        f"{report.chunks_per_second:.1f} chunks/s. Skipped {report.skipped_chunks} unchanged chunks, "
+        f"deleted {report.deleted_chunks} removed chunks."
+    )
+    if embedding_settings.CACHE_ENABLED:
+        logger.info(f"Embedding cache {report.embedding_cache_hits} hits, {report.embedding_cache_misses} misses.")
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main(parse_arguments()))
@@ -0,0 +1,47 @@
+from typing import Annotated, Optional
+
+from fastapi import Depends
+
+from app.application.use_cases.answers import AnswerQuestion
+from app.domain.entities.law_acts import LawActsFilter
+from app.domain.interfaces.embeddings import EmbeddingService, SparseTextEncoder
+from app.domain.interfaces.language_models import LanguageModel
+from app.domain.interfaces.law_acts import LawActsIndex
+from app.framework.dependencies.search import get_sparse_encoder
+from app.framework.dependencies.vector_db import get_law_acts_index
+from app.framework.models.answers import AnswerInput
+from app.infrastructure.embeddings.service import get_embedding_service
+from app.infrastructure.language_models.service import get_language_model
+from app.shared.settings.answer import answer_settings
+from app.shared.settings.search import search_settings
+
+
+def answer_question_provider() -> type[AnswerQuestion]:
+    return AnswerQuestion
+
+
+def get_answer_question(
+    answer_input: AnswerInput,
+    law_acts_repository: Annotated[LawActsIndex, Depends(get_law_acts_index)],
+    embedding_service: Annotated[EmbeddingService, Depends(get_embedding_service)],
+    language_model: Annotated[LanguageModel, Depends(get_language_model)],
+    query_sparse_encoder: Annotated[Optional[SparseTextEncoder], Depends(get_sparse_encoder)],
+    answer_question: type[AnswerQuestion] = Depends(answer_question_provider),
+) -> AnswerQuestion:
+    filters = LawActsFilter(
+        act_type=answer_input.act_type,
+        issuing_body=answer_input.issuing_body,
+        in_force_on=answer_input.in_force_on,
+    )
+    return answer_question(
+        law_acts_repository,
+        embedding_service,
+        language_model,
+        answer_input.question,
+        filters,
+        search_settings.RERANK_ENABLED if answer_input.rerank is None else answer_input.rerank,
+        answer_settings.RETRIEVAL_LIMIT,
+        answer_settings.CONTEXT_TOKEN_BUDGET,
+        answer_settings.MAX_TOKENS,
+        sparse_encoder=query_sparse_encoder,
+    )
@@ -0,0 +1,21 @@
+from typing import Annotated
+
+from fastapi import Depends, Path, Query
+
+from app.application.use_cases.law_acts import ListRelatedLawActs
+from app.framework.dependencies.units_of_work import get_law_acts_unit_of_work
+from app.framework.models.law_acts import RelatedLawActsParameters
+from app.infrastructure.relational_db.units_of_work.law_acts import LawActsUnitOfWork
+
+
+def list_related_law_acts_provider() -> type[ListRelatedLawActs]:
+    return ListRelatedLawActs
+
+
+def get_list_related_law_acts(
+    act_id: Annotated[str, Path(min_length=1, max_length=128)],
+    related_law_acts_parameters: Annotated[RelatedLawActsParameters, Query()],
+    law_acts_unit_of_work: Annotated[LawActsUnitOfWork, Depends(get_law_acts_unit_of_work)],
+    list_related_law_acts: type[ListRelatedLawActs] = Depends(list_related_law_acts_provider),
+) -> ListRelatedLawActs:
+    return list_related_law_acts(law_acts_unit_of_work, act_id, related_law_acts_parameters.limit)
@@ -0,0 +1,123 @@
+from dataclasses import replace
+from typing import Annotated, Optional
+
+from fastapi import Depends, Query
+from redis.asyncio import Redis
+
+from app.application.use_cases.search import GetSearchPage, OpenSearchCursor, SearchLawActs, SuggestLawActs
+from app.domain.entities.law_acts import LawActsFilter
+from app.domain.interfaces.embeddings import EmbeddingService, SparseTextEncoder
+from app.domain.interfaces.law_acts import LawActsIndex
+from app.domain.services.search_analytics import SearchAnalyticsBuffer, search_analytics_buffer
+from app.domain.services.search_cache import SearchResultCache
+from app.domain.services.search_cursor import SearchCursorStore
+from app.domain.services.sparse_vectors import sparse_encoder
+from app.domain.services.suggestions import SuggestionIndex
+from app.framework.dependencies.key_value_repository import get_key_value_repository
+from app.framework.dependencies.units_of_work import get_law_acts_unit_of_work
+from app.framework.dependencies.vector_db import get_law_acts_index
+from app.framework.models.search import SearchPageParameters, SearchParameters, SuggestionsParameters
+from app.infrastructure.embeddings.service import get_embedding_service
+from app.infrastructure.relational_db.units_of_work.law_acts import LawActsUnitOfWork
+from app.shared.settings.search import search_settings
+from app.shared.settings.vector_database import qdrant_settings
+
+
+def get_search_result_cache(key_value_repo: Annotated[Redis, Depends(get_key_value_repository)]) -> SearchResultCache:
+    return SearchResultCache(key_value_repo, qdrant_settings.LAW_ACTS_COLLECTION, search_settings.CACHE_TTL_SECONDS)
+
+
+def get_search_cursor_store(key_value_repo: Annotated[Redis, Depends(get_key_value_repository)]) -> SearchCursorStore:
+    return SearchCursorStore(key_value_repo, qdrant_settings.LAW_ACTS_COLLECTION, search_settings.CURSOR_TTL_SECONDS)
+
+
+def get_suggestion_index(key_value_repo: Annotated[Redis, Depends(get_key_value_repository)]) -> SuggestionIndex:
+    return SuggestionIndex(key_value_repo)
+
+
+def get_sparse_encoder() -> Optional[SparseTextEncoder]:
+    return sparse_encoder if search_settings.HYBRID_ENABLED else None
+
+
+def get_search_analytics_buffer() -> Optional[SearchAnalyticsBuffer]:
+    return search_analytics_buffer if search_settings.ANALYTICS_ENABLED else None
+
+
+def search_law_acts_provider() -> type[SearchLawActs]:
+    return SearchLawActs
+
+
+def get_search_law_acts(
+    search_parameters: Annotated[SearchParameters, Query()],
+    law_acts_repository: Annotated[LawActsIndex, Depends(get_law_acts_index)],
+    embedding_service: Annotated[EmbeddingService, Depends(get_embedding_service)],
+    search_result_cache: Annotated[SearchResultCache, Depends(get_search_result_cache)],
+    suggestion_index: Annotated[SuggestionIndex, Depends(get_suggestion_index)],
+    law_acts_unit_of_work: Annotated[LawActsUnitOfWork, Depends(get_law_acts_unit_of_work)],
+    query_sparse_encoder: Annotated[Optional[SparseTextEncoder], Depends(get_sparse_encoder)],
+    analytics_buffer: Annotated[Optional[SearchAnalyticsBuffer], Depends(get_search_analytics_buffer)],
+    search_law_acts: type[SearchLawActs] = Depends(search_law_acts_provider),
+) -> SearchLawActs:
+    filters = LawActsFilter(
+        act_type=search_parameters.act_type,
+        issuing_body=search_parameters.issuing_body,
+        in_force_on=search_parameters.in_force_on,
+    )
+    return search_law_acts(
+        law_acts_repository,
+        embedding_service,
+        search_result_cache,
+        search_parameters.query,
+        filters,
+        search_parameters.limit,
+        search_parameters.score_threshold,
+        search_parameters.fields,
+        search_settings.RERANK_ENABLED if search_parameters.rerank is None else search_parameters.rerank,
+        suggestion_index=suggestion_index,
+        law_acts_unit_of_work=law_acts_unit_of_work,
+        sparse_encoder=query_sparse_encoder,
+        analytics_buffer=analytics_buffer,
+    )
+
+
+def open_search_cursor_provider() -> type[OpenSearchCursor]:
+    return OpenSearchCursor
+
+
+def get_open_search_cursor(
+    search_parameters: Annotated[SearchParameters, Query()],
+    search_law_acts_: Annotated[SearchLawActs, Depends(get_search_law_acts)],
+    search_cursor_store: Annotated[SearchCursorStore, Depends(get_search_cursor_store)],
+    open_search_cursor: type[OpenSearchCursor] = Depends(open_search_cursor_provider),
+) -> OpenSearchCursor:
+    # All results which can be paged are found at once, `limit` is the size of a page.
+    max_results = max(search_parameters.limit, search_settings.CURSOR_MAX_RESULTS)
+    return open_search_cursor(
+        replace(search_law_acts_, limit=max_results), search_cursor_store, search_parameters.limit
+    )
+
+
+def get_search_page_provider() -> type[GetSearchPage]:
+    return GetSearchPage
+
+
+def get_get_search_page(
+    cursor: str,
+    search_page_parameters: Annotated[SearchPageParameters, Query()],
+    law_acts_repository: Annotated[LawActsIndex, Depends(get_law_acts_index)],
+    search_cursor_store: Annotated[SearchCursorStore, Depends(get_search_cursor_store)],
+    get_search_page: type[GetSearchPage] = Depends(get_search_page_provider),
+) -> GetSearchPage:
+    return get_search_page(law_acts_repository, search_cursor_store, cursor, search_page_parameters.page)
+
+
+def suggest_law_acts_provider() -> type[SuggestLawActs]:
+    return SuggestLawActs
+
+
+def get_suggest_law_acts(
+    suggestions_parameters: Annotated[SuggestionsParameters, Query()],
+    suggestion_index: Annotated[SuggestionIndex, Depends(get_suggestion_index)],
+    suggest_law_acts: type[SuggestLawActs] = Depends(suggest_law_acts_provider),
+) -> SuggestLawActs:
+    return suggest_law_acts(suggestion_index, suggestions_parameters.prefix, suggestions_parameters.limit)
@@ -2,8 +2,13 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.relational_db.connection import get_relational_session
+from app.infrastructure.relational_db.units_of_work.law_acts import LawActsUnitOfWork
 from app.infrastructure.relational_db.units_of_work.users import UsersUnitOfWork
 
 
 def get_users_unit_of_work(session: AsyncSession = Depends(get_relational_session)) -> UsersUnitOfWork:
     return UsersUnitOfWork(session)
+
+
+def get_law_acts_unit_of_work(session: AsyncSession = Depends(get_relational_session)) -> LawActsUnitOfWork:
+    return LawActsUnitOfWork(session)
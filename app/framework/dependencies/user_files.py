@@ -1,12 +1,27 @@
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends, Request, UploadFile
+from fastapi import Depends, Path, Query, Request, UploadFile
 
+from app.domain.interfaces.embeddings import EmbeddingService
 from app.domain.interfaces.file_storage import StorageRepository
 from app.framework.dependencies.file_storage import get_file_storage
 from app.framework.dependencies.units_of_work import get_users_unit_of_work
+from app.framework.dependencies.vector_db import get_user_files_index_repository
+from app.infrastructure.embeddings.service import get_embedding_service
 from app.infrastructure.relational_db.units_of_work.users import UsersUnitOfWork
-from app.application.use_cases.user_files import AddUserFile
+from app.infrastructure.vector_db.repositories.user_files import UserFilesIndexRepository
+from app.framework.models.user_files import UploadSessionCreate, UploadSessionFinalize, UserFilesSearchParameters
+from app.application.use_cases.user_files import (
+    AddUserFile,
+    CreateUploadSession,
+    FinalizeUploadSession,
+    ListUserFiles,
+    SearchUserFiles,
+)
+from app.shared.settings.file_storage import file_storage_settings
+
+upload_session_expiration_seconds = file_storage_settings.UPLOAD_SESSION_EXPIRATION_SECONDS
 
 
 def add_user_file_provider() -> type[AddUserFile]:
@@ -18,4 +33,82 @@ def get_add_user_file(user_file: UploadFile,
     storage_repository: Annotated[StorageRepository, Depends(get_file_storage)],
     users_unit_of_work: UsersUnitOfWork = Depends(get_users_unit_of_work),
     add_user_file: type[AddUserFile] = Depends(add_user_file_provider)) -> AddUserFile:
-    return add_user_file()
\ No newline at end of file
+    user_id = request.state.user_id
+    return add_user_file(users_unit_of_work, storage_repository, user_file, user_id)
+
+
+def list_user_files_provider() -> type[ListUserFiles]:
+    return ListUserFiles
+
+
+def get_list_user_files(
+    request: Request,
+    users_unit_of_work: UsersUnitOfWork = Depends(get_users_unit_of_work),
+    list_user_files: type[ListUserFiles] = Depends(list_user_files_provider),
+) -> ListUserFiles:
+    user_id = request.state.user_id
+    return list_user_files(users_unit_of_work, user_id)
+
+
+def create_upload_session_provider() -> type[CreateUploadSession]:
+    return CreateUploadSession
+
+
+def get_create_upload_session(
+    upload_session_data: UploadSessionCreate,
+    request: Request,
+    storage_repository: Annotated[StorageRepository, Depends(get_file_storage)],
+    users_unit_of_work: UsersUnitOfWork = Depends(get_users_unit_of_work),
+    create_upload_session: type[CreateUploadSession] = Depends(create_upload_session_provider),
+) -> CreateUploadSession:
+    user_id = request.state.user_id
+    return create_upload_session(
+        users_unit_of_work,
+        storage_repository,
+        user_id,
+        upload_session_data.file_name,
+        upload_session_data.content_type,
+        upload_session_data.size,
+        upload_session_expiration_seconds,
+    )
+
+
+def finalize_upload_session_provider() -> type[FinalizeUploadSession]:
+    return FinalizeUploadSession
+
+
+def get_finalize_upload_session(
+    finalize_data: UploadSessionFinalize,
+    request: Request,
+    storage_repository: Annotated[StorageRepository, Depends(get_file_storage)],
+    file_id: UUID = Path(alias="fileId"),
+    users_unit_of_work: UsersUnitOfWork = Depends(get_users_unit_of_work),
+    finalize_upload_session: type[FinalizeUploadSession] = Depends(finalize_upload_session_provider),
+) -> FinalizeUploadSession:
+    user_id = request.state.user_id
+    return finalize_upload_session(
+        users_unit_of_work, storage_repository, user_id, str(file_id), finalize_data.size, finalize_data.md5_hash
+    )
+
+
+def search_user_files_provider() -> type[SearchUserFiles]:
+    return SearchUserFiles
+
+
+def get_search_user_files(
+    search_parameters: Annotated[UserFilesSearchParameters, Query()],
+    request: Request,
+    user_files_index_repository: Annotated[UserFilesIndexRepository, Depends(get_user_files_index_repository)],
+    embedding_service: Annotated[EmbeddingService, Depends(get_embedding_service)],
+    search_user_files: type[SearchUserFiles] = Depends(search_user_files_provider),
+) -> SearchUserFiles:
+    # Tenant is always the authenticated user, it can not be chosen in query parameters.
+    user_id = request.state.user_id
+    return search_user_files(
+        user_files_index_repository,
+        embedding_service,
+        user_id,
+        search_parameters.query,
+        search_parameters.limit,
+        search_parameters.score_threshold,
+    )
@@ -0,0 +1,36 @@
+from typing import Annotated
+
+from fastapi import Depends
+from qdrant_client import AsyncQdrantClient
+
+from app.domain.interfaces.law_acts import LawActsIndex
+from app.infrastructure.enums import HotSetMode
+from app.infrastructure.vector_db.hot_set import HotSetIndex, get_hot_set_index
+from app.infrastructure.vector_db.qdrant_db import get_qdrant_client
+from app.infrastructure.vector_db.repositories.hot_set import HotSetLawActsRepository
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository
+from app.infrastructure.vector_db.repositories.user_files import UserFilesIndexRepository
+from app.shared.settings.vector_database import hot_set_settings
+
+
+def get_law_acts_repository(
+    qdrant_client: Annotated[AsyncQdrantClient, Depends(get_qdrant_client)],
+) -> LawActsRepository:
+    return LawActsRepository(qdrant_client)
+
+
+def get_user_files_index_repository(
+    qdrant_client: Annotated[AsyncQdrantClient, Depends(get_qdrant_client)],
+) -> UserFilesIndexRepository:
+    return UserFilesIndexRepository(qdrant_client)
+
+
+def get_law_acts_index(
+    law_acts_repository: Annotated[LawActsRepository, Depends(get_law_acts_repository)],
+    hot_set_index: Annotated[HotSetIndex, Depends(get_hot_set_index)],
+) -> LawActsIndex:
+    if hot_set_settings.MODE == HotSetMode.DISABLED:
+        return law_acts_repository
+    return HotSetLawActsRepository(
+        hot_set_index, law_acts_repository, hot_set_settings.MODE, hot_set_settings.MIN_SCORE
+    )
@@ -0,0 +1,197 @@
+import logging
+import re
+from enum import Enum, auto
+from typing import Optional
+
+from fastapi import HTTPException, status
+from python_multipart.multipart import parse_options_header
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.domain.services.content_type import SNIFF_LENGTH, sniff_content_type
+
+logger = logging.getLogger(__name__)
+
+MAX_PART_HEADERS_LENGTH = 16 * 1024
+MULTIPART_CONTENT_TYPE = b"multipart/form-data"
+FILE_PART_HEADERS_PATTERN = re.compile(rb"content-disposition:[^\r\n]*\bfilename=", re.IGNORECASE)
+
+
+class UploadGuardMiddleware:
+    """Validate multipart uploads while the request body is still streaming.
+
+    Requests to guarded paths must declare `Content-Length`, so oversized uploads are rejected before
+    any byte of the body is read. The first file part must start within `MAX_PART_HEADERS_LENGTH` bytes,
+    its first bytes are sniffed against the allowed content types before the body is passed on, so rejected
+    files never reach the multipart parser (which spools file parts to disk). Any further file parts are
+    sniffed while the body streams, a not allowed one aborts parsing of the request.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        guarded_paths: frozenset[str],
+        max_body_size: int,
+        allowed_content_types: frozenset[str],
+    ):
+        self.app = app
+        self.guarded_paths = guarded_paths
+        self.max_body_size = max_body_size
+        self.allowed_content_types = allowed_content_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.guarded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is None:
+            await self._reject(scope, receive, send, status.HTTP_411_LENGTH_REQUIRED, "Content-Length is required!")
+            return
+        if not content_length.isdigit():
+            await self._reject(scope, receive, send, status.HTTP_400_BAD_REQUEST, "Invalid Content-Length!")
+            return
+        if int(content_length) > self.max_body_size:
+            logger.warning(f"Rejected upload of {content_length} bytes, before reading the body.")
+            await self._reject(scope, receive, send, status.HTTP_413_CONTENT_TOO_LARGE, "File is too large!")
+            return
+
+        boundary = _get_multipart_boundary(scope)
+        # Without a multipart boundary no file can be parsed from the body, so only its size is limited.
+        file_parts_sniffer = _FilePartsSniffer(boundary, self.allowed_content_types) if boundary is not None else None
+        body_reader = _LimitedBodyReader(receive, self.max_body_size, file_parts_sniffer)
+        try:
+            await body_reader.read_first_file_head()
+        except HTTPException as e:
+            await self._reject(scope, receive, send, e.status_code, e.detail)
+            return
+
+        await self.app(scope, body_reader.receive, send)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, status_code: int, detail: str):
+        response = JSONResponse({"detail": detail}, status_code=status_code, headers={"Connection": "close"})
+        await response(scope, receive, send)
+
+
+def _get_multipart_boundary(scope: Scope) -> Optional[bytes]:
+    content_type = Headers(scope=scope).get("content-type")
+    if content_type is None:
+        return None
+    media_type, parameters = parse_options_header(content_type)
+    if media_type != MULTIPART_CONTENT_TYPE:
+        return None
+    return parameters.get(b"boundary") or None
+
+
+class _SniffingState(Enum):
+    PART_DELIMITER = auto()
+    PART_HEADERS = auto()
+    FILE_HEAD = auto()
+
+
+class _FilePartsSniffer:
+    """Find file parts in chunks of a multipart body and check the content type of each from its first bytes."""
+
+    def __init__(self, boundary: bytes, allowed_content_types: frozenset[str]):
+        self.allowed_content_types = allowed_content_types
+        self.found_file_parts = 0
+        self.sniffed_file_parts = 0
+        self._part_delimiter = b"--" + boundary + b"\r\n"
+        self._part_end = b"\r\n--" + boundary
+        self._state = _SniffingState.PART_DELIMITER
+        self._buffered_body = b""
+
+    def feed(self, body: bytes, more_body: bool):
+        self._buffered_body += body
+        while True:
+            if self._state == _SniffingState.PART_DELIMITER:
+                delimiter_start = self._buffered_body.find(self._part_delimiter)
+                if delimiter_start == -1:
+                    # Only the tail, which can be the beginning of a delimiter split between chunks, is kept.
+                    self._buffered_body = self._buffered_body[-len(self._part_delimiter) + 1 :]
+                    return
+                self._buffered_body = self._buffered_body[delimiter_start + len(self._part_delimiter) :]
+                self._state = _SniffingState.PART_HEADERS
+
+            elif self._state == _SniffingState.PART_HEADERS:
+                headers_end = self._buffered_body.find(b"\r\n\r\n")
+                if headers_end == -1:
+                    if len(self._buffered_body) > MAX_PART_HEADERS_LENGTH:
+                        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid multipart body!")
+                    return
+                part_headers = self._buffered_body[:headers_end]
+                self._buffered_body = self._buffered_body[headers_end + 4 :]
+                if FILE_PART_HEADERS_PATTERN.search(part_headers) is not None:
+                    self.found_file_parts += 1
+                    self._state = _SniffingState.FILE_HEAD
+                else:
+                    self._state = _SniffingState.PART_DELIMITER
+
+            else:
+                part_end = self._buffered_body.find(self._part_end)
+                if part_end == -1:
+                    if more_body and len(self._buffered_body) < SNIFF_LENGTH + len(self._part_end):
+                        return
+                    part_end = SNIFF_LENGTH
+                self._check_file_head(self._buffered_body[: min(part_end, SNIFF_LENGTH)])
+                self.sniffed_file_parts += 1
+                self._state = _SniffingState.PART_DELIMITER
+
+    def _check_file_head(self, file_head: bytes):
+        # Empty files are passed on, they are rejected with a clearer message by the endpoint.
+        if not file_head:
+            return
+        content_type = sniff_content_type(file_head)
+        if content_type not in self.allowed_content_types:
+            logger.warning(f"Rejected upload with not allowed content type {content_type}.")
+            raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="File type is not allowed!")
+
+
+class _LimitedBodyReader:
+    def __init__(self, receive: Receive, max_body_size: int, file_parts_sniffer: Optional[_FilePartsSniffer]):
+        self._receive = receive
+        self._max_body_size = max_body_size
+        self._file_parts_sniffer = file_parts_sniffer
+        self._received_size = 0
+        self._buffered_messages: list[Message] = []
+
+    async def read_first_file_head(self):
+        """Buffer the body until the first file part is sniffed.
+
+        Bodies without a file part in the first `MAX_PART_HEADERS_LENGTH` bytes are rejected, so a file can not
+        be hidden behind a large form field. Short bodies without any file are passed on to be validated
+        by the endpoint.
+        """
+        if self._file_parts_sniffer is None:
+            return
+
+        more_body = True
+        while more_body and not self._file_parts_sniffer.sniffed_file_parts:
+            message = await self._receive_checked()
+            self._buffered_messages.append(message)
+            if message["type"] != "http.request":
+                return
+            more_body = message.get("more_body", False)
+
+            if not self._file_parts_sniffer.found_file_parts and self._received_size > MAX_PART_HEADERS_LENGTH:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="File must be sent at the beginning of the body!"
+                )
+
+    async def receive(self) -> Message:
+        if self._buffered_messages:
+            return self._buffered_messages.pop(0)
+        return await self._receive_checked()
+
+    async def _receive_checked(self) -> Message:
+        message = await self._receive()
+        if message["type"] == "http.request":
+            body = message.get("body", b"")
+            self._received_size += len(body)
+            if self._received_size > self._max_body_size:
+                raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail="File is too large!")
+            if self._file_parts_sniffer is not None:
+                self._file_parts_sniffer.feed(body, message.get("more_body", False))
+        return message
@@ -0,0 +1,31 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.shared.enums import AnswerStage
+
+
+class AnswerInput(BaseModel):
+    question: str = Field(min_length=1, max_length=2000)
+    act_type: Optional[str] = Field(default=None, max_length=128)
+    issuing_body: Optional[str] = Field(default=None, max_length=256)
+    in_force_on: Optional[date] = Field(default=None, description="Answer only from acts in force on that day.")
+    rerank: Optional[bool] = Field(default=None, description="Rescore candidates with BM25, server default if empty.")
+
+
+class AnswerSourceOutput(BaseModel):
+    number: int = Field(description="Number of the source, by which the answer cites it.")
+    act_id: str
+    title: str
+    unit: str
+    score: float
+    tokens: int
+
+
+class AnswerStreamEvent(BaseModel):
+    stage: AnswerStage
+    sources: Optional[list[AnswerSourceOutput]] = None
+    text: Optional[str] = None
+    timings_ms: Optional[dict[str, float]] = None
+    detail: Optional[str] = None
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.shared.enums import ReferenceDirection
+
+
+class RelatedLawActsParameters(BaseModel):
+    limit: int = Field(default=20, ge=1, le=100)
+
+
+class RelatedLawActOutput(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    act_id: str
+    title: Optional[str]
+    direction: ReferenceDirection
+    references: int
+
+
+class RelatedLawActsOutput(BaseModel):
+    results: list[RelatedLawActOutput]
@@ -0,0 +1,63 @@
+from datetime import date
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.shared.enums import LawActPayloadField, SearchStage
+
+DEFAULT_PAYLOAD_FIELDS = [LawActPayloadField.ACT_ID, LawActPayloadField.TITLE, LawActPayloadField.UNIT]
+
+
+class SearchParameters(BaseModel):
+    query: str = Field(min_length=1, max_length=1000)
+    act_type: Optional[str] = Field(default=None, max_length=128)
+    issuing_body: Optional[str] = Field(default=None, max_length=256)
+    in_force_on: Optional[date] = Field(default=None, description="Return only acts in force on that day.")
+    limit: int = Field(default=10, ge=1, le=100)
+    score_threshold: Optional[float] = Field(default=None, ge=-1, le=1)
+    fields: list[LawActPayloadField] = Field(default=DEFAULT_PAYLOAD_FIELDS, max_length=len(LawActPayloadField))
+    rerank: Optional[bool] = Field(default=None, description="Rescore candidates with BM25, server default if empty.")
+
+
+class SearchResultOutput(BaseModel):
+    id: str
+    score: float
+    payload: dict[str, Any]
+
+
+class SearchOutput(BaseModel):
+    results: list[SearchResultOutput]
+
+
+class SearchPageParameters(BaseModel):
+    page: int = Field(default=2, ge=1, le=1000)
+
+
+class SearchPageOutput(BaseModel):
+    results: list[SearchResultOutput]
+    cursor: Optional[str] = Field(description="Cursor of the next pages, empty when all results are on this page.")
+    page: int
+    pages: int
+
+
+class SearchStreamEvent(BaseModel):
+    stage: SearchStage
+    results: Optional[list[SearchResultOutput]] = None
+    timings_ms: Optional[dict[str, float]] = None
+
+
+class SuggestionsParameters(BaseModel):
+    prefix: str = Field(min_length=1, max_length=200)
+    limit: int = Field(default=10, ge=1, le=50)
+
+
+class SuggestionOutput(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    act_id: str
+    title: str
+    citation: Optional[str]
+
+
+class SuggestionsOutput(BaseModel):
+    results: list[SuggestionOutput]
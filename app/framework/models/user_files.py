@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.shared.enums import FileStatus, IndexingStatus
+from app.shared.settings.file_storage import file_storage_settings
+
+
+class UserFileOutput(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    file_name: str
+    status: FileStatus
+    indexing_status: IndexingStatus
+    create_date: datetime
+
+
+class UploadSessionCreate(BaseModel):
+    file_name: str = Field(min_length=1, max_length=256)
+    content_type: str = Field(min_length=1, max_length=128)
+    size: int = Field(gt=0, le=file_storage_settings.MAX_UPLOAD_SIZE)
+
+    @field_validator("content_type")
+    @classmethod
+    def validate_content_type(cls, value: str):
+        if value not in file_storage_settings.ALLOWED_CONTENT_TYPES:
+            raise ValueError("File type is not allowed.")
+        return value
+
+
+class UploadSessionOutput(BaseModel):
+    file_id: UUID
+    upload_url: str
+    method: str
+    headers: dict[str, str]
+    expires_at: datetime
+
+
+class UploadSessionFinalize(BaseModel):
+    size: int = Field(gt=0)
+    md5_hash: str = Field(min_length=24, max_length=24, description="Base64 encoded MD5 digest of the file.")
+
+
+class UserFilesSearchParameters(BaseModel):
+    query: str = Field(min_length=1, max_length=1000)
+    limit: int = Field(default=10, ge=1, le=100)
+    score_threshold: Optional[float] = Field(default=None, ge=-1, le=1)
+
+
+class UserFileHitOutput(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    file_id: UUID
+    file_name: str
+    chunk_number: int
+    text: str
+    score: float
+
+
+class UserFilesSearchOutput(BaseModel):
+    results: list[UserFileHitOutput]
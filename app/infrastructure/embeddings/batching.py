@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from app.domain.interfaces.embeddings import TextEncoder
+from app.infrastructure.enums import EncoderExecutorType
+from app.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class BatchingEmbeddingService:
+    """Embed texts of concurrent requests together, in batches.
+
+    Requests are put in a queue, which is flushed when `max_batch_size` texts are waiting or `max_wait` seconds
+    passed since the first of them arrived. Batches are encoded one at a time in the executor, so encoding never
+    blocks the event loop. The worker task is started by the first request, inside the running event loop.
+    """
+
+    def __init__(self, encoder: TextEncoder, max_batch_size: int, max_wait: float, executor: Executor):
+        self.encoder = encoder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.executor = executor
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue[tuple[str, asyncio.Future, float]]] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self._batch_size = metrics_registry.histogram("embedding_batch_size", buckets=BATCH_SIZE_BUCKETS)
+        self._queue_wait = metrics_registry.histogram("embedding_queue_wait_seconds")
+        self._encode_latency = metrics_registry.histogram("embedding_encode_seconds")
+
+    async def embed(self, text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._process_batches(), name="embedding_batches")
+
+        future = loop.create_future()
+        await self._queue.put((text, future, time.perf_counter()))
+        return await future
+
+    async def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+            while not self._queue.empty():
+                _, future, _ = self._queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _process_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            await self._encode_batch(batch)
+
+    async def _encode_batch(self, batch: list[tuple[str, asyncio.Future, float]]):
+        dispatch_time = time.perf_counter()
+        self._batch_size.observe(len(batch))
+        for _, _, enqueue_time in batch:
+            self._queue_wait.observe(dispatch_time - enqueue_time)
+
+        texts = [text for text, _, _ in batch]
+        try:
+            vectors = await asyncio.get_running_loop().run_in_executor(self.executor, self.encoder.encode, texts)
+        except Exception as e:
+            logger.error(f"Encoding batch of {len(batch)} texts failed: {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._encode_latency.observe(time.perf_counter() - dispatch_time)
+
+        for (_, future, _), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector.tolist())
+
+
+def create_encoder_executor(executor_type: EncoderExecutorType, max_workers: int) -> Executor:
+    match executor_type:
+        case EncoderExecutorType.THREAD:
+            return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="embedding")
+        case EncoderExecutorType.PROCESS:
+            return ProcessPoolExecutor(max_workers=max_workers)
+        case _:
+            raise Exception(f"Invalid encoder executor configuration {executor_type} !")
@@ -0,0 +1,8 @@
+from typing import Awaitable, Callable
+
+from app.infrastructure.embeddings.service import embedding_service
+
+
+async def start_embedding_service() -> Callable[..., Awaitable[None]]:
+    # Batching worker starts with the first request, only its shutdown is bound to the application lifespan.
+    return embedding_service.close
@@ -0,0 +1,42 @@
+import re
+import zlib
+from typing import Sequence
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+")
+SIGN_BIT = 1 << 31
+# Must be changed together with features or hashing, otherwise cached embeddings of the previous version are used.
+ENCODER_VERSION = 1
+
+
+class HashingEncoder:
+    """Deterministic encoder hashing word unigrams and bigrams into a fixed number of dimensions.
+
+    It is a local stand-in for a neural model, it needs no model files and gives the same vector for the same text
+    in every process. Vectors are L2 normalized, so they can be compared with cosine distance.
+    """
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.model_id = f"hashing-v{ENCODER_VERSION}-{dimension}"
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            features = self._get_features(text)
+            if not features:
+                continue
+            hashes = np.fromiter((zlib.crc32(feature.encode()) for feature in features), np.uint32, len(features))
+            signs = np.where(hashes & SIGN_BIT, -1.0, 1.0).astype(np.float32)
+            np.add.at(vectors[row], hashes % self.dimension, signs)
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    @staticmethod
+    def _get_features(text: str) -> list[str]:
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        bigrams = [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+        return tokens + bigrams
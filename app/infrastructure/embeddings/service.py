@@ -0,0 +1,31 @@
+from fastapi.concurrency import run_in_threadpool
+
+from app.domain.interfaces.embeddings import TextEncoder
+from app.infrastructure.embeddings.batching import BatchingEmbeddingService, create_encoder_executor
+from app.infrastructure.embeddings.hashing import HashingEncoder
+from app.shared.settings.embedding import embedding_settings
+
+
+class EncoderEmbeddingService:
+    """Embed every text separately, without batching."""
+
+    def __init__(self, encoder: TextEncoder):
+        self.encoder = encoder
+
+    async def embed(self, text: str) -> list[float]:
+        vectors = await run_in_threadpool(self.encoder.encode, [text])
+        return vectors[0].tolist()
+
+
+text_encoder = HashingEncoder(embedding_settings.DIMENSION)
+
+embedding_service = BatchingEmbeddingService(
+    encoder=text_encoder,
+    max_batch_size=embedding_settings.MAX_BATCH_SIZE,
+    max_wait=embedding_settings.MAX_WAIT_MILLISECONDS / 1000,
+    executor=create_encoder_executor(embedding_settings.EXECUTOR, embedding_settings.EXECUTOR_MAX_WORKERS),
+)
+
+
+async def get_embedding_service():
+    return embedding_service
@@ -4,3 +4,31 @@ from enum import StrEnum
 class FileStorageType(StrEnum):
     GOOGLE_CLOUD = "GOOGLE_CLOUD"
     LOCAL_FILES = "LOCAL_FILES"
+
+
+class EncoderExecutorType(StrEnum):
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
+class QuantizationType(StrEnum):
+    NONE = "NONE"
+    SCALAR = "SCALAR"
+    BINARY = "BINARY"
+
+
+class HotSetMode(StrEnum):
+    DISABLED = "DISABLED"
+    FALLBACK = "FALLBACK"
+    MERGE = "MERGE"
+    EXCLUSIVE = "EXCLUSIVE"
+
+
+class LanguageModelProvider(StrEnum):
+    FAKE = "FAKE"
+    OPENAI_COMPATIBLE = "OPENAI_COMPATIBLE"
+
+
+class HotSetPrecision(StrEnum):
+    FLOAT16 = "FLOAT16"
+    INT8 = "INT8"
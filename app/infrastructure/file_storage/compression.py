@@ -0,0 +1,69 @@
+import shutil
+import zlib
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Optional
+
+from app.shared.settings.file_storage import file_storage_settings
+
+GZIP_CONTENT_ENCODING = "gzip"
+GZIP_WINDOW_BITS = 16 + zlib.MAX_WBITS
+COMPRESSION_CHUNK_SIZE = 1024 * 1024
+COMPRESSED_FILE_MAX_MEMORY_SIZE = 8 * 1024 * 1024
+
+
+def get_compression_level(content_type: Optional[str]) -> Optional[int]:
+    """Return gzip level for content type, or None when it should be stored as is."""
+    if content_type not in file_storage_settings.COMPRESSIBLE_CONTENT_TYPES:
+        return None
+    return file_storage_settings.COMPRESSION_LEVEL
+
+
+class GzipCompressingReader:
+    """File-like object reading gzip stream compressed on the fly from an uncompressed source.
+
+    Only part of the source is compressed at a time, so files of any size can be uploaded with bounded memory.
+    It can not seek, uploads which have to rewind their stream on retry use `compress_to_temporary_file`.
+    """
+
+    def __init__(self, source: BinaryIO, compression_level: int):
+        self._source = source
+        self._compressor = zlib.compressobj(compression_level, zlib.DEFLATED, GZIP_WINDOW_BITS)
+        self._buffer = bytearray()
+        self._position = 0
+        self._finished = False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._finished and (size < 0 or len(self._buffer) < size):
+            chunk = self._source.read(COMPRESSION_CHUNK_SIZE)
+            if chunk:
+                self._buffer += self._compressor.compress(chunk)
+            else:
+                self._buffer += self._compressor.flush()
+                self._finished = True
+
+        if size < 0:
+            size = len(self._buffer)
+        compressed = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._position += len(compressed)
+        return compressed
+
+    def tell(self) -> int:
+        return self._position
+
+    @staticmethod
+    def readable() -> bool:
+        return True
+
+
+def compress_to_temporary_file(source: BinaryIO, compression_level: int) -> tuple[BinaryIO, int]:
+    """Compress the source into a temporary file, spooled to disk when large, return it rewound with its size."""
+    compressed_file = SpooledTemporaryFile(max_size=COMPRESSED_FILE_MAX_MEMORY_SIZE)
+    shutil.copyfileobj(GzipCompressingReader(source, compression_level), compressed_file, COMPRESSION_CHUNK_SIZE)
+    compressed_size = compressed_file.tell()
+    compressed_file.seek(0)
+    return compressed_file, compressed_size
+
+
+def decompress(compressed: bytes) -> bytes:
+    return zlib.decompress(compressed, GZIP_WINDOW_BITS)
@@ -1,8 +1,8 @@
+import asyncio
 from typing import Callable, Awaitable
 
-from fastapi.concurrency import run_in_threadpool
-
 from app.infrastructure.enums import FileStorageType
+from app.infrastructure.file_storage.executor import storage_executor
 from app.shared.settings.application import app_settings
 
 
@@ -10,15 +10,20 @@ async def check_file_storage_connection() -> Callable[..., Awaitable[None]]:
     match app_settings.FILE_STORAGE:
         case FileStorageType.LOCAL_FILES:
             async def closing_callback():
-                pass
+                # Waiting for running calls blocks, in a thread it does not stop the loop and can time out.
+                await asyncio.to_thread(storage_executor.shutdown)
             return closing_callback
         case FileStorageType.GOOGLE_CLOUD:
             from app.infrastructure.file_storage.gc.repository import storage_client
 
-            await run_in_threadpool(storage_client.list_buckets())
+            def _check_connection():
+                return list(storage_client.list_buckets(max_results=1))
+
+            await storage_executor.run("check_connection", _check_connection)
 
             async def closing_callback():
-                await run_in_threadpool(storage_client.close)
+                await storage_executor.run("close", storage_client.close)
+                await asyncio.to_thread(storage_executor.shutdown)
 
             return closing_callback
         case _:
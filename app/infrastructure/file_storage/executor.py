@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, TypeVar
+
+from app.shared.exceptions import FileStorageBusy
+from app.shared.metrics import metrics_registry
+from app.shared.settings.file_storage import file_storage_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StorageExecutor:
+    """Bounded thread pool for blocking file storage calls.
+
+    Kept apart from the default anyio limiter used by FastAPI for sync dependencies, so slow storage
+    calls can not starve request handling on unrelated routes. When all workers are busy and the queue
+    is full, new calls are rejected with `FileStorageBusy` instead of piling up.
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="file_storage")
+        self._capacity = max_workers + max_queue_size
+        self._pending_calls = 0
+        self._pending_calls_lock = threading.Lock()
+
+        self._active_threads = metrics_registry.gauge("file_storage_executor_active_threads")
+        self._queued_calls = metrics_registry.gauge("file_storage_executor_queued_calls")
+        self._rejected_calls = metrics_registry.counter("file_storage_executor_rejected_calls")
+        self._queue_wait = metrics_registry.histogram("file_storage_executor_queue_wait_seconds")
+
+    async def run(self, operation: str, function: Callable[..., T], *args, **kwargs) -> T:
+        with self._pending_calls_lock:
+            if self._pending_calls >= self._capacity:
+                self._rejected_calls.inc()
+                logger.warning(f"File storage executor is saturated, rejecting {operation}.")
+                raise FileStorageBusy
+            self._pending_calls += 1
+
+        self._queued_calls.inc()
+        call = partial(self._timed_call, operation, time.perf_counter(), partial(function, *args, **kwargs))
+        try:
+            future = self._executor.submit(call)
+        except Exception:
+            self._release_call(was_queued=True)
+            raise
+        # Released when the call finishes in its thread, not when the awaiting coroutine is cancelled,
+        # so calls still running after a client disconnected are counted against the capacity.
+        future.add_done_callback(lambda done_future: self._release_call(was_queued=done_future.cancelled()))
+        return await asyncio.wrap_future(future)
+
+    def _release_call(self, was_queued: bool):
+        # Calls cancelled before a worker picked them up never leave the queue in `_timed_call`.
+        if was_queued:
+            self._queued_calls.dec()
+        with self._pending_calls_lock:
+            self._pending_calls -= 1
+
+    def _timed_call(self, operation: str, submit_time: float, call: Callable[[], T]) -> T:
+        start_time = time.perf_counter()
+        self._queued_calls.dec()
+        self._queue_wait.observe(start_time - submit_time)
+
+        self._active_threads.inc()
+        try:
+            return call()
+        finally:
+            self._active_threads.dec()
+            operation_latency = metrics_registry.histogram("file_storage_operation_seconds", operation=operation)
+            operation_latency.observe(time.perf_counter() - start_time)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+storage_executor = StorageExecutor(
+    max_workers=file_storage_settings.EXECUTOR_MAX_WORKERS,
+    max_queue_size=file_storage_settings.EXECUTOR_MAX_QUEUE_SIZE,
+)
@@ -1,12 +1,19 @@
 import os
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, BinaryIO, Optional
 
 from fastapi import UploadFile
-from fastapi.concurrency import run_in_threadpool
 from google.cloud import storage
 from google.cloud.storage import Blob
 
-from app.shared.consts import DEFAULT_URL_EXPIRY
+from app.domain.entities.user_files import FilesPage, StoredFileMetadata, UploadTarget
+from app.infrastructure.file_storage.compression import (
+    GZIP_CONTENT_ENCODING,
+    compress_to_temporary_file,
+    get_compression_level,
+)
+from app.infrastructure.file_storage.executor import storage_executor
+from app.shared.consts import DEFAULT_URL_EXPIRY, LIST_FILES_PAGE_SIZE
 from app.shared.settings.file_storage import gc_file_storage_settings
 
 credentials_path = gc_file_storage_settings.STORAGE_CREDENTIALS
@@ -21,21 +28,59 @@ class GCSStorageRepository:
         self.client = storage_client
         self.bucket = self.client.bucket("user_files")
         self.default_url_expiry = DEFAULT_URL_EXPIRY
+        self.executor = storage_executor
 
-    async def upload_file(self, file_bytes: UploadFile, file_name: str) -> str:
+    async def upload_file(self, file_bytes: UploadFile, file_name: str, content_type: Optional[str] = None) -> str:
         blob: Blob = self.bucket.blob(file_name)
-        await run_in_threadpool(blob.upload_from_string, file_bytes.file)
-        return await self.get_file_url(file_name)
+        compression_level = get_compression_level(content_type)
+        if compression_level is None:
+            await self.executor.run("upload_file", blob.upload_from_file, file_bytes.file, content_type=content_type)
+        else:
+            blob.content_encoding = GZIP_CONTENT_ENCODING
+            await self.executor.run(
+                "upload_file", self._upload_compressed, blob, file_bytes.file, compression_level, content_type
+            )
+        return await self.get_file_url(file_name, is_public=False)
+
+    async def move_file(self, source_file_name: str, target_file_name: str) -> None:
+        blob: Blob = self.bucket.blob(source_file_name)
+        await self.executor.run("move_file", self.bucket.rename_blob, blob, target_file_name)
 
     async def delete_file(self, file_name: str) -> None:
         blob: Blob = self.bucket.blob(file_name)
-        await run_in_threadpool(blob.delete)
+        await self.executor.run("delete_file", blob.delete)
 
     async def get_file(self, file_name: str) -> bytes:
         blob: Blob = self.bucket.blob(file_name)
-        file = await run_in_threadpool(blob.download_as_bytes)
+        # Objects stored with gzip content encoding are decompressed by the client, signed URLs are transcoded by GCS.
+        file = await self.executor.run("get_file", blob.download_as_bytes)
         return file
 
+    async def get_file_head(self, file_name: str, length: int) -> bytes:
+        blob: Blob = self.bucket.blob(file_name)
+        # The range is of the stored bytes, the client decompresses the received part of gzip encoded objects.
+        return await self.executor.run("get_file_head", blob.download_as_bytes, start=0, end=length - 1)
+
+    async def get_file_metadata(self, file_name: str) -> Optional[StoredFileMetadata]:
+        blob: Optional[Blob] = await self.executor.run("get_file_metadata", self.bucket.get_blob, file_name)
+        if blob is None:
+            return None
+        return StoredFileMetadata(size=blob.size, md5_hash=blob.md5_hash)
+
+    async def create_upload_target(
+        self,
+        file_name: str,
+        content_type: str,
+        size: int,
+        expires_in: int,
+    ) -> UploadTarget:
+        blob: Blob = self.bucket.blob(file_name)
+        session_url = await self.executor.run(
+            "create_upload_target", blob.create_resumable_upload_session, content_type=content_type, size=size
+        )
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        return UploadTarget(url=session_url, method="PUT", expires_at=expires_at)
+
     async def get_file_url(
         self,
         file_name: str,
@@ -46,14 +91,30 @@ class GCSStorageRepository:
         if is_public:
             return blob.public_url
         expiry = expires_in or self.default_url_expiry
-        return await run_in_threadpool(blob.generate_signed_url, expiration=expiry)
+        return await self.executor.run("get_file_url", blob.generate_signed_url, expiration=expiry)
 
     async def list_files(
         self,
         prefix: Optional[str] = None,
-    ) -> list[str]:
-        def _list_blobs():
-            return list(self.client.list_blobs(self.bucket, prefix=prefix))
+        page_token: Optional[str] = None,
+        max_results: Optional[int] = None,
+    ) -> AsyncIterator[FilesPage]:
+        blobs = self.client.list_blobs(
+            self.bucket,
+            prefix=prefix,
+            page_token=page_token,
+            max_results=max_results,
+            page_size=LIST_FILES_PAGE_SIZE,
+        )
+        # Only fetching the next page makes a request, iterating the fetched page is done in memory.
+        pages = blobs.pages
+        while (page := await self.executor.run("list_files", next, pages, None)) is not None:
+            yield FilesPage(file_names=[blob.name for blob in page], next_page_token=blobs.next_page_token)
 
-        blobs = await run_in_threadpool(_list_blobs)
-        return [blob.name for blob in blobs]
+    @staticmethod
+    def _upload_compressed(blob: Blob, source: BinaryIO, compression_level: int, content_type: Optional[str]):
+        # Retries of the client rewind the uploaded stream, which is not possible while compressing on the fly,
+        # so the compressed file is spooled first and uploaded with a known size.
+        compressed_file, compressed_size = compress_to_temporary_file(source, compression_level)
+        with compressed_file:
+            blob.upload_from_file(compressed_file, size=compressed_size, content_type=content_type)
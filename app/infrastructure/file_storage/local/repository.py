@@ -1,20 +1,105 @@
-from typing import Optional
+import base64
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Iterator, Optional
+from urllib.parse import quote, urlencode
 
 from fastapi import UploadFile
-from fastapi.concurrency import run_in_threadpool
+
+from app.domain.entities.user_files import FilesPage, StoredFileMetadata, UploadTarget
+from app.infrastructure.file_storage.compression import (
+    GZIP_CONTENT_ENCODING,
+    GzipCompressingReader,
+    decompress,
+    get_compression_level,
+)
+from app.infrastructure.file_storage.executor import storage_executor
+from app.infrastructure.file_storage.local.signing import sign_upload
+from app.shared.consts import LIST_FILES_PAGE_SIZE, LOCAL_FILES_UPLOAD_ROUTE
+from app.shared.exceptions import UploadSizeExceeded
+from app.shared.settings.file_storage import file_storage_settings
+
+COPY_BUFFER_SIZE = 1024 * 1024
+# Object metadata is kept in JSON sidecar files, in a directory hidden from listing.
+METADATA_DIRECTORY = ".metadata"
 
 
 class LocalFileStorage:
-    def __init__(self): ...
+    def __init__(self):
+        self.root_directory = file_storage_settings.LOCAL_DIRECTORY.resolve()
+        self.executor = storage_executor
 
-    async def upload_file(self, file_bytes: UploadFile, file_name: str) -> str:
-        raise NotImplementedError
+    async def upload_file(self, file_bytes: UploadFile, file_name: str, content_type: Optional[str] = None) -> str:
+        file_path = self._get_path(file_name)
+        source = file_bytes.file
+        metadata = {"content_type": content_type}
+        compression_level = get_compression_level(content_type)
+        if compression_level is not None:
+            source = GzipCompressingReader(source, compression_level)
+            metadata["content_encoding"] = GZIP_CONTENT_ENCODING
+        await self.executor.run("upload_file", self._write_file, source, file_path, metadata)
+        return file_path.as_uri()
+
+    async def move_file(self, source_file_name: str, target_file_name: str) -> None:
+        source_path = self._get_path(source_file_name)
+        target_path = self._get_path(target_file_name)
+        await self.executor.run("move_file", self._move_file, source_path, target_path)
 
     async def delete_file(self, file_name: str) -> None:
-        raise NotImplementedError
+        file_path = self._get_path(file_name)
+        await self.executor.run("delete_file", self._delete_file, file_path)
 
     async def get_file(self, file_name: str) -> bytes:
-        raise NotImplementedError
+        file_path = self._get_path(file_name)
+        return await self.executor.run("get_file", self._read_file, file_path)
+
+    async def get_file_head(self, file_name: str, length: int) -> bytes:
+        file_path = self._get_path(file_name)
+        return await self.executor.run("get_file_head", self._read_file_head, file_path, length)
+
+    async def get_file_metadata(self, file_name: str) -> Optional[StoredFileMetadata]:
+        file_path = self._get_path(file_name)
+        return await self.executor.run("get_file_metadata", self._read_metadata, file_path)
+
+    async def create_upload_target(
+        self,
+        file_name: str,
+        content_type: str,
+        size: int,
+        expires_in: int,
+    ) -> UploadTarget:
+        self._get_path(file_name)
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        expires = int(expires_at.timestamp())
+        signature = sign_upload(file_name, expires, size, content_type)
+        query = urlencode({"expires": expires, "size": size, "signature": signature})
+        url = f"{LOCAL_FILES_UPLOAD_ROUTE}/{quote(file_name)}?{query}"
+        return UploadTarget(url=url, method="PUT", expires_at=expires_at, headers={"Content-Type": content_type})
+
+    async def upload_stream(self, chunks: AsyncIterator[bytes], file_name: str, max_size: Optional[int] = None):
+        """Write chunks to the file, if they exceed `max_size` bytes the partial file is deleted."""
+        file_path = self._get_path(file_name)
+        await self.executor.run("upload_stream", self._write_sidecar, file_path, None)
+        destination = await self.executor.run("upload_stream", self._open_for_writing, file_path)
+        written_size = 0
+        try:
+            async for chunk in chunks:
+                written_size += len(chunk)
+                if max_size is not None and written_size > max_size:
+                    break
+                await self.executor.run("upload_stream", destination.write, chunk)
+        finally:
+            await self.executor.run("upload_stream", destination.close)
+
+        if max_size is not None and written_size > max_size:
+            await self.executor.run("upload_stream", self._delete_file, file_path)
+            raise UploadSizeExceeded()
 
     async def get_file_url(
         self,
@@ -22,10 +107,136 @@ class LocalFileStorage:
         is_public: bool,
         expires_in: Optional[int] = None,
     ) -> str:
-        raise NotImplementedError
+        # The URI points to the stored bytes, compressed files are gzip there, their encoding is only in the sidecar.
+        return self._get_path(file_name).as_uri()
 
     async def list_files(
         self,
         prefix: Optional[str] = None,
-    ) -> list[str]:
-        raise NotImplementedError
+        page_token: Optional[str] = None,
+        max_results: Optional[int] = None,
+    ) -> AsyncIterator[FilesPage]:
+        """List file names in sorted order, page by page.
+
+        The page token is the last returned file name, so listing can be resumed from it.
+        """
+        file_names = self._iterate_files(self.root_directory, prefix or "", page_token)
+        remaining_results = max_results
+        while remaining_results is None or remaining_results > 0:
+            page_size = LIST_FILES_PAGE_SIZE
+            if remaining_results is not None:
+                page_size = min(page_size, remaining_results)
+                remaining_results -= page_size
+
+            page = await self.executor.run("list_files", lambda: list(islice(file_names, page_size)))
+            if not page:
+                return
+            is_last_page = len(page) < page_size
+            yield FilesPage(file_names=page, next_page_token=None if is_last_page else page[-1])
+            if is_last_page:
+                return
+
+    def _get_path(self, file_name: str) -> Path:
+        file_path = (self.root_directory / file_name).resolve()
+        if not file_path.is_relative_to(self.root_directory):
+            raise ValueError(f"File name {file_name} points outside of the storage directory!")
+        if file_path.relative_to(self.root_directory).parts[:1] == (METADATA_DIRECTORY,):
+            raise ValueError(f"File name {file_name} points to the metadata directory!")
+        return file_path
+
+    @staticmethod
+    def _open_for_writing(file_path: Path) -> BinaryIO:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        return open(file_path, "wb")
+
+    def _write_file(self, source: BinaryIO, file_path: Path, metadata: dict):
+        self._write_sidecar(file_path, metadata)
+        with self._open_for_writing(file_path) as destination:
+            shutil.copyfileobj(source, destination, COPY_BUFFER_SIZE)
+
+    def _read_file(self, file_path: Path) -> bytes:
+        file = file_path.read_bytes()
+        metadata = self._read_sidecar(file_path)
+        if metadata.get("content_encoding") == GZIP_CONTENT_ENCODING:
+            return decompress(file)
+        return file
+
+    def _read_file_head(self, file_path: Path, length: int) -> bytes:
+        metadata = self._read_sidecar(file_path)
+        if metadata.get("content_encoding") == GZIP_CONTENT_ENCODING:
+            with gzip.open(file_path, "rb") as file:
+                return file.read(length)
+        with open(file_path, "rb") as file:
+            return file.read(length)
+
+    def _delete_file(self, file_path: Path):
+        file_path.unlink()
+        self._get_sidecar_path(file_path).unlink(missing_ok=True)
+
+    def _get_sidecar_path(self, file_path: Path) -> Path:
+        relative_path = file_path.relative_to(self.root_directory)
+        return self.root_directory / METADATA_DIRECTORY / relative_path.with_name(f"{relative_path.name}.json")
+
+    def _write_sidecar(self, file_path: Path, metadata: Optional[dict]):
+        sidecar_path = self._get_sidecar_path(file_path)
+        if metadata is None:
+            sidecar_path.unlink(missing_ok=True)
+            return
+        sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+        sidecar_path.write_text(json.dumps(metadata))
+
+    def _read_sidecar(self, file_path: Path) -> dict:
+        sidecar_path = self._get_sidecar_path(file_path)
+        if not sidecar_path.is_file():
+            return {}
+        return json.loads(sidecar_path.read_text())
+
+    @staticmethod
+    def _read_metadata(file_path: Path) -> Optional[StoredFileMetadata]:
+        if not file_path.is_file():
+            return None
+
+        md5_hash = hashlib.md5(usedforsecurity=False)
+        with open(file_path, "rb") as file:
+            while chunk := file.read(COPY_BUFFER_SIZE):
+                md5_hash.update(chunk)
+        encoded_md5_hash = base64.b64encode(md5_hash.digest()).decode("ascii")
+        return StoredFileMetadata(size=file_path.stat().st_size, md5_hash=encoded_md5_hash)
+
+    def _move_file(self, source_path: Path, target_path: Path):
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        source_path.replace(target_path)
+
+        source_sidecar_path = self._get_sidecar_path(source_path)
+        target_sidecar_path = self._get_sidecar_path(target_path)
+        if source_sidecar_path.is_file():
+            target_sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+            source_sidecar_path.replace(target_sidecar_path)
+        else:
+            target_sidecar_path.unlink(missing_ok=True)
+
+    def _iterate_files(self, directory: Path, prefix: str, page_token: Optional[str]) -> Iterator[str]:
+        # Entries are visited in sorted order, so names come out ordered by their path parts.
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except FileNotFoundError:
+            return
+        if directory == self.root_directory:
+            entries = [entry for entry in entries if entry.name != METADATA_DIRECTORY]
+        token_parts = page_token.split("/") if page_token else None
+
+        for entry in entries:
+            file_path = Path(entry.path)
+            file_name = file_path.relative_to(self.root_directory).as_posix()
+            if entry.is_dir():
+                directory_name = f"{file_name}/"
+                if not (directory_name.startswith(prefix) or prefix.startswith(directory_name)):
+                    continue
+                directory_parts = file_name.split("/")
+                if token_parts is not None and directory_parts < token_parts[: len(directory_parts)]:
+                    continue
+                yield from self._iterate_files(file_path, prefix, page_token)
+            elif entry.is_file() and file_name.startswith(prefix):
+                if token_parts is not None and file_name.split("/") <= token_parts:
+                    continue
+                yield file_name
@@ -0,0 +1,20 @@
+import hashlib
+import hmac
+import time
+
+from app.shared.settings.file_storage import file_storage_settings
+
+signing_key = file_storage_settings.LOCAL_SIGNING_KEY.get_secret_value().encode("utf-8")
+
+
+def sign_upload(file_name: str, expires: int, size: int, content_type: str) -> str:
+    # Declared size and content type are signed too, so a leaked URL can not be used for a different upload.
+    message = f"{file_name}:{expires}:{size}:{content_type}".encode("utf-8")
+    return hmac.new(signing_key, message, hashlib.sha256).hexdigest()
+
+
+def verify_upload_signature(file_name: str, expires: int, size: int, content_type: str, signature: str) -> bool:
+    if expires < time.time():
+        return False
+    expected_signature = sign_upload(file_name, expires, size, content_type)
+    return hmac.compare_digest(expected_signature, signature)
@@ -0,0 +1,8 @@
+from typing import Awaitable, Callable
+
+from app.infrastructure.language_models.service import language_model
+
+
+async def start_language_model() -> Callable[..., Awaitable[None]]:
+    # Connections to the model server are opened with the first answer, only closing is bound to the lifespan.
+    return language_model.close
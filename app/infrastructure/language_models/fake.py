@@ -0,0 +1,20 @@
+import asyncio
+import re
+from typing import AsyncIterator
+
+SOURCE_HEADER_PATTERN = re.compile(r"^\[(\d+)\] (.+)$", re.MULTILINE)
+
+
+class FakeLanguageModel:
+    """Local model for tests and development, lists the sources of the prompt word by word, without any inference."""
+
+    async def stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        sources = [f"[{number}] {header}" for number, header in SOURCE_HEADER_PATTERN.findall(prompt)]
+        answer = f"Odpowiedź na podstawie przepisów: {'; '.join(sources)}." if sources else "Brak przepisów."
+        for word_number, word in enumerate(answer.split(" ")[:max_tokens]):
+            # Control is returned to the event loop like between chunks of a real stream.
+            await asyncio.sleep(0)
+            yield word if word_number == 0 else f" {word}"
+
+    async def close(self):
+        pass
@@ -0,0 +1,52 @@
+import json
+from typing import AsyncIterator, Optional
+
+# Installed with qdrant-client, which uses it for the REST API.
+import httpx
+
+SSE_DATA_PREFIX = "data: "
+SSE_DONE = "[DONE]"
+
+
+class OpenAICompatibleLanguageModel:
+    """Streamed chat completions of a server with the OpenAI API, e.g. vLLM, llama.cpp server or Ollama.
+
+    The connection pool is kept for the whole application and closed with it.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        api_key: str,
+        timeout_seconds: float,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self.model = model
+        self.client = httpx.AsyncClient(
+            base_url=base_url, headers=headers, timeout=timeout_seconds, transport=transport
+        )
+
+    async def stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        request_body = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+        async with self.client.stream("POST", "/chat/completions", json=request_body) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith(SSE_DATA_PREFIX):
+                    continue
+                data = line.removeprefix(SSE_DATA_PREFIX)
+                if data == SSE_DONE:
+                    break
+                choices = json.loads(data)["choices"]
+                content = choices[0]["delta"].get("content") if choices else None
+                if content:
+                    yield content
+
+    async def close(self):
+        await self.client.aclose()
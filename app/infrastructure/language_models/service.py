@@ -0,0 +1,22 @@
+from app.domain.interfaces.language_models import LanguageModel
+from app.infrastructure.enums import LanguageModelProvider
+from app.infrastructure.language_models.fake import FakeLanguageModel
+from app.shared.settings.answer import language_model_settings
+
+
+def create_language_model() -> LanguageModel:
+    settings = language_model_settings
+    if settings.PROVIDER == LanguageModelProvider.OPENAI_COMPATIBLE:
+        from app.infrastructure.language_models.openai_compatible import OpenAICompatibleLanguageModel
+
+        return OpenAICompatibleLanguageModel(
+            settings.BASE_URL, settings.MODEL, settings.API_KEY, settings.TIMEOUT_SECONDS
+        )
+    return FakeLanguageModel()
+
+
+language_model = create_language_model()
+
+
+async def get_language_model() -> LanguageModel:
+    return language_model
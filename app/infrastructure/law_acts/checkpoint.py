@@ -0,0 +1,23 @@
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+from app.domain.entities.law_acts import IngestionCheckpoint
+
+
+def load_checkpoint(checkpoint_path: Path) -> Optional[IngestionCheckpoint]:
+    if not checkpoint_path.is_file():
+        return None
+    return IngestionCheckpoint(**json.loads(checkpoint_path.read_text()))
+
+
+def save_checkpoint(checkpoint_path: Path, checkpoint: IngestionCheckpoint):
+    # Written to a temporary file and renamed, so a crash never leaves a partially written checkpoint.
+    temporary_path = checkpoint_path.with_name(f"{checkpoint_path.name}.tmp")
+    with open(temporary_path, "w") as checkpoint_file:
+        json.dump(asdict(checkpoint), checkpoint_file)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(temporary_path, checkpoint_path)
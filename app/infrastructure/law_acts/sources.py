@@ -0,0 +1,37 @@
+import json
+from datetime import date
+from pathlib import Path
+from typing import Iterator
+
+from app.domain.entities.law_acts import LawActDocument
+
+DOCUMENT_FILE_PATTERN = "*.json"
+
+
+def iterate_law_act_documents(source: Path) -> Iterator[LawActDocument]:
+    """Stream law acts from a JSONL file, or from a directory with one JSON document per file.
+
+    Documents are read one at a time, in a stable order, so position in the stream can be used as a checkpoint.
+    """
+    if source.is_dir():
+        for document_path in sorted(source.rglob(DOCUMENT_FILE_PATTERN)):
+            yield _parse_document(json.loads(document_path.read_text(encoding="utf-8")))
+        return
+
+    with open(source, encoding="utf-8") as source_file:
+        for line in source_file:
+            if line.strip():
+                yield _parse_document(json.loads(line))
+
+
+def _parse_document(raw_document: dict) -> LawActDocument:
+    in_force_to = raw_document.get("in_force_to")
+    return LawActDocument(
+        act_id=raw_document["act_id"],
+        title=raw_document["title"],
+        act_type=raw_document["act_type"],
+        issuing_body=raw_document["issuing_body"],
+        in_force_from=date.fromisoformat(raw_document["in_force_from"]),
+        in_force_to=date.fromisoformat(in_force_to) if in_force_to else None,
+        text=raw_document["text"],
+    )
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import Row, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.infrastructure.relational_db.schemas.analytics as analytics_schema
+
+
+class SearchEventsRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.model = analytics_schema.SearchEvents
+
+    async def copy_many(self, columns: Sequence[str], records: list[tuple]):
+        # COPY of the asyncpg driver, on the connection of the session, so it is a part of its transaction.
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            self.model.__tablename__, records=records, columns=list(columns)
+        )
+
+    async def list_top_searches(self, since: datetime, limit: int) -> Sequence[Row]:
+        """Most frequent searches since the given time, grouped by normalized query and all search parameters."""
+        search_parameters = (
+            self.model.normalized_query,
+            self.model.act_type,
+            self.model.issuing_body,
+            self.model.in_force_on,
+            self.model.result_limit,
+            self.model.score_threshold,
+            self.model.payload_fields,
+            self.model.rerank,
+        )
+        select_statement = (
+            select(func.min(self.model.query).label("query"), *search_parameters, func.count().label("searches"))
+            .where(self.model.searched_at >= since)
+            .group_by(*search_parameters)
+            .order_by(func.count().desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(select_statement)
+        return result.all()
+
+    async def delete_older_than(self, searched_before: datetime) -> int:
+        delete_statement = delete(self.model).where(self.model.searched_at < searched_before)
+        result = await self.session.execute(delete_statement)
+        return result.rowcount
@@ -0,0 +1,25 @@
+from typing import Any, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.infrastructure.relational_db.schemas.embeddings as embeddings_schema
+
+
+class EmbeddingCacheRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.model = embeddings_schema.EmbeddingCacheEntries
+
+    async def get_many(self, model_id: str, text_hashes: Sequence[bytes]) -> dict[bytes, bytes]:
+        select_statement = select(self.model.text_hash, self.model.vector).where(
+            self.model.model_id == model_id, self.model.text_hash.in_(text_hashes)
+        )
+        result = await self.session.execute(select_statement)
+        return {text_hash: vector for text_hash, vector in result.all()}
+
+    async def add_many(self, entries_data: list[dict[str, Any]]):
+        # Concurrent runs may embed the same text, the vector is the same, so the first one is kept.
+        insert_statement = insert(self.model).values(entries_data).on_conflict_do_nothing()
+        await self.session.execute(insert_statement)
@@ -0,0 +1,113 @@
+from datetime import date
+from typing import Any, Sequence
+
+from sqlalchemy import Row, delete, func, literal, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.infrastructure.relational_db.schemas.law_acts as law_acts_schema
+from app.infrastructure.relational_db.bases import CrudRepository
+from app.shared.enums import ReferenceDirection
+
+# Keeps the number of bind parameters of one insert below the PostgreSQL limit.
+REFERENCES_INSERT_BATCH_SIZE = 4000
+
+
+class LawActChunksRepository(CrudRepository[law_acts_schema.LawActChunks]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, law_acts_schema.LawActChunks)
+
+    async def list_by_acts(self, act_ids: Sequence[str]) -> Sequence[law_acts_schema.LawActChunks]:
+        select_statement = select(self.model).where(self.model.act_id.in_(act_ids))
+        result = await self.session.scalars(select_statement)
+        return result.all()
+
+    async def upsert_many(self, chunks_data: list[dict[str, Any]]):
+        insert_statement = insert(self.model).values(chunks_data)
+        upsert_statement = insert_statement.on_conflict_do_update(
+            index_elements=[self.model.id],
+            set_={
+                "act_id": insert_statement.excluded.act_id,
+                "content_hash": insert_statement.excluded.content_hash,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(upsert_statement)
+
+    async def delete_many(self, chunk_ids: Sequence[str]):
+        delete_statement = delete(self.model).where(self.model.id.in_(chunk_ids))
+        await self.session.execute(delete_statement)
+
+
+class LawActsCatalogRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.model = law_acts_schema.LawActs
+
+    async def upsert_many(self, acts_data: list[dict[str, Any]]):
+        insert_statement = insert(self.model).values(acts_data)
+        upsert_statement = insert_statement.on_conflict_do_update(
+            index_elements=[self.model.act_id],
+            set_={
+                "title": insert_statement.excluded.title,
+                "act_type": insert_statement.excluded.act_type,
+                "enacted_on": insert_statement.excluded.enacted_on,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(upsert_statement)
+
+    async def list_by_enactment(self, enactments: Sequence[tuple[str, date]]) -> Sequence[Row[tuple[str, str, date]]]:
+        """Acts with the given pairs of act type and enactment date, as rows of act id, act type and date."""
+        select_statement = select(self.model.act_id, self.model.act_type, self.model.enacted_on).where(
+            tuple_(self.model.act_type, self.model.enacted_on).in_(enactments)
+        )
+        result = await self.session.execute(select_statement)
+        return result.all()
+
+
+class LawActReferencesRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.model = law_acts_schema.LawActReferences
+
+    async def replace_for_sources(self, source_act_ids: Sequence[str], references_data: list[dict[str, Any]]):
+        delete_statement = delete(self.model).where(self.model.source_act_id.in_(source_act_ids))
+        await self.session.execute(delete_statement)
+        for start in range(0, len(references_data), REFERENCES_INSERT_BATCH_SIZE):
+            batch = references_data[start : start + REFERENCES_INSERT_BATCH_SIZE]
+            await self.session.execute(insert(self.model).values(batch))
+
+    async def list_related(self, act_id: str, limit: int) -> Sequence[Row[tuple[str, str | None, str, int]]]:
+        """Acts cited by and citing the act, as rows of act id, title, direction and number of references.
+
+        Both directions are read in one query, each from the index starting with the given act id.
+        """
+        neighbours = union_all(
+            select(
+                self.model.target_act_id.label("act_id"), literal(ReferenceDirection.CITES.value).label("direction")
+            ).where(self.model.source_act_id == act_id),
+            select(
+                self.model.source_act_id.label("act_id"), literal(ReferenceDirection.CITED_BY.value).label("direction")
+            ).where(self.model.target_act_id == act_id),
+        ).subquery()
+        catalog = law_acts_schema.LawActs
+        references = func.count().label("references")
+        select_statement = (
+            select(neighbours.c.act_id, catalog.title, neighbours.c.direction, references)
+            .outerjoin(catalog, catalog.act_id == neighbours.c.act_id)
+            .group_by(neighbours.c.act_id, neighbours.c.direction, catalog.title)
+            .order_by(references.desc(), neighbours.c.act_id)
+            .limit(limit)
+        )
+        result = await self.session.execute(select_statement)
+        return result.all()
+
+    async def list_edges_between(self, act_ids: Sequence[str]) -> set[tuple[str, str]]:
+        select_statement = (
+            select(self.model.source_act_id, self.model.target_act_id)
+            .where(self.model.source_act_id.in_(act_ids), self.model.target_act_id.in_(act_ids))
+            .distinct()
+        )
+        result = await self.session.execute(select_statement)
+        return {(source_act_id, target_act_id) for source_act_id, target_act_id in result.all()}
@@ -1,10 +1,13 @@
-from typing import Optional
+from datetime import timedelta
+from typing import Optional, Sequence
+from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.infrastructure.relational_db.schemas.users as user_schema
 from app.infrastructure.relational_db.bases import CrudRepository
+from app.shared.enums import FileStatus, IndexingStatus
 
 
 class UsersRepository(CrudRepository[user_schema.Users]):
@@ -24,3 +27,68 @@ class UsersRepository(CrudRepository[user_schema.Users]):
 class UsersFilesRepository(CrudRepository[user_schema.UsersFiles]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, user_schema.UsersFiles)
+
+    async def list_by_user(self, user_id: str) -> Sequence[user_schema.UsersFiles]:
+        select_statement = (
+            select(self.model).where(self.model.user_id == user_id).order_by(self.model.create_date.desc())
+        )
+        result = await self.session.scalars(select_statement)
+        return result.all()
+
+    async def mark_ready(self, file_id: str) -> bool:
+        """Mark a pending file as ready, False is returned when its row was already removed by the sweeper."""
+        update_statement = (
+            update(self.model)
+            .where(self.model.id == file_id, self.model.status == FileStatus.PENDING)
+            .values(status=FileStatus.READY)
+        )
+        result = await self.session.execute(update_statement)
+        return result.rowcount == 1
+
+    async def get_stale_pending(self, pending_timeout: timedelta, limit: int) -> Sequence[user_schema.UsersFiles]:
+        select_statement = (
+            select(self.model)
+            .where(self.model.status == FileStatus.PENDING, self.model.create_date < func.now() - pending_timeout)
+            .limit(limit)
+        )
+        result = await self.session.scalars(select_statement)
+        return result.all()
+
+    async def get_pending_ids(self, file_ids: Sequence[UUID]) -> set[UUID]:
+        select_statement = select(self.model.id).where(
+            self.model.id.in_(file_ids), self.model.status == FileStatus.PENDING
+        )
+        result = await self.session.scalars(select_statement)
+        return set(result.all())
+
+    async def claim_for_indexing(self, limit: int, stale_timeout: timedelta) -> Sequence[user_schema.UsersFiles]:
+        """Mark ready files as being indexed, files claimed by a worker which died are claimed again after timeout.
+
+        Rows locked by another worker are skipped, so several instances can index files at the same time.
+        """
+        claimable_files = (
+            select(self.model.id)
+            .where(
+                self.model.status == FileStatus.READY,
+                or_(
+                    self.model.indexing_status == IndexingStatus.PENDING,
+                    (self.model.indexing_status == IndexingStatus.INDEXING)
+                    & (self.model.indexing_started_at < func.now() - stale_timeout),
+                ),
+            )
+            .order_by(self.model.create_date)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        update_statement = (
+            update(self.model)
+            .where(self.model.id.in_(claimable_files.scalar_subquery()))
+            .values(indexing_status=IndexingStatus.INDEXING, indexing_started_at=func.now())
+            .returning(self.model)
+        )
+        result = await self.session.scalars(update_statement)
+        return result.all()
+
+    async def set_indexing_status(self, file_id: str, indexing_status: IndexingStatus):
+        update_statement = update(self.model).where(self.model.id == file_id).values(indexing_status=indexing_status)
+        await self.session.execute(update_statement)
@@ -0,0 +1,32 @@
+from datetime import date, datetime
+from typing import Optional
+
+import sqlalchemy as sqla
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.relational_db.connection import Base
+from app.infrastructure.relational_db.schemas.mixins import IntIdMixin
+
+
+class SearchEvents(Base, IntIdMixin):
+    """Searches of law acts with their parameters, latency and returned chunk ids, written in batches with COPY.
+
+    Filters are separate columns, so searches can be grouped and replayed with the same parameters.
+    """
+
+    __tablename__ = "search_events"
+
+    query: Mapped[str] = mapped_column(sqla.Text, nullable=False)
+    normalized_query: Mapped[str] = mapped_column(sqla.Text, nullable=False)
+    act_type: Mapped[Optional[str]] = mapped_column(sqla.String(128), nullable=True)
+    issuing_body: Mapped[Optional[str]] = mapped_column(sqla.String(256), nullable=True)
+    in_force_on: Mapped[Optional[date]] = mapped_column(sqla.Date, nullable=True)
+    result_limit: Mapped[int] = mapped_column(sqla.Integer, nullable=False)
+    score_threshold: Mapped[Optional[float]] = mapped_column(sqla.Float, nullable=True)
+    payload_fields: Mapped[list[str]] = mapped_column(ARRAY(sqla.String(64)), nullable=False)
+    rerank: Mapped[bool] = mapped_column(sqla.Boolean, nullable=False)
+    cached: Mapped[bool] = mapped_column(sqla.Boolean, nullable=False)
+    latency_ms: Mapped[float] = mapped_column(sqla.Float, nullable=False)
+    result_ids: Mapped[list[str]] = mapped_column(ARRAY(sqla.String(64)), nullable=False)
+    searched_at: Mapped[datetime] = mapped_column(sqla.DateTime(timezone=True), nullable=False, index=True)
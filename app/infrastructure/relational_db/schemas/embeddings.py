@@ -0,0 +1,15 @@
+import sqlalchemy as sqla
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.relational_db.connection import Base
+from app.infrastructure.relational_db.schemas.mixins import CreateDateMixin
+
+
+class EmbeddingCacheEntries(Base, CreateDateMixin):
+    """Embeddings of normalized texts, vectors are stored as raw little-endian float32 values."""
+
+    __tablename__ = "embedding_cache"
+
+    model_id: Mapped[str] = mapped_column(sqla.String(128), primary_key=True)
+    text_hash: Mapped[bytes] = mapped_column(sqla.LargeBinary(32), primary_key=True)
+    vector: Mapped[bytes] = mapped_column(sqla.LargeBinary, nullable=False)
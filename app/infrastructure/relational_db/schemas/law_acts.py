@@ -0,0 +1,48 @@
+from datetime import date
+from typing import Optional
+
+import sqlalchemy as sqla
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.relational_db.connection import Base
+from app.infrastructure.relational_db.schemas.mixins import CreateDateMixin, UpdateDateMixin, UuidIdMixin
+
+
+class LawActChunks(Base, UuidIdMixin, UpdateDateMixin):
+    """Manifest of law-act chunks stored in the vector database, ids are the same as ids of points."""
+
+    __tablename__ = "law_act_chunks"
+
+    act_id: Mapped[str] = mapped_column(sqla.String(128), nullable=False, index=True)
+    content_hash: Mapped[str] = mapped_column(sqla.String(64), nullable=False)
+
+
+class LawActs(Base, UpdateDateMixin):
+    """Catalog of ingested law acts, used to resolve citations by act type and date and to name related acts."""
+
+    __tablename__ = "law_acts"
+    __table_args__ = (sqla.Index("ix_law_acts_act_type_enacted_on", "act_type", "enacted_on"),)
+
+    act_id: Mapped[str] = mapped_column(sqla.String(128), primary_key=True)
+    title: Mapped[str] = mapped_column(sqla.Text, nullable=False)
+    act_type: Mapped[str] = mapped_column(sqla.String(128), nullable=False)
+    enacted_on: Mapped[Optional[date]] = mapped_column(sqla.Date, nullable=True)
+
+
+class LawActReferences(Base, UuidIdMixin, CreateDateMixin):
+    """Citations between law acts, an empty unit is a reference to the whole act.
+
+    Both indexes cover the pair of act ids, so cited and citing acts are found with index-only scans.
+    """
+
+    __tablename__ = "law_act_references"
+    __table_args__ = (
+        sqla.UniqueConstraint("source_act_id", "source_unit", "target_act_id", "target_unit"),
+        sqla.Index("ix_law_act_references_source_target", "source_act_id", "target_act_id"),
+        sqla.Index("ix_law_act_references_target_source", "target_act_id", "source_act_id"),
+    )
+
+    source_act_id: Mapped[str] = mapped_column(sqla.String(128), nullable=False)
+    source_unit: Mapped[str] = mapped_column(sqla.String(128), nullable=False)
+    target_act_id: Mapped[str] = mapped_column(sqla.String(128), nullable=False)
+    target_unit: Mapped[str] = mapped_column(sqla.String(128), nullable=False, server_default="")
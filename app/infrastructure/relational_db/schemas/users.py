@@ -1,3 +1,5 @@
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 import sqlalchemy as sqla
@@ -5,6 +7,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructure.relational_db.connection import Base
 from app.infrastructure.relational_db.schemas.mixins import CreateDateMixin, UuidIdMixin
+from app.shared.enums import FileStatus, IndexingStatus
 
 
 class Users(Base, UuidIdMixin, CreateDateMixin):
@@ -20,9 +23,22 @@ class Users(Base, UuidIdMixin, CreateDateMixin):
 
 class UsersFiles(Base, UuidIdMixin, CreateDateMixin):
     __tablename__ = "user_files"
-    __table_args__ = (sqla.UniqueConstraint("user_id", "file_name"),)
+    __table_args__ = (
+        sqla.UniqueConstraint("user_id", "file_name"),
+        sqla.Index("ix_user_files_status_create_date", "status", "create_date"),
+        sqla.Index("ix_user_files_indexing_status", "indexing_status"),
+    )
 
     file_name: Mapped[str] = mapped_column(sqla.String(256))
     user_id: Mapped[UUID] = mapped_column(sqla.ForeignKey("users.id"), nullable=False)
+    status: Mapped[FileStatus] = mapped_column(
+        sqla.String(16), nullable=False, server_default=sqla.text(f"'{FileStatus.READY}'")
+    )
+    indexing_status: Mapped[IndexingStatus] = mapped_column(
+        sqla.String(16), nullable=False, server_default=sqla.text(f"'{IndexingStatus.PENDING}'")
+    )
+    indexing_started_at: Mapped[Optional[datetime]] = mapped_column(sqla.DateTime, nullable=True)
+    # Size declared when an upload session is created, compared with the stored object on finalize.
+    declared_size: Mapped[Optional[int]] = mapped_column(sqla.BigInteger, nullable=True)
 
     user: Mapped["Users"] = relationship("Users", back_populates="user_files")
@@ -0,0 +1,8 @@
+from app.infrastructure.relational_db.bases import BaseUnitOfWork
+from app.infrastructure.relational_db.repositories.analytics import SearchEventsRepository
+
+
+class AnalyticsUnitOfWork(BaseUnitOfWork):
+    async def __aenter__(self):
+        self.search_events: SearchEventsRepository = SearchEventsRepository(self.session)
+        return self
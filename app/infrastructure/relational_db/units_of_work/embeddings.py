@@ -0,0 +1,8 @@
+from app.infrastructure.relational_db.bases import BaseUnitOfWork
+from app.infrastructure.relational_db.repositories.embeddings import EmbeddingCacheRepository
+
+
+class EmbeddingsUnitOfWork(BaseUnitOfWork):
+    async def __aenter__(self):
+        self.cache: EmbeddingCacheRepository = EmbeddingCacheRepository(self.session)
+        return self
@@ -0,0 +1,14 @@
+from app.infrastructure.relational_db.bases import BaseUnitOfWork
+from app.infrastructure.relational_db.repositories.law_acts import (
+    LawActChunksRepository,
+    LawActReferencesRepository,
+    LawActsCatalogRepository,
+)
+
+
+class LawActsUnitOfWork(BaseUnitOfWork):
+    async def __aenter__(self):
+        self.chunks: LawActChunksRepository = LawActChunksRepository(self.session)
+        self.acts: LawActsCatalogRepository = LawActsCatalogRepository(self.session)
+        self.references: LawActReferencesRepository = LawActReferencesRepository(self.session)
+        return self
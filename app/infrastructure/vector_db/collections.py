@@ -0,0 +1,212 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+from qdrant_client import AsyncQdrantClient, models
+
+from app.infrastructure.enums import QuantizationType
+from app.shared.consts import DENSE_VECTOR_NAME, SPARSE_VECTOR_NAME
+from app.shared.enums import LawActPayloadField, UserFileChunkPayloadField
+from app.shared.exceptions import CollectionSpecMismatch
+from app.shared.settings.embedding import embedding_settings
+from app.shared.settings.vector_database import qdrant_settings
+
+logger = logging.getLogger(__name__)
+
+PayloadIndexSchema = models.PayloadSchemaType | models.KeywordIndexParams
+
+
+@dataclass(frozen=True)
+class CollectionSpec:
+    """Desired layout of a collection with a single named dense vector and optionally a sparse one."""
+
+    name: str
+    vector_size: int
+    distance: models.Distance
+    hnsw_m: int
+    hnsw_ef_construct: int
+    quantization: QuantizationType
+    vectors_on_disk: bool
+    payload_indexes: dict[str, PayloadIndexSchema] = field(default_factory=dict)
+    # With `hnsw_m` 0 and `hnsw_payload_m` set, graphs are built only per tenant, see `is_tenant` payload indexes.
+    hnsw_payload_m: Optional[int] = None
+    # Sparse vectors of terms, their IDF is computed by Qdrant over the whole collection.
+    sparse_vector: bool = False
+
+    def get_quantization_config(self) -> Optional[models.QuantizationConfig]:
+        # Quantized vectors are kept in RAM, original vectors are only read from disk to rescore the candidates.
+        match self.quantization:
+            case QuantizationType.SCALAR:
+                return models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8, quantile=0.99, always_ram=True)
+                )
+            case QuantizationType.BINARY:
+                return models.BinaryQuantization(binary=models.BinaryQuantizationConfig(always_ram=True))
+            case _:
+                return None
+
+    def get_vector_params(self) -> models.VectorParams:
+        return models.VectorParams(
+            size=self.vector_size,
+            distance=self.distance,
+            on_disk=self.vectors_on_disk,
+            hnsw_config=models.HnswConfigDiff(
+                m=self.hnsw_m, ef_construct=self.hnsw_ef_construct, payload_m=self.hnsw_payload_m
+            ),
+            quantization_config=self.get_quantization_config(),
+        )
+
+    def get_sparse_vectors_config(self) -> Optional[dict[str, models.SparseVectorParams]]:
+        if not self.sparse_vector:
+            return None
+        return {
+            SPARSE_VECTOR_NAME: models.SparseVectorParams(
+                index=models.SparseIndexParams(on_disk=self.vectors_on_disk), modifier=models.Modifier.IDF
+            )
+        }
+
+
+@dataclass
+class CollectionChanges:
+    create_collection: bool = False
+    vector_params_diff: Optional[models.VectorParamsDiff] = None
+    disable_quantization: bool = False
+    missing_payload_indexes: dict[str, PayloadIndexSchema] = field(default_factory=dict)
+
+    def describe(self) -> list[str]:
+        changes = []
+        if self.create_collection:
+            changes.append("create collection")
+        if self.vector_params_diff is not None:
+            changes.append(f"update vector parameters {self.vector_params_diff.model_dump(exclude_none=True)}")
+        if self.disable_quantization:
+            changes.append("disable quantization")
+        changes.extend(f"create payload index {field_name}" for field_name in self.missing_payload_indexes)
+        return changes
+
+
+def build_law_acts_collection_spec(
+    collection_name: str = qdrant_settings.LAW_ACTS_COLLECTION, vector_size: int = embedding_settings.DIMENSION
+) -> CollectionSpec:
+    return CollectionSpec(
+        name=collection_name,
+        vector_size=vector_size,
+        distance=models.Distance.COSINE,
+        hnsw_m=qdrant_settings.HNSW_M,
+        hnsw_ef_construct=qdrant_settings.HNSW_EF_CONSTRUCT,
+        quantization=qdrant_settings.QUANTIZATION,
+        vectors_on_disk=qdrant_settings.VECTORS_ON_DISK,
+        sparse_vector=True,
+        payload_indexes={
+            LawActPayloadField.ACT_ID: models.PayloadSchemaType.KEYWORD,
+            LawActPayloadField.ACT_TYPE: models.PayloadSchemaType.KEYWORD,
+            LawActPayloadField.ISSUING_BODY: models.PayloadSchemaType.KEYWORD,
+            LawActPayloadField.IN_FORCE_FROM: models.PayloadSchemaType.DATETIME,
+            LawActPayloadField.IN_FORCE_TO: models.PayloadSchemaType.DATETIME,
+        },
+    )
+
+
+def build_user_files_collection_spec(
+    collection_name: str = qdrant_settings.USER_FILES_COLLECTION, vector_size: int = embedding_settings.DIMENSION
+) -> CollectionSpec:
+    return CollectionSpec(
+        name=collection_name,
+        vector_size=vector_size,
+        distance=models.Distance.COSINE,
+        hnsw_m=0,
+        hnsw_ef_construct=qdrant_settings.HNSW_EF_CONSTRUCT,
+        quantization=qdrant_settings.QUANTIZATION,
+        vectors_on_disk=qdrant_settings.VECTORS_ON_DISK,
+        payload_indexes={
+            UserFileChunkPayloadField.USER_ID: models.KeywordIndexParams(
+                type=models.KeywordIndexType.KEYWORD, is_tenant=True
+            ),
+            UserFileChunkPayloadField.FILE_ID: models.PayloadSchemaType.KEYWORD,
+        },
+        hnsw_payload_m=qdrant_settings.HNSW_M,
+    )
+
+
+def plan_collection_changes(spec: CollectionSpec, collection: Optional[models.CollectionInfo]) -> CollectionChanges:
+    if collection is None:
+        return CollectionChanges(create_collection=True, missing_payload_indexes=dict(spec.payload_indexes))
+
+    vectors = collection.config.params.vectors
+    current_params = vectors.get(DENSE_VECTOR_NAME) if isinstance(vectors, dict) else None
+    if current_params is None:
+        raise CollectionSpecMismatch(f"Collection {spec.name} has no {DENSE_VECTOR_NAME} vector!")
+    if current_params.size != spec.vector_size or current_params.distance != spec.distance:
+        raise CollectionSpecMismatch(
+            f"Collection {spec.name} has {current_params.size} {current_params.distance} vectors, "
+            f"expected {spec.vector_size} {spec.distance}, it has to be recreated and ingested again!"
+        )
+    if spec.sparse_vector and SPARSE_VECTOR_NAME not in (collection.config.params.sparse_vectors or {}):
+        # Searches fall back to the dense vector, so an older collection does not prevent the start.
+        logger.warning(
+            f"Collection {spec.name} has no {SPARSE_VECTOR_NAME} vector, "
+            "recreate it and ingest again for hybrid search."
+        )
+
+    changes = CollectionChanges()
+    desired_params = spec.get_vector_params()
+    current_hnsw = current_params.hnsw_config or collection.config.hnsw_config
+    current_quantization = current_params.quantization_config or collection.config.quantization_config
+    hnsw_changed = (current_hnsw.m, current_hnsw.ef_construct) != (spec.hnsw_m, spec.hnsw_ef_construct) or (
+        spec.hnsw_payload_m is not None and current_hnsw.payload_m != spec.hnsw_payload_m
+    )
+    quantization_changed = current_quantization != desired_params.quantization_config
+    on_disk_changed = bool(current_params.on_disk) != spec.vectors_on_disk
+
+    if hnsw_changed or on_disk_changed or (quantization_changed and desired_params.quantization_config):
+        changes.vector_params_diff = models.VectorParamsDiff(
+            hnsw_config=desired_params.hnsw_config if hnsw_changed else None,
+            quantization_config=desired_params.quantization_config if quantization_changed else None,
+            on_disk=spec.vectors_on_disk if on_disk_changed else None,
+        )
+    changes.disable_quantization = quantization_changed and desired_params.quantization_config is None
+
+    changes.missing_payload_indexes = {
+        field_name: schema
+        for field_name, schema in spec.payload_indexes.items()
+        if field_name not in collection.payload_schema
+    }
+    return changes
+
+
+async def apply_collection_spec(client: AsyncQdrantClient, spec: CollectionSpec) -> list[str]:
+    """Bring collection to the layout from spec, changing only what differs. Returns applied changes."""
+    collection = None
+    if await client.collection_exists(spec.name):
+        collection = await client.get_collection(spec.name)
+    changes = plan_collection_changes(spec, collection)
+
+    if changes.create_collection:
+        await client.create_collection(
+            spec.name,
+            vectors_config={DENSE_VECTOR_NAME: spec.get_vector_params()},
+            sparse_vectors_config=spec.get_sparse_vectors_config(),
+        )
+    if changes.vector_params_diff is not None:
+        await client.update_collection(spec.name, vectors_config={DENSE_VECTOR_NAME: changes.vector_params_diff})
+    if changes.disable_quantization:
+        await client.update_collection(
+            spec.name,
+            vectors_config={DENSE_VECTOR_NAME: models.VectorParamsDiff(quantization_config=models.Disabled.DISABLED)},
+        )
+    for field_name, schema in changes.missing_payload_indexes.items():
+        await client.create_payload_index(spec.name, field_name, schema, wait=True)
+
+    applied_changes = changes.describe()
+    for change in applied_changes:
+        logger.info(f"Collection {spec.name}: {change}.")
+    return applied_changes
+
+
+def build_search_params() -> models.SearchParams:
+    quantization = None
+    if qdrant_settings.QUANTIZATION != QuantizationType.NONE:
+        quantization = models.QuantizationSearchParams(
+            rescore=True, oversampling=qdrant_settings.QUANTIZATION_OVERSAMPLING
+        )
+    return models.SearchParams(hnsw_ef=qdrant_settings.HNSW_EF, quantization=quantization)
@@ -1,8 +1,34 @@
 from typing import Callable, Awaitable
 
+from app.infrastructure.enums import HotSetMode
+from app.infrastructure.vector_db.collections import (
+    apply_collection_spec,
+    build_law_acts_collection_spec,
+    build_user_files_collection_spec,
+)
+from app.infrastructure.vector_db.hot_set import hot_set_index
 from app.infrastructure.vector_db.qdrant_db import qdrant_client
+from app.shared.settings.vector_database import hot_set_settings, qdrant_settings
+
+
+def is_qdrant_used() -> bool:
+    # In the exclusive mode law acts are searched only in the hot set, for deployments without Qdrant.
+    return hot_set_settings.MODE != HotSetMode.EXCLUSIVE
 
 
 async def check_vector_db_connection() -> Callable[..., Awaitable[None]]:
+    if hot_set_settings.MODE != HotSetMode.DISABLED:
+        hot_set_index.open(hot_set_settings.DIRECTORY)
+    if not is_qdrant_used():
+        return close_vector_db
+
     await qdrant_client.get_collections()
-    return qdrant_client.close
+    if qdrant_settings.APPLY_COLLECTIONS_ON_STARTUP:
+        await apply_collection_spec(qdrant_client, build_law_acts_collection_spec())
+        await apply_collection_spec(qdrant_client, build_user_files_collection_spec())
+    return close_vector_db
+
+
+async def close_vector_db():
+    hot_set_index.close()
+    await qdrant_client.close()
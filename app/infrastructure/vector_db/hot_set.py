@@ -0,0 +1,210 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from app.domain.entities.law_acts import LawActHit, LawActsFilter
+from app.infrastructure.enums import HotSetPrecision
+from app.shared.enums import LawActPayloadField
+from app.shared.exceptions import HotSetIndexNotLoaded
+
+VECTORS_FILE_NAME = "vectors.npy"
+SCALES_FILE_NAME = "scales.npy"
+POINTS_FILE_NAME = "points.json"
+INT8_MAX = 127
+# Rows are converted to float32 in small blocks, which stay in CPU cache and do not grow with the index.
+SCORING_BLOCK_ROWS = 256
+
+
+class HotSetIndex:
+    """Exact search over a small set of chunks, held in a memory-mapped matrix.
+
+    Vectors are normalized and stored as float16, or as int8 with a scale per row. The matrix is mapped read-only,
+    so all workers of a host share one copy from the page cache. Results are the same as Qdrant cosine search
+    and can be merged with them.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._vectors: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._payloads: list[dict[str, Any]] = []
+        self._act_types = np.array([], dtype=object)
+        self._issuing_bodies = np.array([], dtype=object)
+        self._in_force_from = np.array([], dtype="datetime64[D]")
+        self._in_force_to = np.array([], dtype="datetime64[D]")
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._vectors is not None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def open(self, directory: Path):
+        vectors = np.load(directory / VECTORS_FILE_NAME, mmap_mode="r")
+        scales = None
+        if vectors.dtype == np.int8:
+            scales = np.load(directory / SCALES_FILE_NAME)
+        points = json.loads((directory / POINTS_FILE_NAME).read_text())
+        payloads = [point["payload"] for point in points]
+
+        self._ids = [point["id"] for point in points]
+        self._rows = {point_id: row for row, point_id in enumerate(self._ids)}
+        self._payloads = payloads
+        self._act_types = np.array([payload.get(LawActPayloadField.ACT_TYPE) for payload in payloads], dtype=object)
+        self._issuing_bodies = np.array(
+            [payload.get(LawActPayloadField.ISSUING_BODY) for payload in payloads], dtype=object
+        )
+        self._in_force_from = np.array(
+            [payload.get(LawActPayloadField.IN_FORCE_FROM) for payload in payloads], dtype="datetime64[D]"
+        )
+        self._in_force_to = np.array(
+            [payload.get(LawActPayloadField.IN_FORCE_TO) for payload in payloads], dtype="datetime64[D]"
+        )
+        self._scales = scales
+        self._vectors = vectors
+
+    def close(self):
+        self._reset()
+
+    def search(
+        self,
+        vector: Sequence[float],
+        filters: LawActsFilter,
+        limit: int,
+        score_threshold: Optional[float] = None,
+        payload_fields: Sequence[LawActPayloadField] = (),
+    ) -> list[LawActHit]:
+        query_vectors = np.asarray(vector, dtype=np.float32)[np.newaxis]
+        return self.search_many(query_vectors, filters, limit, score_threshold, payload_fields)[0]
+
+    def retrieve(self, ids: Sequence[str], payload_fields: Sequence[LawActPayloadField] = ()) -> list[LawActHit]:
+        if not self.is_loaded:
+            raise HotSetIndexNotLoaded()
+        rows = [self._rows[point_id] for point_id in ids if point_id in self._rows]
+        return [
+            LawActHit(
+                id=self._ids[row],
+                score=0.0,
+                payload={field: self._payloads[row][field] for field in payload_fields if field in self._payloads[row]},
+            )
+            for row in rows
+        ]
+
+    def search_many(
+        self,
+        query_vectors: np.ndarray,
+        filters: LawActsFilter,
+        limit: int,
+        score_threshold: Optional[float] = None,
+        payload_fields: Sequence[LawActPayloadField] = (),
+    ) -> list[list[LawActHit]]:
+        """Score all matching rows against a batch of query vectors with one matrix multiply per block."""
+        if not self.is_loaded:
+            raise HotSetIndexNotLoaded()
+
+        rows = self._filter_rows(filters)
+        if not len(rows) or limit < 1:
+            return [[] for _ in query_vectors]
+
+        query_vectors = np.asarray(query_vectors, dtype=np.float32)
+        query_vectors = query_vectors / np.maximum(np.linalg.norm(query_vectors, axis=1, keepdims=True), 1e-12)
+        scores = self._score(query_vectors, rows)
+
+        if limit < len(rows):
+            best_columns = np.argpartition(-scores, limit - 1, axis=1)[:, :limit]
+        else:
+            best_columns = np.broadcast_to(np.arange(len(rows)), (len(query_vectors), len(rows)))
+
+        results = []
+        for query_scores, columns in zip(scores, best_columns):
+            columns = columns[np.argsort(-query_scores[columns], kind="stable")]
+            hits = []
+            for column in columns:
+                score = float(query_scores[column])
+                if score_threshold is not None and score < score_threshold:
+                    break
+                row = int(rows[column])
+                stored_payload = self._payloads[row]
+                payload = {field: stored_payload[field] for field in payload_fields if field in stored_payload}
+                hits.append(LawActHit(id=self._ids[row], score=score, payload=payload))
+            results.append(hits)
+        return results
+
+    def _filter_rows(self, filters: LawActsFilter) -> np.ndarray:
+        mask = np.ones(len(self._ids), dtype=bool)
+        if filters.act_type is not None:
+            mask &= self._act_types == filters.act_type
+        if filters.issuing_body is not None:
+            mask &= self._issuing_bodies == filters.issuing_body
+        if filters.in_force_on is not None:
+            in_force_on = np.datetime64(filters.in_force_on, "D")
+            mask &= self._in_force_from <= in_force_on
+            mask &= np.isnat(self._in_force_to) | (self._in_force_to > in_force_on)
+        return np.flatnonzero(mask)
+
+    def _score(self, query_vectors: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        all_rows = len(rows) == len(self._ids)
+        scores = np.empty((len(query_vectors), len(rows)), dtype=np.float32)
+        block_buffer = np.empty((SCORING_BLOCK_ROWS, self._vectors.shape[1]), dtype=np.float32)
+        for start in range(0, len(rows), SCORING_BLOCK_ROWS):
+            end = min(start + SCORING_BLOCK_ROWS, len(rows))
+            # Contiguous slices of the mapped matrix are read without gathering rows one by one.
+            block_rows = slice(start, end) if all_rows else rows[start:end]
+            block = block_buffer[: end - start]
+            np.copyto(block, self._vectors[block_rows], casting="unsafe")
+            block_scores = query_vectors @ block.T
+            if self._scales is not None:
+                block_scores *= self._scales[block_rows]
+            scores[:, start:end] = block_scores
+        return scores
+
+
+def write_hot_set_index(
+    directory: Path,
+    ids: Sequence[str],
+    vectors: np.ndarray,
+    payloads: Sequence[dict[str, Any]],
+    precision: HotSetPrecision,
+):
+    """Write index files, replacing an existing index only when all of them are written.
+
+    Workers which still map the previous files keep reading them until they are reopened.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+    temporary_directory = directory.with_name(f"{directory.name}.{os.getpid()}.tmp")
+    shutil.rmtree(temporary_directory, ignore_errors=True)
+    temporary_directory.mkdir(parents=True)
+
+    if precision == HotSetPrecision.INT8:
+        scales = np.maximum(np.abs(vectors).max(axis=1), 1e-12) / INT8_MAX
+        quantized_vectors = np.round(vectors / scales[:, np.newaxis]).astype(np.int8)
+        np.save(temporary_directory / VECTORS_FILE_NAME, quantized_vectors)
+        np.save(temporary_directory / SCALES_FILE_NAME, scales.astype(np.float32))
+    else:
+        np.save(temporary_directory / VECTORS_FILE_NAME, vectors.astype(np.float16))
+    points = [{"id": point_id, "payload": payload} for point_id, payload in zip(ids, payloads)]
+    (temporary_directory / POINTS_FILE_NAME).write_text(json.dumps(points, ensure_ascii=False))
+
+    previous_directory = directory.with_name(f"{directory.name}.{os.getpid()}.old")
+    if directory.exists():
+        directory.rename(previous_directory)
+    temporary_directory.rename(directory)
+    shutil.rmtree(previous_directory, ignore_errors=True)
+
+
+hot_set_index = HotSetIndex()
+
+
+async def get_hot_set_index() -> HotSetIndex:
+    return hot_set_index
@@ -0,0 +1,78 @@
+import asyncio
+from typing import Optional, Sequence
+
+from app.domain.entities.embeddings import SparseVector
+from app.domain.entities.law_acts import LawActHit, LawActsFilter
+from app.infrastructure.enums import HotSetMode
+from app.infrastructure.vector_db.hot_set import HotSetIndex
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository
+from app.shared.enums import LawActPayloadField
+
+
+class HotSetLawActsRepository:
+    """Search the in-process hot set first, Qdrant is queried depending on the mode.
+
+    - `FALLBACK` - Qdrant is skipped when the hot set returns `limit` hits scored at least `min_score`,
+    - `MERGE` - both are always queried and results merged by score,
+    - `EXCLUSIVE` - only the hot set is queried, for deployments without Qdrant.
+
+    The hot set is searched by the dense vector only, so hybrid searches (with a sparse vector) skip it and
+    go straight to Qdrant, unless it is not used.
+    """
+
+    def __init__(
+        self,
+        hot_set_index: HotSetIndex,
+        law_acts_repository: Optional[LawActsRepository],
+        mode: HotSetMode,
+        min_score: float,
+    ):
+        self.hot_set_index = hot_set_index
+        self.law_acts_repository = law_acts_repository
+        self.mode = mode
+        self.min_score = min_score
+
+    async def search(
+        self,
+        vector: Sequence[float],
+        filters: LawActsFilter,
+        limit: int,
+        score_threshold: Optional[float] = None,
+        payload_fields: Sequence[LawActPayloadField] = (),
+        sparse_vector: Optional[SparseVector] = None,
+    ) -> list[LawActHit]:
+        is_qdrant_used = self.mode != HotSetMode.EXCLUSIVE and self.law_acts_repository is not None
+        if is_qdrant_used and sparse_vector is not None and sparse_vector.indices:
+            # Dense hot set hits would be cached as hybrid results, and cosine scores can not be merged with fused ones.
+            return await self.law_acts_repository.search(
+                vector, filters, limit, score_threshold, payload_fields, sparse_vector=sparse_vector
+            )
+
+        hot_set_hits = await asyncio.to_thread(
+            self.hot_set_index.search, vector, filters, limit, score_threshold, payload_fields
+        )
+        if not is_qdrant_used:
+            return hot_set_hits
+        if self.mode == HotSetMode.FALLBACK and self._is_sufficient(hot_set_hits, limit):
+            return hot_set_hits
+
+        qdrant_hits = await self.law_acts_repository.search(vector, filters, limit, score_threshold, payload_fields)
+        return merge_hits(hot_set_hits, qdrant_hits, limit)
+
+    async def retrieve(self, ids: Sequence[str], payload_fields: Sequence[LawActPayloadField]) -> list[LawActHit]:
+        # All chunks of the hot set are also stored in Qdrant.
+        if self.mode == HotSetMode.EXCLUSIVE:
+            return self.hot_set_index.retrieve(ids, payload_fields)
+        return await self.law_acts_repository.retrieve(ids, payload_fields)
+
+    def _is_sufficient(self, hits: list[LawActHit], limit: int) -> bool:
+        return len(hits) >= limit and hits[-1].score >= self.min_score
+
+
+def merge_hits(first_hits: list[LawActHit], second_hits: list[LawActHit], limit: int) -> list[LawActHit]:
+    # Hot set chunks are also stored in Qdrant, so the same chunk can be returned twice.
+    best_hits: dict[str, LawActHit] = {}
+    for hit in first_hits + second_hits:
+        if hit.id not in best_hits or best_hits[hit.id].score < hit.score:
+            best_hits[hit.id] = hit
+    return sorted(best_hits.values(), key=lambda hit: hit.score, reverse=True)[:limit]
@@ -0,0 +1,236 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Collection, Optional, Sequence
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient, models
+
+from app.domain.entities.embeddings import SparseVector
+from app.domain.entities.law_acts import LawActChunk, LawActHit, LawActsFilter
+from app.infrastructure.vector_db.collections import (
+    apply_collection_spec,
+    build_law_acts_collection_spec,
+    build_search_params,
+)
+from app.shared.consts import DENSE_VECTOR_NAME, SPARSE_VECTOR_NAME
+from app.shared.enums import LawActPayloadField
+from app.shared.settings.vector_database import qdrant_settings
+
+logger = logging.getLogger(__name__)
+
+# Layout is checked again after the interval, so hybrid search starts once a collection is recreated.
+SPARSE_VECTOR_CHECK_INTERVAL_SECONDS = 300
+# Repositories are created per request, checks are kept per client and collection.
+_sparse_vector_checks: WeakKeyDictionary[AsyncQdrantClient, dict[str, tuple[bool, float]]] = WeakKeyDictionary()
+
+
+class LawActsRepository:
+    def __init__(self, client: AsyncQdrantClient, collection_name: str = qdrant_settings.LAW_ACTS_COLLECTION):
+        self.client = client
+        self.collection_name = collection_name
+        self.search_params = build_search_params()
+        self.hybrid_prefetch_per_result = qdrant_settings.HYBRID_PREFETCH_PER_RESULT
+
+    async def search(
+        self,
+        vector: Sequence[float],
+        filters: LawActsFilter,
+        limit: int,
+        score_threshold: Optional[float] = None,
+        payload_fields: Sequence[LawActPayloadField] = (),
+        sparse_vector: Optional[SparseVector] = None,
+    ) -> list[LawActHit]:
+        """Search by the dense vector, or with the sparse vector also, fusing both rankings in one query.
+
+        Scores of fused results are reciprocal ranks (RRF), `score_threshold` is applied to dense scores only.
+        Collections created before sparse vectors were added are searched by the dense vector only.
+        """
+        query_filter = build_law_acts_filter(filters)
+        with_payload = [str(payload_field) for payload_field in payload_fields] or False
+        if sparse_vector is None or not sparse_vector.indices or not await self.has_sparse_vector():
+            response = await self.client.query_points(
+                collection_name=self.collection_name,
+                query=list(vector),
+                using=DENSE_VECTOR_NAME,
+                query_filter=query_filter,
+                limit=limit,
+                score_threshold=score_threshold,
+                search_params=self.search_params,
+                with_payload=with_payload,
+            )
+        else:
+            prefetch_limit = limit * self.hybrid_prefetch_per_result
+            response = await self.client.query_points(
+                collection_name=self.collection_name,
+                prefetch=[
+                    models.Prefetch(
+                        query=list(vector),
+                        using=DENSE_VECTOR_NAME,
+                        filter=query_filter,
+                        limit=prefetch_limit,
+                        score_threshold=score_threshold,
+                        params=self.search_params,
+                    ),
+                    models.Prefetch(
+                        query=models.SparseVector(indices=sparse_vector.indices, values=sparse_vector.values),
+                        using=SPARSE_VECTOR_NAME,
+                        filter=query_filter,
+                        limit=prefetch_limit,
+                    ),
+                ],
+                query=models.FusionQuery(fusion=models.Fusion.RRF),
+                limit=limit,
+                with_payload=with_payload,
+            )
+        return [
+            LawActHit(id=str(point.id), score=point.score, payload=point.payload or {}) for point in response.points
+        ]
+
+    async def has_sparse_vector(self) -> bool:
+        collection_checks = _sparse_vector_checks.setdefault(self.client, {})
+        check = collection_checks.get(self.collection_name)
+        if check is not None and time.monotonic() - check[1] < SPARSE_VECTOR_CHECK_INTERVAL_SECONDS:
+            return check[0]
+
+        collection = await self.client.get_collection(self.collection_name)
+        has_sparse_vector = SPARSE_VECTOR_NAME in (collection.config.params.sparse_vectors or {})
+        if not has_sparse_vector:
+            logger.warning(
+                f"Collection {self.collection_name} has no {SPARSE_VECTOR_NAME} vector, it is searched by the "
+                f"{DENSE_VECTOR_NAME} one only, recreate it and ingest again for hybrid search."
+            )
+        collection_checks[self.collection_name] = (has_sparse_vector, time.monotonic())
+        return has_sparse_vector
+
+    async def retrieve(self, ids: Sequence[str], payload_fields: Sequence[LawActPayloadField]) -> list[LawActHit]:
+        """Points with the given ids in one request, in any order, scores are 0."""
+        points = await self.client.retrieve(
+            self.collection_name,
+            ids=list(ids),
+            with_payload=[str(payload_field) for payload_field in payload_fields] or False,
+            with_vectors=False,
+        )
+        return [LawActHit(id=str(point.id), score=0.0, payload=point.payload or {}) for point in points]
+
+    async def ensure_collection(self, dimension: int):
+        await apply_collection_spec(self.client, build_law_acts_collection_spec(self.collection_name, dimension))
+
+    async def upload_chunks(
+        self,
+        chunks: Sequence[LawActChunk],
+        vectors: np.ndarray,
+        batch_size: int,
+        parallel: int,
+        sparse_vectors: Optional[Sequence[SparseVector]] = None,
+    ):
+        if sparse_vectors is not None and not await self.has_sparse_vector():
+            sparse_vectors = None
+        points = (
+            models.PointStruct(id=chunk.id, vector=build_vectors(vector, sparse_vector), payload=build_payload(chunk))
+            for chunk, vector, sparse_vector in zip(chunks, vectors, sparse_vectors or [None] * len(chunks))
+        )
+        # Upload is blocking, with more than one worker it runs in a process pool.
+        await asyncio.to_thread(
+            self.client.upload_points, self.collection_name, points, batch_size=batch_size, parallel=parallel, wait=True
+        )
+
+    async def delete_stale_chunks(self, current_chunk_ids: dict[str, list[str]]):
+        """Delete chunks of the given acts, which are not in their current versions."""
+        stale_chunks_filter = models.Filter(
+            should=[
+                models.Filter(
+                    must=[models.FieldCondition(key=LawActPayloadField.ACT_ID, match=models.MatchValue(value=act_id))],
+                    must_not=[models.HasIdCondition(has_id=chunk_ids)],
+                )
+                for act_id, chunk_ids in current_chunk_ids.items()
+            ]
+        )
+        await self.client.delete(
+            self.collection_name, points_selector=models.FilterSelector(filter=stale_chunks_filter), wait=True
+        )
+
+    async def iterate_points(
+        self, act_ids: Collection[str], batch_size: int
+    ) -> AsyncIterator[tuple[str, list[float], dict[str, Any]]]:
+        """Yield id, vector and payload of every chunk of the acts, or of all chunks when no act is given."""
+        scroll_filter = None
+        if act_ids:
+            scroll_filter = models.Filter(
+                must=[models.FieldCondition(key=LawActPayloadField.ACT_ID, match=models.MatchAny(any=list(act_ids)))]
+            )
+        offset = None
+        while True:
+            points, offset = await self.client.scroll(
+                self.collection_name,
+                scroll_filter=scroll_filter,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=[DENSE_VECTOR_NAME],
+            )
+            for point in points:
+                yield str(point.id), point.vector[DENSE_VECTOR_NAME], point.payload or {}
+            if offset is None:
+                return
+
+
+def build_vectors(vector: np.ndarray, sparse_vector: Optional[SparseVector]) -> dict:
+    vectors = {DENSE_VECTOR_NAME: vector.tolist()}
+    if sparse_vector is not None:
+        vectors[SPARSE_VECTOR_NAME] = models.SparseVector(indices=sparse_vector.indices, values=sparse_vector.values)
+    return vectors
+
+
+def build_payload(chunk: LawActChunk) -> dict:
+    act = chunk.act
+    payload = {
+        LawActPayloadField.ACT_ID: act.act_id,
+        LawActPayloadField.TITLE: act.title,
+        LawActPayloadField.ACT_TYPE: act.act_type,
+        LawActPayloadField.ISSUING_BODY: act.issuing_body,
+        LawActPayloadField.IN_FORCE_FROM: act.in_force_from.isoformat(),
+        LawActPayloadField.UNIT: chunk.unit,
+        LawActPayloadField.TEXT: chunk.text,
+        LawActPayloadField.CHUNK_KEY: chunk.key,
+        LawActPayloadField.CONTENT_HASH: chunk.content_hash,
+    }
+    if act.in_force_to is not None:
+        payload[LawActPayloadField.IN_FORCE_TO] = act.in_force_to.isoformat()
+    return {str(key): value for key, value in payload.items()}
+
+
+def build_law_acts_filter(filters: LawActsFilter) -> Optional[models.Filter]:
+    conditions = []
+    if filters.act_type is not None:
+        conditions.append(
+            models.FieldCondition(key=LawActPayloadField.ACT_TYPE, match=models.MatchValue(value=filters.act_type))
+        )
+    if filters.issuing_body is not None:
+        conditions.append(
+            models.FieldCondition(
+                key=LawActPayloadField.ISSUING_BODY, match=models.MatchValue(value=filters.issuing_body)
+            )
+        )
+    if filters.in_force_on is not None:
+        conditions.append(
+            models.FieldCondition(
+                key=LawActPayloadField.IN_FORCE_FROM, range=models.DatetimeRange(lte=filters.in_force_on)
+            )
+        )
+        # Acts in force indefinitely have no end date.
+        conditions.append(
+            models.Filter(
+                should=[
+                    models.IsEmptyCondition(is_empty=models.PayloadField(key=LawActPayloadField.IN_FORCE_TO)),
+                    models.FieldCondition(
+                        key=LawActPayloadField.IN_FORCE_TO, range=models.DatetimeRange(gt=filters.in_force_on)
+                    ),
+                ]
+            )
+        )
+
+    if not conditions:
+        return None
+    return models.Filter(must=conditions)
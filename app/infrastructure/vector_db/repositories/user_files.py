@@ -0,0 +1,92 @@
+from typing import Optional, Sequence
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient, models
+
+from app.domain.entities.user_files import UserFileChunk, UserFileHit
+from app.infrastructure.vector_db.collections import (
+    apply_collection_spec,
+    build_search_params,
+    build_user_files_collection_spec,
+)
+from app.shared.consts import DENSE_VECTOR_NAME
+from app.shared.enums import UserFileChunkPayloadField
+from app.shared.settings.vector_database import qdrant_settings
+
+
+class UserFilesIndexRepository:
+    """Chunks of all users' files in one collection, partitioned by the `user_id` tenant index.
+
+    Every query is filtered by user, so Qdrant searches only the user's own graph and one user can never
+    receive chunks of another.
+    """
+
+    def __init__(self, client: AsyncQdrantClient, collection_name: str = qdrant_settings.USER_FILES_COLLECTION):
+        self.client = client
+        self.collection_name = collection_name
+        self.search_params = build_search_params()
+
+    async def ensure_collection(self, dimension: int):
+        await apply_collection_spec(self.client, build_user_files_collection_spec(self.collection_name, dimension))
+
+    async def search(
+        self, user_id: str, vector: Sequence[float], limit: int, score_threshold: Optional[float] = None
+    ) -> list[UserFileHit]:
+        response = await self.client.query_points(
+            collection_name=self.collection_name,
+            query=list(vector),
+            using=DENSE_VECTOR_NAME,
+            query_filter=build_user_filter(user_id),
+            limit=limit,
+            score_threshold=score_threshold,
+            search_params=self.search_params,
+            with_payload=True,
+        )
+        return [
+            UserFileHit(
+                file_id=point.payload[UserFileChunkPayloadField.FILE_ID],
+                file_name=point.payload[UserFileChunkPayloadField.FILE_NAME],
+                chunk_number=point.payload[UserFileChunkPayloadField.CHUNK_NUMBER],
+                text=point.payload[UserFileChunkPayloadField.TEXT],
+                score=point.score,
+            )
+            for point in response.points
+        ]
+
+    async def replace_file_chunks(
+        self, user_id: str, file_id: str, chunks: Sequence[UserFileChunk], vectors: np.ndarray
+    ):
+        """Replace indexed chunks of a file, so a file indexed again does not keep chunks of its previous text."""
+        await self.delete_file_chunks(user_id, file_id)
+        if not chunks:
+            return
+        points = [
+            models.PointStruct(id=chunk.id, vector={DENSE_VECTOR_NAME: vector.tolist()}, payload=build_payload(chunk))
+            for chunk, vector in zip(chunks, vectors)
+        ]
+        await self.client.upsert(self.collection_name, points=points, wait=True)
+
+    async def delete_file_chunks(self, user_id: str, file_id: str):
+        file_filter = build_user_filter(user_id)
+        file_filter.must.append(
+            models.FieldCondition(key=UserFileChunkPayloadField.FILE_ID, match=models.MatchValue(value=file_id))
+        )
+        await self.client.delete(
+            self.collection_name, points_selector=models.FilterSelector(filter=file_filter), wait=True
+        )
+
+
+def build_user_filter(user_id: str) -> models.Filter:
+    return models.Filter(
+        must=[models.FieldCondition(key=UserFileChunkPayloadField.USER_ID, match=models.MatchValue(value=user_id))]
+    )
+
+
+def build_payload(chunk: UserFileChunk) -> dict:
+    return {
+        UserFileChunkPayloadField.USER_ID: chunk.user_id,
+        UserFileChunkPayloadField.FILE_ID: chunk.file_id,
+        UserFileChunkPayloadField.FILE_NAME: chunk.file_name,
+        UserFileChunkPayloadField.CHUNK_NUMBER: chunk.number,
+        UserFileChunkPayloadField.TEXT: chunk.text,
+    }
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 BEARER_TOKEN_LENGTH = 32
 
 EMAIL_VERIFICATION_TOKEN_LENGTH = 32
@@ -5,3 +7,22 @@ EMAIL_VERIFICATION_TOKEN_LENGTH = 32
 SECURITY_MIN_RESPONSE_TIME = 2.0
 
 DEFAULT_URL_EXPIRY = 900
+
+STAGING_FILES_PREFIX = "staging/"
+
+STALE_UPLOADS_SWEEP_BATCH_SIZE = 100
+
+LOCAL_FILES_UPLOAD_ROUTE = "/local-files"
+
+LIST_FILES_PAGE_SIZE = 1000
+
+FILE_STORAGE_BUSY_RETRY_AFTER_SECONDS = 5
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+DENSE_VECTOR_NAME = "dense"
+SPARSE_VECTOR_NAME = "sparse"
+
+LAW_ACT_CHUNKS_NAMESPACE = UUID("6f1c2b9e-4a8d-5e37-9b0c-3d7a1f5e8c24")
+
+USER_FILE_CHUNKS_NAMESPACE = UUID("0b8e4d72-1c5f-5a93-8e26-7f4a9c3d1b60")
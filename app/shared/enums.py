@@ -10,3 +10,60 @@ class KeyPrefix(StrEnum):
     USER_REFRESH_TOKEN = "user_refresh_token"  # nosec
     REFRESH_TOKEN = "refresh_token"  # nosec
     EMAIL_VERIFICATION_TOKEN = "email_verification_token"  # nosec
+    SEARCH_RESULT = "search_result"
+    COLLECTION_VERSION = "collection_version"
+    SUGGESTIONS = "suggestions"
+    SEARCH_CURSOR = "search_cursor"
+
+
+class FileStatus(StrEnum):
+    PENDING = "pending"
+    READY = "ready"
+
+
+class IndexingStatus(StrEnum):
+    PENDING = "pending"
+    INDEXING = "indexing"
+    INDEXED = "indexed"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+class LawActPayloadField(StrEnum):
+    ACT_ID = "act_id"
+    TITLE = "title"
+    ACT_TYPE = "act_type"
+    ISSUING_BODY = "issuing_body"
+    IN_FORCE_FROM = "in_force_from"
+    IN_FORCE_TO = "in_force_to"
+    UNIT = "unit"
+    TEXT = "text"
+    CHUNK_KEY = "chunk_key"
+    CONTENT_HASH = "content_hash"
+
+
+class UserFileChunkPayloadField(StrEnum):
+    USER_ID = "user_id"
+    FILE_ID = "file_id"
+    FILE_NAME = "file_name"
+    CHUNK_NUMBER = "chunk_number"
+    TEXT = "text"
+
+
+class AnswerStage(StrEnum):
+    SOURCES = "sources"
+    DELTA = "delta"
+    DONE = "done"
+    ERROR = "error"
+
+
+class SearchStage(StrEnum):
+    ANN = "ann"
+    RERANKED = "reranked"
+    BOOSTED = "boosted"
+    DONE = "done"
+
+
+class ReferenceDirection(StrEnum):
+    CITES = "cites"
+    CITED_BY = "cited_by"
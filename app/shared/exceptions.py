@@ -24,3 +24,43 @@ class RelationalDbIntegrityError(Exception):
 
 class UserCantLog(Exception):
     pass
+
+
+class FileStorageBusy(Exception):
+    pass
+
+
+class UploadSessionNotFound(Exception):
+    pass
+
+
+class UploadVerificationFailed(Exception):
+    pass
+
+
+class FileTypeNotAllowed(Exception):
+    pass
+
+
+class PendingUploadExpired(Exception):
+    pass
+
+
+class FileTooLargeToIndex(Exception):
+    pass
+
+
+class CollectionSpecMismatch(Exception):
+    pass
+
+
+class HotSetIndexNotLoaded(Exception):
+    pass
+
+
+class SearchCursorExpired(Exception):
+    pass
+
+
+class UploadSizeExceeded(Exception):
+    pass
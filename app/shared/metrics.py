@@ -0,0 +1,135 @@
+import threading
+from bisect import bisect_left
+from typing import Sequence
+
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Counter:
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> dict:
+        return {"type": "counter", "value": self._value}
+
+
+class Gauge:
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: float):
+        with self._lock:
+            self._value = value
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> dict:
+        return {"type": "gauge", "value": self._value}
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        bucket_index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._bucket_counts[bucket_index] += 1
+            self._count += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            bucket_counts = list(self._bucket_counts)
+            count = self._count
+            total = self._sum
+
+        cumulative_buckets = {}
+        cumulative_count = 0
+        for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+            cumulative_count += bucket_count
+            cumulative_buckets[str(upper_bound)] = cumulative_count
+        cumulative_buckets["+Inf"] = count
+
+        return {"type": "histogram", "count": count, "sum": total, "buckets": cumulative_buckets}
+
+
+class MetricsRegistry:
+    """In-process metrics store.
+
+    Metrics are identified by name and optional labels, rendered in the Prometheus style,
+    e.g. `file_storage_operation_seconds{operation="upload_file"}`.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        return self._get_or_create(name, labels, Counter)
+
+    def gauge(self, name: str, **labels: str) -> Gauge:
+        return self._get_or_create(name, labels, Gauge)
+
+    def histogram(self, name: str, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, **labels: str) -> Histogram:
+        return self._get_or_create(name, labels, lambda: Histogram(buckets))
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {key: metric.snapshot() for key, metric in sorted(metrics.items())}
+
+    def _get_or_create(self, name: str, labels: dict[str, str], factory):
+        key = self._build_key(name, labels)
+        metric = self._metrics.get(key)
+        if metric is not None:
+            return metric
+
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = factory()
+                self._metrics[key] = metric
+        return metric
+
+    @staticmethod
+    def _build_key(name: str, labels: dict[str, str]) -> str:
+        if not labels:
+            return name
+        rendered_labels = ",".join(f'{label}="{value}"' for label, value in sorted(labels.items()))
+        return f"{name}{{{rendered_labels}}}"
+
+
+metrics_registry = MetricsRegistry()
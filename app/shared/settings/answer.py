@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from app.infrastructure.enums import LanguageModelProvider
+
+
+class AnswerSettings(BaseSettings):
+    RETRIEVAL_LIMIT: int = ...
+    CONTEXT_TOKEN_BUDGET: int = ...
+    MAX_TOKENS: int = ...
+
+    model_config = SettingsConfigDict(
+        env_file=Path(".env"), extra="ignore", case_sensitive=True, frozen=True, env_prefix="ANSWER_"
+    )
+
+
+class LanguageModelSettings(BaseSettings):
+    PROVIDER: LanguageModelProvider = ...
+    BASE_URL: str = ...
+    MODEL: str = ...
+    API_KEY: str = ...
+    TIMEOUT_SECONDS: float = ...
+
+    model_config = SettingsConfigDict(
+        env_file=Path(".env"), extra="ignore", case_sensitive=True, frozen=True, env_prefix="LLM_"
+    )
+
+
+answer_settings = AnswerSettings()
+language_model_settings = LanguageModelSettings()
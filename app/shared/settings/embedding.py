@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from app.infrastructure.enums import EncoderExecutorType
+
+
+class EmbeddingSettings(BaseSettings):
+    DIMENSION: int = ...
+    MAX_BATCH_SIZE: int = ...
+    MAX_WAIT_MILLISECONDS: float = ...
+    EXECUTOR: EncoderExecutorType = ...
+    EXECUTOR_MAX_WORKERS: int = ...
+    CACHE_ENABLED: bool = ...
+    SPARSE_AVERAGE_LENGTH: float = ...
+
+    model_config = SettingsConfigDict(
+        env_file=Path(".env"), extra="ignore", case_sensitive=True, frozen=True, env_prefix="EMBEDDING_"
+    )
+
+
+embedding_settings = EmbeddingSettings()
@@ -1,8 +1,27 @@
 from pathlib import Path
 
+from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class FileStorageSettings(BaseSettings):
+    EXECUTOR_MAX_WORKERS: int = ...
+    EXECUTOR_MAX_QUEUE_SIZE: int = ...
+    LOCAL_DIRECTORY: Path = ...
+    PENDING_UPLOAD_TIMEOUT_SECONDS: int = ...
+    SWEEP_INTERVAL_SECONDS: int = ...
+    UPLOAD_SESSION_EXPIRATION_SECONDS: int = ...
+    LOCAL_SIGNING_KEY: SecretStr = ...
+    MAX_UPLOAD_SIZE: int = ...
+    ALLOWED_CONTENT_TYPES: frozenset[str] = ...
+    COMPRESSIBLE_CONTENT_TYPES: frozenset[str] = ...
+    COMPRESSION_LEVEL: int = ...
+
+    model_config = SettingsConfigDict(
+        env_file=Path(".env"), extra="ignore", case_sensitive=True, frozen=True, env_prefix="FILE_STORAGE_"
+    )
+
+
 class GCFileStorageSettings(BaseSettings):
     STORAGE_CREDENTIALS: Path = ...
     PRIVATE_COLLECTION: str = ...
@@ -13,4 +32,20 @@ class GCFileStorageSettings(BaseSettings):
     )
 
 
+class UserFilesIndexingSettings(BaseSettings):
+    INTERVAL_SECONDS: int = ...
+    BATCH_SIZE: int = ...
+    STALE_TIMEOUT_SECONDS: int = ...
+    EMBEDDING_BATCH_SIZE: int = ...
+    MAX_CHUNK_LENGTH: int = ...
+    MAX_FILE_SIZE: int = ...
+    MAX_UNPACKED_SIZE: int = ...
+
+    model_config = SettingsConfigDict(
+        env_file=Path(".env"), extra="ignore", case_sensitive=True, frozen=True, env_prefix="USER_FILES_INDEXING_"
+    )
+
+
+file_storage_settings = FileStorageSettings()
 gc_file_storage_settings = GCFileStorageSettings()
+user_files_indexing_settings = UserFilesIndexingSettings()
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class SearchSettings(BaseSettings):
+    CACHE_TTL_SECONDS: int = ...
+    RERANK_ENABLED: bool = ...
+    RERANK_CANDIDATES_PER_RESULT: int = ...
+    RERANK_MAX_CANDIDATES: int = ...
+    RERANK_DENSE_WEIGHT: float = ...
+    RERANK_LEXICAL_WEIGHT: float = ...
+    BM25_K1: float = ...
+    BM25_B: float = ...
+    SUGGESTIONS_MAX_CANDIDATES: int = ...
+    SUGGESTIONS_MAX_TITLE_TERMS: int = ...
+    GRAPH_BOOST_WEIGHT: float = ...
+    HYBRID_ENABLED: bool = ...
+    ANALYTICS_ENABLED: bool = ...
+    ANALYTICS_BUFFER_SIZE: int = ...
+    ANALYTICS_FLUSH_INTERVAL_SECONDS: float = ...
+    ANALYTICS_FLUSH_BATCH_SIZE: int = ...
+    ANALYTICS_RETENTION_DAYS: int = ...
+    WARM_UP_QUERIES: int = ...
+    WARM_UP_WINDOW_HOURS: int = ...
+    WARM_UP_TIMEOUT_SECONDS: float = ...
+    CURSOR_TTL_SECONDS: int = ...
+    CURSOR_MAX_RESULTS: int = ...
+
+    model_config = SettingsConfigDict(
+        env_file=Path(".env"), extra="ignore", case_sensitive=True, frozen=True, env_prefix="SEARCH_"
+    )
+
+
+search_settings = SearchSettings()
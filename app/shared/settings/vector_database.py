@@ -2,16 +2,41 @@ from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.infrastructure.enums import HotSetMode, HotSetPrecision, QuantizationType
+
 VECTOR_DB_SETTINGS_FILE_PATH = Path("config") / "vector_db.env"
 
 
 class QdrantSettings(BaseSettings):
     HOST: str = ...
     GRPC_PORT: int = ...
+    LAW_ACTS_COLLECTION: str = ...
+    USER_FILES_COLLECTION: str = ...
+    APPLY_COLLECTIONS_ON_STARTUP: bool = ...
+    HNSW_M: int = ...
+    HNSW_EF_CONSTRUCT: int = ...
+    HNSW_EF: int = ...
+    QUANTIZATION: QuantizationType = ...
+    QUANTIZATION_OVERSAMPLING: float = ...
+    VECTORS_ON_DISK: bool = ...
+    HYBRID_PREFETCH_PER_RESULT: int = ...
 
     model_config = SettingsConfigDict(
         env_file=Path(".env"), extra="ignore", case_sensitive=True, frozen=True, env_prefix="QDRANT_"
     )
 
 
+class HotSetSettings(BaseSettings):
+    MODE: HotSetMode = ...
+    DIRECTORY: Path = ...
+    ACT_IDS: frozenset[str] = ...
+    PRECISION: HotSetPrecision = ...
+    MIN_SCORE: float = ...
+
+    model_config = SettingsConfigDict(
+        env_file=Path(".env"), extra="ignore", case_sensitive=True, frozen=True, env_prefix="HOT_SET_"
+    )
+
+
 qdrant_settings = QdrantSettings()
+hot_set_settings = HotSetSettings()
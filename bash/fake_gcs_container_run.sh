@@ -0,0 +1,5 @@
+podman run -d --name fake-gcs-prawobiorca -p 4443:4443 \
+  fsouza/fake-gcs-server:latest -scheme http -port 4443 -public-host localhost:4443
+
+# Variables exported by a script do not reach the calling shell, export it there.
+echo "export STORAGE_EMULATOR_HOST=http://localhost:4443"
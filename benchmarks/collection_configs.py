@@ -0,0 +1,171 @@
+"""Recall and latency of law-act collection configurations.
+
+Run against a Qdrant server, e.g. `python -m benchmarks.collection_configs --host localhost --points 200000`.
+In-process mode always searches exactly, so it can not be used here. Ground truth is an exact search over the
+float32 collection, the estimated RAM shows how many chunks fit on a node for every configuration.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient, models
+
+from app.infrastructure.enums import QuantizationType
+from app.infrastructure.vector_db.collections import CollectionSpec, apply_collection_spec
+from app.shared.consts import DENSE_VECTOR_NAME
+
+UPLOAD_BATCH_SIZE = 1024
+INDEXING_POLL_SECONDS = 1.0
+CLUSTERS = 256
+
+
+@dataclass(frozen=True)
+class BenchmarkConfiguration:
+    name: str
+    spec: CollectionSpec
+    oversampling: float = 1.0
+
+
+def build_configurations(dimension: int) -> list[BenchmarkConfiguration]:
+    base_spec = CollectionSpec(
+        name="benchmark_float32",
+        vector_size=dimension,
+        distance=models.Distance.COSINE,
+        hnsw_m=16,
+        hnsw_ef_construct=128,
+        quantization=QuantizationType.NONE,
+        vectors_on_disk=False,
+    )
+    int8_spec = replace(base_spec, name="benchmark_int8", quantization=QuantizationType.SCALAR, vectors_on_disk=True)
+    binary_spec = replace(
+        base_spec, name="benchmark_binary", quantization=QuantizationType.BINARY, vectors_on_disk=True
+    )
+    return [
+        BenchmarkConfiguration("float32", base_spec),
+        BenchmarkConfiguration("int8_rescore", int8_spec, oversampling=2.0),
+        BenchmarkConfiguration("int8_m8", replace(int8_spec, name="benchmark_int8_m8", hnsw_m=8), oversampling=2.0),
+        BenchmarkConfiguration("binary_rescore_x2", binary_spec, oversampling=2.0),
+        BenchmarkConfiguration("binary_rescore_x4", binary_spec, oversampling=4.0),
+    ]
+
+
+def generate_vectors(generator: np.random.Generator, count: int, dimension: int, centers: np.ndarray) -> np.ndarray:
+    # Clustered data, closer to text embeddings than uniformly random vectors.
+    vectors = centers[generator.integers(0, len(centers), count)] + 0.35 * generator.standard_normal((count, dimension))
+    vectors = vectors.astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def estimate_ram_bytes(spec: CollectionSpec, points: int) -> int:
+    hnsw_links = points * spec.hnsw_m * 2 * 4
+    original_vectors = 0 if spec.vectors_on_disk else points * spec.vector_size * 4
+    match spec.quantization:
+        case QuantizationType.SCALAR:
+            quantized_vectors = points * spec.vector_size
+        case QuantizationType.BINARY:
+            quantized_vectors = points * spec.vector_size // 8
+        case _:
+            quantized_vectors = 0
+    return hnsw_links + original_vectors + quantized_vectors
+
+
+async def load_collection(client: AsyncQdrantClient, spec: CollectionSpec, vectors: np.ndarray):
+    if await client.collection_exists(spec.name):
+        return
+    await apply_collection_spec(client, spec)
+    for offset in range(0, len(vectors), UPLOAD_BATCH_SIZE):
+        batch = vectors[offset : offset + UPLOAD_BATCH_SIZE]
+        await client.upsert(
+            spec.name,
+            points=models.Batch(
+                ids=list(range(offset, offset + len(batch))), vectors={DENSE_VECTOR_NAME: batch.tolist()}
+            ),
+        )
+    while (await client.get_collection(spec.name)).status != models.CollectionStatus.GREEN:
+        await asyncio.sleep(INDEXING_POLL_SECONDS)
+
+
+async def search_ids(
+    client: AsyncQdrantClient, collection_name: str, query: np.ndarray, limit: int, search_params: models.SearchParams
+) -> list[int]:
+    response = await client.query_points(
+        collection_name, query=query.tolist(), using=DENSE_VECTOR_NAME, limit=limit, search_params=search_params
+    )
+    return [point.id for point in response.points]
+
+
+async def run_benchmark(arguments: argparse.Namespace) -> dict:
+    client = AsyncQdrantClient(host=arguments.host, grpc_port=arguments.grpc_port, prefer_grpc=True, https=False)
+    generator = np.random.default_rng(0)
+    centers = generator.standard_normal((CLUSTERS, arguments.dimension))
+    vectors = generate_vectors(generator, arguments.points, arguments.dimension, centers)
+    queries = generate_vectors(generator, arguments.queries, arguments.dimension, centers)
+    configurations = build_configurations(arguments.dimension)
+
+    for configuration in configurations:
+        await load_collection(client, configuration.spec, vectors)
+
+    exact_search = models.SearchParams(exact=True)
+    ground_truth = [
+        set(await search_ids(client, configurations[0].spec.name, query, arguments.limit, exact_search))
+        for query in queries
+    ]
+
+    report = {"points": arguments.points, "dimension": arguments.dimension, "limit": arguments.limit, "results": []}
+    for configuration in configurations:
+        quantization = None
+        if configuration.spec.quantization != QuantizationType.NONE:
+            quantization = models.QuantizationSearchParams(rescore=True, oversampling=configuration.oversampling)
+        search_params = models.SearchParams(hnsw_ef=arguments.hnsw_ef, quantization=quantization)
+
+        latencies, recalls = [], []
+        for query, expected_ids in zip(queries, ground_truth):
+            start = time.perf_counter()
+            found_ids = await search_ids(client, configuration.spec.name, query, arguments.limit, search_params)
+            latencies.append(time.perf_counter() - start)
+            recalls.append(len(expected_ids.intersection(found_ids)) / len(expected_ids))
+
+        report["results"].append(
+            {
+                "configuration": configuration.name,
+                "recall": round(float(np.mean(recalls)), 4),
+                "p50_ms": round(float(np.percentile(latencies, 50)) * 1000, 3),
+                "p99_ms": round(float(np.percentile(latencies, 99)) * 1000, 3),
+                "estimated_ram_mb": round(estimate_ram_bytes(configuration.spec, arguments.points) / 1024 / 1024, 1),
+            }
+        )
+
+    if not arguments.keep_collections:
+        for collection_name in {configuration.spec.name for configuration in configurations}:
+            await client.delete_collection(collection_name)
+    await client.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", required=True)
+    parser.add_argument("--grpc-port", type=int, default=6334)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--hnsw-ef", type=int, default=128)
+    parser.add_argument("--keep-collections", action="store_true", help="Reuse loaded collections in the next run.")
+    parser.add_argument("--output", type=Path, default=Path("benchmarks/results/collection_configs.json"))
+    arguments = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(arguments))
+    print(json.dumps(report, indent=2))
+
+    arguments.output.parent.mkdir(parents=True, exist_ok=True)
+    arguments.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Throughput of on-the-fly gzip compression used for stored documents.
+
+Run with `python -m benchmarks.compression [--size-mb 64] [--levels 1 6 9]`.
+"""
+
+import argparse
+import io
+import random
+import time
+
+from app.infrastructure.file_storage.compression import GzipCompressingReader, decompress
+
+UPLOAD_READ_SIZE = 256 * 1024
+SAMPLE_WORDS = (
+    "art.",
+    "ustawa",
+    "z dnia",
+    "o zmianie",
+    "przepisy",
+    "wprowadzające",
+    "kodeks",
+    "cywilny",
+    "§",
+    "ust.",
+    "pkt",
+    "minister",
+    "właściwy",
+    "rozporządzenie",
+    "w sprawie",
+    "Dz. U.",
+    "poz.",
+    "<p>",
+    "</p>",
+)
+
+
+def generate_document(size: int) -> bytes:
+    words = random.Random(0).choices(SAMPLE_WORDS, k=size // 4)
+    return " ".join(words).encode()[:size]
+
+
+def benchmark_level(document: bytes, compression_level: int) -> dict:
+    reader = GzipCompressingReader(io.BytesIO(document), compression_level)
+    start = time.perf_counter()
+    compressed = bytearray()
+    while chunk := reader.read(UPLOAD_READ_SIZE):
+        compressed += chunk
+    compression_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decompress(bytes(compressed))
+    decompression_seconds = time.perf_counter() - start
+
+    size_mb = len(document) / 1024 / 1024
+    return {
+        "level": compression_level,
+        "ratio": round(len(document) / len(compressed), 2),
+        "compression_mb_s": round(size_mb / compression_seconds, 1),
+        "decompression_mb_s": round(size_mb / decompression_seconds, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9])
+    arguments = parser.parse_args()
+
+    document = generate_document(arguments.size_mb * 1024 * 1024)
+    print(f"{'level':>5} {'ratio':>7} {'compress MB/s':>14} {'decompress MB/s':>16}")
+    for compression_level in arguments.levels:
+        result = benchmark_level(document, compression_level)
+        print(
+            f"{result['level']:>5} {result['ratio']:>7} "
+            f"{result['compression_mb_s']:>14} {result['decompression_mb_s']:>16}"
+        )
+
+
+if __name__ == "__main__":
+    main()
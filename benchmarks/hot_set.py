@@ -0,0 +1,79 @@
+"""Latency of the in-process hot set index, for every precision and query batch size.
+
+Run with `python -m benchmarks.hot_set [--points 50000] [--dimension 384]`. Indexes are written to a temporary
+directory and queried through the memory map, as by the application workers.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.domain.entities.law_acts import LawActsFilter
+from app.infrastructure.enums import HotSetPrecision
+from app.infrastructure.vector_db.hot_set import VECTORS_FILE_NAME, HotSetIndex, write_hot_set_index
+from app.shared.enums import LawActPayloadField
+
+BATCH_SIZES = (1, 8, 32)
+
+
+def run_benchmark(arguments: argparse.Namespace) -> dict:
+    generator = np.random.default_rng(0)
+    vectors = generator.standard_normal((arguments.points, arguments.dimension)).astype(np.float32)
+    ids = [str(number) for number in range(arguments.points)]
+    payloads = [
+        {LawActPayloadField.ACT_TYPE: "ustawa" if number % 2 else "rozporządzenie"}
+        for number in range(arguments.points)
+    ]
+
+    report = {"points": arguments.points, "dimension": arguments.dimension, "limit": arguments.limit, "results": []}
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        for precision in HotSetPrecision:
+            directory = Path(temporary_directory) / precision
+            write_hot_set_index(directory, ids, vectors, payloads, precision)
+            hot_set_index = HotSetIndex()
+            hot_set_index.open(directory)
+
+            for filters in (LawActsFilter(), LawActsFilter(act_type="ustawa")):
+                for batch_size in BATCH_SIZES:
+                    latencies = []
+                    for _ in range(arguments.queries // batch_size):
+                        queries = generator.standard_normal((batch_size, arguments.dimension)).astype(np.float32)
+                        start = time.perf_counter()
+                        hot_set_index.search_many(queries, filters, arguments.limit)
+                        latencies.append((time.perf_counter() - start) / batch_size)
+                    report["results"].append(
+                        {
+                            "precision": precision,
+                            "filters": repr(filters),
+                            "batch_size": batch_size,
+                            "index_mb": round((directory / VECTORS_FILE_NAME).stat().st_size / 1024 / 1024, 1),
+                            "p50_ms_per_query": round(float(np.percentile(latencies, 50)) * 1000, 3),
+                            "p99_ms_per_query": round(float(np.percentile(latencies, 99)) * 1000, 3),
+                        }
+                    )
+            hot_set_index.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=50_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=256)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--output", type=Path, default=Path("benchmarks/results/hot_set.json"))
+    arguments = parser.parse_args()
+
+    report = run_benchmark(arguments)
+    print(json.dumps(report, indent=2))
+
+    arguments.output.parent.mkdir(parents=True, exist_ok=True)
+    arguments.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
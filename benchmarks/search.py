@@ -0,0 +1,169 @@
+"""Latency of law-act search, from query embedding to Qdrant results and optional BM25 reranking.
+
+Run with `python -m benchmarks.search [--points 20000] [--queries 500] [--rerank]`. By default an in-process `:memory:`
+collection is used, pass `--host` to benchmark against a running Qdrant server over gRPC.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date
+from pathlib import Path
+
+from qdrant_client import AsyncQdrantClient, models
+
+from app.domain.entities.law_acts import LawActsFilter
+from app.domain.services.search import SearchStageTimings, search_law_acts
+from app.infrastructure.embeddings.hashing import HashingEncoder
+from app.infrastructure.embeddings.service import EncoderEmbeddingService
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository
+from app.shared.consts import DENSE_VECTOR_NAME
+from app.shared.enums import LawActPayloadField
+from app.shared.settings.embedding import embedding_settings
+
+BENCHMARK_COLLECTION = "law_acts_benchmark"
+UPSERT_BATCH_SIZE = 512
+ACT_TYPES = ("ustawa", "rozporządzenie", "obwieszczenie")
+ISSUING_BODIES = ("Sejm", "Rada Ministrów", "Minister Finansów", "Minister Sprawiedliwości")
+VOCABULARY = (
+    "umowa sprzedaży najem dzierżawa podatek dochodowy vat faktura spółka akcje zarząd sąd wyrok apelacja kara "
+    "grzywna przestępstwo wykroczenie pracownik pracodawca urlop wynagrodzenie gmina powiat województwo budżet "
+    "dotacja zamówienie publiczne przetarg ochrona danych osobowych zgoda administrator własność użytkowanie"
+).split()
+FILTERS = (
+    LawActsFilter(),
+    LawActsFilter(act_type="ustawa"),
+    LawActsFilter(issuing_body="Sejm", in_force_on=date(2020, 1, 1)),
+)
+
+
+def generate_text(generator: random.Random) -> str:
+    return " ".join(generator.choices(VOCABULARY, k=generator.randint(20, 80)))
+
+
+def generate_payload(generator: random.Random, act_number: int, text: str) -> dict:
+    in_force_from = date(generator.randint(1950, 2024), 1, 1)
+    payload = {
+        LawActPayloadField.ACT_ID: f"act-{act_number}",
+        LawActPayloadField.TITLE: f"Akt {act_number}",
+        LawActPayloadField.ACT_TYPE: generator.choice(ACT_TYPES),
+        LawActPayloadField.ISSUING_BODY: generator.choice(ISSUING_BODIES),
+        LawActPayloadField.IN_FORCE_FROM: in_force_from.isoformat(),
+        LawActPayloadField.TEXT: text,
+    }
+    if generator.random() < 0.3:
+        payload[LawActPayloadField.IN_FORCE_TO] = date(in_force_from.year + 10, 1, 1).isoformat()
+    return payload
+
+
+async def load_collection(client: AsyncQdrantClient, encoder: HashingEncoder, points: int):
+    if await client.collection_exists(BENCHMARK_COLLECTION):
+        await client.delete_collection(BENCHMARK_COLLECTION)
+    await client.create_collection(
+        BENCHMARK_COLLECTION,
+        vectors_config={
+            DENSE_VECTOR_NAME: models.VectorParams(size=encoder.dimension, distance=models.Distance.COSINE)
+        },
+    )
+
+    generator = random.Random(0)
+    for offset in range(0, points, UPSERT_BATCH_SIZE):
+        batch_size = min(UPSERT_BATCH_SIZE, points - offset)
+        texts = [generate_text(generator) for _ in range(batch_size)]
+        payloads = [generate_payload(generator, offset + index, text) for index, text in enumerate(texts)]
+        vectors = encoder.encode(texts)
+        await client.upsert(
+            BENCHMARK_COLLECTION,
+            points=models.Batch(
+                ids=list(range(offset, offset + batch_size)),
+                vectors={DENSE_VECTOR_NAME: vectors.tolist()},
+                payloads=payloads,
+            ),
+        )
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+async def run_benchmark(arguments: argparse.Namespace) -> dict:
+    if arguments.host:
+        client = AsyncQdrantClient(host=arguments.host, grpc_port=arguments.grpc_port, prefer_grpc=True, https=False)
+    else:
+        client = AsyncQdrantClient(location=":memory:")
+    encoder = HashingEncoder(embedding_settings.DIMENSION)
+    embedding_service = EncoderEmbeddingService(encoder)
+    repository = LawActsRepository(client, BENCHMARK_COLLECTION)
+
+    await load_collection(client, encoder, arguments.points)
+
+    generator = random.Random(1)
+    report = {
+        "points": arguments.points,
+        "queries": arguments.queries,
+        "limit": arguments.limit,
+        "rerank": arguments.rerank,
+        "filters": [],
+    }
+    for filters in FILTERS:
+        latencies = []
+        stage_latencies = {}
+        for _ in range(arguments.queries):
+            query = " ".join(generator.choices(VOCABULARY, k=4))
+            timings = SearchStageTimings()
+            start = time.perf_counter()
+            await search_law_acts(
+                repository,
+                embedding_service,
+                query,
+                filters,
+                arguments.limit,
+                None,
+                [LawActPayloadField.TITLE],
+                arguments.rerank,
+                timings,
+            )
+            latencies.append(time.perf_counter() - start)
+            for stage, duration in timings.stages.items():
+                stage_latencies.setdefault(stage, []).append(duration)
+        report["filters"].append(
+            {
+                "filters": repr(filters),
+                "p50_ms": round(percentile(latencies, 0.5) * 1000, 3),
+                "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+                "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+                "queries_s": round(len(latencies) / sum(latencies), 1),
+                "stages_p95_ms": {
+                    stage: round(percentile(durations, 0.95) * 1000, 3) for stage, durations in stage_latencies.items()
+                },
+            }
+        )
+
+    await client.delete_collection(BENCHMARK_COLLECTION)
+    await client.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--rerank", action="store_true", help="Rescore ANN candidates with BM25.")
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--grpc-port", type=int, default=6334)
+    parser.add_argument("--output", type=Path, default=Path("benchmarks/results/search.json"))
+    arguments = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(arguments))
+    print(json.dumps(report, indent=2))
+
+    arguments.output.parent.mkdir(parents=True, exist_ok=True)
+    arguments.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
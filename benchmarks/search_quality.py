@@ -0,0 +1,185 @@
+"""Quality and latency of law-act search, on a fixed corpus with graded relevance judgments.
+
+Run with `python -m benchmarks.search_quality [--k 10] [--concurrency 8] [--rerank] [--hybrid]`. The fixture corpus
+(`benchmarks/fixtures/search_quality/acts.jsonl`, in the ingestion format) is chunked, embedded and loaded into
+an in-process `:memory:` collection, pass `--host` to use a Qdrant server with the configured collection layout
+(HNSW, quantization), so the effect of its changes is measured. Judgments in `queries.jsonl` grade chunks by keys
+(`<act id>#<unit>`), from 1 (related) to 3 (answers the query).
+
+Recall@k, MRR and nDCG@k are computed from the first round, latency percentiles and throughput from all rounds.
+The JSON report can be compared with a previous one with `--baseline`, differences are added under `delta`.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+
+from app.domain.entities.law_acts import LawActsFilter
+from app.domain.services.law_acts_chunking import chunk_law_act
+from app.domain.services.search import SearchStageTimings, search_law_acts
+from app.domain.services.search_quality import average_metrics, evaluate_ranking, get_hit_key
+from app.domain.services.sparse_vectors import sparse_encoder
+from app.infrastructure.embeddings.hashing import HashingEncoder
+from app.infrastructure.embeddings.service import EncoderEmbeddingService
+from app.infrastructure.law_acts.sources import iterate_law_act_documents
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository
+from app.shared.enums import LawActPayloadField
+from app.shared.settings.embedding import embedding_settings
+
+BENCHMARK_COLLECTION = "law_acts_quality_benchmark"
+FIXTURES_DIRECTORY = Path(__file__).parent / "fixtures" / "search_quality"
+MAX_CHUNK_LENGTH = 1500
+UPLOAD_BATCH_SIZE = 256
+PAYLOAD_FIELDS = [LawActPayloadField.ACT_ID, LawActPayloadField.UNIT]
+COMPARED_METRICS = ("recall", "mrr", "ndcg", "p50_ms", "p95_ms", "p99_ms", "queries_s")
+
+
+def load_judgments(path: Path) -> list[tuple[str, dict[str, int]]]:
+    with open(path, encoding="utf-8") as judgments_file:
+        return [
+            (judgment["query"], judgment["relevance"])
+            for judgment in (json.loads(line) for line in judgments_file if line.strip())
+        ]
+
+
+async def load_corpus(repository: LawActsRepository, encoder: HashingEncoder, corpus: Path) -> int:
+    chunks = [
+        chunk for document in iterate_law_act_documents(corpus) for chunk in chunk_law_act(document, MAX_CHUNK_LENGTH)
+    ]
+    await repository.ensure_collection(encoder.dimension)
+    texts = [chunk.text for chunk in chunks]
+    await repository.upload_chunks(
+        chunks, encoder.encode(texts), UPLOAD_BATCH_SIZE, 1, sparse_vectors=sparse_encoder.encode_documents(texts)
+    )
+    return len(chunks)
+
+
+async def run_queries(
+    repository: LawActsRepository,
+    embedding_service: EncoderEmbeddingService,
+    queries: list[str],
+    arguments: argparse.Namespace,
+) -> tuple[list[list[str]], list[float], float]:
+    """Search all queries with `concurrency` workers, return ranked keys, latencies and wall time in seconds."""
+    rankings: list[list[str]] = [[] for _ in queries]
+    latencies: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for query_number in range(len(queries)):
+        queue.put_nowait(query_number)
+
+    async def worker():
+        while not queue.empty():
+            query_number = queue.get_nowait()
+            start = time.perf_counter()
+            hits = await search_law_acts(
+                repository,
+                embedding_service,
+                queries[query_number],
+                LawActsFilter(),
+                arguments.k,
+                None,
+                PAYLOAD_FIELDS,
+                arguments.rerank,
+                SearchStageTimings(),
+                sparse_encoder=sparse_encoder if arguments.hybrid else None,
+            )
+            latencies.append(time.perf_counter() - start)
+            rankings[query_number] = [get_hit_key(hit) for hit in hits]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(arguments.concurrency)))
+    return rankings, latencies, time.perf_counter() - start
+
+
+def compare_reports(report: dict, baseline: dict) -> dict:
+    return {
+        metric: round(report[metric] - baseline[metric], 4)
+        for metric in COMPARED_METRICS
+        if metric in report and metric in baseline
+    }
+
+
+async def run_benchmark(arguments: argparse.Namespace) -> dict:
+    if arguments.host:
+        client = AsyncQdrantClient(host=arguments.host, grpc_port=arguments.grpc_port, prefer_grpc=True, https=False)
+    else:
+        client = AsyncQdrantClient(location=":memory:")
+    encoder = HashingEncoder(embedding_settings.DIMENSION)
+    embedding_service = EncoderEmbeddingService(encoder)
+    repository = LawActsRepository(client, BENCHMARK_COLLECTION)
+
+    judgments = load_judgments(arguments.queries)
+    queries = [query for query, _ in judgments]
+    chunks = await load_corpus(repository, encoder, arguments.corpus)
+
+    # Warm-up, so connection setup and lazy imports are not measured.
+    await run_queries(repository, embedding_service, queries[: arguments.concurrency], arguments)
+    rankings, latencies, wall_seconds = [], [], 0.0
+    for round_number in range(arguments.rounds):
+        round_rankings, round_latencies, round_seconds = await run_queries(
+            repository, embedding_service, queries, arguments
+        )
+        if round_number == 0:
+            rankings = round_rankings
+        latencies.extend(round_latencies)
+        wall_seconds += round_seconds
+
+    metrics = average_metrics(
+        [evaluate_ranking(ranking, relevance, arguments.k) for ranking, (_, relevance) in zip(rankings, judgments)]
+    )
+    latencies_ms = np.array(latencies) * 1000
+    report = {
+        "corpus": str(arguments.corpus),
+        "chunks": chunks,
+        "queries": len(queries),
+        "k": arguments.k,
+        "rerank": arguments.rerank,
+        "hybrid": arguments.hybrid,
+        "concurrency": arguments.concurrency,
+        "rounds": arguments.rounds,
+        "qdrant": arguments.host or ":memory:",
+        "recall": round(metrics.recall, 4),
+        "mrr": round(metrics.reciprocal_rank, 4),
+        "ndcg": round(metrics.ndcg, 4),
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(latencies_ms, 95)), 3),
+        "p99_ms": round(float(np.percentile(latencies_ms, 99)), 3),
+        "queries_s": round(len(latencies) / wall_seconds, 1),
+    }
+    if arguments.baseline:
+        report["delta"] = compare_reports(report, json.loads(arguments.baseline.read_text()))
+
+    await client.delete_collection(BENCHMARK_COLLECTION)
+    await client.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=Path, default=FIXTURES_DIRECTORY / "acts.jsonl")
+    parser.add_argument("--queries", type=Path, default=FIXTURES_DIRECTORY / "queries.jsonl")
+    parser.add_argument("--k", type=int, default=10, help="Results per query, cut-off of recall and nDCG.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=20, help="Repetitions of the query set for latency.")
+    parser.add_argument("--rerank", action="store_true", help="Rescore ANN candidates with BM25.")
+    parser.add_argument("--hybrid", action="store_true", help="Fuse dense and sparse rankings with RRF.")
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--grpc-port", type=int, default=6334)
+    parser.add_argument("--baseline", type=Path, default=None, help="Previous report to compare with.")
+    parser.add_argument("--output", type=Path, default=Path("benchmarks/results/search_quality.json"))
+    arguments = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(arguments))
+    print(json.dumps(report, indent=2))
+
+    arguments.output.parent.mkdir(parents=True, exist_ok=True)
+    arguments.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Upload, download, sign and list throughput of the storage backends.
+
+Run with `python -m benchmarks.storage [--backends local gcs] [--sizes 1024 1048576] [--concurrency 1 4 16]`.
+The GCS backend is meant to run against the fake-gcs-server emulator started by `bash/fake_gcs_container_run.sh`,
+export `STORAGE_EMULATOR_HOST` with the command printed by it.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.domain.interfaces.file_storage import StorageRepository
+
+KB = 1024
+MB = 1024 * KB
+GB = 1024 * MB
+DEFAULT_SIZES = (KB, MB, 64 * MB, GB)
+DEFAULT_CONCURRENCY_LEVELS = (1, 4, 16)
+SOURCE_BLOCK_SIZE = MB
+BENCHMARK_PREFIX = "benchmark/"
+EMULATOR_BUCKET = "user_files"
+
+
+def create_local_storage(directory: Path) -> StorageRepository:
+    from app.infrastructure.file_storage.local.repository import LocalFileStorage
+
+    storage = LocalFileStorage()
+    storage.root_directory = directory.resolve()
+    return storage
+
+
+def create_gcs_storage() -> StorageRepository:
+    if "STORAGE_EMULATOR_HOST" not in os.environ:
+        raise SystemExit("STORAGE_EMULATOR_HOST is not set, export the one printed by the emulator script.")
+    from app.infrastructure.file_storage.gc.repository import GCSStorageRepository
+
+    storage = GCSStorageRepository()
+    if storage.client.lookup_bucket(EMULATOR_BUCKET) is None:
+        storage.client.create_bucket(EMULATOR_BUCKET)
+    return storage
+
+
+def write_source_file(directory: Path, size: int) -> Path:
+    # Random data, so the upload is not compressed and measures the raw storage path.
+    source_path = directory / f"source_{size}"
+    block = os.urandom(min(size, SOURCE_BLOCK_SIZE))
+    with open(source_path, "wb") as source:
+        for offset in range(0, size, len(block)):
+            source.write(block[: size - offset])
+    return source_path
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def get_peak_rss_mb() -> float:
+    # On Linux ru_maxrss is in kilobytes, it is the peak of the whole process so far.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / KB
+
+
+async def measure(operation, concurrency: int, iterations: int) -> tuple[float, list[float]]:
+    latencies = []
+
+    async def timed(index: int):
+        start = time.perf_counter()
+        await operation(index)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for iteration in range(iterations):
+        await asyncio.gather(*(timed(iteration * concurrency + task) for task in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+def summarize(operation: str, size: int, concurrency: int, elapsed: float, latencies: list[float]) -> dict:
+    transferred_mb = size * len(latencies) / MB
+    return {
+        "operation": operation,
+        "size": size,
+        "concurrency": concurrency,
+        "operations": len(latencies),
+        "mb_s": round(transferred_mb / elapsed, 2) if size else None,
+        "operations_s": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "peak_rss_mb": round(get_peak_rss_mb(), 1),
+    }
+
+
+async def benchmark_size(
+    storage: StorageRepository, source_path: Path, size: int, concurrency: int, iterations: int
+) -> list[dict]:
+    run_prefix = f"{BENCHMARK_PREFIX}{uuid4()}/"
+
+    def file_name(index: int) -> str:
+        return f"{run_prefix}{index}"
+
+    async def upload(index: int):
+        with open(source_path, "rb") as source:
+            await storage.upload_file(UploadFile(file=source, headers=Headers()), file_name(index))
+
+    async def download(index: int):
+        await storage.get_file(file_name(index))
+
+    async def sign(index: int):
+        await storage.get_file_url(file_name(index), is_public=False)
+
+    async def list_files(index: int):
+        async for _ in storage.list_files(prefix=run_prefix):
+            pass
+
+    results = []
+    try:
+        for operation_name, operation, operation_size in (
+            ("upload", upload, size),
+            ("download", download, size),
+            ("sign", sign, 0),
+            ("list", list_files, 0),
+        ):
+            try:
+                elapsed, latencies = await measure(operation, concurrency, iterations)
+            except Exception as e:
+                error = {"operation": operation_name, "size": size, "concurrency": concurrency, "error": repr(e)}
+                results.append(error)
+                continue
+            results.append(summarize(operation_name, operation_size, concurrency, elapsed, latencies))
+    finally:
+        for index in range(concurrency * iterations):
+            try:
+                await storage.delete_file(file_name(index))
+            except Exception:
+                pass
+    return results
+
+
+async def run_benchmark(arguments: argparse.Namespace) -> dict:
+    report = {"iterations": arguments.iterations, "max_in_flight": arguments.max_in_flight, "backends": {}}
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        working_directory = Path(temporary_directory)
+        storages = {}
+        for backend in arguments.backends:
+            if backend == "local":
+                storages[backend] = create_local_storage(working_directory / "storage")
+            else:
+                storages[backend] = create_gcs_storage()
+
+        for backend, storage in storages.items():
+            results = []
+            for size in arguments.sizes:
+                source_path = write_source_file(working_directory, size)
+                for concurrency in arguments.concurrency:
+                    if size * concurrency > arguments.max_in_flight:
+                        results.append({"size": size, "concurrency": concurrency, "skipped": "max in flight"})
+                        continue
+                    print(f"{backend}: {size} B x {concurrency}", flush=True)
+                    results.extend(await benchmark_size(storage, source_path, size, concurrency, arguments.iterations))
+                source_path.unlink()
+            report["backends"][backend] = results
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backends", nargs="+", choices=("local", "gcs"), default=["local"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(DEFAULT_CONCURRENCY_LEVELS))
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=4 * GB,
+        help="Skip combinations where size x concurrency exceeds this many bytes, downloads are held in memory.",
+    )
+    parser.add_argument("--output", type=Path, default=Path("benchmarks/results/storage.json"))
+    arguments = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(arguments))
+
+    arguments.output.parent.mkdir(parents=True, exist_ok=True)
+    arguments.output.write_text(json.dumps(report, indent=2))
+    print(f"Results saved to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Latency of law-act suggestions (typeahead), for prefixes of different lengths.
+
+Run against a Redis server, e.g. `python -m benchmarks.suggestions --host localhost --acts 100000`. Keys of the
+suggestion index are written to the `--db` database and deleted after the run.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import redis.asyncio as redis
+
+from app.domain.entities.law_acts import LawActDocument
+from app.domain.services.suggestions import ACTS_KEY, POPULARITY_KEY, TERMS_KEY, SuggestionIndex
+
+TITLE_WORDS = (
+    "kodeks postępowania cywilnego karnego administracyjnego ustawa o zmianie podatku dochodowym od osób fizycznych "
+    "prawnych rozporządzenie ministra finansów w sprawie sposobu prowadzenia ewidencji ochronie danych osobowych "
+    "samorządzie gminnym prawo budowlane zamówieniach publicznych rachunkowości systemie ubezpieczeń społecznych"
+).split()
+PREFIX_LENGTHS = (2, 4, 8, 16)
+ADD_BATCH_SIZE = 1000
+
+
+def make_documents(count: int, generator: np.random.Generator) -> list[LawActDocument]:
+    documents = []
+    for number in range(count):
+        title_words = generator.choice(TITLE_WORDS, size=generator.integers(3, 14))
+        year = int(generator.integers(1950, 2026))
+        documents.append(
+            LawActDocument(
+                act_id=f"DU/{year}/{number}",
+                title=f"Ustawa z dnia {number % 28 + 1} maja {year} r. {' '.join(title_words)}",
+                act_type="ustawa",
+                issuing_body="Sejm",
+                in_force_from=date(year, 1, 1),
+                text="",
+            )
+        )
+    return documents
+
+
+async def run_benchmark(arguments: argparse.Namespace) -> dict:
+    key_value_repo = redis.Redis(host=arguments.host, port=arguments.port, db=arguments.db, decode_responses=True)
+    suggestion_index = SuggestionIndex(key_value_repo)
+    generator = np.random.default_rng(0)
+    documents = make_documents(arguments.acts, generator)
+
+    load_start = time.perf_counter()
+    for offset in range(0, len(documents), ADD_BATCH_SIZE):
+        await suggestion_index.add_acts(documents[offset : offset + ADD_BATCH_SIZE])
+    popular_act_ids = [document.act_id for document in generator.choice(documents, size=arguments.acts // 10)]
+    await suggestion_index.record_popularity(popular_act_ids)
+    load_seconds = time.perf_counter() - load_start
+
+    report = {
+        "acts": arguments.acts,
+        "terms": await key_value_repo.zcard(TERMS_KEY),
+        "load_seconds": round(load_seconds, 1),
+        "results": [],
+    }
+    for prefix_length in PREFIX_LENGTHS:
+        latencies = []
+        for document in generator.choice(documents, size=arguments.queries):
+            title_words = document.title.split(" ")
+            prefix = " ".join(title_words[int(generator.integers(0, len(title_words))) :])[:prefix_length]
+            start = time.perf_counter()
+            await suggestion_index.suggest(prefix, arguments.limit)
+            latencies.append(time.perf_counter() - start)
+        report["results"].append(
+            {
+                "prefix_length": prefix_length,
+                "p50_ms": round(float(np.percentile(latencies, 50)) * 1000, 3),
+                "p99_ms": round(float(np.percentile(latencies, 99)) * 1000, 3),
+            }
+        )
+
+    await key_value_repo.delete(TERMS_KEY, ACTS_KEY, POPULARITY_KEY)
+    await key_value_repo.aclose()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", required=True)
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--db", type=int, default=15)
+    parser.add_argument("--acts", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--output", type=Path, default=Path("benchmarks/results/suggestions.json"))
+    arguments = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(arguments))
+    print(json.dumps(report, indent=2))
+
+    arguments.output.parent.mkdir(parents=True, exist_ok=True)
+    arguments.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,20 @@ import asyncio
 
 from fastapi import FastAPI
 
+from app.framework.api.exception_handlers import include_exception_handlers
 from app.framework.api.router import include_all_routers
+from app.framework.background.search_analytics import start_search_analytics_flusher, warm_up_search_caches
+from app.framework.background.user_files_indexer import start_user_files_indexer
+from app.framework.background.user_files_sweeper import start_user_files_sweeper
+from app.framework.middlewares.upload_guard import UploadGuardMiddleware
+from app.infrastructure.embeddings.connection import start_embedding_service
 from app.infrastructure.file_storage.connection import check_file_storage_connection
 from app.infrastructure.key_value_db.connection import check_key_value_db_connection
+from app.infrastructure.language_models.connection import start_language_model
 from app.infrastructure.relational_db.connection import check_relational_db_connection
-from app.infrastructure.vector_db.connection import check_vector_db_connection
+from app.infrastructure.vector_db.connection import check_vector_db_connection, is_qdrant_used
 from app.shared.logging_config import setup_logging
+from app.shared.settings.file_storage import file_storage_settings
 
 logger = logging.getLogger("app")
 with open("pyproject.toml", "rb") as f:
@@ -34,8 +42,28 @@ async def lifespan(_: FastAPI):
         vector_db_closing_callback = await check_vector_db_connection()
         closing_callbacks.insert(0, vector_db_closing_callback)
 
+        embedding_closing_callback = await start_embedding_service()
+        closing_callbacks.insert(0, embedding_closing_callback)
+
+        language_model_closing_callback = await start_language_model()
+        closing_callbacks.insert(0, language_model_closing_callback)
+
         file_storage_closing_callback = await check_file_storage_connection()
         closing_callbacks.insert(0, file_storage_closing_callback)
+
+        user_files_sweeper_closing_callback = await start_user_files_sweeper()
+        closing_callbacks.insert(0, user_files_sweeper_closing_callback)
+
+        if is_qdrant_used():
+            user_files_indexer_closing_callback = await start_user_files_indexer()
+            closing_callbacks.insert(0, user_files_indexer_closing_callback)
+        else:
+            logger.info("User files are not indexed, Qdrant is not used in the exclusive hot set mode.")
+
+        search_analytics_closing_callback = await start_search_analytics_flusher()
+        closing_callbacks.insert(0, search_analytics_closing_callback)
+
+        await warm_up_search_caches()
     except Exception as e:
         logger.critical(f'Can not connect to external service: {e}')
         raise
@@ -59,6 +87,13 @@ app = FastAPI(lifespan=lifespan, title="PRAWOBIORCA", version=version)
 
 setup_logging()
 include_all_routers(app)
+include_exception_handlers(app)
+app.add_middleware(
+    UploadGuardMiddleware,
+    guarded_paths=frozenset({"/user/files"}),
+    max_body_size=file_storage_settings.MAX_UPLOAD_SIZE,
+    allowed_content_types=file_storage_settings.ALLOWED_CONTENT_TYPES,
+)
 
 
 if __name__ == "__main__":
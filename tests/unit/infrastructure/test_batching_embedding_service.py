@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.infrastructure.embeddings.batching import BatchingEmbeddingService
+from app.infrastructure.embeddings.hashing import HashingEncoder
+from app.shared.metrics import metrics_registry
+
+
+class RecordingEncoder(HashingEncoder):
+    def __init__(self, dimension: int):
+        super().__init__(dimension)
+        self.batches = []
+
+    def encode(self, texts):
+        self.batches.append(list(texts))
+        return super().encode(texts)
+
+
+class FailingEncoder(HashingEncoder):
+    def encode(self, texts):
+        raise RuntimeError("Model not loaded!")
+
+
+@pytest.fixture
+async def create_service():
+    services = []
+
+    def _create(encoder, max_batch_size=4, max_wait=0.05):
+        service = BatchingEmbeddingService(encoder, max_batch_size, max_wait, ThreadPoolExecutor(max_workers=1))
+        services.append(service)
+        return service
+
+    yield _create
+    for service in services:
+        await service.close()
+
+
+async def test_concurrent_requests_are_batched(create_service):
+    encoder = RecordingEncoder(32)
+    service = create_service(encoder, max_batch_size=4)
+    texts = [f"artykuł {number}" for number in range(10)]
+    batch_sizes_before = metrics_registry.histogram("embedding_batch_size").count
+
+    vectors = await asyncio.gather(*(service.embed(text) for text in texts))
+
+    assert [len(batch) for batch in encoder.batches] == [4, 4, 2]
+    assert vectors == HashingEncoder(32).encode(texts).tolist()
+    assert metrics_registry.histogram("embedding_batch_size").count - batch_sizes_before == 3
+
+
+async def test_single_request_flushed_after_max_wait(create_service):
+    encoder = RecordingEncoder(32)
+    service = create_service(encoder, max_batch_size=64, max_wait=0.01)
+
+    vector = await asyncio.wait_for(service.embed("kodeks"), timeout=1)
+
+    assert encoder.batches == [["kodeks"]]
+    assert len(vector) == 32
+
+
+async def test_encoder_error_is_propagated(create_service):
+    service = create_service(FailingEncoder(32))
+
+    results = await asyncio.gather(service.embed("a"), service.embed("b"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,85 @@
+from dataclasses import replace
+
+import pytest
+from qdrant_client import AsyncQdrantClient, models
+
+from app.infrastructure.enums import QuantizationType
+from app.infrastructure.vector_db.collections import CollectionSpec, apply_collection_spec, plan_collection_changes
+from app.shared.consts import DENSE_VECTOR_NAME, SPARSE_VECTOR_NAME
+from app.shared.exceptions import CollectionSpecMismatch
+
+TEST_SPEC = CollectionSpec(
+    name="law_acts_test",
+    vector_size=8,
+    distance=models.Distance.COSINE,
+    hnsw_m=16,
+    hnsw_ef_construct=128,
+    quantization=QuantizationType.SCALAR,
+    vectors_on_disk=True,
+)
+
+
+@pytest.fixture
+async def qdrant_client():
+    client = AsyncQdrantClient(location=":memory:")
+    yield client
+    await client.close()
+
+
+async def test_apply_creates_collection_once(qdrant_client):
+    first_changes = await apply_collection_spec(qdrant_client, TEST_SPEC)
+    second_changes = await apply_collection_spec(qdrant_client, TEST_SPEC)
+
+    vector_params = (await qdrant_client.get_collection(TEST_SPEC.name)).config.params.vectors[DENSE_VECTOR_NAME]
+    assert first_changes == ["create collection"]
+    assert second_changes == []
+    assert vector_params.on_disk is True
+    assert vector_params.hnsw_config.m == 16
+    assert vector_params.quantization_config.scalar.type == models.ScalarType.INT8
+
+
+async def test_plan_only_changed_parameters(qdrant_client):
+    await apply_collection_spec(qdrant_client, TEST_SPEC)
+    collection = await qdrant_client.get_collection(TEST_SPEC.name)
+
+    changes = plan_collection_changes(replace(TEST_SPEC, hnsw_m=32, quantization=QuantizationType.BINARY), collection)
+
+    assert changes.vector_params_diff.hnsw_config.m == 32
+    assert isinstance(changes.vector_params_diff.quantization_config, models.BinaryQuantization)
+    assert changes.vector_params_diff.on_disk is None
+    assert not changes.create_collection
+
+
+async def test_plan_disable_quantization_and_missing_indexes(qdrant_client):
+    await apply_collection_spec(qdrant_client, TEST_SPEC)
+    collection = await qdrant_client.get_collection(TEST_SPEC.name)
+    collection.payload_schema = {
+        "act_type": models.PayloadIndexInfo(data_type=models.PayloadSchemaType.KEYWORD, points=0)
+    }
+    payload_indexes = {"act_type": models.PayloadSchemaType.KEYWORD, "in_force_from": models.PayloadSchemaType.DATETIME}
+    spec = replace(TEST_SPEC, quantization=QuantizationType.NONE, payload_indexes=payload_indexes)
+
+    changes = plan_collection_changes(spec, collection)
+
+    assert changes.disable_quantization
+    assert changes.vector_params_diff is None
+    assert changes.missing_payload_indexes == {"in_force_from": models.PayloadSchemaType.DATETIME}
+
+
+async def test_vector_size_change_is_rejected(qdrant_client):
+    await apply_collection_spec(qdrant_client, TEST_SPEC)
+
+    with pytest.raises(CollectionSpecMismatch):
+        await apply_collection_spec(qdrant_client, replace(TEST_SPEC, vector_size=16))
+
+
+async def test_sparse_vector_is_created_and_missing_one_reported(qdrant_client, caplog):
+    await apply_collection_spec(qdrant_client, replace(TEST_SPEC, name="law_acts_sparse_test", sparse_vector=True))
+    await apply_collection_spec(qdrant_client, TEST_SPEC)
+
+    applied_changes = await apply_collection_spec(qdrant_client, replace(TEST_SPEC, sparse_vector=True))
+
+    sparse_vectors = (await qdrant_client.get_collection("law_acts_sparse_test")).config.params.sparse_vectors
+    assert sparse_vectors[SPARSE_VECTOR_NAME].modifier == models.Modifier.IDF
+    assert applied_changes == []
+    assert f"has no {SPARSE_VECTOR_NAME} vector" in caplog.text
@@ -0,0 +1,38 @@
+import gzip
+import io
+
+from app.infrastructure.file_storage.compression import GzipCompressingReader, compress_to_temporary_file, decompress
+
+
+def test_compressing_reader_streams_gzip():
+    content = b"Dziennik Ustaw. " * 100_000
+    reader = GzipCompressingReader(io.BytesIO(content), compression_level=6)
+
+    chunks = []
+    while chunk := reader.read(4096):
+        assert len(chunk) <= 4096
+        chunks.append(chunk)
+    compressed = b"".join(chunks)
+
+    assert reader.tell() == len(compressed)
+    assert gzip.decompress(compressed) == content
+    assert decompress(compressed) == content
+
+
+def test_compressing_reader_empty_source():
+    reader = GzipCompressingReader(io.BytesIO(b""), compression_level=1)
+
+    assert gzip.decompress(reader.read()) == b""
+
+
+def test_compress_to_temporary_file():
+    content = b"Dziennik Ustaw. " * 100_000
+
+    compressed_file, compressed_size = compress_to_temporary_file(io.BytesIO(content), compression_level=6)
+
+    with compressed_file:
+        compressed = compressed_file.read()
+        compressed_file.seek(0)
+        assert compressed_file.read() == compressed
+    assert len(compressed) == compressed_size
+    assert decompress(compressed) == content
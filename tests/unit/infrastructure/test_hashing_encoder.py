@@ -0,0 +1,23 @@
+import numpy as np
+
+from app.infrastructure.embeddings.hashing import HashingEncoder
+
+
+def test_encoder_is_deterministic_and_normalized():
+    encoder = HashingEncoder(128)
+
+    vectors = encoder.encode(["Kodeks cywilny", "kodeks  CYWILNY", ""])
+
+    assert vectors.shape == (3, 128)
+    assert vectors.dtype == np.float32
+    np.testing.assert_allclose(vectors[0], vectors[1])
+    np.testing.assert_allclose(np.linalg.norm(vectors[0]), 1.0, rtol=1e-6)
+    assert not vectors[2].any()
+
+
+def test_similar_texts_are_closer():
+    encoder = HashingEncoder(256)
+
+    query, similar, other = encoder.encode(["umowa sprzedaży", "umowa sprzedaży rzeczy", "podatek dochodowy"])
+
+    assert query @ similar > query @ other
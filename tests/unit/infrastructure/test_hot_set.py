@@ -0,0 +1,171 @@
+import json
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from app.application.use_cases.law_acts import BuildHotSetIndex
+from app.domain.entities.embeddings import SparseVector
+from app.domain.entities.law_acts import LawActHit, LawActsFilter
+from app.infrastructure.embeddings.hashing import HashingEncoder
+from app.infrastructure.enums import HotSetMode, HotSetPrecision
+from app.infrastructure.vector_db.hot_set import HotSetIndex, write_hot_set_index
+from app.infrastructure.vector_db.repositories.hot_set import HotSetLawActsRepository
+from app.shared.enums import LawActPayloadField
+from app.shared.exceptions import HotSetIndexNotLoaded
+
+POINTS = 300
+DIMENSION = 32
+
+
+def make_payload(number: int) -> dict:
+    payload = {
+        LawActPayloadField.ACT_ID: f"act-{number % 3}",
+        LawActPayloadField.ACT_TYPE: "ustawa" if number % 2 else "rozporządzenie",
+        LawActPayloadField.IN_FORCE_FROM: "2000-01-01",
+        LawActPayloadField.TEXT: f"Fragment {number}",
+    }
+    if number % 5 == 0:
+        payload[LawActPayloadField.IN_FORCE_TO] = "2010-01-01"
+    return payload
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).standard_normal((POINTS, DIMENSION)).astype(np.float32)
+
+
+def open_index(directory, vectors, precision) -> HotSetIndex:
+    ids = [str(number) for number in range(POINTS)]
+    write_hot_set_index(directory, ids, vectors, [make_payload(number) for number in range(POINTS)], precision)
+    hot_set_index = HotSetIndex()
+    hot_set_index.open(directory)
+    return hot_set_index
+
+
+@pytest.mark.parametrize("precision", [HotSetPrecision.FLOAT16, HotSetPrecision.INT8])
+def test_hot_set_matches_exact_search(tmp_path, vectors, precision):
+    hot_set_index = open_index(tmp_path / "hot_set", vectors, precision)
+    queries = vectors[:20] + 0.1
+    normalized_vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    normalized_queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    exact_scores = normalized_queries @ normalized_vectors.T
+
+    results = hot_set_index.search_many(queries, LawActsFilter(), limit=5)
+
+    for query_number, hits in enumerate(results):
+        assert hits[0].id == str(query_number)
+        assert [hit.score for hit in hits] == sorted((hit.score for hit in hits), reverse=True)
+        assert hits[0].score == pytest.approx(exact_scores[query_number, query_number], abs=0.01)
+
+
+def test_hot_set_filters_and_payload_fields(tmp_path, vectors):
+    hot_set_index = open_index(tmp_path / "hot_set", vectors, HotSetPrecision.FLOAT16)
+    filters = LawActsFilter(act_type="ustawa", in_force_on=date(2015, 1, 1))
+
+    hits = hot_set_index.search(vectors[0], filters, limit=POINTS, payload_fields=[LawActPayloadField.ACT_TYPE])
+
+    assert len(hits) == len([number for number in range(POINTS) if number % 2 and number % 5])
+    assert all(int(hit.id) % 2 and int(hit.id) % 5 for hit in hits)
+    assert all(hit.payload == {LawActPayloadField.ACT_TYPE: "ustawa"} for hit in hits)
+
+
+def test_hot_set_retrieve_by_ids(tmp_path, vectors):
+    hot_set_index = open_index(tmp_path / "hot_set", vectors, HotSetPrecision.INT8)
+
+    hits = hot_set_index.retrieve(["7", "missing", "3"], payload_fields=[LawActPayloadField.TEXT])
+
+    assert [(hit.id, hit.payload) for hit in hits] == [("7", {"text": "Fragment 7"}), ("3", {"text": "Fragment 3"})]
+
+
+def test_hot_set_not_loaded():
+    with pytest.raises(HotSetIndexNotLoaded):
+        HotSetIndex().search([0.0] * DIMENSION, LawActsFilter(), limit=1)
+
+
+def make_hits(*scores: float) -> list[LawActHit]:
+    return [LawActHit(id=f"hit-{score}", score=score) for score in scores]
+
+
+async def test_fallback_skips_qdrant_for_good_hot_set_hits():
+    hot_set_index, law_acts_repository = AsyncMock(), AsyncMock()
+    hot_set_index.search = lambda *args: make_hits(0.9, 0.8)
+    repository = HotSetLawActsRepository(hot_set_index, law_acts_repository, HotSetMode.FALLBACK, min_score=0.5)
+
+    hits = await repository.search([0.0], LawActsFilter(), limit=2)
+
+    assert [hit.score for hit in hits] == [0.9, 0.8]
+    law_acts_repository.search.assert_not_awaited()
+
+
+async def test_fallback_merges_weak_hot_set_hits():
+    hot_set_index, law_acts_repository = AsyncMock(), AsyncMock()
+    hot_set_index.search = lambda *args: make_hits(0.9, 0.3)
+    law_acts_repository.search.return_value = make_hits(0.95, 0.9, 0.4)
+    repository = HotSetLawActsRepository(hot_set_index, law_acts_repository, HotSetMode.FALLBACK, min_score=0.5)
+
+    hits = await repository.search([0.0], LawActsFilter(), limit=3)
+
+    assert [hit.score for hit in hits] == [0.95, 0.9, 0.4]
+
+
+@pytest.mark.parametrize("mode", [HotSetMode.FALLBACK, HotSetMode.MERGE])
+async def test_hybrid_search_skips_hot_set(mode):
+    hot_set_index, law_acts_repository = MagicMock(), AsyncMock()
+    hot_set_index.search.return_value = make_hits(0.9, 0.8)
+    law_acts_repository.search.return_value = make_hits(0.5, 0.3)
+    repository = HotSetLawActsRepository(hot_set_index, law_acts_repository, mode, min_score=0.5)
+    sparse_vector = SparseVector(indices=[1], values=[1.0])
+
+    hits = await repository.search([0.0], LawActsFilter(), limit=2, sparse_vector=sparse_vector)
+
+    assert [hit.score for hit in hits] == [0.5, 0.3]
+    hot_set_index.search.assert_not_called()
+    assert law_acts_repository.search.await_args.kwargs["sparse_vector"] == sparse_vector
+
+
+async def test_exclusive_never_queries_qdrant():
+    hot_set_index = AsyncMock()
+    hot_set_index.search = lambda *args: make_hits(0.2)
+    repository = HotSetLawActsRepository(hot_set_index, None, HotSetMode.EXCLUSIVE, min_score=0.5)
+
+    assert [hit.score for hit in await repository.search([0.0], LawActsFilter(), limit=5)] == [0.2]
+
+
+async def test_build_hot_set_index_from_source(tmp_path):
+    source = tmp_path / "acts.jsonl"
+    documents = [
+        {
+            "act_id": act_id,
+            "title": title,
+            "act_type": "ustawa",
+            "issuing_body": "Sejm",
+            "in_force_from": "1965-01-01",
+            "text": text,
+        }
+        for act_id, title, text in [
+            ("kc", "Kodeks cywilny", "Art. 1. Stosunki cywilnoprawne.\nArt. 2. Umowa sprzedaży rzeczy."),
+            ("kp", "Kodeks pracy", "Art. 1. Prawa i obowiązki pracowników."),
+        ]
+    ]
+    source.write_text("\n".join(json.dumps(document) for document in documents), encoding="utf-8")
+    encoder = HashingEncoder(64)
+    directory = tmp_path / "hot_set"
+    build_hot_set_index = BuildHotSetIndex(
+        law_acts_repository=AsyncMock(),
+        encoder=encoder,
+        act_ids=frozenset({"kc"}),
+        directory=directory,
+        precision=HotSetPrecision.INT8,
+        source=source,
+        batch_size=1,
+        max_chunk_length=1000,
+    )
+
+    assert await build_hot_set_index.execute() == 2
+    hot_set_index = HotSetIndex()
+    hot_set_index.open(directory)
+    query_vector = encoder.encode(["umowa sprzedaży rzeczy"])[0]
+    hits = hot_set_index.search(query_vector, LawActsFilter(), limit=1, payload_fields=[LawActPayloadField.UNIT])
+    assert hits[0].payload == {LawActPayloadField.UNIT: "art. 2"}
@@ -0,0 +1,53 @@
+import json
+
+import httpx
+
+from app.infrastructure.language_models.fake import FakeLanguageModel
+from app.infrastructure.language_models.openai_compatible import OpenAICompatibleLanguageModel
+
+PROMPT = "Przepisy:\n[1] Kodeks cywilny, art. 535\nArt. 535. Przez umowę sprzedaży.\n\nPytanie: Czym jest sprzedaż?"
+
+
+async def collect(language_model, prompt: str, max_tokens: int) -> list[str]:
+    return [text async for text in language_model.stream(prompt, max_tokens)]
+
+
+async def test_fake_language_model_cites_sources():
+    texts = await collect(FakeLanguageModel(), PROMPT, max_tokens=100)
+
+    assert len(texts) > 1
+    assert "[1] Kodeks cywilny, art. 535" in "".join(texts)
+
+
+async def test_fake_language_model_max_tokens():
+    texts = await collect(FakeLanguageModel(), PROMPT, max_tokens=2)
+
+    assert len(texts) == 2
+
+
+async def test_openai_compatible_language_model_streams_deltas():
+    requests = []
+    events = [
+        {"choices": [{"delta": {"role": "assistant"}}]},
+        {"choices": [{"delta": {"content": "Umowa"}}]},
+        {"choices": []},
+        {"choices": [{"delta": {"content": " sprzedaży [1]."}}]},
+    ]
+    body = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+    language_model = OpenAICompatibleLanguageModel(
+        "http://model/v1", "local-model", "secret", 5, transport=httpx.MockTransport(handler)
+    )
+    texts = await collect(language_model, PROMPT, max_tokens=50)
+    await language_model.close()
+
+    assert texts == ["Umowa", " sprzedaży [1]."]
+    assert requests[0].url == "http://model/v1/chat/completions"
+    assert requests[0].headers["Authorization"] == "Bearer secret"
+    request_body = json.loads(requests[0].content)
+    assert request_body["stream"] is True
+    assert request_body["max_tokens"] == 50
@@ -0,0 +1,187 @@
+from datetime import date
+
+import pytest
+from qdrant_client import AsyncQdrantClient, models
+
+from app.domain.entities.law_acts import LawActsFilter
+from app.domain.services.sparse_vectors import PolishSparseEncoder
+from app.infrastructure.embeddings.hashing import HashingEncoder
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository
+from app.shared.consts import DENSE_VECTOR_NAME, SPARSE_VECTOR_NAME
+from app.shared.enums import LawActPayloadField
+
+TEST_COLLECTION = "law_acts_test"
+TEST_DIMENSION = 64
+
+LAW_ACTS = (
+    {
+        "act_id": "civil-code",
+        "title": "Kodeks cywilny",
+        "act_type": "ustawa",
+        "issuing_body": "Sejm",
+        "in_force_from": "1965-01-01T00:00:00Z",
+        "text": "Umowa sprzedaży przenosi własność rzeczy na kupującego.",
+    },
+    {
+        "act_id": "old-tax-act",
+        "title": "Ustawa o podatku obrotowym",
+        "act_type": "ustawa",
+        "issuing_body": "Sejm",
+        "in_force_from": "1983-01-01T00:00:00Z",
+        "in_force_to": "1993-07-05T00:00:00Z",
+        "text": "Podatek obrotowy od sprzedaży rzeczy.",
+    },
+    {
+        "act_id": "vat-regulation",
+        "title": "Rozporządzenie w sprawie faktur",
+        "act_type": "rozporządzenie",
+        "issuing_body": "Minister Finansów",
+        "in_force_from": "2021-10-01T00:00:00Z",
+        "text": "Faktura dokumentuje sprzedaż rzeczy.",
+    },
+)
+
+
+@pytest.fixture
+def encoder():
+    return HashingEncoder(TEST_DIMENSION)
+
+
+@pytest.fixture
+def sparse_encoder():
+    return PolishSparseEncoder(k1=1.2, b=0.75, average_length=6)
+
+
+@pytest.fixture
+async def law_acts_repository(encoder, sparse_encoder):
+    client = AsyncQdrantClient(location=":memory:")
+    await client.create_collection(
+        TEST_COLLECTION,
+        vectors_config={DENSE_VECTOR_NAME: models.VectorParams(size=TEST_DIMENSION, distance=models.Distance.COSINE)},
+        sparse_vectors_config={SPARSE_VECTOR_NAME: models.SparseVectorParams(modifier=models.Modifier.IDF)},
+    )
+    texts = [law_act["text"] for law_act in LAW_ACTS]
+    vectors = encoder.encode(texts)
+    sparse_vectors = sparse_encoder.encode_documents(texts)
+    await client.upsert(
+        TEST_COLLECTION,
+        points=[
+            models.PointStruct(
+                id=index,
+                vector={
+                    DENSE_VECTOR_NAME: vector.tolist(),
+                    SPARSE_VECTOR_NAME: models.SparseVector(indices=sparse_vector.indices, values=sparse_vector.values),
+                },
+                payload=law_act,
+            )
+            for index, (vector, sparse_vector, law_act) in enumerate(zip(vectors, sparse_vectors, LAW_ACTS))
+        ],
+    )
+    yield LawActsRepository(client, TEST_COLLECTION)
+    await client.close()
+
+
+async def search(law_acts_repository, encoder, filters, **kwargs):
+    query_vector = encoder.encode(["sprzedaż rzeczy"])[0]
+    hits = await law_acts_repository.search(
+        query_vector, filters, limit=10, payload_fields=[LawActPayloadField.ACT_ID], **kwargs
+    )
+    return [hit.payload[LawActPayloadField.ACT_ID] for hit in hits]
+
+
+async def test_search_without_filters(law_acts_repository, encoder):
+    act_ids = await search(law_acts_repository, encoder, LawActsFilter())
+
+    assert sorted(act_ids) == ["civil-code", "old-tax-act", "vat-regulation"]
+
+
+async def test_search_by_act_type_and_issuing_body(law_acts_repository, encoder):
+    act_ids = await search(law_acts_repository, encoder, LawActsFilter(act_type="ustawa", issuing_body="Sejm"))
+
+    assert sorted(act_ids) == ["civil-code", "old-tax-act"]
+
+
+@pytest.mark.parametrize(
+    "in_force_on, expected_act_ids",
+    [
+        (date(1990, 1, 1), ["civil-code", "old-tax-act"]),
+        (date(2000, 1, 1), ["civil-code"]),
+        (date(2024, 1, 1), ["civil-code", "vat-regulation"]),
+    ],
+)
+async def test_search_in_force_on(law_acts_repository, encoder, in_force_on, expected_act_ids):
+    act_ids = await search(law_acts_repository, encoder, LawActsFilter(in_force_on=in_force_on))
+
+    assert sorted(act_ids) == expected_act_ids
+
+
+async def test_search_score_threshold_and_payload_fields(law_acts_repository, encoder):
+    query_vector = encoder.encode(["Faktura dokumentuje sprzedaż rzeczy."])[0]
+
+    hits = await law_acts_repository.search(
+        query_vector, LawActsFilter(), limit=10, score_threshold=0.99, payload_fields=[LawActPayloadField.TITLE]
+    )
+
+    assert len(hits) == 1
+    assert hits[0].payload == {"title": "Rozporządzenie w sprawie faktur"}
+
+
+async def test_hybrid_search_fuses_term_matches(law_acts_repository, encoder, sparse_encoder):
+    query_vector = encoder.encode(["sprzedaż rzeczy"])[0]
+
+    hits = await law_acts_repository.search(
+        query_vector,
+        LawActsFilter(act_type="ustawa"),
+        limit=10,
+        payload_fields=[LawActPayloadField.ACT_ID],
+        sparse_vector=sparse_encoder.encode_query("podatek obrotowy"),
+    )
+
+    assert [hit.payload[LawActPayloadField.ACT_ID] for hit in hits][0] == "old-tax-act"
+    assert sorted(hit.payload[LawActPayloadField.ACT_ID] for hit in hits) == ["civil-code", "old-tax-act"]
+
+
+async def test_hybrid_search_without_query_terms_is_dense(law_acts_repository, encoder, sparse_encoder):
+    act_ids = await search(
+        law_acts_repository, encoder, LawActsFilter(), sparse_vector=sparse_encoder.encode_query("i lub oraz")
+    )
+
+    assert sorted(act_ids) == ["civil-code", "old-tax-act", "vat-regulation"]
+
+
+async def test_hybrid_search_without_sparse_vector_in_collection_is_dense(encoder, sparse_encoder):
+    client = AsyncQdrantClient(location=":memory:")
+    await client.create_collection(
+        TEST_COLLECTION,
+        vectors_config={DENSE_VECTOR_NAME: models.VectorParams(size=TEST_DIMENSION, distance=models.Distance.COSINE)},
+    )
+    vectors = encoder.encode([law_act["text"] for law_act in LAW_ACTS])
+    await client.upsert(
+        TEST_COLLECTION,
+        points=[
+            models.PointStruct(id=index, vector={DENSE_VECTOR_NAME: vector.tolist()}, payload=law_act)
+            for index, (vector, law_act) in enumerate(zip(vectors, LAW_ACTS))
+        ],
+    )
+
+    act_ids = await search(
+        LawActsRepository(client, TEST_COLLECTION),
+        encoder,
+        LawActsFilter(),
+        sparse_vector=sparse_encoder.encode_query("podatek obrotowy"),
+    )
+    await client.close()
+
+    assert sorted(act_ids) == ["civil-code", "old-tax-act", "vat-regulation"]
+
+
+async def test_retrieve_by_ids(law_acts_repository, encoder):
+    found_hits = await law_acts_repository.search(
+        encoder.encode(["sprzedaż rzeczy"])[0], LawActsFilter(act_type="ustawa"), limit=10
+    )
+
+    hits = await law_acts_repository.retrieve(
+        [int(hit.id) for hit in found_hits], payload_fields=[LawActPayloadField.ACT_ID]
+    )
+
+    assert sorted(hit.payload[LawActPayloadField.ACT_ID] for hit in hits) == ["civil-code", "old-tax-act"]
@@ -0,0 +1,48 @@
+import json
+from datetime import date
+
+from app.domain.entities.law_acts import IngestionCheckpoint
+from app.infrastructure.law_acts.checkpoint import load_checkpoint, save_checkpoint
+from app.infrastructure.law_acts.sources import iterate_law_act_documents
+
+RAW_DOCUMENT = {
+    "act_id": "kc",
+    "title": "Kodeks cywilny",
+    "act_type": "ustawa",
+    "issuing_body": "Sejm",
+    "in_force_from": "1965-01-01",
+    "text": "Art. 1. Kodeks niniejszy reguluje stosunki cywilnoprawne.",
+}
+
+
+def test_jsonl_source(tmp_path):
+    source = tmp_path / "acts.jsonl"
+    repealed_document = RAW_DOCUMENT | {"act_id": "old", "in_force_to": "1990-01-01"}
+    source.write_text(f"{json.dumps(RAW_DOCUMENT)}\n\n{json.dumps(repealed_document)}\n", encoding="utf-8")
+
+    documents = list(iterate_law_act_documents(source))
+
+    assert [document.act_id for document in documents] == ["kc", "old"]
+    assert documents[0].in_force_from == date(1965, 1, 1)
+    assert documents[0].in_force_to is None
+    assert documents[1].in_force_to == date(1990, 1, 1)
+
+
+def test_directory_source_is_ordered(tmp_path):
+    for act_id in ("b", "a"):
+        (tmp_path / f"{act_id}.json").write_text(json.dumps(RAW_DOCUMENT | {"act_id": act_id}), encoding="utf-8")
+
+    documents = list(iterate_law_act_documents(tmp_path))
+
+    assert [document.act_id for document in documents] == ["a", "b"]
+
+
+def test_checkpoint_round_trip(tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint = IngestionCheckpoint(source="acts.jsonl", processed_documents=3, uploaded_chunks=42)
+
+    assert load_checkpoint(checkpoint_path) is None
+    save_checkpoint(checkpoint_path, checkpoint)
+
+    assert load_checkpoint(checkpoint_path) == checkpoint
+    assert list(tmp_path.iterdir()) == [checkpoint_path]
@@ -0,0 +1,119 @@
+import base64
+import hashlib
+import io
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.infrastructure.file_storage.local.repository import LocalFileStorage
+from app.infrastructure.file_storage.local.signing import verify_upload_signature
+from app.shared.exceptions import UploadSizeExceeded
+
+
+@pytest.fixture
+def local_file_storage(tmp_path):
+    storage = LocalFileStorage()
+    storage.root_directory = tmp_path.resolve()
+    return storage
+
+
+async def chunks_of(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_upload_target_is_signed(local_file_storage):
+    upload_target = await local_file_storage.create_upload_target("staging/file", "text/plain", 4, 60)
+
+    url = urlsplit(upload_target.url)
+    query = parse_qs(url.query)
+    expires, size, signature = int(query["expires"][0]), int(query["size"][0]), query["signature"][0]
+    assert upload_target.method == "PUT"
+    assert url.path.endswith("/staging/file")
+    assert verify_upload_signature("staging/file", expires, size, "text/plain", signature)
+    assert not verify_upload_signature("staging/other", expires, size, "text/plain", signature)
+    assert not verify_upload_signature("staging/file", expires, size + 1, "text/plain", signature)
+    assert not verify_upload_signature("staging/file", expires, size, "application/pdf", signature)
+
+
+async def test_uploaded_stream_metadata(local_file_storage):
+    await local_file_storage.upload_stream(chunks_of(b"te", b"st"), "staging/file")
+
+    metadata = await local_file_storage.get_file_metadata("staging/file")
+
+    assert metadata.size == 4
+    assert metadata.md5_hash == base64.b64encode(hashlib.md5(b"test").digest()).decode("ascii")
+
+
+async def test_upload_stream_over_max_size_deleted(local_file_storage):
+    with pytest.raises(UploadSizeExceeded):
+        await local_file_storage.upload_stream(chunks_of(b"te", b"st", b"!"), "staging/file", max_size=4)
+
+    assert await local_file_storage.get_file_metadata("staging/file") is None
+
+
+async def test_move_file(local_file_storage):
+    await local_file_storage.upload_stream(chunks_of(b"test"), "staging/file")
+
+    await local_file_storage.move_file("staging/file", "file")
+
+    assert await local_file_storage.get_file_metadata("staging/file") is None
+    assert await local_file_storage.get_file("file") == b"test"
+
+
+async def test_file_name_outside_storage_directory(local_file_storage):
+    with pytest.raises(ValueError):
+        await local_file_storage.get_file("../outside")
+
+
+async def test_list_files_pages(local_file_storage, monkeypatch):
+    monkeypatch.setattr("app.infrastructure.file_storage.local.repository.LIST_FILES_PAGE_SIZE", 2)
+    for file_name in ("b", "a/2", "a/1", "c", "staging/d"):
+        await local_file_storage.upload_stream(chunks_of(b"test"), file_name)
+
+    pages = [page async for page in local_file_storage.list_files()]
+
+    assert [page.file_names for page in pages] == [["a/1", "a/2"], ["b", "c"], ["staging/d"]]
+    assert [page.next_page_token for page in pages] == ["a/2", "c", None]
+
+
+async def test_list_files_resume(local_file_storage):
+    for file_name in ("b", "a/2", "a/1", "c", "staging/d"):
+        await local_file_storage.upload_stream(chunks_of(b"test"), file_name)
+
+    first_page = [page async for page in local_file_storage.list_files(max_results=2)][0]
+    resumed_pages = [page async for page in local_file_storage.list_files(page_token=first_page.next_page_token)]
+    staging_pages = [page async for page in local_file_storage.list_files(prefix="staging/")]
+
+    assert first_page.file_names == ["a/1", "a/2"]
+    assert resumed_pages[0].file_names == ["b", "c", "staging/d"]
+    assert staging_pages[0].file_names == ["staging/d"]
+
+
+async def test_compressed_upload(local_file_storage):
+    content = b"Art. 1. Ustawa okresla zasady. " * 1000
+    upload_file = UploadFile(filename="act.txt", file=io.BytesIO(content), headers=Headers())
+
+    await local_file_storage.upload_file(upload_file, "staging/act", "text/plain")
+    await local_file_storage.move_file("staging/act", "act")
+
+    stored_file = await local_file_storage.get_file_metadata("act")
+    file_names = [file_name async for page in local_file_storage.list_files() for file_name in page.file_names]
+    assert stored_file.size < len(content) // 10
+    assert await local_file_storage.get_file("act") == content
+    assert await local_file_storage.get_file_head("act", 7) == b"Art. 1."
+    assert file_names == ["act"]
+
+
+async def test_not_compressible_upload(local_file_storage):
+    content = b"%PDF-1.7 binary content"
+    upload_file = UploadFile(filename="act.pdf", file=io.BytesIO(content), headers=Headers())
+
+    await local_file_storage.upload_file(upload_file, "act", "application/pdf")
+
+    stored_file = await local_file_storage.get_file_metadata("act")
+    assert stored_file.size == len(content)
+    assert await local_file_storage.get_file("act") == content
+    assert await local_file_storage.get_file_head("act", 5) == b"%PDF-"
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.infrastructure.file_storage.executor import StorageExecutor
+from app.shared.exceptions import FileStorageBusy
+from app.shared.metrics import metrics_registry
+
+
+@pytest.fixture
+def storage_executor():
+    executor = StorageExecutor(max_workers=1, max_queue_size=1)
+    yield executor
+    executor.shutdown()
+
+
+async def test_run_uses_dedicated_threads(storage_executor):
+    thread_name = await storage_executor.run("test_operation", lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("file_storage")
+
+
+async def test_run_passes_arguments_and_records_latency(storage_executor):
+    operation_latency = metrics_registry.histogram("file_storage_operation_seconds", operation="test_arguments")
+    observations_before = operation_latency.count
+
+    result = await storage_executor.run("test_arguments", lambda a, b=0: a + b, 1, b=2)
+
+    assert result == 3
+    assert operation_latency.count == observations_before + 1
+
+
+async def test_run_rejects_calls_over_capacity(storage_executor):
+    release_worker = threading.Event()
+    running_calls = [
+        asyncio.create_task(storage_executor.run("test_blocking", release_worker.wait)),
+        asyncio.create_task(storage_executor.run("test_blocking", release_worker.wait)),
+    ]
+    await asyncio.sleep(0)
+
+    try:
+        with pytest.raises(FileStorageBusy):
+            await storage_executor.run("test_blocking", release_worker.wait)
+    finally:
+        release_worker.set()
+        await asyncio.gather(*running_calls)
+
+
+async def test_cancelled_calls_released_when_they_leave_executor(storage_executor):
+    queued_calls = metrics_registry.gauge("file_storage_executor_queued_calls")
+    queued_calls_before = queued_calls.value
+    release_worker = threading.Event()
+    worker_started = threading.Event()
+
+    def slow_call():
+        worker_started.set()
+        release_worker.wait()
+
+    running_call = asyncio.create_task(storage_executor.run("test_cancelled", slow_call))
+    await asyncio.to_thread(worker_started.wait)
+    running_call.cancel()
+    queued_call = asyncio.create_task(storage_executor.run("test_cancelled", release_worker.wait))
+    await asyncio.sleep(0)
+
+    try:
+        # The cancelled call still runs in the worker thread, so it takes a place of the capacity.
+        with pytest.raises(FileStorageBusy):
+            await asyncio.wait_for(storage_executor.run("test_cancelled", release_worker.wait), timeout=1)
+
+        # A call cancelled before a worker picked it up is never started and leaves the queue at once.
+        queued_call.cancel()
+        await asyncio.sleep(0)
+        assert queued_calls.value == queued_calls_before
+    finally:
+        release_worker.set()
+        await asyncio.gather(running_call, queued_call, return_exceptions=True)
+
+    assert await storage_executor.run("test_cancelled", lambda: "released") == "released"
@@ -0,0 +1,116 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+
+from app.domain.entities.user_files import StoredFileMetadata
+from app.domain.services.user_files_indexing import create_user_file_chunks, index_pending_user_files
+from app.infrastructure.embeddings.hashing import HashingEncoder
+from app.infrastructure.relational_db.schemas.users import UsersFiles
+from app.infrastructure.vector_db.repositories.user_files import UserFilesIndexRepository
+from app.shared.consts import DENSE_VECTOR_NAME
+from app.shared.enums import IndexingStatus
+
+TEST_COLLECTION = "user_files_test"
+TEST_DIMENSION = 64
+FIRST_USER_ID = str(uuid4())
+SECOND_USER_ID = str(uuid4())
+
+
+@pytest.fixture
+def encoder():
+    return HashingEncoder(TEST_DIMENSION)
+
+
+@pytest.fixture
+async def user_files_index_repository():
+    client = AsyncQdrantClient(location=":memory:")
+    repository = UserFilesIndexRepository(client, TEST_COLLECTION)
+    await repository.ensure_collection(TEST_DIMENSION)
+    yield repository
+    await client.close()
+
+
+def make_user_file(user_id: str, file_name: str) -> UsersFiles:
+    return UsersFiles(id=uuid4(), user_id=user_id, file_name=file_name)
+
+
+async def add_file(repository: UserFilesIndexRepository, encoder: HashingEncoder, user_file: UsersFiles, text: str):
+    chunks = create_user_file_chunks(user_file, text, max_chunk_length=1000)
+    vectors = encoder.encode([chunk.text for chunk in chunks])
+    await repository.replace_file_chunks(str(user_file.user_id), str(user_file.id), chunks, vectors)
+
+
+async def test_collection_is_partitioned_by_user(user_files_index_repository):
+    collection = await user_files_index_repository.client.get_collection(TEST_COLLECTION)
+
+    hnsw_config = collection.config.params.vectors[DENSE_VECTOR_NAME].hnsw_config
+    assert hnsw_config.m == 0
+    assert hnsw_config.payload_m > 0
+
+
+async def test_search_returns_only_files_of_user(user_files_index_repository, encoder):
+    text = "Wezwanie do zapłaty za fakturę VAT."
+    first_user_file = make_user_file(FIRST_USER_ID, "wezwanie.txt")
+    await add_file(user_files_index_repository, encoder, first_user_file, text)
+    await add_file(user_files_index_repository, encoder, make_user_file(SECOND_USER_ID, "cudze.txt"), text)
+
+    query_vector = encoder.encode([text])[0]
+    hits = await user_files_index_repository.search(FIRST_USER_ID, query_vector, limit=10)
+
+    assert [(hit.file_id, hit.file_name, hit.text) for hit in hits] == [(str(first_user_file.id), "wezwanie.txt", text)]
+
+
+async def test_replace_file_chunks_removes_previous_text(user_files_index_repository, encoder):
+    user_file = make_user_file(FIRST_USER_ID, "umowa.txt")
+    await add_file(user_files_index_repository, encoder, user_file, "Pierwszy akapit.\n\nDrugi akapit.")
+    await add_file(user_files_index_repository, encoder, user_file, "Nowa treść umowy.")
+
+    query_vector = encoder.encode(["Drugi akapit."])[0]
+    hits = await user_files_index_repository.search(FIRST_USER_ID, query_vector, limit=10)
+
+    assert [hit.text for hit in hits] == ["Nowa treść umowy."]
+
+
+async def test_index_pending_user_files_sets_statuses(user_files_index_repository, encoder):
+    text_file = make_user_file(FIRST_USER_ID, "pismo.txt")
+    image_file = make_user_file(FIRST_USER_ID, "skan.png")
+    missing_file = make_user_file(FIRST_USER_ID, "usuniety.txt")
+    large_file = make_user_file(FIRST_USER_ID, "akta.txt")
+    stored_files = {
+        str(text_file.id): "Pozew o zapłatę.".encode(),
+        str(image_file.id): b"\x89PNG\r\n\x1a\n\x00",
+        str(large_file.id): b"a" * 101,
+    }
+
+    users_unit_of_work = AsyncMock()
+    users_unit_of_work.__aenter__.return_value = users_unit_of_work
+    users_unit_of_work.files.claim_for_indexing.return_value = [text_file, image_file, missing_file, large_file]
+    storage_repository = AsyncMock()
+    storage_repository.get_file.side_effect = lambda file_name: stored_files[file_name]
+    storage_repository.get_file_metadata.side_effect = lambda file_name: (
+        StoredFileMetadata(size=len(stored_files[file_name]), md5_hash="") if file_name in stored_files else None
+    )
+
+    indexing_statuses = await index_pending_user_files(
+        users_unit_of_work,
+        storage_repository,
+        user_files_index_repository,
+        encoder,
+        batch_size=10,
+        stale_timeout=timedelta(minutes=15),
+        embedding_batch_size=8,
+        max_chunk_length=1000,
+        max_file_size=100,
+        max_unpacked_size=1000,
+    )
+
+    assert indexing_statuses == {IndexingStatus.INDEXED: 1, IndexingStatus.SKIPPED: 2, IndexingStatus.FAILED: 1}
+    users_unit_of_work.files.set_indexing_status.assert_any_await(str(large_file.id), IndexingStatus.SKIPPED)
+    assert all(call.args != (str(large_file.id),) for call in storage_repository.get_file.await_args_list)
+    users_unit_of_work.files.set_indexing_status.assert_any_await(str(text_file.id), IndexingStatus.INDEXED)
+    users_unit_of_work.files.set_indexing_status.assert_any_await(str(missing_file.id), IndexingStatus.FAILED)
+    hits = await user_files_index_repository.search(FIRST_USER_ID, encoder.encode(["Pozew o zapłatę."])[0], limit=1)
+    assert hits[0].file_name == "pismo.txt"
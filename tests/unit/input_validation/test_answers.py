@@ -0,0 +1,31 @@
+import pytest
+from fastapi import status
+
+from app.framework.dependencies.answers import answer_question_provider
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        {"question": ""},
+        {"question": "u" * 2001},
+        {"question": "umowa", "in_force_on": "not-a-date"},
+        {"question": "umowa", "rerank": "sometimes"},
+    ],
+)
+def test_answer_invalid_body(client, override_validate_token, assure_use_case_not_executed, body):
+    assure_use_case_not_executed(answer_question_provider)
+
+    access_token, _ = override_validate_token
+    response = client.post("/answer", json=body, headers={"Authorization": f"Bearer {access_token}"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_answer_without_token(client, assure_use_case_not_executed):
+    assure_use_case_not_executed(answer_question_provider)
+
+    response = client.post("/answer", json={"question": "umowa"})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
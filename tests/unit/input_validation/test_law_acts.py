@@ -0,0 +1,15 @@
+import pytest
+from fastapi import status
+
+from app.framework.dependencies.law_acts import list_related_law_acts_provider
+
+
+@pytest.mark.parametrize(
+    "url", ["/acts/DU/1964/93/related?limit=0", "/acts/DU/1964/93/related?limit=101", f"/acts/{'a' * 129}/related"]
+)
+def test_related_law_acts_invalid_parameters(client, assure_use_case_not_executed, url):
+    assure_use_case_not_executed(list_related_law_acts_provider)
+
+    response = client.get(url)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,51 @@
+from urllib.parse import urlsplit
+
+import pytest
+from fastapi import status
+
+from app.framework.dependencies.file_storage import get_file_storage
+from app.infrastructure.file_storage.local.repository import LocalFileStorage
+from main import app
+
+
+@pytest.fixture
+def local_file_storage(tmp_path):
+    storage = LocalFileStorage()
+    storage.root_directory = tmp_path.resolve()
+    app.dependency_overrides[get_file_storage] = lambda: storage
+    yield storage
+    app.dependency_overrides = {}
+
+
+async def create_upload_url(local_file_storage: LocalFileStorage, size: int) -> str:
+    upload_target = await local_file_storage.create_upload_target("staging/file", "text/plain", size, 60)
+    return upload_target.url
+
+
+async def test_upload_local_file(client, local_file_storage):
+    url = await create_upload_url(local_file_storage, size=4)
+
+    response = client.put(url, content=b"test", headers={"Content-Type": "text/plain"})
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert await local_file_storage.get_file("staging/file") == b"test"
+
+
+async def test_upload_local_file_changed_size_or_content_type(client, local_file_storage):
+    url = urlsplit(await create_upload_url(local_file_storage, size=4))
+    changed_size_url = f"{url.path}?{url.query.replace('size=4', 'size=4000')}"
+
+    changed_size_response = client.put(changed_size_url, content=b"test", headers={"Content-Type": "text/plain"})
+    changed_type_response = client.put(url.geturl(), content=b"test", headers={"Content-Type": "text/html"})
+
+    assert changed_size_response.status_code == status.HTTP_403_FORBIDDEN
+    assert changed_type_response.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_upload_local_file_over_declared_size(client, local_file_storage):
+    url = await create_upload_url(local_file_storage, size=4)
+
+    response = client.put(url, content=b"test!", headers={"Content-Type": "text/plain"})
+
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    assert await local_file_storage.get_file_metadata("staging/file") is None
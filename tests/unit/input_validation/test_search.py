@@ -0,0 +1,46 @@
+import pytest
+from fastapi import status
+
+from app.framework.dependencies.search import (
+    get_search_page_provider,
+    search_law_acts_provider,
+    suggest_law_acts_provider,
+)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"query": ""},
+        {"query": "umowa", "limit": 0},
+        {"query": "umowa", "limit": 101},
+        {"query": "umowa", "score_threshold": 2},
+        {"query": "umowa", "in_force_on": "not-a-date"},
+        {"query": "umowa", "fields": "password"},
+    ],
+)
+def test_search_invalid_parameters(client, assure_use_case_not_executed, params):
+    assure_use_case_not_executed(search_law_acts_provider)
+
+    response = client.get("/search", params=params)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize("params", [{}, {"prefix": ""}, {"prefix": "k" * 201}, {"prefix": "kodeks", "limit": 51}])
+def test_suggestions_invalid_parameters(client, assure_use_case_not_executed, params):
+    assure_use_case_not_executed(suggest_law_acts_provider)
+
+    response = client.get("/search/suggestions", params=params)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize("params", [{"page": 0}, {"page": 1001}, {"page": "last"}])
+def test_search_page_invalid_parameters(client, assure_use_case_not_executed, params):
+    assure_use_case_not_executed(get_search_page_provider)
+
+    response = client.get("/search/pages/cursor", params=params)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,135 @@
+from unittest.mock import AsyncMock, patch
+
+from fastapi import status
+
+from app.framework.dependencies.user_files import add_user_file_provider
+from app.framework.middlewares.upload_guard import UploadGuardMiddleware
+from main import app
+
+ONE_GIGABYTE = 1024**3
+CHUNK_SIZE = 1024**2
+BOUNDARY = "upload-guard-boundary"
+
+
+def multipart_chunks(file_head: bytes, file_size: int, consumed_chunks: list[int]):
+    yield (
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="user_file"; filename="act.txt"\r\n'
+        f"Content-Type: text/plain\r\n\r\n"
+    ).encode()
+    consumed_chunks.append(len(file_head))
+    yield file_head
+
+    sent_size = len(file_head)
+    while sent_size < file_size:
+        consumed_chunks.append(CHUNK_SIZE)
+        yield b"a" * CHUNK_SIZE
+        sent_size += CHUNK_SIZE
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def test_oversized_upload_rejected_without_reading_body(client, override_validate_token, assure_use_case_not_executed):
+    assure_use_case_not_executed(add_user_file_provider)
+    access_token, _ = override_validate_token
+    consumed_chunks = []
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": f"multipart/form-data; boundary={BOUNDARY}",
+        "Content-Length": str(ONE_GIGABYTE),
+    }
+
+    with patch("starlette.formparsers.SpooledTemporaryFile") as spooled_file:
+        response = client.post(
+            "/user/files", content=multipart_chunks(b"Art. 1.", ONE_GIGABYTE, consumed_chunks), headers=headers
+        )
+
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    assert consumed_chunks == []
+    spooled_file.assert_not_called()
+
+
+def test_upload_without_content_length_rejected(client, override_validate_token, assure_use_case_not_executed):
+    assure_use_case_not_executed(add_user_file_provider)
+    access_token, _ = override_validate_token
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": f"multipart/form-data; boundary={BOUNDARY}",
+    }
+
+    response = client.post("/user/files", content=multipart_chunks(b"Art. 1.", 0, []), headers=headers)
+
+    assert response.status_code == status.HTTP_411_LENGTH_REQUIRED
+
+
+def test_upload_with_not_allowed_content_rejected(client, override_validate_token, assure_use_case_not_executed):
+    assure_use_case_not_executed(add_user_file_provider)
+    access_token, _ = override_validate_token
+    headers = {"Authorization": f"Bearer {access_token}"}
+    executable = ("act.txt", b"MZ\x90\x00\x03\x00\x00\x00", "text/plain")
+
+    with patch("starlette.formparsers.SpooledTemporaryFile") as spooled_file:
+        response = client.post("/user/files", files={"user_file": executable}, headers=headers)
+
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+    spooled_file.assert_not_called()
+
+
+def test_allowed_upload_passes_guard(client, override_validate_token):
+    add_user_file = AsyncMock()
+    app.dependency_overrides[add_user_file_provider] = lambda: lambda *args: add_user_file
+    access_token, _ = override_validate_token
+    headers = {"Authorization": f"Bearer {access_token}"}
+    law_act = ("act.txt", "Art. 1. Ustawa wchodzi w życie z dniem ogłoszenia.".encode(), "text/plain")
+
+    response = client.post("/user/files", files={"user_file": law_act}, headers=headers)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    add_user_file.execute.assert_awaited_once()
+
+
+async def test_upload_with_file_after_large_field_rejected():
+    guarded_app = AsyncMock()
+    upload_guard = UploadGuardMiddleware(
+        guarded_app,
+        frozenset({"/user/files"}),
+        max_body_size=ONE_GIGABYTE,
+        allowed_content_types=frozenset({"text/plain"}),
+    )
+    field_part = f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="comment"\r\n\r\n'.encode() + b"a" * 20 * 1024
+    file_part = (
+        f'\r\n--{BOUNDARY}\r\nContent-Disposition: form-data; name="user_file"; filename="act.txt"\r\n\r\n'
+        f"MZ\x90\x00\r\n--{BOUNDARY}--\r\n"
+    ).encode()
+    body_chunks = [field_part[start : start + 1024] for start in range(0, len(field_part), 1024)] + [file_part]
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in body_chunks]
+    messages[-1]["more_body"] = False
+    receive = AsyncMock(side_effect=messages)
+    sent_messages = []
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/user/files",
+        "headers": [
+            (b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode()),
+            (b"content-length", str(len(field_part) + len(file_part)).encode()),
+        ],
+    }
+
+    await upload_guard(scope, receive, AsyncMock(side_effect=sent_messages.append))
+
+    guarded_app.assert_not_called()
+    assert sent_messages[0]["status"] == status.HTTP_400_BAD_REQUEST
+    assert receive.await_count < len(messages)
+
+
+def test_upload_with_not_allowed_second_file_rejected(client, override_validate_token, assure_use_case_not_executed):
+    assure_use_case_not_executed(add_user_file_provider)
+    access_token, _ = override_validate_token
+    headers = {"Authorization": f"Bearer {access_token}"}
+    files = [
+        ("user_file", ("act.txt", "Art. 1. Ustawa wchodzi w życie.".encode(), "text/plain")),
+        ("user_file", ("other.txt", b"MZ\x90\x00\x03\x00\x00\x00", "text/plain")),
+    ]
+
+    response = client.post("/user/files", files=files, headers=headers)
+
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
@@ -1,6 +1,18 @@
-from fastapi import status
+from unittest.mock import AsyncMock
 
-from app.framework.dependencies.user_files import add_user_file_provider
+import pytest
+from fastapi import FastAPI, status
+
+import app.framework.api.router as router_module
+from app.framework.api.router import include_all_routers
+from app.framework.dependencies.user_files import (
+    add_user_file_provider,
+    get_list_user_files,
+    search_user_files_provider,
+)
+from app.shared.consts import FILE_STORAGE_BUSY_RETRY_AFTER_SECONDS
+from app.shared.exceptions import FileStorageBusy
+from main import app
 
 
 def test_add_user_file_missing_file_field(
@@ -14,3 +26,48 @@ def test_add_user_file_missing_file_field(
     response = client.post("/user/files", headers=headers, files={})
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"query": ""},
+        {"query": "umowa", "limit": 0},
+        {"query": "umowa", "score_threshold": 2},
+    ],
+)
+def test_search_user_files_invalid_parameters(client, override_validate_token, assure_use_case_not_executed, params):
+    assure_use_case_not_executed(search_user_files_provider)
+
+    access_token, _ = override_validate_token
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = client.get("/user/files/search/semantic", params=params, headers=headers)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_file_storage_busy(client, override_validate_token):
+    list_user_files = AsyncMock()
+    list_user_files.execute.side_effect = FileStorageBusy()
+    app.dependency_overrides[get_list_user_files] = lambda: list_user_files
+
+    access_token, _ = override_validate_token
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = client.get("/user/files", headers=headers)
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == str(FILE_STORAGE_BUSY_RETRY_AFTER_SECONDS)
+
+
+def test_semantic_search_not_mounted_without_qdrant(monkeypatch):
+    monkeypatch.setattr(router_module, "is_qdrant_used", lambda: False)
+    application = FastAPI()
+
+    include_all_routers(application)
+
+    paths = application.openapi()["paths"]
+    assert "/user/files" in paths
+    assert "/user/files/search/semantic" not in paths
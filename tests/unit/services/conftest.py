@@ -39,6 +39,33 @@ class DummyUnitOfWork:
             await self.return_object.rollback()
 
 
+class InMemoryEmbeddingCacheRepository:
+    def __init__(self):
+        self.entries = {}
+
+    async def get_many(self, model_id, text_hashes):
+        return {
+            text_hash: self.entries[(model_id, text_hash)]
+            for text_hash in text_hashes
+            if (model_id, text_hash) in self.entries
+        }
+
+    async def add_many(self, entries_data):
+        for entry_data in entries_data:
+            self.entries.setdefault((entry_data["model_id"], entry_data["text_hash"]), entry_data["vector"])
+
+
+class InMemoryEmbeddingsUnitOfWork:
+    def __init__(self):
+        self.cache = InMemoryEmbeddingCacheRepository()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
 @pytest.fixture
 def user():
     return DummyUser(id_=uuid4(), email=VALID_EMAIL, hashed_password=b"hashed", is_email_verified=False)
@@ -75,3 +102,8 @@ def key_value_repository():
 @pytest.fixture
 def storage_client():
     return AsyncMock()
+
+
+@pytest.fixture
+def embeddings_unit_of_work():
+    return InMemoryEmbeddingsUnitOfWork()
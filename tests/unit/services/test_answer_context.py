@@ -0,0 +1,82 @@
+from app.domain.entities.answers import ContextPassage
+from app.domain.entities.law_acts import LawActHit
+from app.domain.services.answer_context import (
+    build_answer_prompt,
+    estimate_tokens,
+    get_article_unit,
+    merge_context_hits,
+    pack_context,
+)
+
+SHARED_SENTENCE = "Sprzedawca zobowiązuje się przenieść na kupującego własność rzeczy"
+
+
+def create_hit(hit_id: str, score: float, unit: str, text: str, act_id: str = "kc") -> LawActHit:
+    return LawActHit(
+        id=hit_id, score=score, payload={"act_id": act_id, "title": "Kodeks cywilny", "unit": unit, "text": text}
+    )
+
+
+def create_passage(text: str, score: float = 0.5) -> ContextPassage:
+    return ContextPassage(act_id="kc", title="Kodeks cywilny", unit="art. 1", text=text, score=score)
+
+
+def test_get_article_unit():
+    assert get_article_unit("art. 5 § 2-§ 4") == "art. 5"
+    assert get_article_unit("art. 10a") == "art. 10a"
+    assert get_article_unit("załącznik nr 1") == "załącznik nr 1"
+
+
+def test_merge_context_hits_per_article_in_text_order():
+    hits = [
+        create_hit("2", 0.9, "art. 535 § 10", "§ 10. Druga część."),
+        create_hit("1", 0.7, "art. 535 § 2", "§ 2. Pierwsza część."),
+        create_hit("3", 0.8, "art. 536", "Art. 536. Inny artykuł."),
+    ]
+
+    passages = merge_context_hits(hits)
+
+    assert [(passage.unit, passage.score) for passage in passages] == [("art. 535", 0.9), ("art. 536", 0.8)]
+    assert passages[0].text == "§ 2. Pierwsza część.\n§ 10. Druga część."
+    assert passages[0].chunk_ids == ["1", "2"]
+
+
+def test_merge_context_hits_drops_duplicated_and_contained_texts():
+    hits = [
+        create_hit("1", 0.9, "art. 535", "Art. 535. Przez umowę sprzedaży.", act_id="kc"),
+        create_hit("2", 0.8, "art. 12", "Art.  535. Przez umowę sprzedaży.", act_id="kc-2020"),
+        create_hit("3", 0.7, "art. 535 § 1", "Przez umowę"),
+    ]
+
+    passages = merge_context_hits(hits)
+
+    assert len(passages) == 1
+    assert passages[0].chunk_ids == ["1"]
+
+
+def test_merge_context_hits_joins_overlap_once():
+    hits = [
+        create_hit("1", 0.9, "art. 535 § 1", f"§ 1. Przez umowę sprzedaży. {SHARED_SENTENCE}"),
+        create_hit("2", 0.8, "art. 535 § 2", f"{SHARED_SENTENCE} i wydać mu rzecz."),
+    ]
+
+    passages = merge_context_hits(hits)
+
+    assert passages[0].text == f"§ 1. Przez umowę sprzedaży. {SHARED_SENTENCE}\ni wydać mu rzecz."
+    assert passages[0].text.count(SHARED_SENTENCE) == 1
+
+
+def test_pack_context_skips_passages_over_budget():
+    passages = [create_passage("a" * 30), create_passage("b" * 300), create_passage("c" * 15)]
+
+    packed_passages = pack_context(passages, token_budget=20)
+
+    assert [passage.text[0] for passage in packed_passages] == ["a", "c"]
+    assert [passage.tokens for passage in packed_passages] == [estimate_tokens("a" * 30), estimate_tokens("c" * 15)]
+
+
+def test_build_answer_prompt_numbers_sources():
+    prompt = build_answer_prompt("Czym jest sprzedaż?", [create_passage("Art. 1. Tekst.")])
+
+    assert "[1] Kodeks cywilny, art. 1\nArt. 1. Tekst." in prompt
+    assert prompt.endswith("Pytanie: Czym jest sprzedaż?")
@@ -0,0 +1,70 @@
+from datetime import date
+
+import pytest
+
+from app.domain.entities.law_acts import LawActCitation, LawActHit
+from app.domain.services.citations import boost_connected_hits, extract_citations, parse_enactment_date
+from app.shared.enums import LawActPayloadField
+
+
+def test_extract_citations_resolves_dated_act_by_journal_position():
+    text = (
+        "Do umów stosuje się art. 535 § 1 ustawy z dnia 23 kwietnia 1964 r. - Kodeks cywilny "
+        "(Dz. U. z 2023 r. poz. 1610 i 1615)."
+    )
+
+    assert extract_citations(text) == [
+        LawActCitation(target_unit="art. 535", target_act_id="DU/2023/1610"),
+        LawActCitation(target_unit="", target_act_id="DU/2023/1615"),
+    ]
+
+
+def test_extract_citations_without_journal_position():
+    text = "Stosuje się przepisy rozporządzenia Ministra Finansów z dnia 5 maja 2020 r. w sprawie podatków."
+
+    assert extract_citations(text) == [
+        LawActCitation(target_unit="", act_type="rozporządzenie", enacted_on=date(2020, 5, 5))
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, act_id",
+    [
+        ("Dz. U. z 1964 r. Nr 16, poz. 93", "DU/1964/93"),
+        ("Dz.U. 2019 poz. 7", "DU/2019/7"),
+        ("M.P. z 2021 r. poz. 12", "MP/2021/12"),
+    ],
+)
+def test_extract_citations_journal_formats(text, act_id):
+    assert extract_citations(text) == [LawActCitation(target_unit="", target_act_id=act_id)]
+
+
+def test_extract_citations_ignores_references_within_act():
+    assert extract_citations("Przepis art. 5 § 2 stosuje się odpowiednio do art. 7 ust. 1 pkt 3.") == []
+
+
+def test_parse_enactment_date():
+    assert parse_enactment_date("Ustawa z dnia 26 czerwca 1974 r. Kodeks pracy") == date(1974, 6, 26)
+    assert parse_enactment_date("Kodeks pracy") is None
+    assert parse_enactment_date("Ustawa z dnia 31 lutego 1974 r.") is None
+
+
+def make_hit(hit_id: str, score: float, act_id: str) -> LawActHit:
+    return LawActHit(id=hit_id, score=score, payload={LawActPayloadField.ACT_ID: act_id})
+
+
+def test_boost_connected_hits():
+    hits = [make_hit("1", 0.80, "kp"), make_hit("2", 0.79, "kc"), make_hit("3", 0.78, "kpc"), make_hit("4", 0.7, "kc")]
+
+    boosted_hits = boost_connected_hits(hits, {("kp", "kc"), ("kpc", "kc"), ("kc", "other")}, weight=0.1)
+
+    assert [hit.id for hit in boosted_hits] == ["2", "1", "3", "4"]
+    assert boosted_hits[0].score == pytest.approx(0.79 + 0.1)
+    assert boosted_hits[1].score == pytest.approx(0.80 + 0.05)
+    assert hits[0].score == 0.80
+
+
+def test_boost_connected_hits_single_act():
+    hits = [make_hit("1", 0.8, "kc"), make_hit("2", 0.7, "kc")]
+
+    assert boost_connected_hits(hits, {("kc", "kc")}, weight=0.1) is hits
@@ -0,0 +1,21 @@
+import pytest
+
+from app.domain.services.content_type import DOCX_CONTENT_TYPE, OCTET_STREAM_CONTENT_TYPE, sniff_content_type
+
+
+@pytest.mark.parametrize(
+    "file_head, content_type",
+    [
+        (b"%PDF-1.7\n%\xe2\xe3\xcf\xd3", "application/pdf"),
+        (b"PK\x03\x04\x14\x00\x06\x00[Content_Types].xml", DOCX_CONTENT_TYPE),
+        (b"PK\x03\x04\x14\x00\x06\x00other.bin", "application/zip"),
+        (b'\xef\xbb\xbf<?xml version="1.0"?><akt/>', "application/xml"),
+        (b"  <!DOCTYPE html><html></html>", "text/html"),
+        ("Art. 1. Ustawa reguluje zasady postępowania.".encode("utf-8"), "text/plain"),
+        ("Art. 1. Ustawa reguluje zasady postępowania.".encode("cp1250"), "text/plain"),
+        (b"MZ\x90\x00\x03\x00", "application/x-msdownload"),
+        (b"\x00\x01\x02\x03", OCTET_STREAM_CONTENT_TYPE),
+    ],
+)
+def test_sniff_content_type(file_head, content_type):
+    assert sniff_content_type(file_head) == content_type
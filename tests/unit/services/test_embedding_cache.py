@@ -0,0 +1,60 @@
+import numpy as np
+
+from app.domain.services.embedding_cache import EmbeddingCache, encode_in_batches, get_text_hash
+from app.infrastructure.embeddings.hashing import HashingEncoder
+
+
+class CountingEncoder(HashingEncoder):
+    def __init__(self, dimension: int):
+        super().__init__(dimension)
+        self.encoded_texts = []
+
+    def encode(self, texts):
+        self.encoded_texts.extend(texts)
+        return super().encode(texts)
+
+
+async def test_embedding_cache_encodes_every_text_once(embeddings_unit_of_work):
+    encoder = CountingEncoder(16)
+    texts = ["Art. 1. Ustawa wchodzi w życie.", "Art. 2. Traci moc ustawa.", "Art. 1.  Ustawa wchodzi\nw życie."]
+
+    first_vectors = await EmbeddingCache(embeddings_unit_of_work).encode(texts, encoder, embedding_batch_size=1)
+    embedding_cache = EmbeddingCache(embeddings_unit_of_work)
+    second_vectors = await embedding_cache.encode(texts[:2], encoder, embedding_batch_size=1)
+
+    assert encoder.encoded_texts == ["Art. 1. Ustawa wchodzi w życie.", "Art. 2. Traci moc ustawa."]
+    np.testing.assert_array_equal(first_vectors[0], first_vectors[2])
+    np.testing.assert_array_equal(first_vectors[:2], second_vectors)
+    assert (embedding_cache.stats.hits, embedding_cache.stats.misses) == (2, 0)
+
+
+async def test_embedding_cache_encodes_original_text(embeddings_unit_of_work):
+    encoder = CountingEncoder(16)
+    text = "Art. 1.\n\nUstawa  wchodzi w życie."
+
+    vectors = await EmbeddingCache(embeddings_unit_of_work).encode([text], encoder, embedding_batch_size=8)
+
+    assert encoder.encoded_texts == [text]
+    np.testing.assert_array_equal(vectors, await encode_in_batches([text], encoder, embedding_batch_size=8))
+
+
+async def test_embedding_cache_separates_models(embeddings_unit_of_work):
+    text = "Umowa sprzedaży."
+    await EmbeddingCache(embeddings_unit_of_work).encode([text], HashingEncoder(16), embedding_batch_size=8)
+    embedding_cache = EmbeddingCache(embeddings_unit_of_work)
+
+    vectors = await embedding_cache.encode([text], HashingEncoder(32), embedding_batch_size=8)
+
+    assert vectors.shape == (1, 32)
+    assert (embedding_cache.stats.hits, embedding_cache.stats.misses) == (0, 1)
+    assert {model_id for model_id, _ in embeddings_unit_of_work.cache.entries} == {"hashing-v1-16", "hashing-v1-32"}
+
+
+async def test_embedding_cache_stores_float32_bytes(embeddings_unit_of_work):
+    encoder = HashingEncoder(16)
+
+    vectors = await EmbeddingCache(embeddings_unit_of_work).encode(["Kodeks pracy."], encoder, embedding_batch_size=8)
+
+    stored_vector = embeddings_unit_of_work.cache.entries[(encoder.model_id, get_text_hash("Kodeks pracy."))]
+    assert len(stored_vector) == 16 * 4
+    np.testing.assert_array_equal(np.frombuffer(stored_vector, dtype="<f4"), vectors[0])
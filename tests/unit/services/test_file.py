@@ -1,13 +1,33 @@
 import io
-from unittest.mock import AsyncMock, MagicMock
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, call
+from uuid import UUID
 
 import pytest
 from fastapi import UploadFile
-from sqlalchemy.exc import IntegrityError
 from starlette.datastructures import Headers
 
-from app.domain.services.user_files import add_user_file
-from app.shared.exceptions import EmptyFileException, FileNameExist
+from app.domain.entities.user_files import FilesPage, StoredFileMetadata
+from app.domain.services.content_type import SNIFF_LENGTH
+from app.domain.services.user_files import (
+    add_user_file,
+    finalize_upload_session,
+    get_staging_file_name,
+    sweep_orphaned_uploads,
+)
+from app.shared.consts import STAGING_FILES_PREFIX
+from app.shared.enums import FileStatus
+from app.shared.exceptions import (
+    EmptyFileException,
+    FileNameExist,
+    FileTypeNotAllowed,
+    PendingUploadExpired,
+    RelationalDbIntegrityError,
+    UploadSessionNotFound,
+    UploadVerificationFailed,
+)
+
+TEST_MD5_HASH = "CY9rzUYh03PK3k6DJie09g=="
 
 
 def make_upload_file(name="test.txt", content=b"test-content"):
@@ -28,15 +48,36 @@ async def test_add_user_file_success(uow, storage_client, uuid_generator):
 
     await add_user_file(uow, upload_file, user_id, storage_client)
 
-    uow.files.add.assert_awaited_once_with({"file_name": "test.txt", "user_id": user_id})
-    storage_client.upload_file.assert_awaited_once_with(upload_file, fake_file_id)
-    uow.commit.assert_awaited_once()
+    staging_file_name = get_staging_file_name(fake_file_id)
+    uow.files.add.assert_awaited_once_with({"file_name": "test.txt", "user_id": user_id, "status": FileStatus.PENDING})
+    storage_client.upload_file.assert_awaited_once_with(upload_file, staging_file_name, "text/plain")
+    storage_client.move_file.assert_awaited_once_with(staging_file_name, fake_file_id)
+    uow.files.mark_ready.assert_awaited_once_with(fake_file_id)
+    assert uow.commit.await_count == 2
+
+
+async def test_add_user_file_upload_failure_discards_pending_file(uow, storage_client, uuid_generator):
+    upload_file = make_upload_file()
+    user_id = next(uuid_generator)
+    fake_file_id = next(uuid_generator)
+
+    add_result = MagicMock()
+    add_result.id = fake_file_id
+    uow.files.add = AsyncMock(return_value=add_result)
+    storage_client.upload_file = AsyncMock(side_effect=ConnectionError())
+
+    with pytest.raises(ConnectionError):
+        await add_user_file(uow, upload_file, user_id, storage_client)
+
+    uow.files.delete.assert_awaited_once_with(fake_file_id)
+    uow.files.mark_ready.assert_not_awaited()
+    storage_client.delete_file.assert_has_awaits([call(get_staging_file_name(fake_file_id)), call(fake_file_id)])
 
 
 async def test_add_user_file_duplicate_file_name(uow, storage_client, uuid_generator):
     upload_file = make_upload_file()
     user_id = next(uuid_generator)
-    uow.files.add = AsyncMock(side_effect=IntegrityError("msg", None, Exception()))
+    uow.files.add = AsyncMock(side_effect=RelationalDbIntegrityError())
     with pytest.raises(FileNameExist):
         await add_user_file(uow, upload_file, user_id, storage_client)
     uow.commit.assert_not_awaited()
@@ -48,3 +89,123 @@ async def test_add_user_file_empty_file(uow, storage_client, uuid_generator):
     with pytest.raises(EmptyFileException):
         await add_user_file(uow, upload_file, user_id, storage_client)
     uow.commit.assert_not_awaited()
+
+
+async def pages_of(*pages: list[str]):
+    for file_names in pages:
+        yield FilesPage(file_names=file_names, next_page_token=None)
+
+
+async def test_add_user_file_expired_while_uploading(uow, storage_client, uuid_generator):
+    upload_file = make_upload_file()
+    user_id = next(uuid_generator)
+    fake_file_id = next(uuid_generator)
+
+    add_result = MagicMock()
+    add_result.id = fake_file_id
+    uow.files.add = AsyncMock(return_value=add_result)
+    uow.files.mark_ready = AsyncMock(return_value=False)
+
+    with pytest.raises(PendingUploadExpired):
+        await add_user_file(uow, upload_file, user_id, storage_client)
+
+    storage_client.move_file.assert_awaited_once_with(get_staging_file_name(fake_file_id), fake_file_id)
+    storage_client.delete_file.assert_any_await(fake_file_id)
+
+
+async def test_sweep_orphaned_uploads(uow, storage_client, uuid_generator):
+    stale_file_id = next(uuid_generator)
+    in_progress_file_id = next(uuid_generator)
+    orphaned_file_id = next(uuid_generator)
+
+    stale_file = MagicMock()
+    stale_file.id = stale_file_id
+    uow.files.get_stale_pending = AsyncMock(return_value=[stale_file])
+    uow.files.get_pending_ids = AsyncMock(return_value={UUID(in_progress_file_id)})
+    storage_client.list_files = MagicMock(
+        return_value=pages_of(
+            [get_staging_file_name(in_progress_file_id)],
+            [get_staging_file_name(orphaned_file_id)],
+        )
+    )
+
+    removed_uploads = await sweep_orphaned_uploads(uow, storage_client, timedelta(hours=1))
+
+    assert removed_uploads == 2
+    storage_client.list_files.assert_called_once_with(prefix=STAGING_FILES_PREFIX)
+    assert uow.files.get_pending_ids.await_count == 2
+    uow.files.delete.assert_awaited_once_with(stale_file_id)
+    storage_client.delete_file.assert_any_await(get_staging_file_name(orphaned_file_id))
+    assert call(get_staging_file_name(in_progress_file_id)) not in storage_client.delete_file.await_args_list
+
+
+async def test_finalize_upload_session_success(uow, storage_client, uuid_generator):
+    user_id = next(uuid_generator)
+    file_id = next(uuid_generator)
+    user_file = MagicMock(user_id=UUID(user_id), status=FileStatus.PENDING, declared_size=4)
+    uow.files.get = AsyncMock(return_value=user_file)
+    storage_client.get_file_metadata = AsyncMock(return_value=StoredFileMetadata(size=4, md5_hash=TEST_MD5_HASH))
+    storage_client.get_file_head = AsyncMock(return_value=b"test")
+
+    await finalize_upload_session(uow, storage_client, user_id, file_id, 4, TEST_MD5_HASH)
+
+    storage_client.move_file.assert_awaited_once_with(get_staging_file_name(file_id), file_id)
+    uow.files.mark_ready.assert_awaited_once_with(file_id)
+
+
+async def test_finalize_upload_session_hash_mismatch(uow, storage_client, uuid_generator):
+    user_id = next(uuid_generator)
+    file_id = next(uuid_generator)
+    user_file = MagicMock(user_id=UUID(user_id), status=FileStatus.PENDING, declared_size=4)
+    uow.files.get = AsyncMock(return_value=user_file)
+    storage_client.get_file_metadata = AsyncMock(return_value=StoredFileMetadata(size=4, md5_hash="other-hash"))
+
+    with pytest.raises(UploadVerificationFailed):
+        await finalize_upload_session(uow, storage_client, user_id, file_id, 4, TEST_MD5_HASH)
+
+    storage_client.move_file.assert_not_awaited()
+    uow.files.delete.assert_awaited_once_with(file_id)
+
+
+async def test_finalize_upload_session_size_of_session_mismatch(uow, storage_client, uuid_generator):
+    user_id = next(uuid_generator)
+    file_id = next(uuid_generator)
+    user_file = MagicMock(user_id=UUID(user_id), status=FileStatus.PENDING, declared_size=2)
+    uow.files.get = AsyncMock(return_value=user_file)
+    storage_client.get_file_metadata = AsyncMock(return_value=StoredFileMetadata(size=4, md5_hash=TEST_MD5_HASH))
+
+    with pytest.raises(UploadVerificationFailed):
+        await finalize_upload_session(uow, storage_client, user_id, file_id, 4, TEST_MD5_HASH)
+
+    storage_client.move_file.assert_not_awaited()
+    uow.files.delete.assert_awaited_once_with(file_id)
+
+
+async def test_finalize_upload_session_not_allowed_content(uow, storage_client, uuid_generator):
+    user_id = next(uuid_generator)
+    file_id = next(uuid_generator)
+    user_file = MagicMock(user_id=UUID(user_id), status=FileStatus.PENDING, declared_size=4)
+    uow.files.get = AsyncMock(return_value=user_file)
+    storage_client.get_file_metadata = AsyncMock(return_value=StoredFileMetadata(size=4, md5_hash=TEST_MD5_HASH))
+    storage_client.get_file_head = AsyncMock(return_value=b"MZ\x90\x00")
+
+    with pytest.raises(FileTypeNotAllowed):
+        await finalize_upload_session(uow, storage_client, user_id, file_id, 4, TEST_MD5_HASH)
+
+    storage_client.get_file_head.assert_awaited_once_with(get_staging_file_name(file_id), SNIFF_LENGTH)
+    storage_client.move_file.assert_not_awaited()
+    storage_client.delete_file.assert_any_await(get_staging_file_name(file_id))
+    uow.files.delete.assert_awaited_once_with(file_id)
+
+
+async def test_finalize_upload_session_of_other_user(uow, storage_client, uuid_generator):
+    user_id = next(uuid_generator)
+    other_user_id = next(uuid_generator)
+    file_id = next(uuid_generator)
+    user_file = MagicMock(user_id=UUID(other_user_id), status=FileStatus.PENDING)
+    uow.files.get = AsyncMock(return_value=user_file)
+
+    with pytest.raises(UploadSessionNotFound):
+        await finalize_upload_session(uow, storage_client, user_id, file_id, 4, TEST_MD5_HASH)
+
+    storage_client.get_file_metadata.assert_not_awaited()
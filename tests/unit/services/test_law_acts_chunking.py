@@ -0,0 +1,62 @@
+from datetime import date
+
+from app.domain.entities.law_acts import LawActDocument
+from app.domain.services.law_acts_chunking import chunk_law_act
+
+ACT_TEXT = """USTAWA
+z dnia 23 kwietnia 1964 r.
+Kodeks cywilny
+
+Art. 1. Kodeks niniejszy reguluje stosunki cywilnoprawne między osobami fizycznymi i osobami prawnymi.
+Art. 2. (uchylony)
+Art. 3. § 1. Ustawa nie ma mocy wstecznej, chyba że to wynika z jej brzmienia lub celu.
+§ 2. Zdanie drugie jest bardzo długie i opisuje szczegółowo zasady stosowania przepisów.
+§ 3. Trzeci paragraf zamyka artykuł.
+"""
+
+
+def make_document(text=ACT_TEXT):
+    return LawActDocument(
+        act_id="kc",
+        title="Kodeks cywilny",
+        act_type="ustawa",
+        issuing_body="Sejm",
+        in_force_from=date(1965, 1, 1),
+        text=text,
+    )
+
+
+def test_articles_become_chunks():
+    chunks = list(chunk_law_act(make_document(), max_chunk_length=1000))
+
+    assert [chunk.unit for chunk in chunks] == ["preambuła", "art. 1", "art. 2", "art. 3"]
+    assert chunks[1].text.startswith("Art. 1. Kodeks niniejszy")
+    assert chunks[1].key == "kc#art. 1"
+
+
+def test_long_article_split_into_paragraph_groups():
+    chunks = list(chunk_law_act(make_document(), max_chunk_length=160))
+
+    article_units = [chunk.unit for chunk in chunks if chunk.unit.startswith("art. 3")]
+    assert article_units == ["art. 3 § 1", "art. 3 § 2-3"]
+    assert all(len(chunk.text) <= 160 for chunk in chunks)
+
+
+def test_sections_in_article_header_line():
+    text = "Art. 5. 1. Pierwszy ustęp artykułu.\n2. Drugi ustęp artykułu.\n3. Trzeci ustęp artykułu."
+
+    chunks = list(chunk_law_act(make_document(text), max_chunk_length=40))
+
+    assert [chunk.unit for chunk in chunks] == ["art. 5 ust. 1", "art. 5 ust. 2", "art. 5 ust. 3"]
+    assert chunks[0].text == "1. Pierwszy ustęp artykułu."
+
+
+def test_chunk_ids_are_stable_and_unique():
+    text = "Art. 1. Pierwszy.\nArt. 1. Pierwszy powtórzony w nowelizacji."
+
+    first_run = list(chunk_law_act(make_document(text), max_chunk_length=1000))
+    second_run = list(chunk_law_act(make_document(text), max_chunk_length=1000))
+
+    assert [chunk.id for chunk in first_run] == [chunk.id for chunk in second_run]
+    assert len({chunk.id for chunk in first_run}) == 2
+    assert first_run[1].unit == "art. 1 (2)"
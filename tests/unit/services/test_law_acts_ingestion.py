@@ -0,0 +1,234 @@
+from dataclasses import replace
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+
+from app.domain.entities.law_acts import IngestionCheckpoint, LawActDocument
+from app.domain.services.embedding_cache import EmbeddingCache
+from app.domain.services.law_acts_ingestion import ingest_law_acts
+from app.domain.services.sparse_vectors import sparse_encoder
+from app.infrastructure.embeddings.hashing import HashingEncoder
+from app.infrastructure.vector_db.repositories.law_acts import LawActsRepository
+from app.shared.consts import SPARSE_VECTOR_NAME
+from app.shared.enums import LawActPayloadField
+
+TEST_COLLECTION = "law_acts_test"
+
+
+def make_documents(count: int) -> list[LawActDocument]:
+    return [
+        LawActDocument(
+            act_id=f"act-{number}",
+            title=f"Ustawa {number}",
+            act_type="ustawa",
+            issuing_body="Sejm",
+            in_force_from=date(2000, 1, 1),
+            text=f"Art. 1. Pierwszy artykuł ustawy {number}.\nArt. 2. Drugi artykuł ustawy {number}.",
+        )
+        for number in range(count)
+    ]
+
+
+class FailingRepository(LawActsRepository):
+    def __init__(self, client, collection_name, fail_on_upload: int):
+        super().__init__(client, collection_name)
+        self.uploads = 0
+        self.fail_on_upload = fail_on_upload
+
+    async def upload_chunks(self, chunks, vectors, batch_size, parallel, sparse_vectors=None):
+        self.uploads += 1
+        if self.uploads == self.fail_on_upload:
+            raise ConnectionError()
+        await super().upload_chunks(chunks, vectors, batch_size, parallel, sparse_vectors=sparse_vectors)
+
+
+class InMemoryLawActChunksRepository:
+    def __init__(self):
+        self.chunks = {}
+
+    async def list_by_acts(self, act_ids):
+        return [chunk for chunk in self.chunks.values() if chunk.act_id in act_ids]
+
+    async def upsert_many(self, chunks_data):
+        for chunk_data in chunks_data:
+            self.chunks[chunk_data["id"]] = SimpleNamespace(**chunk_data)
+
+    async def delete_many(self, chunk_ids):
+        for chunk_id in chunk_ids:
+            del self.chunks[chunk_id]
+
+
+class InMemoryLawActsCatalogRepository:
+    def __init__(self):
+        self.acts = {}
+
+    async def upsert_many(self, acts_data):
+        for act_data in acts_data:
+            self.acts[act_data["act_id"]] = act_data
+
+    async def list_by_enactment(self, enactments):
+        return [
+            (act["act_id"], act["act_type"], act["enacted_on"])
+            for act in self.acts.values()
+            if (act["act_type"], act["enacted_on"]) in enactments
+        ]
+
+
+class InMemoryLawActReferencesRepository:
+    def __init__(self):
+        self.references = []
+
+    async def replace_for_sources(self, source_act_ids, references_data):
+        self.references = [
+            reference for reference in self.references if reference["source_act_id"] not in source_act_ids
+        ]
+        self.references.extend(references_data)
+
+
+class InMemoryLawActsUnitOfWork:
+    def __init__(self):
+        self.chunks = InMemoryLawActChunksRepository()
+        self.acts = InMemoryLawActsCatalogRepository()
+        self.references = InMemoryLawActReferencesRepository()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+@pytest.fixture
+async def qdrant_client():
+    client = AsyncQdrantClient(location=":memory:")
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def law_acts_unit_of_work():
+    return InMemoryLawActsUnitOfWork()
+
+
+async def ingest(repository, unit_of_work, documents, checkpoint, saved_checkpoints, embedding_cache=None):
+    return await ingest_law_acts(
+        documents,
+        repository,
+        unit_of_work,
+        HashingEncoder(16),
+        checkpoint,
+        saved_checkpoints.append,
+        window_size=4,
+        embedding_batch_size=3,
+        upload_batch_size=2,
+        upload_workers=1,
+        max_chunk_length=1000,
+        embedding_cache=embedding_cache,
+        sparse_encoder=sparse_encoder,
+    )
+
+
+async def test_ingest_law_acts(qdrant_client, law_acts_unit_of_work):
+    saved_checkpoints = []
+    repository = LawActsRepository(qdrant_client, TEST_COLLECTION)
+
+    checkpoint = IngestionCheckpoint(source="acts.jsonl")
+
+    report = await ingest(repository, law_acts_unit_of_work, make_documents(5), checkpoint, saved_checkpoints)
+
+    assert (report.documents, report.chunks) == (5, 10)
+    assert (await qdrant_client.count(TEST_COLLECTION)).count == 10
+    assert [checkpoint.processed_documents for checkpoint in saved_checkpoints] == [2, 4, 5]
+    assert saved_checkpoints[-1].uploaded_chunks == 10
+    points, _ = await qdrant_client.scroll(TEST_COLLECTION, limit=1, with_vectors=True)
+    assert points[0].vector[SPARSE_VECTOR_NAME].indices
+
+
+async def test_ingestion_resumes_from_checkpoint(qdrant_client, law_acts_unit_of_work):
+    saved_checkpoints = []
+    documents = make_documents(5)
+    failing_repository = FailingRepository(qdrant_client, TEST_COLLECTION, fail_on_upload=2)
+
+    with pytest.raises(ConnectionError):
+        await ingest(
+            failing_repository,
+            law_acts_unit_of_work,
+            documents,
+            IngestionCheckpoint(source="acts.jsonl"),
+            saved_checkpoints,
+        )
+    checkpoint = saved_checkpoints[-1]
+    report = await ingest(
+        LawActsRepository(qdrant_client, TEST_COLLECTION),
+        law_acts_unit_of_work,
+        documents,
+        replace(checkpoint),
+        saved_checkpoints,
+    )
+
+    assert checkpoint.processed_documents == 2
+    assert (report.documents, report.chunks) == (3, 6)
+    assert (await qdrant_client.count(TEST_COLLECTION)).count == 10
+    assert saved_checkpoints[-1] == IngestionCheckpoint(source="acts.jsonl", processed_documents=5, uploaded_chunks=10)
+
+
+async def test_ingestion_uploads_only_changed_chunks(qdrant_client, law_acts_unit_of_work):
+    repository = LawActsRepository(qdrant_client, TEST_COLLECTION)
+    documents = make_documents(3)
+    await ingest(repository, law_acts_unit_of_work, documents, IngestionCheckpoint(source="acts.jsonl"), [])
+
+    documents[1] = replace(documents[1], text="Art. 1. Pierwszy artykuł ustawy 1.")
+    documents[2] = replace(documents[2], text="Art. 1. Pierwszy artykuł ustawy 2.\nArt. 2. Zmieniony artykuł.")
+    report = await ingest(repository, law_acts_unit_of_work, documents, IngestionCheckpoint(source="acts.jsonl"), [])
+
+    assert (report.documents, report.chunks, report.skipped_chunks, report.deleted_chunks) == (3, 1, 4, 1)
+    assert (await qdrant_client.count(TEST_COLLECTION)).count == 5
+    assert len(law_acts_unit_of_work.chunks.chunks) == 5
+    points, _ = await qdrant_client.scroll(TEST_COLLECTION, with_payload=[LawActPayloadField.TEXT], limit=10)
+    assert "Art. 2. Zmieniony artykuł." in {point.payload[LawActPayloadField.TEXT] for point in points}
+
+
+async def test_ingestion_reuses_cached_embeddings(qdrant_client, law_acts_unit_of_work, embeddings_unit_of_work):
+    repository = LawActsRepository(qdrant_client, TEST_COLLECTION)
+    embedding_cache = EmbeddingCache(embeddings_unit_of_work)
+    documents = make_documents(2)
+    consolidated_documents = [replace(document, act_id=f"{document.act_id}-consolidated") for document in documents]
+
+    report = await ingest(
+        repository,
+        law_acts_unit_of_work,
+        documents + consolidated_documents,
+        IngestionCheckpoint(source="acts.jsonl"),
+        [],
+        embedding_cache,
+    )
+
+    assert report.chunks == 8
+    assert (report.embedding_cache_hits, report.embedding_cache_misses) == (4, 4)
+
+
+async def test_ingestion_stores_references(qdrant_client, law_acts_unit_of_work):
+    repository = LawActsRepository(qdrant_client, TEST_COLLECTION)
+    civil_code, labour_code = make_documents(2)
+    civil_code = replace(civil_code, act_id="DU/1964/93", title="Ustawa z dnia 23 kwietnia 1964 r. - Kodeks cywilny")
+    labour_code = replace(
+        labour_code,
+        act_id="DU/1974/141",
+        text=(
+            "Art. 1. W sprawach nieuregulowanych stosuje się art. 56 ustawy z dnia 23 kwietnia 1964 r. "
+            "- Kodeks cywilny.\nArt. 2. Zob. też Dz. U. z 2023 r. poz. 1610 oraz art. 1."
+        ),
+    )
+
+    report = await ingest(
+        repository, law_acts_unit_of_work, [civil_code, labour_code], IngestionCheckpoint(source="acts.jsonl"), []
+    )
+
+    assert report.references == 2
+    assert law_acts_unit_of_work.acts.acts["DU/1964/93"]["enacted_on"] == date(1964, 4, 23)
+    assert sorted(
+        (reference["source_unit"], reference["target_act_id"], reference["target_unit"])
+        for reference in law_acts_unit_of_work.references.references
+    ) == [("art. 1", "DU/1964/93", "art. 56"), ("art. 2", "DU/2023/1610", "")]
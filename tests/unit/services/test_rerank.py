@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from app.domain.entities.law_acts import LawActHit
+from app.domain.services.rerank import bm25_scores, fuse_scores, get_rerank_candidates_limit, rerank_hits, tokenize
+from app.shared.enums import LawActPayloadField
+from app.shared.settings.search import search_settings
+
+
+def test_tokenize_folds_case_and_diacritics():
+    assert tokenize("Umowa SPRZEDAŻY, art. 535 §1") == ["umowa", "sprzedazy", "art", "535", "1"]
+
+
+def test_bm25_scores_rare_term_weighted_higher():
+    documents = [["umowa", "najmu"], ["umowa", "sprzedazy"], ["umowa", "zlecenia"]]
+
+    scores = bm25_scores(["umowa", "sprzedazy"], documents, k1=1.2, b=0.75)
+
+    assert np.argmax(scores) == 1
+    assert scores[0] == pytest.approx(scores[2])
+
+
+def test_bm25_scores_without_query_terms():
+    assert bm25_scores([], [["umowa"]], k1=1.2, b=0.75).tolist() == [0.0]
+
+
+def test_fuse_scores_constant_lexical_scores():
+    fused = fuse_scores(np.array([0.2, 0.6, 0.4]), np.zeros(3), dense_weight=0.7, lexical_weight=0.3)
+
+    assert fused.tolist() == pytest.approx([0.0, 0.7, 0.35])
+
+
+def test_rerank_hits_promotes_exact_term():
+    hits = [
+        LawActHit(id="1", score=0.802, payload={LawActPayloadField.TEXT: "Przepisy ogólne o umowach"}),
+        LawActHit(id="2", score=0.800, payload={LawActPayloadField.TEXT: "Umowa dzierżawy gruntu rolnego"}),
+        LawActHit(id="3", score=0.790, payload={LawActPayloadField.TEXT: "Najem lokalu mieszkalnego"}),
+    ]
+
+    reranked_hits = rerank_hits("dzierżawy gruntu", hits, limit=2)
+
+    assert [hit.id for hit in reranked_hits] == ["2", "1"]
+    assert reranked_hits[0].score > reranked_hits[1].score
+
+
+@pytest.mark.parametrize("limit", [1, 10, 100])
+def test_get_rerank_candidates_limit(limit):
+    candidates_limit = get_rerank_candidates_limit(limit)
+
+    assert limit <= candidates_limit <= max(limit, search_settings.RERANK_MAX_CANDIDATES)
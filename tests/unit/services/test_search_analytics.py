@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+from app.domain.entities.law_acts import LawActsFilter, SearchEvent
+from app.domain.services.search_analytics import (
+    SEARCH_EVENT_COLUMNS,
+    SearchAnalyticsBuffer,
+    delete_expired_search_events,
+    flush_search_events,
+)
+from app.shared.enums import LawActPayloadField
+
+
+def make_event(query: str) -> SearchEvent:
+    return SearchEvent(
+        query=query,
+        filters=LawActsFilter(act_type="ustawa"),
+        limit=10,
+        score_threshold=None,
+        payload_fields=[LawActPayloadField.TITLE],
+        rerank=True,
+        cached=False,
+        latency_seconds=0.025,
+        result_ids=["1", "2"],
+        searched_at=datetime(2026, 10, 19, tzinfo=timezone.utc),
+    )
+
+
+def make_unit_of_work():
+    unit_of_work = AsyncMock()
+    unit_of_work.__aenter__.return_value = unit_of_work
+    return unit_of_work
+
+
+def test_buffer_overwrites_oldest_events():
+    buffer = SearchAnalyticsBuffer(capacity=2)
+
+    for query in ("umowa", "najem", "dzierżawa"):
+        buffer.record(make_event(query))
+
+    assert [event.query for event in buffer.drain(10)] == ["najem", "dzierżawa"]
+    assert len(buffer) == 0
+
+
+async def test_flush_search_events_in_batches():
+    buffer = SearchAnalyticsBuffer(capacity=10)
+    for query in ("Umowa SPRZEDAŻY", "najem", "dzierżawa"):
+        buffer.record(make_event(query))
+    unit_of_work = make_unit_of_work()
+
+    written_events = await flush_search_events(buffer, unit_of_work, batch_size=2)
+
+    assert written_events == 3
+    assert len(buffer) == 0
+    batches = [call.args for call in unit_of_work.search_events.copy_many.await_args_list]
+    assert [len(records) for _, records in batches] == [2, 1]
+    first_record = dict(zip(SEARCH_EVENT_COLUMNS, batches[0][1][0]))
+    assert first_record["normalized_query"] == "umowa sprzedazy"
+    assert first_record["act_type"] == "ustawa"
+    assert first_record["payload_fields"] == ["title"]
+    assert first_record["latency_ms"] == 25.0
+
+
+async def test_flush_search_events_drops_failed_batch():
+    buffer = SearchAnalyticsBuffer(capacity=10)
+    for query in ("umowa", "najem", "dzierżawa"):
+        buffer.record(make_event(query))
+    unit_of_work = make_unit_of_work()
+    unit_of_work.search_events.copy_many.side_effect = ConnectionError()
+
+    written_events = await flush_search_events(buffer, unit_of_work, batch_size=2)
+
+    assert written_events == 0
+    assert [event.query for event in buffer.drain(10)] == ["dzierżawa"]
+
+
+async def test_delete_expired_search_events():
+    unit_of_work = make_unit_of_work()
+    unit_of_work.search_events.delete_older_than.return_value = 7
+
+    deleted_events = await delete_expired_search_events(unit_of_work, retention_days=30)
+
+    assert deleted_events == 7
+    searched_before = unit_of_work.search_events.delete_older_than.await_args.args[0]
+    expected_searched_before = datetime.now(timezone.utc) - timedelta(days=30)
+    assert abs(searched_before - expected_searched_before) < timedelta(minutes=1)
@@ -0,0 +1,86 @@
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.entities.law_acts import LawActHit, LawActsFilter
+from app.domain.services.search_cache import SearchResultCache, publish_collection_version
+from app.domain.services.text import normalize_query
+from app.shared.enums import LawActPayloadField
+from app.shared.metrics import metrics_registry
+
+TEST_COLLECTION = "law_acts"
+PAYLOAD_FIELDS = [LawActPayloadField.TITLE]
+
+
+class DictKeyValueRepository:
+    def __init__(self):
+        self.values = {}
+        self.set = AsyncMock(side_effect=self._set)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def _set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+
+@pytest.fixture
+def key_value_repo():
+    return DictKeyValueRepository()
+
+
+@pytest.fixture
+def search_result_cache(key_value_repo):
+    return SearchResultCache(key_value_repo, TEST_COLLECTION, ttl_seconds=60)
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["Kodeks  Cywilny", " kodeks cywilny ", "KODEKS\tCYWILNY", "Kódeks cywilny"],
+)
+def test_normalize_query_case_and_whitespace(query):
+    assert normalize_query(query) == "kodeks cywilny"
+
+
+def test_normalize_query_polish_diacritics():
+    assert normalize_query("Zażółć gęślą jaźń ŁÓDŹ") == "zazolc gesla jazn lodz"
+
+
+async def test_equivalent_queries_share_key(search_result_cache):
+    filters = LawActsFilter(in_force_on=date(2024, 1, 1))
+
+    first_key = await search_result_cache.build_key("Prawo Pracy", filters, 10, None, PAYLOAD_FIELDS)
+    second_key = await search_result_cache.build_key("prawo  pracy", filters, 10, None, PAYLOAD_FIELDS)
+    other_limit_key = await search_result_cache.build_key("prawo pracy", filters, 5, None, PAYLOAD_FIELDS)
+    hybrid_key = await search_result_cache.build_key("prawo pracy", filters, 10, None, PAYLOAD_FIELDS, hybrid=True)
+
+    assert first_key == second_key
+    assert first_key != other_limit_key
+    assert first_key != hybrid_key
+
+
+async def test_cache_hit_and_miss(search_result_cache, key_value_repo):
+    hits = [LawActHit(id="1", score=0.5, payload={"title": "Kodeks pracy"})]
+    saved_seconds_before = metrics_registry.counter("search_cache_saved_seconds").value
+    key = await search_result_cache.build_key("kodeks pracy", LawActsFilter(), 10, None, PAYLOAD_FIELDS)
+
+    assert await search_result_cache.get(key) is None
+    await search_result_cache.set(key, hits, search_seconds=0.2)
+
+    assert await search_result_cache.get(key) == hits
+    assert key_value_repo.set.await_args.kwargs == {"ex": 60}
+    assert metrics_registry.counter("search_cache_saved_seconds").value > saved_seconds_before
+
+
+async def test_new_collection_version_invalidates_keys(search_result_cache, key_value_repo):
+    key = await search_result_cache.build_key("kodeks pracy", LawActsFilter(), 10, None, PAYLOAD_FIELDS)
+
+    assert await publish_collection_version(key_value_repo, TEST_COLLECTION) == 1
+    new_key = await search_result_cache.build_key("kodeks pracy", LawActsFilter(), 10, None, PAYLOAD_FIELDS)
+
+    assert key != new_key
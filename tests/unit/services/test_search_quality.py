@@ -0,0 +1,39 @@
+import math
+
+import pytest
+
+from app.domain.entities.law_acts import LawActHit
+from app.domain.services.search_quality import SearchQualityMetrics, average_metrics, evaluate_ranking, get_hit_key
+from app.shared.enums import LawActPayloadField
+
+
+def test_evaluate_ranking():
+    relevance = {"kc#art. 535": 3, "kc#art. 556": 1, "kc#art. 659": 2}
+
+    metrics = evaluate_ranking(["kc#art. 1", "kc#art. 556", "kc#art. 535", "kc#art. 2"], relevance, k=3)
+
+    assert metrics.recall == pytest.approx(2 / 3)
+    assert metrics.reciprocal_rank == 0.5
+    dcg = 1 / math.log2(3) + 7 / math.log2(4)
+    ideal_dcg = 7 + 3 / math.log2(3) + 1 / math.log2(4)
+    assert metrics.ndcg == pytest.approx(dcg / ideal_dcg)
+
+
+def test_evaluate_ranking_perfect_and_empty():
+    relevance = {"kc#art. 535": 3, "kc#art. 556": 1}
+
+    assert evaluate_ranking(["kc#art. 535", "kc#art. 556"], relevance, k=10) == SearchQualityMetrics(1.0, 1.0, 1.0)
+    assert evaluate_ranking([], relevance, k=10) == SearchQualityMetrics(0.0, 0.0, 0.0)
+
+
+def test_average_metrics():
+    metrics = average_metrics([SearchQualityMetrics(1.0, 1.0, 1.0), SearchQualityMetrics(0.5, 0.0, 0.25)])
+
+    assert metrics == SearchQualityMetrics(recall=0.75, reciprocal_rank=0.5, ndcg=0.625)
+
+
+def test_get_hit_key():
+    payload = {LawActPayloadField.ACT_ID: "DU/1964/93", LawActPayloadField.UNIT: "art. 535"}
+
+    assert get_hit_key(LawActHit(id="1", score=0.5, payload=payload)) == "DU/1964/93#art. 535"
+    assert get_hit_key(LawActHit(id="1", score=0.5)) is None
@@ -0,0 +1,49 @@
+import pytest
+
+from app.domain.services.sparse_vectors import PolishSparseEncoder, analyze, get_term_index, stem
+
+
+@pytest.fixture
+def sparse_encoder():
+    return PolishSparseEncoder(k1=1.2, b=0.75, average_length=4)
+
+
+@pytest.mark.parametrize("forms", [("umowa", "umowy", "umowie", "umowami"), ("sprzedaz", "sprzedazy")])
+def test_stem_inflected_forms(forms):
+    assert len({stem(form) for form in forms}) == 1
+
+
+def test_stem_keeps_short_words_and_numbers():
+    assert stem("akt") == "akt"
+    assert stem("535") == "535"
+
+
+def test_analyze_removes_stop_words():
+    terms = analyze("Umowa sprzedaży i najmu, art. 535")
+
+    assert terms == [stem("umowa"), stem("sprzedazy"), stem("najmu"), "art", "535"]
+
+
+def test_encode_documents_batch_equals_single_texts(sparse_encoder):
+    texts = ["Umowa sprzedaży rzeczy.", "", "Umowa najmu lokalu, umowa dzierżawy gruntu rolnego."]
+
+    batch_vectors = sparse_encoder.encode_documents(texts)
+
+    assert batch_vectors == [sparse_encoder.encode_documents([text])[0] for text in texts]
+    assert batch_vectors[1].indices == []
+    assert all(indices == sorted(indices) for indices in (vector.indices for vector in batch_vectors))
+
+
+def test_encode_documents_saturates_term_frequency(sparse_encoder):
+    vector = sparse_encoder.encode_documents(["umowa umowy umowie najem"])[0]
+    weights = dict(zip(vector.indices, vector.values))
+    single_weight = weights[get_term_index(stem("najem"))]
+
+    assert single_weight < weights[get_term_index(stem("umowa"))] < 3 * single_weight
+
+
+def test_encode_query_unique_terms(sparse_encoder):
+    vector = sparse_encoder.encode_query("Umowa, umowy i umowie")
+
+    assert vector.indices == [get_term_index(stem("umowa"))]
+    assert vector.values == [1.0]
@@ -0,0 +1,124 @@
+from datetime import date
+
+import pytest
+
+from app.domain.entities.law_acts import LawActDocument
+from app.domain.services.suggestions import SuggestionIndex, get_act_citation, get_suggestion_terms
+
+
+class SortedSetsKeyValueRepository:
+    """Redis commands used by the suggestion index, members of sorted sets compared as UTF-8 bytes like in Redis."""
+
+    def __init__(self):
+        self.sorted_sets = {}
+        self.hashes = {}
+
+    async def zadd(self, name, mapping):
+        self.sorted_sets.setdefault(name, {}).update(mapping)
+
+    async def zrem(self, name, *members):
+        for member in members:
+            self.sorted_sets.get(name, {}).pop(member, None)
+
+    async def zincrby(self, name, amount, member):
+        sorted_set = self.sorted_sets.setdefault(name, {})
+        sorted_set[member] = sorted_set.get(member, 0) + amount
+
+    async def zmscore(self, name, members):
+        return [self.sorted_sets.get(name, {}).get(member) for member in members]
+
+    async def zrangebylex(self, name, min, max, start, num):
+        minimum = min[1:].encode()
+        maximum = max[1:]
+        members = sorted(self.sorted_sets.get(name, {}), key=str.encode)
+        return [member for member in members if minimum <= member.encode() <= maximum][start : start + num]
+
+    async def hset(self, name, key, value):
+        self.hashes.setdefault(name, {})[key] = value
+
+    async def hmget(self, name, keys):
+        return [self.hashes.get(name, {}).get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return Pipeline(self)
+
+
+class Pipeline:
+    def __init__(self, repository):
+        self.repository = repository
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append(getattr(self.repository, name)(*args, **kwargs))
+
+    async def execute(self):
+        return [await command for command in self.commands]
+
+
+def make_document(act_id: str, title: str) -> LawActDocument:
+    return LawActDocument(
+        act_id=act_id, title=title, act_type="ustawa", issuing_body="Sejm", in_force_from=date(2000, 1, 1), text=""
+    )
+
+
+DOCUMENTS = [
+    make_document("DU/1964/43", "Ustawa z dnia 17 listopada 1964 r. - Kodeks postępowania cywilnego"),
+    make_document("DU/1997/89", "Ustawa z dnia 6 czerwca 1997 r. - Kodeks postępowania karnego"),
+    make_document("DU/2023/1610", "Ustawa z dnia 14 lipca 2023 r. o zmianie ustawy o podatku dochodowym"),
+]
+
+
+@pytest.fixture
+async def suggestion_index():
+    suggestion_index = SuggestionIndex(SortedSetsKeyValueRepository(), max_candidates=50, max_title_terms=16)
+    await suggestion_index.add_acts(DOCUMENTS)
+    return suggestion_index
+
+
+def test_get_suggestion_terms():
+    terms = get_suggestion_terms(make_document("DU/1964/93", "Kodeks cywilny"), max_title_terms=16)
+
+    assert terms == ["kodeks cywilny", "cywilny", "dz u 1964 poz 93", "du 1964 93"]
+    assert get_act_citation("local-act") is None
+
+
+@pytest.mark.parametrize(
+    "prefix, act_ids",
+    [
+        ("KODEKS POSTĘPOWANIA", ["DU/1964/43", "DU/1997/89"]),
+        ("kodeks postepowania k", ["DU/1997/89"]),
+        ("Dz.U. 2023 poz. 16", ["DU/2023/1610"]),
+        ("podatku doch", ["DU/2023/1610"]),
+        ("prawo", []),
+        ("...", []),
+    ],
+)
+async def test_suggest_matches_prefix_ignoring_diacritics(suggestion_index, prefix, act_ids):
+    suggestions = await suggestion_index.suggest(prefix, limit=5)
+
+    assert [suggestion.act_id for suggestion in suggestions] == act_ids
+
+
+async def test_suggest_ranks_by_popularity(suggestion_index):
+    await suggestion_index.record_popularity(["DU/1997/89", "DU/1964/43", "DU/1997/89"])
+    await suggestion_index.record_popularity(["DU/1997/89"])
+
+    suggestions = await suggestion_index.suggest("kodeks", limit=1)
+
+    assert [(suggestion.act_id, suggestion.popularity) for suggestion in suggestions] == [("DU/1997/89", 2.0)]
+    assert suggestions[0].citation == "Dz.U. 1997 poz. 89"
+
+
+async def test_add_acts_replaces_terms_of_amended_act(suggestion_index):
+    await suggestion_index.add_acts([make_document("DU/1997/89", "Kodeks karny wykonawczy")])
+
+    assert await suggestion_index.suggest("kodeks postępowania karnego", limit=5) == []
+    assert [suggestion.title for suggestion in await suggestion_index.suggest("kodeks karny", limit=5)] == [
+        "Kodeks karny wykonawczy"
+    ]
@@ -0,0 +1,75 @@
+import zipfile
+from io import BytesIO
+
+import pytest
+from defusedxml import DTDForbidden
+
+from app.domain.services.text_extraction import extract_text
+from app.domain.services.user_files_indexing import chunk_user_file_text
+from app.shared.exceptions import FileTooLargeToIndex
+
+MAX_UNPACKED_SIZE = 1024 * 1024
+
+DOCX_DOCUMENT = (
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+    "<w:p><w:r><w:t>Umowa </w:t></w:r><w:r><w:t>dzierżawy</w:t></w:r></w:p>"
+    "<w:p><w:r><w:t>§ 1. Przedmiot umowy.</w:t></w:r></w:p>"
+    "</w:body></w:document>"
+)
+
+
+def make_docx() -> bytes:
+    docx_file = BytesIO()
+    with zipfile.ZipFile(docx_file, "w") as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml", DOCX_DOCUMENT)
+    return docx_file.getvalue()
+
+
+@pytest.mark.parametrize(
+    "file_bytes, text",
+    [
+        ("Zażółć\n\n\n\ngęślą jaźń".encode("utf-8"), "Zażółć\n\ngęślą jaźń"),
+        ("Zażółć gęślą jaźń".encode("cp1250"), "Zażółć gęślą jaźń"),
+        (
+            b"<!DOCTYPE html><html><head><title>Pismo</title></head>"
+            b"<body><p>Wezwanie</p><script>run()</script><p>do zap\xc5\x82aty</p></body></html>",
+            "Wezwanie\ndo zapłaty",
+        ),
+        (b'<?xml version="1.0"?><akt><tytul>Ustawa</tytul><art> Art. 1. </art></akt>', "Ustawa\nArt. 1."),
+        (
+            rb"{\rtf1\ansi\ansicpg1250{\fonttbl{\f0 Arial;}}{\*\generator Word;}\pard\f0 Pe\'b3nomocnictwo\par Tre"
+            rb"\'9c\'e6}",
+            "Pełnomocnictwo\nTreść",
+        ),
+        (make_docx(), "Umowa dzierżawy\n§ 1. Przedmiot umowy."),
+        (b"\x89PNG\r\n\x1a\n\x00\x00", None),
+    ],
+)
+def test_extract_text(file_bytes, text):
+    assert extract_text(file_bytes, MAX_UNPACKED_SIZE) == text
+
+
+def test_extract_text_refuses_xml_entities():
+    xml_bytes = b'<?xml version="1.0"?><!DOCTYPE akt [<!ENTITY a "aaaaaaaaaa">]><akt>&a;&a;&a;</akt>'
+
+    with pytest.raises(DTDForbidden):
+        extract_text(xml_bytes, MAX_UNPACKED_SIZE)
+
+
+def test_extract_text_docx_over_max_unpacked_size():
+    with pytest.raises(FileTooLargeToIndex):
+        extract_text(make_docx(), max_unpacked_size=len(DOCX_DOCUMENT.encode()) - 1)
+
+
+def test_chunk_user_file_text_packs_paragraphs():
+    text = "Pierwszy akapit.\n\nDrugi akapit.\n\n\nTrzeci, znacznie dłuższy akapit pisma procesowego."
+
+    chunks = list(chunk_user_file_text(text, max_chunk_length=40))
+
+    assert chunks == [
+        "Pierwszy akapit.\n\nDrugi akapit.",
+        "Trzeci, znacznie dłuższy akapit pisma",
+        "procesowego.",
+    ]
+    assert all(len(chunk) <= 40 for chunk in chunks)
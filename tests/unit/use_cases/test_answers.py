@@ -0,0 +1,86 @@
+import json
+from typing import AsyncIterator
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import status
+
+from app.application.use_cases.answers import NO_SOURCES_ANSWER
+from app.domain.entities.law_acts import LawActHit
+from app.framework.dependencies.authentication import validate_token
+from app.framework.dependencies.vector_db import get_law_acts_repository
+from app.infrastructure.language_models.fake import FakeLanguageModel
+from app.infrastructure.language_models.service import get_language_model
+from main import app
+
+
+@pytest.fixture
+def law_acts_repository():
+    repository = AsyncMock()
+    app.dependency_overrides[get_law_acts_repository] = lambda: repository
+    app.dependency_overrides[get_language_model] = FakeLanguageModel
+    app.dependency_overrides[validate_token] = lambda: ("access_token", uuid4())
+    yield repository
+    app.dependency_overrides = {}
+
+
+class FailingLanguageModel:
+    async def stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        yield "Odpowiedź"
+        raise httpx.ReadTimeout("Language model stopped responding.")
+
+
+def create_hit(hit_id: str, score: float, unit: str, text: str) -> LawActHit:
+    return LawActHit(
+        id=hit_id, score=score, payload={"act_id": "kc", "title": "Kodeks cywilny", "unit": unit, "text": text}
+    )
+
+
+def test_answer_question(client, law_acts_repository):
+    law_acts_repository.search.return_value = [
+        create_hit("1", 0.9, "art. 535 § 1", "Art. 535. § 1. Przez umowę sprzedaży sprzedawca zobowiązuje się."),
+        create_hit("2", 0.8, "art. 535 § 2", "§ 2. Kupujący zobowiązuje się zapłacić cenę."),
+        create_hit("3", 0.7, "art. 536", "Art. 536. Cena może być określona."),
+    ]
+
+    response = client.post("/answer", json={"question": "Czym jest umowa sprzedaży?", "rerank": False})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[0]["stage"] == "sources"
+    assert [(source["number"], source["unit"]) for source in events[0]["sources"]] == [
+        (1, "art. 535"),
+        (2, "art. 536"),
+    ]
+    assert {event["stage"] for event in events[1:-1]} == {"delta"}
+    answer = "".join(event["text"] for event in events[1:-1])
+    assert "[1] Kodeks cywilny, art. 535" in answer
+    assert events[-1]["stage"] == "done"
+    assert set(events[-1]["timings_ms"]) == {"embed", "ann", "pack", "generate"}
+
+
+def test_answer_question_without_sources(client, law_acts_repository):
+    law_acts_repository.search.return_value = []
+
+    response = client.post("/answer", json={"question": "Czym jest umowa sprzedaży?", "rerank": False})
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["stage"] for event in events] == ["sources", "delta", "done"]
+    assert events[0]["sources"] == []
+    assert events[1]["text"] == NO_SOURCES_ANSWER
+    assert "generate" not in events[2]["timings_ms"]
+
+
+def test_answer_question_language_model_failure(client, law_acts_repository):
+    law_acts_repository.search.return_value = [create_hit("1", 0.9, "art. 535", "Art. 535. Przez umowę sprzedaży.")]
+    app.dependency_overrides[get_language_model] = FailingLanguageModel
+
+    response = client.post("/answer", json={"question": "Czym jest umowa sprzedaży?", "rerank": False})
+
+    assert response.status_code == status.HTTP_200_OK
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["stage"] for event in events] == ["sources", "delta", "error"]
+    assert events[-1]["detail"] == "Answer could not be generated."
@@ -0,0 +1,30 @@
+from unittest.mock import AsyncMock
+
+from fastapi import status
+
+from app.framework.dependencies.units_of_work import get_law_acts_unit_of_work
+from main import app
+
+
+def test_list_related_law_acts(client):
+    law_acts_unit_of_work = AsyncMock()
+    law_acts_unit_of_work.__aenter__.return_value = law_acts_unit_of_work
+    law_acts_unit_of_work.references.list_related.return_value = [
+        ("DU/1974/141", "Kodeks pracy", "cited_by", 3),
+        ("DU/2023/1610", None, "cites", 1),
+    ]
+    app.dependency_overrides[get_law_acts_unit_of_work] = lambda: law_acts_unit_of_work
+
+    try:
+        response = client.get("/acts/DU/1964/93/related", params={"limit": 5})
+    finally:
+        app.dependency_overrides = {}
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "results": [
+            {"act_id": "DU/1974/141", "title": "Kodeks pracy", "direction": "cited_by", "references": 3},
+            {"act_id": "DU/2023/1610", "title": None, "direction": "cites", "references": 1},
+        ]
+    }
+    law_acts_unit_of_work.references.list_related.assert_awaited_once_with("DU/1964/93", 5)
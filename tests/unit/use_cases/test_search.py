@@ -0,0 +1,291 @@
+import json
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import status
+
+import app.application.use_cases.search as search_use_cases
+from app.domain.entities.law_acts import LawActHit, LawActsFilter, LawActSuggestion
+from app.domain.services.rerank import get_rerank_candidates_limit
+from app.domain.services.search_analytics import SearchAnalyticsBuffer
+from app.domain.services.search_cache import SearchResultCache
+from app.domain.services.search_cursor import SearchCursorStore
+from app.framework.dependencies.search import (
+    get_search_analytics_buffer,
+    get_search_cursor_store,
+    get_search_result_cache,
+    get_suggestion_index,
+)
+from app.framework.dependencies.units_of_work import get_law_acts_unit_of_work
+from app.framework.dependencies.vector_db import get_law_acts_repository
+from app.shared.enums import LawActPayloadField
+from app.shared.settings.search import search_settings
+from main import app
+
+
+@pytest.fixture
+def law_acts_repository():
+    repository = AsyncMock()
+    app.dependency_overrides[get_law_acts_repository] = lambda: repository
+    yield repository
+    app.dependency_overrides = {}
+
+
+@pytest.fixture
+def key_value_repository():
+    cached_values = {}
+    repository = AsyncMock()
+    repository.get.side_effect = cached_values.get
+    repository.set.side_effect = lambda key, value, ex: cached_values.__setitem__(key, value)
+    cache = SearchResultCache(repository, "law_acts", ttl_seconds=60)
+    app.dependency_overrides[get_search_result_cache] = lambda: cache
+    yield repository
+    app.dependency_overrides = {}
+
+
+def test_search_law_acts(client, law_acts_repository, key_value_repository):
+    law_acts_repository.search.return_value = [LawActHit(id="1", score=0.75, payload={"title": "Kodeks cywilny"})]
+    params = {
+        "query": "umowa sprzedaży",
+        "act_type": "ustawa",
+        "in_force_on": "2024-01-01",
+        "limit": 5,
+        "rerank": False,
+    }
+
+    response = client.get("/search", params=params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"results": [{"id": "1", "score": 0.75, "payload": {"title": "Kodeks cywilny"}}]}
+    _, filters, limit, score_threshold, _ = law_acts_repository.search.await_args.args
+    assert filters == LawActsFilter(act_type="ustawa", in_force_on=date(2024, 1, 1))
+    assert limit == 5
+    assert score_threshold is None
+
+
+def test_search_law_acts_reranked(client, law_acts_repository, key_value_repository):
+    law_acts_repository.search.return_value = [
+        LawActHit(id="1", score=0.9, payload={"title": "Kodeks cywilny", "text": "Przepisy ogólne"}),
+        LawActHit(id="2", score=0.8, payload={"title": "Kodeks cywilny", "text": "Umowa dzierżawy gruntu"}),
+    ]
+
+    response = client.get("/search", params={"query": "dzierżawy", "limit": 1, "rerank": True})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [result["payload"] for result in response.json()["results"]] == [{"title": "Kodeks cywilny"}]
+    _, _, limit, _, payload_fields = law_acts_repository.search.await_args.args
+    assert limit == get_rerank_candidates_limit(1)
+    assert LawActPayloadField.TEXT in payload_fields
+    assert [stage.split(";")[0] for stage in response.headers["Server-Timing"].split(", ")] == [
+        "cache",
+        "embed",
+        "ann",
+        "rerank",
+    ]
+
+
+def test_stream_search_law_acts(client, law_acts_repository, key_value_repository):
+    law_acts_repository.search.return_value = [
+        LawActHit(id="1", score=0.9, payload={"title": "Kodeks cywilny", "text": "Przepisy ogólne"}),
+        LawActHit(id="2", score=0.89, payload={"title": "Kodeks cywilny", "text": "Umowa dzierżawy gruntu"}),
+        LawActHit(id="3", score=0.5, payload={"title": "Kodeks pracy", "text": "Urlop wypoczynkowy"}),
+    ]
+
+    response = client.get("/search/stream", params={"query": "umowa dzierżawy", "limit": 1, "rerank": True})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["stage"] for event in events] == ["ann", "reranked", "done"]
+    assert [result["id"] for result in events[0]["results"]] == ["1"]
+    assert [result["id"] for result in events[1]["results"]] == ["2"]
+    assert events[1]["results"][0]["payload"] == {"title": "Kodeks cywilny"}
+    assert set(events[2]["timings_ms"]) == {"cache", "embed", "ann", "rerank"}
+
+
+def test_stream_search_law_acts_cached(client, law_acts_repository, key_value_repository):
+    law_acts_repository.search.return_value = [LawActHit(id="1", score=0.75, payload={"title": "Kodeks cywilny"})]
+    params = {"query": "umowa", "rerank": False}
+
+    client.get("/search", params=params)
+    response = client.get("/search/stream", params=params)
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["stage"] for event in events] == ["ann", "done"]
+    assert events[0]["results"] == [{"id": "1", "score": 0.75, "payload": {"title": "Kodeks cywilny"}}]
+    law_acts_repository.search.assert_awaited_once()
+
+
+def test_search_law_acts_cached(client, law_acts_repository, key_value_repository):
+    law_acts_repository.search.return_value = [LawActHit(id="1", score=0.75, payload={"title": "Kodeks cywilny"})]
+
+    first_response = client.get("/search", params={"query": "Umowa sprzedaży"})
+    second_response = client.get("/search", params={"query": "umowa  sprzedazy"})
+
+    assert first_response.json() == second_response.json()
+    law_acts_repository.search.assert_awaited_once()
+
+
+def test_search_law_acts_cache_not_available(client, law_acts_repository, key_value_repository):
+    law_acts_repository.search.return_value = []
+    key_value_repository.get.side_effect = ConnectionError()
+
+    response = client.get("/search", params={"query": "umowa"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"results": []}
+
+
+def test_suggest_law_acts(client):
+    suggestion_index = AsyncMock()
+    suggestion_index.suggest.return_value = [
+        LawActSuggestion(act_id="DU/1964/93", title="Kodeks cywilny", citation="Dz.U. 1964 poz. 93", popularity=3.5)
+    ]
+    app.dependency_overrides[get_suggestion_index] = lambda: suggestion_index
+
+    try:
+        response = client.get("/search/suggestions", params={"prefix": "kodeks cyw", "limit": 3})
+    finally:
+        app.dependency_overrides = {}
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "results": [{"act_id": "DU/1964/93", "title": "Kodeks cywilny", "citation": "Dz.U. 1964 poz. 93"}]
+    }
+    suggestion_index.suggest.assert_awaited_once_with("kodeks cyw", 3)
+
+
+def test_search_law_acts_boosted_by_references(client, law_acts_repository, key_value_repository, monkeypatch):
+    law_acts_repository.search.return_value = [
+        LawActHit(id="1", score=0.80, payload={"title": "Kodeks pracy", "act_id": "DU/1974/141"}),
+        LawActHit(id="2", score=0.79, payload={"title": "Kodeks cywilny", "act_id": "DU/1964/93"}),
+        LawActHit(id="3", score=0.78, payload={"title": "Prawo bankowe", "act_id": "DU/1997/939"}),
+    ]
+    law_acts_unit_of_work = AsyncMock()
+    law_acts_unit_of_work.__aenter__.return_value = law_acts_unit_of_work
+    law_acts_unit_of_work.references.list_edges_between.return_value = {
+        ("DU/1974/141", "DU/1964/93"),
+        ("DU/1997/939", "DU/1964/93"),
+    }
+    app.dependency_overrides[get_law_acts_unit_of_work] = lambda: law_acts_unit_of_work
+    boost_settings = search_settings.model_copy(update={"GRAPH_BOOST_WEIGHT": 0.1})
+    monkeypatch.setattr(search_use_cases, "search_settings", boost_settings)
+
+    response = client.get("/search/stream", params={"query": "umowa", "fields": "title", "rerank": False})
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["stage"] for event in events] == ["ann", "boosted", "done"]
+    assert [result["id"] for result in events[1]["results"]] == ["2", "1", "3"]
+    assert events[1]["results"][0] == {"id": "2", "score": pytest.approx(0.89), "payload": {"title": "Kodeks cywilny"}}
+    _, _, _, _, payload_fields = law_acts_repository.search.await_args.args
+    assert LawActPayloadField.ACT_ID in payload_fields
+
+
+def test_search_law_acts_recorded_for_analytics(client, law_acts_repository, key_value_repository):
+    law_acts_repository.search.return_value = [LawActHit(id="1", score=0.75, payload={"title": "Kodeks cywilny"})]
+    analytics_buffer = SearchAnalyticsBuffer(capacity=10)
+    app.dependency_overrides[get_search_analytics_buffer] = lambda: analytics_buffer
+    params = {"query": "umowa", "act_type": "ustawa", "limit": 5, "rerank": False}
+
+    client.get("/search", params=params)
+    client.get("/search", params=params)
+
+    events = analytics_buffer.drain(10)
+    assert [event.cached for event in events] == [False, True]
+    assert events[0].filters == LawActsFilter(act_type="ustawa")
+    assert events[0].limit == 5
+    assert events[0].result_ids == ["1"]
+    assert events[0].latency_seconds > 0
+
+
+async def test_warm_up_search_caches(key_value_repository):
+    law_acts_repository = AsyncMock()
+    law_acts_repository.search.return_value = [LawActHit(id="1", score=0.75, payload={"title": "Kodeks cywilny"})]
+    analytics_unit_of_work = AsyncMock()
+    analytics_unit_of_work.__aenter__.return_value = analytics_unit_of_work
+    top_search = SimpleNamespace(
+        query="Umowa sprzedaży",
+        act_type="ustawa",
+        issuing_body=None,
+        in_force_on=None,
+        result_limit=5,
+        score_threshold=None,
+        payload_fields=["title"],
+        rerank=False,
+    )
+    analytics_unit_of_work.search_events.list_top_searches.return_value = [top_search]
+    search_result_cache = SearchResultCache(key_value_repository, "law_acts", ttl_seconds=60)
+    embedding_service = AsyncMock()
+    embedding_service.embed.return_value = [0.1, 0.2]
+    warm_up = search_use_cases.WarmUpSearchCaches(
+        analytics_unit_of_work,
+        law_acts_repository,
+        embedding_service,
+        search_result_cache,
+        since=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        max_searches=10,
+    )
+
+    replayed_searches = await warm_up.execute()
+
+    assert replayed_searches == 1
+    cache_key = await search_result_cache.build_key(
+        "umowa sprzedazy", LawActsFilter(act_type="ustawa"), 5, None, [LawActPayloadField.TITLE], rerank=False
+    )
+    assert await search_result_cache.get(cache_key) == law_acts_repository.search.return_value
+
+
+@pytest.fixture
+def search_cursor_store(key_value_repository):
+    key_value_repository.getex.side_effect = lambda key, ex: key_value_repository.get.side_effect(key)
+    store = SearchCursorStore(key_value_repository, "law_acts", ttl_seconds=60)
+    app.dependency_overrides[get_search_cursor_store] = lambda: store
+    return store
+
+
+def test_search_law_acts_pages(client, law_acts_repository, key_value_repository, search_cursor_store):
+    law_acts_repository.search.return_value = [
+        LawActHit(id=str(number), score=1 - number / 10, payload={"title": f"Akt {number}"}) for number in range(5)
+    ]
+    law_acts_repository.retrieve.return_value = [
+        LawActHit(id="3", score=0.0, payload={"title": "Akt 3"}),
+        LawActHit(id="2", score=0.0, payload={"title": "Akt 2"}),
+    ]
+
+    first_response = client.get(
+        "/search/pages", params={"query": "umowa", "limit": 2, "fields": "title", "rerank": False}
+    )
+    cursor = first_response.json()["cursor"]
+    second_response = client.get(f"/search/pages/{cursor}", params={"page": 2})
+
+    assert [result["id"] for result in first_response.json()["results"]] == ["0", "1"]
+    assert first_response.json()["pages"] == 3
+    assert second_response.json() == {
+        "results": [
+            {"id": "2", "score": 0.8, "payload": {"title": "Akt 2"}},
+            {"id": "3", "score": 0.7, "payload": {"title": "Akt 3"}},
+        ],
+        "cursor": cursor,
+        "page": 2,
+        "pages": 3,
+    }
+    law_acts_repository.search.assert_awaited_once()
+    law_acts_repository.retrieve.assert_awaited_once_with(["2", "3"], [LawActPayloadField.TITLE])
+
+
+def test_search_law_acts_page_expired(client, law_acts_repository, key_value_repository, search_cursor_store):
+    law_acts_repository.search.return_value = [LawActHit(id=str(number), score=0.5) for number in range(3)]
+
+    cursor = client.get("/search/pages", params={"query": "umowa", "limit": 1}).json()["cursor"]
+    cached_values_get = key_value_repository.get.side_effect
+    key_value_repository.get.side_effect = lambda key: (
+        "1" if key.startswith("collection_version") else cached_values_get(key)
+    )
+    changed_collection_response = client.get(f"/search/pages/{cursor}")
+    unknown_cursor_response = client.get("/search/pages/unknown")
+
+    assert changed_collection_response.status_code == status.HTTP_410_GONE
+    assert unknown_cursor_response.status_code == status.HTTP_410_GONE
+    key_value_repository.delete.assert_awaited_once()